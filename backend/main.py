@@ -8,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 import logging
 from contextlib import asynccontextmanager
 
+from backend.services.profiling import start_metrics_server
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -20,6 +22,8 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events."""
     logger.info("Starting V2 Optimization Backend")
+    # Optional Prometheus scrape endpoint (PROMETHEUS_METRICS_PORT)
+    start_metrics_server()
     yield
     logger.info("Shutting down V2 Optimization Backend")
 
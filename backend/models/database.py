@@ -78,6 +78,9 @@ class BacktestJob(Base):
     container_id = Column(String(100))  # Docker container tracking
     result_path = Column(String(500))  # LEAN output directory path
     error_message = Column(Text)  # Failure details
+    stage_timings = Column(
+        JSONB
+    )  # Stage durations in seconds {"container_start": 1.2, "lean_execution": 84.5, ...}
     created_at = Column(DateTime, default=datetime.utcnow)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
@@ -110,6 +113,9 @@ class OptimizationBatch(Base):
     best_result_id = Column(
         Integer, ForeignKey("backtest_jobs.id")
     )  # Best performing job
+    stage_timings = Column(
+        JSONB
+    )  # Batch-level stage durations {"combination_generation": 0.02, "job_submission": 3.1}
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime)
 
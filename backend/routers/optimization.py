@@ -15,6 +15,7 @@ from backend.schemas.optimization import (
     OptimizationResponse,
     BatchStatusResponse,
     BatchResultsResponse,
+    BatchProfileResponse,
     ErrorResponse
 )
 from backend.database import get_db
@@ -167,6 +168,40 @@ async def get_batch_results(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get(
+    "/batches/{batch_id}/profile",
+    response_model=BatchProfileResponse,
+    summary="Get batch stage profile",
+    description="Get stage duration percentiles for the jobs of an optimization batch"
+)
+async def get_batch_profile(
+    batch_id: str,
+    db: Session = Depends(get_db)
+) -> BatchProfileResponse:
+    """
+    Get where an optimization batch spent its time.
+
+    Returns:
+    - Batch-level stage durations (combination generation, batch creation, job submission)
+    - Per-job stage percentiles (container start, LEAN execution, result extraction,
+      validation and insert)
+    """
+    try:
+        opt_service = OptimizationService(db)
+        profile = opt_service.get_batch_profile(batch_id)
+
+        if not profile:
+            raise HTTPException(status_code=404, detail=f"Batch {batch_id} not found")
+
+        return BatchProfileResponse(**profile)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get batch profile: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.delete(
     "/batches/{batch_id}",
     summary="Cancel batch",
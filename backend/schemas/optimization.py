@@ -119,6 +119,26 @@ class BatchResultsResponse(BaseModel):
     parameter_analysis: Dict[str, Any] = Field(..., description="Parameter performance analysis")
 
 
+class StageStats(BaseModel):
+    """Duration statistics for one pipeline stage across jobs (seconds)."""
+    count: int
+    total: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class BatchProfileResponse(BaseModel):
+    """Batch stage profiling response."""
+    batch_id: str
+    total_jobs: int
+    profiled_jobs: int = Field(..., description="Jobs with recorded stage timings")
+    batch_stages: Dict[str, float] = Field(..., description="Batch-level stage durations (seconds)")
+    job_stages: Dict[str, StageStats] = Field(..., description="Per-job stage percentile breakdown")
+
+
 # Backtest Schemas
 class BacktestRequest(BaseModel):
     """Request to run individual backtest."""
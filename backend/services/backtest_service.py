@@ -12,6 +12,16 @@ import json
 
 from backend.models.database import BacktestJob, BacktestResult, SuccessCriteria
 from backend.schemas.optimization import BacktestRequest
+from backend.services.profiling import (
+    JOB_INSERT,
+    CONTAINER_START,
+    LEAN_EXECUTION,
+    RESULT_EXTRACTION,
+    RESULT_VALIDATION,
+    RESULT_INSERT,
+    StageTimer,
+    merge_timings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,8 +87,10 @@ class BacktestService:
             status="running",
         )
 
-        self.db.add(job)
-        self.db.flush()  # Get job ID
+        timer = StageTimer(component="backtest_service")
+        with timer.span(JOB_INSERT):
+            self.db.add(job)
+            self.db.flush()  # Get job ID
 
         try:
             # Build LEAN command
@@ -87,11 +99,13 @@ class BacktestService:
             )
 
             # Run container
-            container = self.run_lean_container(cmd, job.id)
+            with timer.span(CONTAINER_START):
+                container = self.run_lean_container(cmd, job.id)
 
             # Update job with container info
             job.container_id = container.id
             job.started_at = datetime.utcnow()
+            job.stage_timings = merge_timings(job.stage_timings, timer.pop())
             self.db.commit()
 
             logger.info(f"Started backtest job {job.id} in container {container.id}")
@@ -101,6 +115,7 @@ class BacktestService:
             # Mark job as failed
             job.status = "failed"
             job.error_message = str(e)
+            job.stage_timings = merge_timings(job.stage_timings, timer.pop())
             self.db.commit()
             logger.error(f"Failed to start backtest job {job.id}: {e}")
             raise
@@ -197,6 +212,8 @@ class BacktestService:
             logger.error(f"Failed to start container for job {job_id}: {e}")
             raise
 
+        return container
+
     def monitor_job(self, job_id: int) -> Dict[str, Any]:
         """
         Monitor the status of a backtest job.
@@ -250,27 +267,35 @@ class BacktestService:
 
     def _process_completed_job(self, job: BacktestJob, container: Any):
         """Process results from a completed backtest job."""
+        timer = StageTimer(component="backtest_service")
+        self._record_lean_execution(job, container, timer)
+
         try:
             # Extract results from container
-            results = self._extract_results_from_container(container)
+            with timer.span(RESULT_EXTRACTION):
+                results = self._extract_results_from_container(container)
 
             if results:
                 # Validate against success criteria
-                meets_criteria, rejection_reasons = self._validate_results(
-                    job.strategy_name, results
-                )
+                with timer.span(RESULT_VALIDATION):
+                    meets_criteria, rejection_reasons = self._validate_results(
+                        job.strategy_name, results
+                    )
 
                 # Create result record
-                result = BacktestResult(
-                    job_id=job.id,
-                    batch_id=job.batch_id,
-                    parameters=job.parameters,
-                    metrics=results,
-                    meets_criteria=meets_criteria,
-                    rejection_reasons=rejection_reasons if rejection_reasons else None,
-                )
+                with timer.span(RESULT_INSERT):
+                    result = BacktestResult(
+                        job_id=job.id,
+                        batch_id=job.batch_id,
+                        parameters=job.parameters,
+                        metrics=results,
+                        meets_criteria=meets_criteria,
+                        rejection_reasons=rejection_reasons if rejection_reasons else None,
+                    )
+
+                    self.db.add(result)
+                    self.db.flush()
 
-                self.db.add(result)
                 job.status = "completed"
                 job.completed_at = datetime.utcnow()
 
@@ -283,13 +308,16 @@ class BacktestService:
                 job.error_message = "No results found in container"
                 job.completed_at = datetime.utcnow()
 
+            job.stage_timings = merge_timings(job.stage_timings, timer.pop())
             self.db.commit()
 
         except Exception as e:
             logger.error(f"Failed to process results for job {job.id}: {e}")
+            self.db.rollback()
             job.status = "failed"
             job.error_message = f"Result processing failed: {str(e)}"
             job.completed_at = datetime.utcnow()
+            job.stage_timings = merge_timings(job.stage_timings, timer.pop())
             self.db.commit()
 
         finally:
@@ -302,6 +330,10 @@ class BacktestService:
 
     def _handle_failed_job(self, job: BacktestJob, container: Any, exit_code: int):
         """Handle a failed backtest job."""
+        timer = StageTimer(component="backtest_service")
+        self._record_lean_execution(job, container, timer)
+        job.stage_timings = merge_timings(job.stage_timings, timer.pop())
+
         try:
             # Try to get logs for debugging
             logs = container.logs().decode("utf-8", errors="ignore")
@@ -329,6 +361,26 @@ class BacktestService:
         except Exception as e:
             logger.warning(f"Failed to remove failed container {container.id}: {e}")
 
+    def _record_lean_execution(self, job: BacktestJob, container: Any, timer: StageTimer):
+        """
+        Record LEAN execution time for a finished container.
+
+        Uses the container's own start/finish timestamps when available,
+        falling back to the job's started_at and the current time.
+        """
+        seconds = None
+        try:
+            state = container.attrs["State"]
+            started = _parse_docker_timestamp(state["StartedAt"])
+            finished = _parse_docker_timestamp(state["FinishedAt"])
+            seconds = (finished - started).total_seconds()
+        except Exception:
+            if job.started_at:
+                seconds = (datetime.utcnow() - job.started_at).total_seconds()
+
+        if seconds is not None and seconds >= 0:
+            timer.record(LEAN_EXECUTION, seconds)
+
     def _update_running_job_status(self, job: BacktestJob, container: Any):
         """Update status for a running job."""
         try:
@@ -434,3 +486,12 @@ class BacktestService:
 
         except Exception as e:
             logger.error(f"Failed to cleanup old containers: {e}")
+
+
+def _parse_docker_timestamp(value: str) -> datetime:
+    """Parse a Docker RFC 3339 timestamp (nanosecond precision, UTC) to naive UTC."""
+    value = value.rstrip("Z")
+    if "." in value:
+        seconds, fraction = value.split(".", 1)
+        value = f"{seconds}.{fraction[:6]}"
+    return datetime.fromisoformat(value)
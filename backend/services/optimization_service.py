@@ -18,6 +18,14 @@ from backend.models.database import (
     SuccessCriteria,
 )
 from backend.schemas.optimization import OptimizationConfig, ParameterRange
+from backend.services.profiling import (
+    COMBINATION_GENERATION,
+    BATCH_CREATE,
+    JOB_SUBMISSION,
+    StageTimer,
+    merge_timings,
+    summarize_stage_timings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +36,7 @@ class OptimizationService:
     def __init__(self, db_session):
         """Initialize with database session."""
         self.db = db_session
+        self.timer = StageTimer(component="optimization_service")
 
     def generate_parameter_combinations(self, config_path: str) -> List[Dict[str, Any]]:
         """
@@ -90,7 +99,8 @@ class OptimizationService:
             param_ranges[param_name] = ParameterRange(**param_config)
 
         # Generate all combinations
-        combinations = self._generate_combinations(param_ranges)
+        with self.timer.span(COMBINATION_GENERATION):
+            combinations = self._generate_combinations(param_ranges)
 
         logger.info(
             f"Generated {len(combinations)} parameter combinations from {config_path}"
@@ -155,17 +165,21 @@ class OptimizationService:
         random_suffix = str(uuid.uuid4())[:6]
         batch_id = f"opt_{timestamp}_{random_suffix}"
 
-        # Create batch record
-        batch = OptimizationBatch(
-            id=batch_id,
-            strategy_name=strategy_name,
-            config_file=config_path,
-            total_jobs=len(combinations),
-            status="running",
-        )
+        # Create batch record (carrying combination generation time, if measured)
+        with self.timer.span(BATCH_CREATE):
+            batch = OptimizationBatch(
+                id=batch_id,
+                strategy_name=strategy_name,
+                config_file=config_path,
+                total_jobs=len(combinations),
+                status="running",
+                stage_timings=merge_timings(
+                    None, self.timer.pop(COMBINATION_GENERATION)
+                ),
+            )
 
-        self.db.add(batch)
-        self.db.commit()
+            self.db.add(batch)
+            self.db.commit()
 
         logger.info(
             f"Created optimization batch {batch_id} with {len(combinations)} jobs for strategy {strategy_name}"
@@ -199,23 +213,31 @@ class OptimizationService:
 
         job_ids = []
 
-        for i, params in enumerate(combinations):
-            # Create job record
-            job = BacktestJob(
-                batch_id=batch_id,
-                strategy_name=strategy_name,
-                lean_project_path=lean_project_path,
-                parameters=params,
-                symbols=symbols,
-                status="queued",
+        with self.timer.span(JOB_SUBMISSION):
+            for i, params in enumerate(combinations):
+                # Create job record
+                job = BacktestJob(
+                    batch_id=batch_id,
+                    strategy_name=strategy_name,
+                    lean_project_path=lean_project_path,
+                    parameters=params,
+                    symbols=symbols,
+                    status="queued",
+                )
+
+                self.db.add(job)
+                self.db.flush()  # Get job ID
+
+                job_ids.append(job.id)
+                logger.debug(f"Created job {job.id} for batch {batch_id}")
+
+        # Record batch-level timings (batch creation + job submission)
+        batch = self.db.query(OptimizationBatch).filter_by(id=batch_id).first()
+        if batch is not None:
+            batch.stage_timings = merge_timings(
+                batch.stage_timings, self.timer.pop(BATCH_CREATE, JOB_SUBMISSION)
             )
 
-            self.db.add(job)
-            self.db.flush()  # Get job ID
-
-            job_ids.append(job.id)
-            logger.debug(f"Created job {job.id} for batch {batch_id}")
-
         self.db.commit()
 
         logger.info(f"Submitted {len(job_ids)} backtest jobs for batch {batch_id}")
@@ -257,6 +279,37 @@ class OptimizationService:
             "best_result": best_result.parameters if best_result else None,
         }
 
+    def get_batch_profile(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get stage duration breakdown for an optimization batch.
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            Profile dict (batch-level stages plus per-job stage percentiles)
+            or None if not found
+        """
+        batch = self.db.query(OptimizationBatch).filter_by(id=batch_id).first()
+        if not batch:
+            return None
+
+        job_timings = [
+            timings
+            for (timings,) in self.db.query(BacktestJob.stage_timings)
+            .filter(BacktestJob.batch_id == batch_id)
+            .all()
+        ]
+        profiled = [timings for timings in job_timings if timings]
+
+        return {
+            "batch_id": batch.id,
+            "total_jobs": len(job_timings),
+            "profiled_jobs": len(profiled),
+            "batch_stages": batch.stage_timings or {},
+            "job_stages": summarize_stage_timings(profiled),
+        }
+
     def cancel_batch(self, batch_id: str) -> bool:
         """
         Cancel an optimization batch and mark remaining jobs as cancelled.
@@ -0,0 +1,172 @@
+"""
+V2 Parallel Optimization System - Stage Profiling
+Lightweight spans for timing pipeline stages (combination generation, DB inserts,
+container start, LEAN execution, result extraction, import) with percentile
+summaries and optional Prometheus export.
+"""
+
+import os
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import Histogram, start_http_server
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # Optional dependency
+    PROMETHEUS_AVAILABLE = False
+
+# Stage names recorded by the services
+COMBINATION_GENERATION = "combination_generation"
+BATCH_CREATE = "batch_create"
+JOB_SUBMISSION = "job_submission"
+JOB_INSERT = "job_insert"
+CONTAINER_START = "container_start"
+LEAN_EXECUTION = "lean_execution"
+RESULT_EXTRACTION = "result_extraction"
+RESULT_VALIDATION = "result_validation"
+RESULT_INSERT = "result_insert"
+
+PERCENTILES = (50, 95, 99)
+
+# Buckets spanning sub-millisecond DB calls to half-hour LEAN runs
+_HISTOGRAM_BUCKETS = (
+    0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800,
+)
+
+_stage_histogram = None
+_metrics_server_started = False
+
+
+def _get_histogram():
+    """Create the Prometheus stage histogram on first use."""
+    global _stage_histogram
+    if _stage_histogram is None and PROMETHEUS_AVAILABLE:
+        _stage_histogram = Histogram(
+            "backtest_stage_duration_seconds",
+            "Duration of optimization pipeline stages",
+            ["component", "stage"],
+            buckets=_HISTOGRAM_BUCKETS,
+        )
+    return _stage_histogram
+
+
+def start_metrics_server(port: Optional[int] = None) -> bool:
+    """
+    Start a local Prometheus scrape endpoint for stage durations.
+
+    Args:
+        port: Port to listen on (defaults to PROMETHEUS_METRICS_PORT env var)
+
+    Returns:
+        True if the endpoint is running, False if disabled or unavailable
+    """
+    global _metrics_server_started
+    if _metrics_server_started:
+        return True
+
+    if port is None:
+        port = os.getenv("PROMETHEUS_METRICS_PORT")
+    if not port:
+        return False
+
+    if not PROMETHEUS_AVAILABLE:
+        logger.warning("prometheus_client not installed - stage metrics export disabled")
+        return False
+
+    try:
+        start_http_server(int(port))
+    except OSError as e:
+        logger.warning(f"Failed to start Prometheus metrics endpoint on port {port}: {e}")
+        return False
+
+    _metrics_server_started = True
+    logger.info(f"Serving stage metrics for Prometheus on port {port}")
+    return True
+
+
+class StageTimer:
+    """Accumulates wall-clock durations of named stages."""
+
+    def __init__(self, component: str = "backend"):
+        """
+        Initialize timer.
+
+        Args:
+            component: Label identifying the service recording the stages
+        """
+        self.component = component
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as `stage` (recorded even if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage: str, seconds: float):
+        """Add a measured duration to `stage`."""
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+        histogram = _get_histogram()
+        if histogram is not None:
+            histogram.labels(component=self.component, stage=stage).observe(seconds)
+
+    def pop(self, *stages: str) -> Dict[str, float]:
+        """Remove and return the given stages (all stages if none given)."""
+        if not stages:
+            timings, self.timings = self.timings, {}
+            return timings
+        return {stage: self.timings.pop(stage) for stage in stages if stage in self.timings}
+
+
+def merge_timings(
+    existing: Optional[Dict[str, float]], new: Dict[str, float]
+) -> Dict[str, float]:
+    """Merge stage durations into a stored stage_timings value (returns a new dict)."""
+    merged = dict(existing or {})
+    for stage, seconds in new.items():
+        merged[stage] = round(merged.get(stage, 0.0) + seconds, 6)
+    return merged
+
+
+def summarize_stage_timings(
+    timings: Iterable[Optional[Dict[str, float]]]
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compute per-stage percentile breakdowns across jobs.
+
+    Args:
+        timings: One stage_timings dict per job (None entries are skipped)
+
+    Returns:
+        Dict of stage -> {count, total, mean, p50, p95, p99, max}
+    """
+    samples: Dict[str, list] = {}
+    for job_timings in timings:
+        for stage, seconds in (job_timings or {}).items():
+            samples.setdefault(stage, []).append(seconds)
+
+    summary = {}
+    for stage, values in samples.items():
+        arr = np.asarray(values, dtype=float)
+        p50, p95, p99 = np.percentile(arr, PERCENTILES)
+        summary[stage] = {
+            "count": int(arr.size),
+            "total": float(arr.sum()),
+            "mean": float(arr.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(arr.max()),
+        }
+    return summary
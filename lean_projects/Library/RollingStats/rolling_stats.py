@@ -0,0 +1,201 @@
+"""
+RollingStats Library
+
+Shared rolling-window statistics for the STR-* LEAN projects, with O(1)
+amortized updates per bar regardless of the lookback length:
+- RollingStats: mean, variance, std dev, z-score (rolling Welford update)
+- RollingMax / RollingMin: window extremes via monotonic deques
+- RollingSlope: least-squares slope vs. bar index from running sums
+
+Usage (after `lean library add "<Project>" "Library/RollingStats"`):
+    from RollingStats.rolling_stats import RollingStats
+
+    self.spread_stats = RollingStats(self.sma_period)
+    self.spread_stats.add(spread)
+    if self.spread_stats.is_ready:
+        z_score = self.spread_stats.zscore(spread)
+
+Category: LIBRARY (Indicators)
+"""
+
+from collections import deque
+
+
+class RollingStats:
+    """
+    Rolling mean / variance over the last `period` values.
+
+    Mean and sum of squared deviations are updated in place when a value
+    enters and another leaves the window (Welford's update), which avoids
+    the cancellation error of naive sum / sum-of-squares bookkeeping.
+    Variance is the population variance (divides by N), matching the
+    hand-rolled calculations it replaces.
+    """
+
+    def __init__(self, period):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = int(period)
+        self._window = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value):
+        """Add a value, evicting the oldest one once the window is full."""
+        value = float(value)
+        window = self._window
+
+        if len(window) < self.period:
+            window.append(value)
+            delta = value - self._mean
+            self._mean += delta / len(window)
+            self._m2 += delta * (value - self._mean)
+        else:
+            old = window.popleft()
+            window.append(value)
+            old_mean = self._mean
+            self._mean += (value - old) / self.period
+            self._m2 += (value - old) * (value - self._mean + old - old_mean)
+            if self._m2 < 0.0:
+                self._m2 = 0.0
+
+    @property
+    def is_ready(self):
+        """True once the window holds `period` values."""
+        return len(self._window) == self.period
+
+    @property
+    def count(self):
+        """Number of values currently in the window."""
+        return len(self._window)
+
+    @property
+    def mean(self):
+        """Mean of the values in the window."""
+        return self._mean
+
+    @property
+    def variance(self):
+        """Population variance of the values in the window."""
+        return self._m2 / len(self._window) if self._window else 0.0
+
+    @property
+    def std(self):
+        """Population standard deviation of the values in the window."""
+        return self.variance ** 0.5
+
+    def zscore(self, value):
+        """Z-score of `value` against the window (0 if std is 0)."""
+        std = self.std
+        return (value - self._mean) / std if std > 0 else 0.0
+
+
+class _RollingExtreme:
+    """Monotonic-deque rolling extreme; subclasses pick the comparison."""
+
+    def __init__(self, period):
+        if period < 1:
+            raise ValueError(f"period must be >= 1, got {period}")
+        self.period = int(period)
+        self._candidates = deque()  # (index, value), best value at the left
+        self._index = 0
+
+    def _dominates(self, new, old):
+        raise NotImplementedError
+
+    def add(self, value):
+        """Add a value, evicting values that fell out of the window."""
+        value = float(value)
+        candidates = self._candidates
+
+        while candidates and self._dominates(value, candidates[-1][1]):
+            candidates.pop()
+        candidates.append((self._index, value))
+
+        if candidates[0][0] <= self._index - self.period:
+            candidates.popleft()
+
+        self._index += 1
+
+    @property
+    def is_ready(self):
+        """True once `period` values have been added."""
+        return self._index >= self.period
+
+    @property
+    def count(self):
+        """Number of values currently in the window."""
+        return min(self._index, self.period)
+
+    @property
+    def value(self):
+        """Current window extreme (None before the first value)."""
+        return self._candidates[0][1] if self._candidates else None
+
+
+class RollingMax(_RollingExtreme):
+    """Maximum of the last `period` values."""
+
+    def _dominates(self, new, old):
+        return new >= old
+
+
+class RollingMin(_RollingExtreme):
+    """Minimum of the last `period` values."""
+
+    def _dominates(self, new, old):
+        return new <= old
+
+
+class RollingSlope:
+    """
+    Least-squares slope of the last `period` values against bar index.
+
+    Keeps sum(y) and sum(x*y) with x = 0..n-1 relative to the oldest value;
+    shifting the window subtracts sum(y) from sum(x*y), so each update is
+    O(1). The sums of x and x^2 have closed forms.
+    """
+
+    def __init__(self, period):
+        if period < 2:
+            raise ValueError(f"period must be >= 2, got {period}")
+        self.period = int(period)
+        self._window = deque()
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+
+    def add(self, value):
+        """Add a value, evicting the oldest one once the window is full."""
+        value = float(value)
+        window = self._window
+
+        if len(window) == self.period:
+            old = window.popleft()
+            self._sum_y -= old
+            # Re-index remaining values one step to the left
+            self._sum_xy -= self._sum_y
+
+        self._sum_xy += len(window) * value
+        self._sum_y += value
+        window.append(value)
+
+    @property
+    def is_ready(self):
+        """True once the window holds `period` values."""
+        return len(self._window) == self.period
+
+    @property
+    def count(self):
+        """Number of values currently in the window."""
+        return len(self._window)
+
+    @property
+    def slope(self):
+        """Slope per bar (0 with fewer than two values)."""
+        n = len(self._window)
+        if n < 2:
+            return 0.0
+        sum_x = n * (n - 1) / 2.0
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6.0
+        denominator = n * sum_xx - sum_x * sum_x
+        return (n * self._sum_xy - sum_x * self._sum_y) / denominator
@@ -19,6 +19,7 @@ Version: 1.0 (Initial Implementation)
 """
 
 from AlgorithmImports import *
+from RollingStats.rolling_stats import RollingMax, RollingStats
 
 
 class BreakoutMomentumEquity(QCAlgorithm):
@@ -51,9 +52,9 @@ class BreakoutMomentumEquity(QCAlgorithm):
         symbol_ticker = self.get_parameter("symbol", "QQQ")
         self.symbol = self.add_equity(symbol_ticker, Resolution.DAILY).symbol
 
-        # Track N-day highs and volumes manually
-        self.daily_highs = []
-        self.daily_volumes = []
+        # Track N-day highs (excluding today) and volumes with O(1) rolling windows
+        self.prior_highs = RollingMax(max(self.lookback_period - 1, 1))
+        self.volume_stats = RollingStats(self.lookback_period)
 
         # Track trade state
         self.entry_price = None
@@ -95,25 +96,17 @@ class BreakoutMomentumEquity(QCAlgorithm):
         current_high = bar.high
         current_volume = bar.volume
 
-        # Update tracking lists
-        self.daily_highs.append(current_high)
-        self.daily_volumes.append(current_volume)
-
-        # Keep only last N values (lookback period)
-        if len(self.daily_highs) > self.lookback_period:
-            self.daily_highs.pop(0)
-        if len(self.daily_volumes) > self.lookback_period:
-            self.daily_volumes.pop(0)
+        # N-day high (resistance level) over prior bars, read before adding today's high
+        n_day_high = self.prior_highs.value
+        self.prior_highs.add(current_high)
+        self.volume_stats.add(current_volume)
 
         # Need at least lookback_period bars before trading
-        if len(self.daily_highs) < self.lookback_period:
+        if not self.volume_stats.is_ready:
             return
 
-        # Calculate N-day high (resistance level)
-        n_day_high = max(self.daily_highs[:-1])  # Exclude today's high
-
         # Calculate average volume
-        avg_volume = sum(self.daily_volumes) / len(self.daily_volumes)
+        avg_volume = self.volume_stats.mean
 
         # Check if we have an open position
         if self.portfolio[self.symbol].invested:
@@ -22,6 +22,7 @@ Category: MEAN REVERSION (Statistical Arbitrage)
 """
 
 from AlgorithmImports import *
+from RollingStats.rolling_stats import RollingStats
 
 
 class StatisticalPairsTrading(QCAlgorithm):
@@ -54,8 +55,8 @@ class StatisticalPairsTrading(QCAlgorithm):
         # We'll trade QQQ (tech-heavy) vs SPY (broad market)
         self.symbol = self.qqq
 
-        # Rolling window to track spread history
-        self.spread_window = RollingWindow[float](self.sma_period)
+        # Rolling spread statistics (O(1) update per bar)
+        self.spread_stats = RollingStats(self.sma_period)
 
         # Track entry details
         self.entry_price = None
@@ -83,21 +84,18 @@ class StatisticalPairsTrading(QCAlgorithm):
         # Calculate spread (QQQ/SPY ratio)
         spread = qqq_price / spy_price
 
-        # Add to rolling window
-        self.spread_window.add(spread)
+        # Add to rolling statistics
+        self.spread_stats.add(spread)
 
         # Wait for window to be ready
-        if not self.spread_window.is_ready:
+        if not self.spread_stats.is_ready:
             return
 
-        # Calculate spread statistics
-        spread_values = list(self.spread_window)
-        spread_mean = sum(spread_values) / len(spread_values)
-        spread_variance = sum((x - spread_mean) ** 2 for x in spread_values) / len(spread_values)
-        spread_std = spread_variance ** 0.5
+        # Spread statistics
+        spread_mean = self.spread_stats.mean
 
         # Calculate z-score (how many std devs from mean)
-        z_score = (spread - spread_mean) / spread_std if spread_std > 0 else 0
+        z_score = self.spread_stats.zscore(spread)
 
         # Entry Logic: Spread divergence
         if not self.portfolio.invested:
@@ -27,6 +27,7 @@ import pandas as pd
 # Import utilities
 from scripts.databento_zip_extractor import DatabentoZipExtractor
 from scripts.data_file_scanner import DataFileScanner
+from scripts.job_queue import enqueue_job
 from utils.data_metadata import DataMetadataExtractor
 from utils.metadata_cache import get_cache_manager
 
@@ -233,7 +234,7 @@ async def process_databento_zip(request: DataProcessingRequest):
 
         # Submit job to Redis queue
         job_json = json.dumps(job_spec)
-        redis_client.zadd("data_processing_queue", {job_json: 1})  # Score of 1 for FIFO
+        enqueue_job(redis_client, "data_processing_queue", "data", job_json, 1)  # Score of 1 for FIFO
 
         # Store job status
         job_key = f"data_job:{job_id}"
@@ -12,6 +12,9 @@ from backend.schemas.ranking import (
     RankingListResponse,
     RankingFilter,
     RankingSummary,
+    LiveRankingUpdate,
+    LiveRankingResponse,
+    LiveRankingTop,
 )
 from backend.services.ranking_service import get_ranking_service
 
@@ -183,3 +186,59 @@ async def delete_ranking_job(job_id: str):
         raise HTTPException(status_code=404, detail=f"Ranking job {job_id} not found")
 
     return {"message": f"Ranking job {job_id} and its results deleted successfully"}
+
+
+@router.post("/live/{batch_id}/results", response_model=LiveRankingResponse)
+async def update_live_ranking(batch_id: str, update: LiveRankingUpdate):
+    """
+    Add newly arrived results to a batch's live ranking.
+
+    Only the posted results are scored, so this can be called after every
+    completed backtest while the batch is still running.
+    """
+    try:
+        service = get_ranking_service()
+        result = service.update_live_ranking(
+            batch_id, update.results, criteria_weights=update.criteria_weights
+        )
+        return LiveRankingResponse(**result)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to update live ranking: {str(e)}"
+        )
+
+
+@router.get("/live/{batch_id}/top", response_model=LiveRankingTop)
+async def get_live_ranking_top(
+    batch_id: str,
+    top_n: int = Query(15, ge=1, le=1000, description="Number of strategies"),
+):
+    """
+    Get the current top strategies of a batch's live ranking.
+
+    Served from the maintained top-N list without re-sorting all results.
+    """
+    service = get_ranking_service()
+    result = service.get_live_top(batch_id, top_n=top_n)
+
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail=f"No live ranking for batch {batch_id}"
+        )
+
+    return LiveRankingTop(**result)
+
+
+@router.delete("/live/{batch_id}")
+async def close_live_ranking(batch_id: str):
+    """Discard a batch's live ranking once the batch has finished."""
+    service = get_ranking_service()
+    if not service.close_live_ranking(batch_id):
+        raise HTTPException(
+            status_code=404, detail=f"No live ranking for batch {batch_id}"
+        )
+
+    return {"message": f"Live ranking for batch {batch_id} discarded"}
@@ -125,6 +125,37 @@ class RankingResult(BaseModel):
     execution_time_seconds: float
 
 
+class LiveRankingUpdate(BaseModel):
+    """Newly arrived results for a batch's live ranking"""
+
+    results: List[Dict[str, Any]] = Field(
+        ..., description="Result rows with strategy, symbol and performance metrics"
+    )
+    criteria_weights: Optional[Dict[str, float]] = Field(
+        None,
+        description="Scoring weights merged over the defaults (the merged weights must "
+        "sum to 100; only used when the live ranking is created)",
+    )
+
+
+class LiveRankingResponse(BaseModel):
+    """Live ranking state after an update"""
+
+    batch_id: str
+    total_ranked: int
+    rescored: int
+    updated_at: datetime
+
+
+class LiveRankingTop(BaseModel):
+    """Current best strategies of a batch's live ranking"""
+
+    batch_id: str
+    strategies: List[RankedStrategy]
+    total_ranked: int
+    updated_at: Optional[datetime] = None
+
+
 class RankingListResponse(BaseModel):
     """Paginated response for ranking job list"""
 
@@ -10,6 +10,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from backend.utils.database import DatabaseManager, get_db_manager
+from scripts.job_queue import enqueue_job
 from backend.models.backtest import Backtest
 
 
@@ -150,7 +151,7 @@ class BacktestService:
                 # Submit to Redis queue
                 job_json = json.dumps(job.to_dict())
                 print(f"DEBUG: Submitting job to Redis: {job_json[:100]}...")
-                result = self.redis.zadd("backtest_jobs", {job_json: -job.priority})
+                result = enqueue_job(self.redis, "backtest_jobs", "backtest", job_json, -job.priority)
                 print(f"DEBUG: Redis ZADD result: {result}")
                 jobs_submitted += 1
 
@@ -10,6 +10,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 from backend.utils.database import DatabaseManager, get_db_manager
+from scripts.job_queue import enqueue_job
 from backend.models.discovery import DiscoveryJob, DiscoveryResult
 
 
@@ -93,7 +94,7 @@ class DiscoveryService:
                 }
             )
 
-            result = self.redis.zadd("discovery_jobs", {job_json: -job_spec.priority})
+            result = enqueue_job(self.redis, "discovery_jobs", "discovery", job_json, -job_spec.priority)
 
             return (job_id, f"Submitted discovery job for scanner: {scanner_name}")
 
@@ -1,7 +1,10 @@
 # MLflow client service for programmatic access to experiments and runs (Epic 25 Story 6)
 
 import os
+import re
+import sys
 import json
+import time
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -26,9 +29,128 @@ from backend.schemas.mlflow import (
     MLflowRunsResponse,
     MLflowRunDetailResponse,
 )
+from backend.utils.cache import TTLCache, approximate_size
 
 logger = logging.getLogger(__name__)
 
+# Run statuses whose metrics/end time may still change after the run is cached
+UNFINISHED_STATUSES = ("RUNNING", "SCHEDULED")
+
+# order_by clause: [attributes.|metrics.|params.|tags.]name [ASC|DESC]
+_ORDER_BY_PATTERN = re.compile(
+    r"^(?:(attributes|metrics|params|tags)\.)?(`[^`]+`|[\w.\-]+)(?:\s+(asc|desc))?$",
+    re.IGNORECASE,
+)
+_SORTABLE_ATTRIBUTES = set(MLflowRunInfo.model_fields)
+
+
+def _start_time_ms(run: MLflowRun) -> int:
+    """Run start time in epoch milliseconds (-1 if unknown)"""
+    start_time = run.info.start_time
+    return int(start_time.timestamp() * 1000) if start_time else -1
+
+
+def _parse_order_by(order_by: List[str]) -> Optional[List[Tuple[str, str, bool]]]:
+    """
+    Parse MLflow order_by clauses into (kind, name, descending) tuples
+
+    Returns None if any clause cannot be evaluated against cached runs.
+    """
+    clauses = []
+    for clause in order_by:
+        match = _ORDER_BY_PATTERN.match(clause.strip())
+        if not match:
+            return None
+        kind, name, direction = match.groups()
+        kind = (kind or "attributes").lower()
+        name = name.strip("`")
+        if kind == "attributes" and name not in _SORTABLE_ATTRIBUTES:
+            return None
+        clauses.append((kind, name, (direction or "asc").lower() == "desc"))
+    return clauses
+
+
+def _sort_value(run: MLflowRun, kind: str, name: str) -> Any:
+    if kind == "attributes":
+        return getattr(run.info, name)
+    return getattr(run.data, kind).get(name)
+
+
+def _sort_runs(
+    runs: List[MLflowRun], clauses: List[Tuple[str, str, bool]]
+) -> List[MLflowRun]:
+    """Sort runs by parsed order_by clauses, missing values last"""
+    ordered = list(runs)
+    # Stable sorts applied from the least to the most significant clause
+    for kind, name, descending in reversed(clauses):
+        present = [run for run in ordered if _sort_value(run, kind, name) is not None]
+        missing = [run for run in ordered if _sort_value(run, kind, name) is None]
+        present.sort(key=lambda run: _sort_value(run, kind, name), reverse=descending)
+        ordered = present + missing
+    return ordered
+
+
+class _RunIndex:
+    """Cached runs of one experiment ordered by start time (newest first)"""
+
+    def __init__(
+        self,
+        runs: List[MLflowRun],
+        loaded_at: Optional[float] = None,
+        run_sizes: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            runs: Runs of the experiment in any order
+            loaded_at: Monotonic time of the last full load (now if None)
+            run_sizes: Known approximate sizes by run ID (measured if missing)
+        """
+        now = time.monotonic()
+        self.runs = sorted(runs, key=_start_time_ms, reverse=True)
+        self.watermark = _start_time_ms(self.runs[0]) if self.runs else -1
+        self.loaded_at = now if loaded_at is None else loaded_at
+        self.refreshed_at = now
+        self._views: Dict[Tuple, List[MLflowRun]] = {}
+
+        known = run_sizes or {}
+        self._run_sizes = {
+            run.info.run_id: known.get(run.info.run_id) or approximate_size(run)
+            for run in self.runs
+        }
+        self.size = sys.getsizeof(self.runs) + sum(self._run_sizes.values())
+
+    def unfinished_run_ids(self) -> List[str]:
+        return [
+            run.info.run_id
+            for run in self.runs
+            if run.info.status in UNFINISHED_STATUSES
+        ]
+
+    def merge(self, runs: List[MLflowRun]) -> "_RunIndex":
+        """Return a new index with `runs` added or replacing cached runs"""
+        by_id = {run.info.run_id: run for run in self.runs}
+        by_id.update((run.info.run_id, run) for run in runs)
+        # Only added or replaced runs are measured
+        run_sizes = dict(self._run_sizes)
+        for run in runs:
+            run_sizes.pop(run.info.run_id, None)
+        return _RunIndex(list(by_id.values()), loaded_at=self.loaded_at, run_sizes=run_sizes)
+
+    def ordered(self, clauses: List[Tuple[str, str, bool]]) -> List[MLflowRun]:
+        """Runs sorted by parsed order_by clauses (memoized per ordering)"""
+        view_key = tuple(clauses)
+        view = self._views.get(view_key)
+        if view is None:
+            view = self._views[view_key] = _sort_runs(self.runs, clauses)
+        return view
+
+
+def _cached_size(value: Any) -> int:
+    """Size of a cached value; run indexes keep a running total of their runs"""
+    if isinstance(value, _RunIndex):
+        return value.size
+    return approximate_size(value)
+
 
 class MLflowClientService:
     """Service for programmatic access to MLflow experiments and runs with caching"""
@@ -39,7 +161,24 @@ class MLflowClientService:
         redis_host: str = "redis",
         redis_port: int = 6379,
         cache_ttl_seconds: int = 300,  # 5 minutes default
+        runs_refresh_seconds: int = 15,
+        cache_max_entries: int = 1024,
+        cache_max_bytes: int = 64 * 1024 * 1024,
     ):
+        """
+        Initialize service
+
+        Args:
+            tracking_uri: MLflow tracking URI (env/Docker default if None)
+            redis_host: Redis host for the shared cache tier
+            redis_port: Redis port
+            cache_ttl_seconds: Lifetime of cached entries; cached run lists are
+                fully reloaded after this long
+            runs_refresh_seconds: Age after which a cached run list is topped up
+                with runs newer than its watermark
+            cache_max_entries: Maximum entries in the in-process cache
+            cache_max_bytes: Approximate memory bound of the in-process cache
+        """
         if tracking_uri is None:
             # Try environment variable first
             tracking_uri = os.environ.get("MLFLOW_TRACKING_URI")
@@ -55,6 +194,15 @@ class MLflowClientService:
         self.redis_host = redis_host
         self.redis_port = redis_port
         self.cache_ttl = cache_ttl_seconds
+        self.runs_refresh_seconds = runs_refresh_seconds
+
+        # In-process cache in front of Redis and MLflow
+        self.cache = TTLCache(
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_bytes,
+            default_ttl=cache_ttl_seconds,
+            sizeof=_cached_size,
+        )
 
         # Initialize Redis for caching
         self.redis = redis.Redis(
@@ -95,22 +243,93 @@ class MLflowClientService:
     def _set_cached_data(
         self, cache_key: str, data: Any, ttl: Optional[int] = None
     ) -> None:
-        """Store data in Redis cache"""
+        """Store data in Redis cache (datetimes are stored as ISO strings)"""
         try:
             ttl = ttl or self.cache_ttl
-            self.redis.setex(cache_key, ttl, json.dumps(data))
+            self.redis.setex(cache_key, ttl, json.dumps(data, default=_json_default))
         except Exception as e:
             logger.warning(f"Failed to cache data for key {cache_key}: {e}")
 
     def _clear_cache_pattern(self, pattern: str) -> None:
-        """Clear cache keys matching a pattern"""
+        """Clear Redis cache keys matching a pattern"""
         try:
-            keys = self.redis.keys(pattern)
+            keys = list(self.redis.scan_iter(match=pattern))
             if keys:
                 self.redis.delete(*keys)
         except Exception as e:
             logger.warning(f"Failed to clear cache pattern {pattern}: {e}")
 
+    def _search_runs(
+        self,
+        experiment_id: str,
+        filter_string: str = "",
+        order_by: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> List[MLflowRun]:
+        """Query runs from the tracking server and convert them to our schema"""
+        kwargs = {"max_results": max_results} if max_results else {}
+        mlflow_runs_df = mlflow.search_runs(
+            experiment_ids=[experiment_id],
+            filter_string=filter_string,
+            order_by=order_by,
+            **kwargs,
+        )
+        return self._runs_from_dataframe(mlflow_runs_df)
+
+    @staticmethod
+    def _runs_from_dataframe(mlflow_runs_df: pd.DataFrame) -> List[MLflowRun]:
+        """Convert a mlflow.search_runs DataFrame to MLflowRun objects"""
+        if mlflow_runs_df.empty:
+            return []
+
+        # Group data columns once instead of rescanning them for every row
+        prefixed = {"metrics.": [], "params.": [], "tags.": []}
+        for col in mlflow_runs_df.columns:
+            for prefix, columns in prefixed.items():
+                if col.startswith(prefix):
+                    columns.append((col, col[len(prefix) :]))
+
+        runs = []
+        for run_row in mlflow_runs_df.to_dict("records"):
+            run_info = MLflowRunInfo(
+                run_id=run_row["run_id"],
+                run_uuid=run_row.get(
+                    "run_uuid", run_row["run_id"]
+                ),  # Fallback if run_uuid not available
+                experiment_id=str(run_row["experiment_id"]),
+                user_id=run_row.get("user_id", "unknown"),
+                status=run_row["status"],
+                start_time=pd.to_datetime(run_row["start_time"])
+                if pd.notna(run_row["start_time"])
+                else None,
+                end_time=pd.to_datetime(run_row["end_time"])
+                if pd.notna(run_row["end_time"])
+                else None,
+                artifact_uri=run_row.get("artifact_uri", ""),
+                lifecycle_stage=run_row.get("lifecycle_stage", "active"),
+            )
+
+            metrics = {
+                name: float(run_row[col])
+                for col, name in prefixed["metrics."]
+                if pd.notna(run_row[col])
+            }
+            params = {
+                name: str(run_row[col])
+                for col, name in prefixed["params."]
+                if pd.notna(run_row[col])
+            }
+            tags = {
+                name: str(run_row[col])
+                for col, name in prefixed["tags."]
+                if pd.notna(run_row[col])
+            }
+
+            run_data = MLflowRunData(metrics=metrics, params=params, tags=tags)
+            runs.append(MLflowRun(info=run_info, data=run_data))
+
+        return runs
+
     def list_experiments(self) -> MLflowExperimentsResponse:
         """
         List all MLflow experiments
@@ -122,51 +341,44 @@ class MLflowClientService:
             raise RuntimeError("MLflow client not available")
 
         cache_key = self._get_cache_key("experiments")
-        cached_data = self._get_cached_data(cache_key)
-
-        if cached_data:
-            experiments = [MLflowExperiment(**exp) for exp in cached_data]
-            return MLflowExperimentsResponse(experiments=experiments)
-
         try:
-            # Get experiments from MLflow
-            mlflow_experiments = mlflow.search_experiments()
-
-            experiments = []
-            for exp in mlflow_experiments:
-                experiment = MLflowExperiment(
-                    experiment_id=exp.experiment_id,
-                    name=exp.name,
-                    lifecycle_stage=exp.lifecycle_stage,
-                    artifact_location=exp.artifact_location,
-                    creation_time=datetime.fromtimestamp(exp.creation_time / 1000)
-                    if exp.creation_time
-                    else None,
-                    last_update_time=datetime.fromtimestamp(exp.last_update_time / 1000)
-                    if exp.last_update_time
-                    else None,
-                )
-                experiments.append(experiment)
-
-            # Cache the results (convert datetime to string for JSON serialization)
-            cache_data = []
-            for exp in experiments:
-                exp_dict = exp.dict()
-                if exp_dict.get("creation_time"):
-                    exp_dict["creation_time"] = exp_dict["creation_time"].isoformat()
-                if exp_dict.get("last_update_time"):
-                    exp_dict["last_update_time"] = exp_dict[
-                        "last_update_time"
-                    ].isoformat()
-                cache_data.append(exp_dict)
-            self._set_cached_data(cache_key, cache_data)
-
+            experiments = self.cache.get_or_load(
+                cache_key, lambda: self._load_experiments(cache_key)
+            )
             return MLflowExperimentsResponse(experiments=experiments)
 
         except Exception as e:
             logger.error(f"Failed to list MLflow experiments: {e}")
             raise RuntimeError(f"Failed to retrieve experiments: {str(e)}")
 
+    def _load_experiments(self, cache_key: str) -> List[MLflowExperiment]:
+        """Load experiments from Redis, falling back to the tracking server"""
+        cached_data = self._get_cached_data(cache_key)
+        if cached_data:
+            return [MLflowExperiment(**exp) for exp in cached_data]
+
+        # Get experiments from MLflow
+        mlflow_experiments = mlflow.search_experiments()
+
+        experiments = []
+        for exp in mlflow_experiments:
+            experiment = MLflowExperiment(
+                experiment_id=exp.experiment_id,
+                name=exp.name,
+                lifecycle_stage=exp.lifecycle_stage,
+                artifact_location=exp.artifact_location,
+                creation_time=datetime.fromtimestamp(exp.creation_time / 1000)
+                if exp.creation_time
+                else None,
+                last_update_time=datetime.fromtimestamp(exp.last_update_time / 1000)
+                if exp.last_update_time
+                else None,
+            )
+            experiments.append(experiment)
+
+        self._set_cached_data(cache_key, [exp.dict() for exp in experiments])
+        return experiments
+
     def get_experiment_runs(
         self,
         experiment_id: str,
@@ -177,6 +389,13 @@ class MLflowClientService:
         """
         Get runs for a specific experiment with pagination
 
+        Pages are served from a cached run list per experiment. Once the list
+        is older than `runs_refresh_seconds` only runs started since its
+        watermark (plus runs that were still in progress) are fetched; the
+        full list is reloaded after `cache_ttl` seconds. Experiments whose
+        run list exceeds the cache's memory bound are paged by the tracking
+        server instead.
+
         Args:
             experiment_id: MLflow experiment ID
             page: Page number (1-based)
@@ -189,116 +408,26 @@ class MLflowClientService:
         if not self.mlflow_available:
             raise RuntimeError("MLflow client not available")
 
-        cache_key = self._get_cache_key(
-            f"runs:{experiment_id}:page_{page}:size_{page_size}"
-        )
-        cached_data = self._get_cached_data(cache_key)
-
-        if cached_data:
-            runs = [MLflowRun(**run) for run in cached_data["runs"]]
-            return MLflowRunsResponse(
-                runs=runs,
-                total=cached_data["total"],
-                page=page,
-                page_size=page_size,
-                total_pages=cached_data["total_pages"],
-            )
-
         try:
             # Default ordering by start time descending
             if not order_by:
                 order_by = ["start_time DESC"]
 
-            # Get runs from MLflow (returns pandas DataFrame)
-            mlflow_runs_df = mlflow.search_runs(
-                experiment_ids=[experiment_id],
-                order_by=order_by,
-                max_results=page_size * page,  # Get enough for pagination
-            )
-
-            # Convert DataFrame to our schema
-            runs = []
-            for idx, run_row in mlflow_runs_df.iterrows():
-                # Extract run info from DataFrame columns
-                run_info = MLflowRunInfo(
-                    run_id=run_row["run_id"],
-                    run_uuid=run_row.get(
-                        "run_uuid", run_row["run_id"]
-                    ),  # Fallback if run_uuid not available
-                    experiment_id=str(run_row["experiment_id"]),
-                    user_id=run_row.get("user_id", "unknown"),
-                    status=run_row["status"],
-                    start_time=pd.to_datetime(run_row["start_time"])
-                    if pd.notna(run_row["start_time"])
-                    else None,
-                    end_time=pd.to_datetime(run_row["end_time"])
-                    if pd.notna(run_row["end_time"])
-                    else None,
-                    artifact_uri=run_row.get("artifact_uri", ""),
-                    lifecycle_stage=run_row.get("lifecycle_stage", "active"),
+            clauses = _parse_order_by(order_by)
+            index = self._get_run_index(experiment_id) if clauses is not None else None
+            if index is None:
+                # Ordering we cannot evaluate locally: let MLflow sort this page
+                total, paginated_runs = self._get_ordered_runs_page(
+                    experiment_id, page, page_size, order_by
                 )
-
-                # Extract metrics, params, and tags from DataFrame
-                metrics = {}
-                params = {}
-                tags = {}
-
-                # Parse metrics (columns starting with 'metrics.')
-                for col in mlflow_runs_df.columns:
-                    if col.startswith("metrics."):
-                        metric_name = col[8:]  # Remove 'metrics.' prefix
-                        if pd.notna(run_row[col]):
-                            metrics[metric_name] = float(run_row[col])
-
-                # Parse params (columns starting with 'params.')
-                for col in mlflow_runs_df.columns:
-                    if col.startswith("params."):
-                        param_name = col[7:]  # Remove 'params.' prefix
-                        if pd.notna(run_row[col]):
-                            params[param_name] = str(run_row[col])
-
-                # Parse tags (columns starting with 'tags.')
-                for col in mlflow_runs_df.columns:
-                    if col.startswith("tags."):
-                        tag_name = col[5:]  # Remove 'tags.' prefix
-                        if pd.notna(run_row[col]):
-                            tags[tag_name] = str(run_row[col])
-
-                run_data = MLflowRunData(metrics=metrics, params=params, tags=tags)
-
-                mlflow_run = MLflowRun(info=run_info, data=run_data)
-                runs.append(mlflow_run)
-
-            # Calculate pagination info
-            total = len(runs)  # Note: This is approximate since we limited results
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_runs = runs[start_idx:end_idx]
+            else:
+                runs = index.ordered(clauses)
+                start_idx = (page - 1) * page_size
+                paginated_runs = runs[start_idx : start_idx + page_size]
+                total = len(runs)
 
             total_pages = (total + page_size - 1) // page_size
 
-            # Cache the results (convert datetime to string for JSON serialization)
-            cache_runs = []
-            for run in paginated_runs:
-                run_dict = run.dict()
-                # Convert datetime objects to ISO format strings
-                if run_dict["info"].get("start_time"):
-                    run_dict["info"]["start_time"] = run_dict["info"][
-                        "start_time"
-                    ].isoformat()
-                if run_dict["info"].get("end_time"):
-                    run_dict["info"]["end_time"] = run_dict["info"][
-                        "end_time"
-                    ].isoformat()
-                cache_runs.append(run_dict)
-
-            cache_data = {
-                "runs": cache_runs,
-                "total": total,
-                "total_pages": total_pages,
-            }
-            self._set_cached_data(cache_key, cache_data)
-
             return MLflowRunsResponse(
                 runs=paginated_runs,
                 total=total,
@@ -311,6 +440,92 @@ class MLflowClientService:
             logger.error(f"Failed to get runs for experiment {experiment_id}: {e}")
             raise RuntimeError(f"Failed to retrieve experiment runs: {str(e)}")
 
+    def _get_run_index(self, experiment_id: str) -> Optional[_RunIndex]:
+        """
+        Get the cached run list of an experiment, topping it up if stale
+
+        Returns:
+            The run index, or None if it is too large to cache (the caller
+            pages on the tracking server until the marker expires)
+        """
+        cache_key = self._get_cache_key(f"runs:{experiment_id}")
+        too_large_key = f"{cache_key}:too_large"
+        if self.cache.get(too_large_key):
+            return None
+
+        index = self.cache.get_or_load(
+            cache_key, lambda: _RunIndex(self._search_runs(experiment_id))
+        )
+
+        if time.monotonic() - index.refreshed_at >= self.runs_refresh_seconds:
+            # ttl=0: concurrent refreshes share one fetch but nothing extra is cached
+            index = self.cache.get_or_load(
+                f"{cache_key}:refresh",
+                lambda: self._refresh_run_index(cache_key, experiment_id, index),
+                ttl=0,
+            )
+
+        if index.size > self.cache.max_bytes:
+            # Never cached, so every request would reload the whole experiment
+            logger.warning(
+                f"Runs of experiment {experiment_id} exceed the cache size "
+                f"({index.size} > {self.cache.max_bytes} bytes); paging on the server"
+            )
+            self.cache.set(too_large_key, True)
+            return None
+        return index
+
+    def _refresh_run_index(
+        self, cache_key: str, experiment_id: str, index: _RunIndex
+    ) -> _RunIndex:
+        """Merge runs newer than the watermark and in-progress runs into the index"""
+        current = self.cache.get(cache_key)
+        if current is not None:
+            if time.monotonic() - current.refreshed_at < self.runs_refresh_seconds:
+                return current  # Refreshed by another caller in the meantime
+            index = current
+
+        # >= so runs sharing the watermark millisecond are not missed
+        updates = self._search_runs(
+            experiment_id, filter_string=f"attributes.start_time >= {index.watermark}"
+        )
+        unfinished = index.unfinished_run_ids()
+        if unfinished:
+            run_ids = ", ".join(f"'{run_id}'" for run_id in unfinished)
+            updates += self._search_runs(
+                experiment_id, filter_string=f"attributes.run_id IN ({run_ids})"
+            )
+
+        refreshed = index.merge(updates)
+        # Keep the original expiry so the list is still fully reloaded periodically
+        remaining = self.cache_ttl - (time.monotonic() - refreshed.loaded_at)
+        self.cache.set(cache_key, refreshed, ttl=remaining)
+        return refreshed
+
+    def _get_ordered_runs_page(
+        self,
+        experiment_id: str,
+        page: int,
+        page_size: int,
+        order_by: List[str],
+    ) -> Tuple[int, List[MLflowRun]]:
+        """Fetch one page of runs sorted by the tracking server"""
+        cache_key = self._get_cache_key(
+            f"runs:{experiment_id}:order_{','.join(order_by)}:page_{page}:size_{page_size}"
+        )
+
+        def load() -> Tuple[int, List[MLflowRun]]:
+            runs = self._search_runs(
+                experiment_id,
+                order_by=order_by,
+                max_results=page_size * page,  # Get enough for pagination
+            )
+            start_idx = (page - 1) * page_size
+            # Note: total is approximate since we limited results
+            return len(runs), runs[start_idx : start_idx + page_size]
+
+        return self.cache.get_or_load(cache_key, load, ttl=self.runs_refresh_seconds)
+
     def get_run_details(self, run_id: str) -> MLflowRunDetailResponse:
         """
         Get detailed information for a specific run
@@ -325,63 +540,54 @@ class MLflowClientService:
             raise RuntimeError("MLflow client not available")
 
         cache_key = self._get_cache_key(f"run:{run_id}")
-        cached_data = self._get_cached_data(cache_key)
-
-        if cached_data:
-            run = MLflowRun(**cached_data)
-            return MLflowRunDetailResponse(run=run)
-
         try:
-            # Get run from MLflow
-            mlflow_run = mlflow.get_run(run_id)
+            run = self.cache.get_or_load(cache_key, lambda: self._load_run(cache_key, run_id))
+            return MLflowRunDetailResponse(run=run)
 
-            run_info = MLflowRunInfo(
-                run_id=mlflow_run.info.run_id,
-                run_uuid=getattr(
-                    mlflow_run.info, "run_uuid", mlflow_run.info.run_id
-                ),  # Fallback if run_uuid not available
-                experiment_id=mlflow_run.info.experiment_id,
-                user_id=mlflow_run.info.user_id,
-                status=mlflow_run.info.status,
-                start_time=datetime.fromtimestamp(mlflow_run.info.start_time / 1000)
-                if mlflow_run.info.start_time
-                else None,
-                end_time=datetime.fromtimestamp(mlflow_run.info.end_time / 1000)
-                if mlflow_run.info.end_time
-                else None,
-                artifact_uri=mlflow_run.info.artifact_uri,
-                lifecycle_stage=mlflow_run.info.lifecycle_stage,
-            )
+        except Exception as e:
+            logger.error(f"Failed to get run details for {run_id}: {e}")
+            raise RuntimeError(f"Failed to retrieve run details: {str(e)}")
 
-            # Extract metrics, params, and tags
-            metrics = (
-                {k: v for k, v in mlflow_run.data.metrics.items()}
-                if mlflow_run.data.metrics
-                else {}
-            )
-            params = (
-                {k: v for k, v in mlflow_run.data.params.items()}
-                if mlflow_run.data.params
-                else {}
-            )
-            tags = (
-                {k: v for k, v in mlflow_run.data.tags.items()}
-                if mlflow_run.data.tags
-                else {}
-            )
+    def _load_run(self, cache_key: str, run_id: str) -> MLflowRun:
+        """Load a run from Redis, falling back to the tracking server"""
+        cached_data = self._get_cached_data(cache_key)
+        if cached_data:
+            return MLflowRun(**cached_data)
+
+        # Get run from MLflow
+        mlflow_run = mlflow.get_run(run_id)
+
+        run_info = MLflowRunInfo(
+            run_id=mlflow_run.info.run_id,
+            run_uuid=getattr(
+                mlflow_run.info, "run_uuid", mlflow_run.info.run_id
+            ),  # Fallback if run_uuid not available
+            experiment_id=mlflow_run.info.experiment_id,
+            user_id=mlflow_run.info.user_id,
+            status=mlflow_run.info.status,
+            start_time=datetime.fromtimestamp(mlflow_run.info.start_time / 1000)
+            if mlflow_run.info.start_time
+            else None,
+            end_time=datetime.fromtimestamp(mlflow_run.info.end_time / 1000)
+            if mlflow_run.info.end_time
+            else None,
+            artifact_uri=mlflow_run.info.artifact_uri,
+            lifecycle_stage=mlflow_run.info.lifecycle_stage,
+        )
 
-            run_data = MLflowRunData(metrics=metrics, params=params, tags=tags)
+        # Extract metrics, params, and tags
+        metrics = dict(mlflow_run.data.metrics) if mlflow_run.data.metrics else {}
+        params = dict(mlflow_run.data.params) if mlflow_run.data.params else {}
+        tags = dict(mlflow_run.data.tags) if mlflow_run.data.tags else {}
 
-            run = MLflowRun(info=run_info, data=run_data)
+        run_data = MLflowRunData(metrics=metrics, params=params, tags=tags)
 
-            # Cache the result
-            self._set_cached_data(cache_key, run.dict())
+        run = MLflowRun(info=run_info, data=run_data)
 
-            return MLflowRunDetailResponse(run=run)
+        # Cache the result
+        self._set_cached_data(cache_key, run.dict())
 
-        except Exception as e:
-            logger.error(f"Failed to get run details for {run_id}: {e}")
-            raise RuntimeError(f"Failed to retrieve run details: {str(e)}")
+        return run
 
     def invalidate_experiment_cache(self, experiment_id: Optional[str] = None) -> None:
         """
@@ -393,19 +599,29 @@ class MLflowClientService:
         try:
             if experiment_id:
                 # Clear specific experiment cache
-                self._clear_cache_pattern(
-                    self._get_cache_key(f"runs:{experiment_id}:*")
-                )
-                self._clear_cache_pattern(
-                    self._get_cache_key(f"run:*")
-                )  # Individual runs might be affected
+                runs_key = self._get_cache_key(f"runs:{experiment_id}")
+                self.cache.delete(runs_key)
+                self.cache.delete_prefix(f"{runs_key}:")
+                # Individual runs might be affected
+                self.cache.delete_prefix(self._get_cache_key("run:"))
+
+                self._clear_cache_pattern(f"{runs_key}:*")
+                self._clear_cache_pattern(self._get_cache_key("run:*"))
             else:
                 # Clear all MLflow cache
+                self.cache.clear()
                 self._clear_cache_pattern(self._get_cache_key("*"))
         except Exception as e:
             logger.warning(f"Failed to invalidate MLflow cache: {e}")
 
 
+def _json_default(value: Any) -> Any:
+    """JSON fallback for datetimes stored in Redis"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 # Global service instance
 _mlflow_service = None
 
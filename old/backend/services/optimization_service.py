@@ -65,7 +65,8 @@ class OptimizationService:
         if MLFLOW_LOGGER_AVAILABLE:
             try:
                 self.mlflow_logger = MLflowBacktestLogger(
-                    tracking_uri=None  # Will use environment variable or default
+                    tracking_uri=None,  # Will use environment variable or default
+                    async_logging=True,  # Queue trial runs off the request path
                 )
                 logger.info("MLflow logger initialized for optimization tracking")
             except Exception as e:
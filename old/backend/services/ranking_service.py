@@ -4,13 +4,18 @@ import os
 import json
 import uuid
 import redis
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+import pandas as pd
+
 from backend.utils.database import DatabaseManager, get_db_manager
 from backend.models.discovery import RankingJob, RankingResult
+from scripts.strategy_ranker import StrategyRanker
+from scripts.job_queue import enqueue_job
 
 
 @dataclass
@@ -36,6 +41,11 @@ class RankingService:
         )
         self.db_manager = get_db_manager()
 
+        # Live rankers for running batches, updated as results arrive
+        self._live_rankers: Dict[str, StrategyRanker] = {}
+        self._live_updated: Dict[str, datetime] = {}
+        self._live_lock = threading.Lock()
+
     def submit_ranking_job(
         self,
         input_type: str,
@@ -107,7 +117,7 @@ class RankingService:
                 }
             )
 
-            result = self.redis.zadd("ranking_jobs", {job_json: -job_spec.priority})
+            result = enqueue_job(self.redis, "ranking_jobs", "ranking", job_json, -job_spec.priority)
 
             return (job_id, f"Submitted ranking job for input type: {input_type}")
 
@@ -398,6 +408,139 @@ class RankingService:
         finally:
             session.close()
 
+    def update_live_ranking(
+        self,
+        batch_id: str,
+        results: List[Dict[str, Any]],
+        criteria_weights: Optional[Dict[str, float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Merge newly arrived results into the live ranking of a batch
+
+        Only the given results are scored; results already ranked (same
+        backtest_id/result_id/job_id) are re-scored only if their metrics changed.
+
+        Args:
+            batch_id: Batch whose ranking to update
+            results: Result rows (strategy, symbol, sharpe_ratio, max_drawdown,
+                win_rate, total_trades, profit_factor, optional id columns)
+            criteria_weights: Scoring weights merged over the ranker's defaults,
+                only used when the live ranking is created
+
+        Returns:
+            Dict with batch_id, total_ranked, rescored and updated_at
+
+        Raises:
+            ValueError: If a weight names an unknown criterion or the merged
+                weights do not sum to 100
+        """
+        with self._live_lock:
+            ranker = self._live_rankers.get(batch_id)
+            if ranker is None:
+                ranker = StrategyRanker()
+                if criteria_weights:
+                    ranker.scoring_weights = self._merge_criteria_weights(
+                        ranker.scoring_weights, criteria_weights
+                    )
+                self._live_rankers[batch_id] = ranker
+            elif criteria_weights:
+                self._merge_criteria_weights(ranker.scoring_weights, criteria_weights)
+
+            rescored = 0
+            if results:
+                results_df = ranker._prepare_csv_frame(pd.DataFrame(results))
+                rescored = ranker.update_rankings(results_df)
+            self._live_updated[batch_id] = datetime.now()
+
+            return {
+                "batch_id": batch_id,
+                "total_ranked": len(ranker.ranking_table or []),
+                "rescored": rescored,
+                "updated_at": self._live_updated[batch_id],
+            }
+
+    @staticmethod
+    def _merge_criteria_weights(
+        defaults: Dict[str, float], criteria_weights: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Merge partial scoring weights over the defaults, rejecting unknown criteria"""
+        unknown = sorted(set(criteria_weights) - set(defaults))
+        if unknown:
+            raise ValueError(
+                f"Unknown criteria weights: {', '.join(unknown)} "
+                f"(expected {', '.join(defaults)})"
+            )
+
+        weights = {**defaults, **criteria_weights}
+        total = sum(weights.values())
+        if abs(total - 100.0) > 0.1:  # Allow small floating point errors
+            raise ValueError(f"Criteria weights must sum to 100, got {total}")
+        return weights
+
+    def get_live_top(self, batch_id: str, top_n: int = 15) -> Optional[Dict[str, Any]]:
+        """
+        Get the current best strategies of a batch's live ranking
+
+        Args:
+            batch_id: Batch to query
+            top_n: Number of strategies to return
+
+        Returns:
+            Dict with batch_id, strategies, total_ranked and updated_at, or None
+            if the batch has no live ranking
+        """
+        with self._live_lock:
+            ranker = self._live_rankers.get(batch_id)
+            if ranker is None:
+                return None
+            top_df = ranker.get_top_strategies(top_n=top_n)
+            total_ranked = len(ranker.ranking_table or [])
+            updated_at = self._live_updated.get(batch_id)
+
+        id_columns = [col for col in ("backtest_id", "result_id", "job_id") if col in top_df.columns]
+        strategies = []
+        for row in top_df.to_dict("records"):
+            strategies.append(
+                {
+                    "strategy_name": row.get("strategy"),
+                    "symbol": row.get("symbol"),
+                    "sharpe_ratio": row.get("sharpe_ratio"),
+                    "max_drawdown": row.get("max_drawdown"),
+                    "win_rate": row.get("win_rate"),
+                    "total_trades": row.get("total_trades"),
+                    "profit_factor": row.get("profit_factor"),
+                    "sharpe_score": row.get("sharpe_score"),
+                    "consistency_score": row.get("consistency_score"),
+                    "drawdown_score": row.get("drawdown_score"),
+                    "frequency_score": row.get("frequency_score"),
+                    "efficiency_score": row.get("efficiency_score"),
+                    "composite_score": row["composite_score"],
+                    "rank": row["rank"],
+                    "metadata": {col: row[col] for col in id_columns} or None,
+                }
+            )
+
+        return {
+            "batch_id": batch_id,
+            "strategies": strategies,
+            "total_ranked": total_ranked,
+            "updated_at": updated_at,
+        }
+
+    def close_live_ranking(self, batch_id: str) -> bool:
+        """
+        Discard the live ranking of a batch
+
+        Args:
+            batch_id: Batch whose ranking to discard
+
+        Returns:
+            True if a live ranking existed
+        """
+        with self._live_lock:
+            self._live_updated.pop(batch_id, None)
+            return self._live_rankers.pop(batch_id, None) is not None
+
 
 # Global service instance
 ranking_service = RankingService()
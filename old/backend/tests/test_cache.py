@@ -0,0 +1,153 @@
+# Unit tests for the in-process TTL + LRU cache
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from backend.utils import cache as cache_module
+from backend.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch.object(cache_module.time, "monotonic", fake):
+        yield fake
+
+
+class TestEviction:
+    """Test LRU and TTL eviction"""
+
+    def test_lru_by_entry_count(self):
+        """Test the least recently used entry is evicted first"""
+        cache = TTLCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_lru_by_bytes(self):
+        """Test entries are evicted until the size bound holds"""
+        cache = TTLCache(max_bytes=100, sizeof=len)
+        cache.set("a", "x" * 40)
+        cache.set("b", "x" * 40)
+        cache.set("c", "x" * 40)
+
+        assert "a" not in cache
+        assert cache.current_bytes == 80
+        assert cache.stats()["entries"] == 2
+
+    def test_oversized_value_is_not_cached(self):
+        """Test a value above the size bound replaces nothing and is dropped"""
+        cache = TTLCache(max_bytes=100, sizeof=len)
+        cache.set("a", "x" * 40)
+        cache.set("b", "x" * 40)
+        cache.set("a", "x" * 101)
+
+        assert "a" not in cache
+        assert cache.get("b") == "x" * 40
+        assert cache.current_bytes == 40
+
+    def test_ttl_expiry(self, clock):
+        """Test entries expire after their own TTL"""
+        cache = TTLCache(default_ttl=10)
+        cache.set("short", 1, ttl=5)
+        cache.set("default", 2)
+
+        clock.now += 5
+        assert "short" not in cache
+        assert cache.get("default") == 2
+
+        clock.now += 5
+        assert "default" not in cache
+        assert cache.current_bytes == 0
+
+    def test_zero_ttl_is_not_cached(self):
+        """Test ttl=0 removes the key instead of storing it"""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("a", 2, ttl=0)
+        assert "a" not in cache
+
+
+class TestGetOrLoad:
+    """Test single-flight loading"""
+
+    def test_concurrent_misses_share_one_load(self):
+        """Test concurrent callers missing the same key run the loader once"""
+        cache = TTLCache()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+            for _ in range(8)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert calls == [1]
+        assert results == ["value"] * 8
+        assert cache.get_or_load("k", loader) == "value"
+        assert calls == [1]
+
+    def test_loader_error_reaches_waiters_and_is_not_cached(self):
+        """Test a failing load raises for every caller and the next call retries"""
+        cache = TTLCache()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                cache.get_or_load("k", failing)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        waiter = threading.Thread(target=call)
+        waiter.start()
+        release.set()
+        leader.join(5)
+        waiter.join(5)
+
+        assert len(errors) == 2
+        assert "k" not in cache
+        assert cache.get_or_load("k", lambda: 1) == 1
@@ -0,0 +1,134 @@
+# Unit tests for the MLflow client service run index (sqlite tracking store)
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from backend.services import mlflow_client
+from backend.services.mlflow_client import MLflowClientService, _RunIndex
+
+pytestmark = pytest.mark.skipif(
+    not mlflow_client.MLFLOW_AVAILABLE, reason="mlflow not installed"
+)
+
+
+@pytest.fixture
+def tracking(tmp_path):
+    """Sqlite tracking store with one experiment"""
+    from mlflow.tracking import MlflowClient
+
+    uri = f"sqlite:///{tmp_path / 'mlflow.db'}"
+    client = MlflowClient(tracking_uri=uri)
+    experiment_id = client.create_experiment(
+        "runs", artifact_location=str(tmp_path / "artifacts")
+    )
+    return uri, client, experiment_id
+
+
+def create_run(client, experiment_id, sharpe, finished=True):
+    run = client.create_run(experiment_id)
+    client.log_metric(run.info.run_id, "sharpe_ratio", sharpe)
+    if finished:
+        client.set_terminated(run.info.run_id)
+    time.sleep(0.002)  # Distinct start times
+    return run.info.run_id
+
+
+def make_service(uri, **kwargs):
+    with patch("os.path.exists", return_value=False):
+        return MLflowClientService(tracking_uri=uri, **kwargs)
+
+
+def run_ids(response):
+    return [run.info.run_id for run in response.runs]
+
+
+class TestRunIndexRefresh:
+    """Test incremental refresh of cached run lists"""
+
+    def test_new_and_unfinished_runs_are_merged(self, tracking):
+        """Test a refresh fetches only new runs and in-progress runs"""
+        uri, client, experiment_id = tracking
+        finished = create_run(client, experiment_id, 1.0)
+        running = create_run(client, experiment_id, 2.0, finished=False)
+
+        service = make_service(uri, runs_refresh_seconds=0)
+        first = service.get_experiment_runs(experiment_id)
+        assert run_ids(first) == [running, finished]
+        assert first.runs[0].info.status == "RUNNING"
+
+        newer = create_run(client, experiment_id, 3.0)
+        client.log_metric(running, "sharpe_ratio", 2.5)
+        client.set_terminated(running)
+
+        with patch.object(service, "_search_runs", wraps=service._search_runs) as search:
+            second = service.get_experiment_runs(experiment_id)
+
+        filters = [call.kwargs["filter_string"] for call in search.call_args_list]
+        assert filters[0].startswith("attributes.start_time >= ")
+        assert filters[1] == f"attributes.run_id IN ('{running}')"
+        assert run_ids(second) == [newer, running, finished]
+        assert second.runs[1].info.status == "FINISHED"
+        assert second.runs[1].data.metrics["sharpe_ratio"] == 2.5
+
+        # Nothing unfinished is left to re-fetch
+        with patch.object(service, "_search_runs", wraps=service._search_runs) as search:
+            third = service.get_experiment_runs(experiment_id, order_by=["metrics.sharpe_ratio DESC"])
+        assert search.call_count == 1
+        assert run_ids(third) == [newer, running, finished]
+
+    def test_fresh_index_is_served_from_cache(self, tracking):
+        """Test pages within the refresh interval do not query the server"""
+        uri, client, experiment_id = tracking
+        for sharpe in range(5):
+            create_run(client, experiment_id, float(sharpe))
+
+        service = make_service(uri, runs_refresh_seconds=60)
+        service.get_experiment_runs(experiment_id, page=1, page_size=2)
+        with patch.object(service, "_search_runs") as search:
+            page = service.get_experiment_runs(experiment_id, page=3, page_size=2)
+
+        search.assert_not_called()
+        assert (page.total, page.total_pages, len(page.runs)) == (5, 3, 1)
+
+
+class TestRunIndexSize:
+    """Test size accounting of cached run lists"""
+
+    def test_merge_measures_only_changed_runs(self, tracking):
+        """Test merged sizes match a full measurement while only re-measuring updates"""
+        uri, client, experiment_id = tracking
+        for sharpe in range(4):
+            create_run(client, experiment_id, float(sharpe))
+        service = make_service(uri)
+        runs = service._search_runs(experiment_id)
+        index = _RunIndex(runs[1:])
+
+        updated = runs[1].model_copy(deep=True)
+        updated.data.metrics["extra"] = 1.0
+        with patch.object(
+            mlflow_client, "approximate_size", wraps=mlflow_client.approximate_size
+        ) as measure:
+            merged = index.merge([runs[0], updated])
+
+        assert measure.call_count == 2
+        assert len(merged.runs) == 4
+        assert merged.size == _RunIndex(merged.runs).size
+        assert service.cache.sizeof(merged) == merged.size
+
+    def test_oversized_index_pages_on_server(self, tracking):
+        """Test an experiment too large to cache is paged by the tracking server"""
+        uri, client, experiment_id = tracking
+        created = [create_run(client, experiment_id, float(sharpe)) for sharpe in range(3)]
+        service = make_service(uri, cache_max_bytes=2000)
+
+        first = service.get_experiment_runs(experiment_id, page=1, page_size=2)
+        assert run_ids(first) == created[::-1][:2]
+        assert service.cache.get(service._get_cache_key(f"runs:{experiment_id}")) is None
+
+        with patch.object(service, "_search_runs", wraps=service._search_runs) as search:
+            second = service.get_experiment_runs(experiment_id, page=2, page_size=2)
+        assert search.call_count == 1
+        assert search.call_args.kwargs["max_results"] == 4
+        assert run_ids(second) == [created[0]]
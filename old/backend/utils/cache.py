@@ -0,0 +1,262 @@
+# In-process TTL + LRU cache with single-flight loading for backend services
+
+import sys
+import time
+import threading
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def approximate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Estimate the memory footprint of an object graph in bytes
+
+    Walks containers and object ``__dict__`` attributes (which covers pydantic
+    models), counting each object once.
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += approximate_size(key, _seen) + approximate_size(value, _seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += approximate_size(item, _seen)
+    elif hasattr(obj, "__dict__"):
+        size += approximate_size(vars(obj), _seen)
+    return size
+
+
+class _Flight:
+    """A load in progress that concurrent callers for the same key wait on"""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """
+    Thread-safe cache bounded by entry count and approximate memory
+
+    Entries expire after a per-key TTL and the least recently used entries are
+    evicted once either bound is exceeded. ``get_or_load`` de-duplicates
+    concurrent misses for the same key so only one caller runs the loader
+    while the others wait for its result.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 300,
+        sizeof: Callable[[Any], int] = approximate_size,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum approximate memory used by cached values
+            default_ttl: Seconds an entry stays valid when no TTL is given
+            sizeof: Function estimating the size of a value in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sizeof = sizeof
+
+        # key -> (value, expires_at, size), ordered from least to most recently used
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    @property
+    def current_bytes(self) -> int:
+        """Approximate memory used by cached values"""
+        return self._bytes
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def _lookup(self, key: Hashable, now: float) -> Any:
+        """Return a live value (marking it recently used) or _MISSING; caller holds lock"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[1] <= now:
+            self._remove(key)
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or ``default``
+        """
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting least recently used entries if over budget
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires (default_ttl if None)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        size = self.sizeof(value)
+        if ttl <= 0 or size > self.max_bytes:
+            self.delete(key)
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Get a cached value, loading it once on a miss
+
+        Concurrent callers missing on the same key share a single loader call.
+        Loader exceptions propagate to every waiting caller and nothing is cached.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument function producing the value
+            ttl: Seconds until the loaded entry expires (default_ttl if None)
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            self.misses += 1
+
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+            self.set(key, flight.value, ttl)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a key, returning True if it was cached"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                return True
+            return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Remove all string keys starting with a prefix
+
+        Args:
+            prefix: Key prefix to match
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if isinstance(key, str) and key.startswith(prefix)
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current usage"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -3,31 +3,92 @@
 Auto-Scaling Manager for Parallel Backtesting Workers
 Epic 20: Parallel Backtesting Orchestrator
 
-Monitors Redis queue length and dynamically scales worker containers
+Monitors Redis job queues and dynamically scales worker containers
 based on workload demand.
+
+Sizing model (per job type, summed over types):
+- Rolling job-duration percentiles and completion counts published by
+  scripts/unified_worker.py under worker_stats:<job_type>:*
+- Arrival rate from the worker_stats:<job_type>:enqueued counters that job
+  producers increment (scripts/job_queue.py)
+- Running worker containers re-read from docker compose every cycle, so
+  crashed or externally removed workers are replaced
+- Worker slots needed to drain the backlog within target_drain_seconds (and
+  optionally keep p95 queue wait under target_p95_wait_seconds) while keeping
+  up with arrivals
+- Hysteresis band and cool-downs before acting; every decision is published
+  to Redis (autoscaler:metrics hash, autoscaler:decisions list)
 """
 
 import os
+import json
+import math
 import time
 import logging
 import redis
 import subprocess
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    from scripts.job_queue import STATS_KEY_PREFIX, enqueued_key
+except ImportError:
+    # Run as scripts/auto_scaling_manager.py
+    from job_queue import STATS_KEY_PREFIX, enqueued_key
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Job type -> Redis queue (same mapping as UnifiedWorker.queues)
+JOB_QUEUES = {
+    'backtest': 'backtest_jobs',
+    'discovery': 'discovery_jobs',
+    'ranking': 'ranking_jobs',
+    'data': 'data_processing_queue',
+}
+
+# Where scaling decisions are published
+METRICS_KEY = 'autoscaler:metrics'
+DECISIONS_KEY = 'autoscaler:decisions'
+DECISION_HISTORY = 500
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Linear-interpolated percentile (q in [0, 100]) of pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+@dataclass
+class JobTypeStats:
+    """Rolling demand statistics for one job type."""
+
+    queue_length: int = 0
+    arrival_rate: float = 0.0       # Jobs/second (smoothed)
+    completion_rate: float = 0.0    # Jobs/second (smoothed)
+    duration_mean: float = 0.0      # Seconds, over recent completions
+    duration_p50: float = 0.0
+    duration_p95: float = 0.0
+    duration_samples: int = 0
+    required_slots: float = 0.0     # Worker slots needed for this job type
+
 
 class AutoScalingManager:
     """
     Auto-scaling manager for parallel backtesting workers.
 
-    Monitors queue length and scales worker containers dynamically:
-    - Scale up when queue length > threshold
-    - Scale down when queue length < threshold and workers > min
-    - Maintain optimal worker count for current workload
+    Sizes worker containers from queued work rather than queue length:
+    - Backlog work (queue length x mean duration) must drain within the target time
+    - Arrival rate x mean duration must be covered to keep up with new jobs
+    - Scale up after scale_up_cooldown, scale down only below the hysteresis
+      band and after scale_down_cooldown
+    - Falls back to queue length thresholds until duration samples exist
     """
 
     def __init__(self,
@@ -37,7 +98,16 @@ class AutoScalingManager:
                  max_workers: int = 10,
                  scale_up_threshold: int = 5,
                  scale_down_threshold: int = 1,
-                 check_interval: int = 30):
+                 check_interval: int = 30,
+                 target_drain_seconds: float = 300.0,
+                 target_p95_wait_seconds: Optional[float] = None,
+                 slots_per_worker: int = 1,
+                 scale_down_margin: float = 0.25,
+                 scale_up_cooldown: float = 60.0,
+                 scale_down_cooldown: float = 300.0,
+                 rate_smoothing: float = 0.3,
+                 default_job_seconds: float = 60.0,
+                 queues: Optional[Dict[str, str]] = None):
         """
         Initialize auto-scaling manager.
 
@@ -49,6 +119,16 @@ class AutoScalingManager:
             scale_up_threshold: Queue length threshold to trigger scale up
             scale_down_threshold: Queue length threshold to trigger scale down
             check_interval: Seconds between queue checks
+            target_drain_seconds: Time within which the current backlog should drain
+            target_p95_wait_seconds: Optional p95 queue wait target
+            slots_per_worker: Concurrent jobs per worker container (WORKER_CONCURRENCY)
+            scale_down_margin: Scale down only when required workers fall this
+                fraction below the current count (hysteresis)
+            scale_up_cooldown: Minimum seconds after a scaling action before scaling up
+            scale_down_cooldown: Minimum seconds after a scaling action before scaling down
+            rate_smoothing: EWMA weight of the newest arrival/completion rate sample
+            default_job_seconds: Assumed duration for job types without samples yet
+            queues: Job type -> Redis queue mapping (default: JOB_QUEUES)
         """
         self.redis_host = redis_host
         self.redis_port = redis_port
@@ -57,6 +137,20 @@ class AutoScalingManager:
         self.scale_up_threshold = scale_up_threshold
         self.scale_down_threshold = scale_down_threshold
         self.check_interval = check_interval
+        self.target_drain_seconds = target_drain_seconds
+        self.target_p95_wait_seconds = target_p95_wait_seconds
+        self.slots_per_worker = max(1, slots_per_worker)
+        self.scale_down_margin = scale_down_margin
+        self.scale_up_cooldown = scale_up_cooldown
+        self.scale_down_cooldown = scale_down_cooldown
+        self.rate_smoothing = rate_smoothing
+        self.default_job_seconds = default_job_seconds
+        self.queues = dict(queues or JOB_QUEUES)
+
+        # Rolling per-type statistics and the previous (enqueued, completed) counters
+        self.stats: Dict[str, JobTypeStats] = {job_type: JobTypeStats() for job_type in self.queues}
+        self._last_sample: Optional[Tuple[float, Dict[str, Tuple[int, int]]]] = None
+        self._last_scale_time = float('-inf')
 
         # Initialize Redis connection
         self.redis = redis.Redis(
@@ -65,16 +159,18 @@ class AutoScalingManager:
             decode_responses=True
         )
 
-        # Track current worker count
-        self.current_workers = self._get_current_worker_count()
+        # Track current worker count (re-read from docker every cycle)
+        self.current_workers = self._get_current_worker_count() or 0
 
         logger.info("Auto-scaling manager initialized")
         logger.info(f"Worker range: {min_workers}-{max_workers}")
         logger.info(f"Scale thresholds: up={scale_up_threshold}, down={scale_down_threshold}")
+        logger.info(f"Targets: drain={target_drain_seconds}s, p95 wait={target_p95_wait_seconds}s, "
+                    f"slots/worker={self.slots_per_worker}")
         logger.info(f"Current workers: {self.current_workers}")
 
-    def _get_current_worker_count(self) -> int:
-        """Get current number of running worker containers"""
+    def _get_current_worker_count(self) -> Optional[int]:
+        """Get current number of running worker containers (None if docker cannot be queried)"""
         try:
             result = subprocess.run(
                 ['docker', 'compose', 'ps', '--format', 'json'],
@@ -89,7 +185,6 @@ class AutoScalingManager:
                 for line in lines:
                     if line.strip():
                         try:
-                            import json
                             container = json.loads(line)
                             service = container.get('Service', '')
                             if service.startswith('backtest-worker'):
@@ -99,23 +194,29 @@ class AutoScalingManager:
                 return worker_count
             else:
                 logger.warning(f"Failed to get container status: {result.stderr}")
-                return 0
+                return None
 
         except Exception as e:
             logger.error(f"Error getting worker count: {e}")
-            return 0
+            return None
 
-    def _get_queue_length(self) -> int:
-        """Get current queue length"""
-        try:
-            queue_length = self.redis.zcard('backtest_jobs')
-            return queue_length
-        except redis.ConnectionError:
-            logger.warning("Redis connection failed")
-            return 0
-        except Exception as e:
-            logger.error(f"Error getting queue length: {e}")
-            return 0
+    def _refresh_worker_count(self) -> int:
+        """
+        Reconcile current_workers with the containers actually running.
+
+        Containers that crashed or were removed outside the manager show up as
+        a lower count, which the next decision scales back up. The last known
+        count is kept when docker cannot be queried.
+
+        Returns:
+            Current worker count
+        """
+        count = self._get_current_worker_count()
+        if count is not None and count != self.current_workers:
+            logger.warning(f"Running workers changed outside the manager: "
+                           f"{self.current_workers} -> {count}")
+            self.current_workers = count
+        return self.current_workers
 
     def _scale_workers(self, target_count: int) -> bool:
         """
@@ -153,10 +254,13 @@ class AutoScalingManager:
                 # For now, just log that we would scale down
                 # In production, you'd implement graceful shutdown
                 logger.info(f"Would scale down by {scale_diff} workers (not implemented)")
-                success = True
+                # Nothing was stopped, so keep the real count for the next cycle
+                self._last_scale_time = time.time()
+                return True
 
             if success:
                 self.current_workers = target_count
+                self._last_scale_time = time.time()
                 logger.info(f"✅ Successfully scaled to {target_count} workers")
                 return True
             else:
@@ -167,7 +271,148 @@ class AutoScalingManager:
             logger.error(f"Error scaling workers: {e}")
             return False
 
-    def _calculate_target_workers(self, queue_length: int) -> int:
+    # ===================================================================
+    # Demand Statistics
+    # ===================================================================
+
+    def _collect_stats(self, now: Optional[float] = None) -> Dict[str, JobTypeStats]:
+        """
+        Refresh per-job-type queue length, rates and duration percentiles.
+
+        Reads all queues and worker statistics in one Redis pipeline. Arrivals
+        over the interval are the change in the producers' enqueued counter,
+        so demand is measured even while workers fall behind.
+
+        Args:
+            now: Sample timestamp (default: time.time())
+
+        Returns:
+            Updated statistics by job type
+        """
+        now = time.time() if now is None else now
+        pipe = self.redis.pipeline(transaction=False)
+        for job_type, queue_name in self.queues.items():
+            pipe.zcard(queue_name)
+            pipe.get(enqueued_key(job_type))
+            pipe.get(f'{STATS_KEY_PREFIX}:{job_type}:completed')
+            pipe.lrange(f'{STATS_KEY_PREFIX}:{job_type}:durations', 0, -1)
+        replies = pipe.execute()
+
+        sample = {}
+        for i, job_type in enumerate(self.queues):
+            queue_length, enqueued, completed, durations = replies[4 * i:4 * i + 4]
+            queue_length = int(queue_length or 0)
+            enqueued = int(enqueued or 0)
+            completed = int(completed or 0)
+            sample[job_type] = (enqueued, completed)
+
+            stats = self.stats[job_type]
+            stats.queue_length = queue_length
+
+            values = sorted(float(d) for d in durations)
+            stats.duration_samples = len(values)
+            if values:
+                stats.duration_mean = sum(values) / len(values)
+                stats.duration_p50 = _percentile(values, 50)
+                stats.duration_p95 = _percentile(values, 95)
+
+            if self._last_sample is not None:
+                last_time, last_counts = self._last_sample
+                elapsed = now - last_time
+                if elapsed > 0 and job_type in last_counts:
+                    last_enqueued, last_completed = last_counts[job_type]
+                    # Counters may have been reset
+                    arrived = max(0, enqueued - last_enqueued)
+                    done = max(0, completed - last_completed)
+                    alpha = self.rate_smoothing
+                    stats.arrival_rate += alpha * (arrived / elapsed - stats.arrival_rate)
+                    stats.completion_rate += alpha * (done / elapsed - stats.completion_rate)
+
+        self._last_sample = (now, sample)
+        return self.stats
+
+    def _required_slots(self, stats: JobTypeStats) -> float:
+        """
+        Worker slots one job type needs to meet the drain/wait targets.
+
+        backlog work / target time + arrival rate x mean duration, capped at
+        one slot per queued job plus the arrival load (more slots than jobs
+        cannot finish long jobs any sooner).
+        """
+        if stats.queue_length == 0 and stats.arrival_rate == 0:
+            return 0.0
+
+        mean = stats.duration_mean if stats.duration_samples else self.default_job_seconds
+        backlog_work = stats.queue_length * mean
+        steady_state = stats.arrival_rate * mean
+
+        slots = backlog_work / self.target_drain_seconds + steady_state
+        if self.target_p95_wait_seconds:
+            # The job at the 95th queue position waits ~0.95 * backlog / slots
+            slots = max(slots, 0.95 * backlog_work / self.target_p95_wait_seconds + steady_state)
+
+        return min(slots, stats.queue_length + steady_state)
+
+    # ===================================================================
+    # Scaling Decisions
+    # ===================================================================
+
+    def _calculate_target_workers(self, stats: Dict[str, JobTypeStats],
+                                  now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Calculate target number of workers from per-type demand.
+
+        Scale up as soon as the up cool-down has passed. Scale down only when
+        the required count is at least scale_down_margin below the current
+        count and the down cool-down has passed. Until any job type has
+        duration samples, falls back to the queue length thresholds.
+
+        Returns:
+            Decision dict (current, target, required workers/slots, action, reason)
+        """
+        now = time.time() if now is None else now
+        current = self.current_workers
+        since_scale = now - self._last_scale_time
+
+        if not any(s.duration_samples for s in stats.values()):
+            queue_length = sum(s.queue_length for s in stats.values())
+            required = self._calculate_threshold_target(queue_length)
+            required_slots = float(required * self.slots_per_worker)
+            basis = 'queue_length'
+        else:
+            for job_stats in stats.values():
+                job_stats.required_slots = self._required_slots(job_stats)
+            required_slots = sum(s.required_slots for s in stats.values())
+            required = math.ceil(required_slots / self.slots_per_worker - 1e-9)
+            basis = 'duration'
+
+        required = max(self.min_workers, min(self.max_workers, required))
+
+        target, action, reason = current, 'hold', 'optimal'
+        if required > current:
+            if since_scale >= self.scale_up_cooldown:
+                target, action, reason = required, 'scale_up', f'{basis} demand'
+            else:
+                reason = 'scale_up_cooldown'
+        elif required < current:
+            if required > current * (1 - self.scale_down_margin):
+                reason = 'hysteresis'
+            elif since_scale < self.scale_down_cooldown:
+                reason = 'scale_down_cooldown'
+            else:
+                target, action, reason = required, 'scale_down', f'{basis} demand'
+
+        return {
+            'timestamp': now,
+            'current_workers': current,
+            'target_workers': target,
+            'required_workers': required,
+            'required_slots': round(required_slots, 3),
+            'action': action,
+            'reason': reason,
+        }
+
+    def _calculate_threshold_target(self, queue_length: int) -> int:
         """
         Calculate target number of workers based on queue length.
 
@@ -177,39 +422,71 @@ class AutoScalingManager:
         - Otherwise: maintain current count
         """
         if queue_length >= self.scale_up_threshold:
-            # Scale up aggressively
-            target = min(self.current_workers * 2, self.max_workers)
-            if target > self.current_workers:
-                logger.info(f"Queue length {queue_length} >= {self.scale_up_threshold}, scaling up to {target}")
-                return target
-
-        elif queue_length <= self.scale_down_threshold and self.current_workers > self.min_workers:
-            # Scale down conservatively
-            target = max(self.current_workers // 2, self.min_workers)
-            if target < self.current_workers:
-                logger.info(f"Queue length {queue_length} <= {self.scale_down_threshold}, scaling down to {target}")
-                return target
-
+            return min(max(self.current_workers, 1) * 2, self.max_workers)
+        if queue_length <= self.scale_down_threshold and self.current_workers > self.min_workers:
+            return max(self.current_workers // 2, self.min_workers)
         return self.current_workers
 
+    def _publish_decision(self, decision: Dict[str, Any]):
+        """Publish a decision and current statistics to Redis as metrics."""
+        metrics = {k: v for k, v in decision.items()}
+        for job_type, job_stats in self.stats.items():
+            for field, value in asdict(job_stats).items():
+                metrics[f'{job_type}_{field}'] = round(value, 6) if isinstance(value, float) else value
+
+        record = dict(decision, job_types={t: asdict(s) for t, s in self.stats.items()})
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(METRICS_KEY, mapping=metrics)
+            pipe.lpush(DECISIONS_KEY, json.dumps(record))
+            pipe.ltrim(DECISIONS_KEY, 0, DECISION_HISTORY - 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Failed to publish scaling metrics: {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the latest published scaling metrics.
+
+        Returns:
+            Flat dict from the autoscaler:metrics hash (empty if unavailable)
+        """
+        try:
+            return self.redis.hgetall(METRICS_KEY)
+        except redis.RedisError as e:
+            logger.warning(f"Failed to read scaling metrics: {e}")
+            return {}
+
+    def evaluate(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run one sizing cycle: reconcile the worker count, refresh statistics,
+        decide and publish.
+
+        Returns:
+            Decision dict
+        """
+        self._refresh_worker_count()
+        stats = self._collect_stats(now)
+        decision = self._calculate_target_workers(stats, now)
+        self._publish_decision(decision)
+
+        level = logging.INFO if decision['action'] != 'hold' else logging.DEBUG
+        logger.log(level, "Workers %d -> %d (required %d, %.2f slots): %s",
+                   decision['current_workers'], decision['target_workers'],
+                   decision['required_workers'], decision['required_slots'], decision['reason'])
+        return decision
+
     def run(self):
         """Main auto-scaling loop"""
         logger.info("Starting auto-scaling manager")
 
         while True:
             try:
-                # Get current metrics
-                queue_length = self._get_queue_length()
-                current_workers = self._get_current_worker_count()
-
-                logger.debug(f"Queue length: {queue_length}, Workers: {current_workers}")
-
-                # Calculate target workers
-                target_workers = self._calculate_target_workers(queue_length)
+                decision = self.evaluate()
 
                 # Scale if needed
-                if target_workers != current_workers:
-                    self._scale_workers(target_workers)
+                if decision['target_workers'] != self.current_workers:
+                    self._scale_workers(decision['target_workers'])
                 else:
                     logger.debug("Worker count optimal")
 
@@ -236,6 +513,13 @@ def main():
     parser.add_argument('--scale-up-threshold', type=int, default=5, help='Queue length to trigger scale up')
     parser.add_argument('--scale-down-threshold', type=int, default=1, help='Queue length to trigger scale down')
     parser.add_argument('--check-interval', type=int, default=30, help='Seconds between checks')
+    parser.add_argument('--target-drain-seconds', type=float, default=300.0, help='Backlog drain time target')
+    parser.add_argument('--target-p95-wait-seconds', type=float, default=None, help='p95 queue wait target')
+    parser.add_argument('--slots-per-worker', type=int, default=int(os.getenv('WORKER_CONCURRENCY', 1)),
+                        help='Concurrent jobs per worker container')
+    parser.add_argument('--scale-down-margin', type=float, default=0.25, help='Hysteresis band for scaling down')
+    parser.add_argument('--scale-up-cooldown', type=float, default=60.0, help='Seconds between scale-ups')
+    parser.add_argument('--scale-down-cooldown', type=float, default=300.0, help='Seconds between scale-downs')
 
     args = parser.parse_args()
 
@@ -246,7 +530,13 @@ def main():
         max_workers=args.max_workers,
         scale_up_threshold=args.scale_up_threshold,
         scale_down_threshold=args.scale_down_threshold,
-        check_interval=args.check_interval
+        check_interval=args.check_interval,
+        target_drain_seconds=args.target_drain_seconds,
+        target_p95_wait_seconds=args.target_p95_wait_seconds,
+        slots_per_worker=args.slots_per_worker,
+        scale_down_margin=args.scale_down_margin,
+        scale_up_cooldown=args.scale_up_cooldown,
+        scale_down_cooldown=args.scale_down_cooldown
     )
 
     manager.run()
@@ -18,6 +18,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from scripts.backtrader_analyzers import columns_to_records
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -241,8 +243,8 @@ class BacktraderResultParser:
         # Try TradeLogAnalyzer
         if 'tradelog' in analyzers:
             tradelog = analyzers['tradelog']
-            if 'trades' in tradelog and isinstance(tradelog['trades'], list):
-                return tradelog['trades']
+            if tradelog.get('trade_count'):
+                return columns_to_records(tradelog['trades'])
 
         logger.warning("No trade data found in analyzers")
         return []
@@ -258,27 +260,14 @@ class BacktraderResultParser:
         """
         equity_curve = []
 
-        # Try EquityCurveAnalyzer
-        if 'equity' in analyzers:
-            equity_data = analyzers['equity']
-            if 'equity_curve' in equity_data:
-                for point in equity_data['equity_curve']:
-                    equity_curve.append({
-                        'datetime': point['datetime'].isoformat() if hasattr(point['datetime'], 'isoformat') else str(point['datetime']),
-                        'value': point['value']
-                    })
-                return equity_curve
-
-        # Try IBPerformanceAnalyzer
-        if 'ibperformance' in analyzers:
-            ib_perf = analyzers['ibperformance']
-            if 'equity_curve' in ib_perf:
-                for point in ib_perf['equity_curve']:
-                    equity_curve.append({
-                        'datetime': point['datetime'].isoformat() if hasattr(point['datetime'], 'isoformat') else str(point['datetime']),
-                        'value': point['value']
-                    })
-                return equity_curve
+        # Try EquityCurveAnalyzer, then IBPerformanceAnalyzer (both store NumPy columns)
+        for name in ('equity', 'ibperformance'):
+            columns = analyzers.get(name, {}).get('equity_curve')
+            if columns is not None and len(columns['datetime']):
+                return columns_to_records({
+                    'datetime': columns['datetime'],
+                    'value': columns['value'],
+                })
 
         # Try TimeReturn analyzer
         if 'timereturn' in analyzers:
@@ -306,7 +295,7 @@ class BacktraderResultParser:
         if 'monthly' in analyzers:
             monthly_data = analyzers['monthly']
             if 'monthly_returns' in monthly_data:
-                return monthly_data['monthly_returns']
+                return columns_to_records(monthly_data['monthly_returns'])
 
         # Calculate from trades if available
         if 'ibperformance' in analyzers:
@@ -7,11 +7,192 @@ Provides custom analyzers matching LEAN metrics for comparison:
 - CommissionAnalyzer: Detailed commission tracking
 - EquityCurveAnalyzer: Portfolio value over time
 - MonthlyReturnsAnalyzer: Monthly performance breakdown
+- TradeLogAnalyzer: Detailed trade log
+
+Per-bar and per-trade records are written into preallocated, growable NumPy
+arrays (RecordBuffer) rather than lists of dicts, so minute-bar backtests do
+not allocate a Python object per bar. Timestamps are stored as int64 epoch
+milliseconds; monthly returns and daily resampling are derived from the
+arrays at stop(). get_analysis() returns dicts of NumPy arrays, or pyarrow
+Tables when the analyzer is added with arrow=True. Use columns_to_records()
+to turn either into JSON-ready lists of dicts.
+
+The per-bar lists of earlier versions remain available as arrays: the
+daily_returns, dates, values and cash attributes, the 'dates', 'values' and
+'cash' keys of EquityCurveAnalyzer and 'monthly_returns_dict' of
+MonthlyReturnsAnalyzer.
 """
 
+import logging
+from typing import Any, Dict, List, Optional, Union
+
 import backtrader as bt
-from datetime import datetime
-from collections import defaultdict
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # Optional dependency
+    PYARROW_AVAILABLE = False
+
+# Backtrader date numbers count days since 0001-01-01 (ordinal 1)
+EPOCH_ORDINAL = 719163  # datetime(1970, 1, 1).toordinal()
+MS_PER_DAY = 86400000
+
+VALUE_DTYPE = np.dtype([
+    ('timestamp', '<i8'),     # Epoch milliseconds (UTC)
+    ('value', '<f8'),
+])
+
+EQUITY_DTYPE = np.dtype([
+    ('timestamp', '<i8'),     # Epoch milliseconds (UTC)
+    ('value', '<f8'),
+    ('cash', '<f8'),
+])
+
+TRADE_DTYPE = np.dtype([
+    ('symbol', '<i4'),        # Index into TradeLogAnalyzer.symbols
+    ('direction', 'i1'),      # 1 = Long, -1 = Short
+    ('entry_time', '<i8'),    # Epoch milliseconds
+    ('exit_time', '<i8'),     # Epoch milliseconds
+    ('entry_price', '<f8'),
+    ('exit_price', '<f8'),
+    ('size', '<f8'),
+    ('pnl_gross', '<f8'),
+    ('pnl_net', '<f8'),
+    ('commission', '<f8'),
+    ('bars_held', '<i8'),
+])
+
+DIRECTION_LABELS = np.array(['Short', '', 'Long'])  # Indexed by direction + 1
+
+AnalysisTable = Union[Dict[str, np.ndarray], 'pa.Table']
+
+
+def num2epoch(num: float) -> int:
+    """Convert a Backtrader date number to epoch milliseconds."""
+    return int(round((num - EPOCH_ORDINAL) * MS_PER_DAY))
+
+
+def epoch_to_datetime64(timestamps: np.ndarray, tz=None) -> np.ndarray:
+    """
+    Convert epoch milliseconds to naive datetime64[ms] values.
+
+    Args:
+        timestamps: int64 epoch milliseconds (UTC)
+        tz: Optional timezone to express the values in (Backtrader data tz)
+
+    Returns:
+        datetime64[ms] array (naive, local to tz if given)
+    """
+    values = np.asarray(timestamps, dtype=np.int64).astype('datetime64[ms]')
+    if tz is None or len(values) == 0:
+        return values
+    local = pd.DatetimeIndex(values).tz_localize('UTC').tz_convert(tz).tz_localize(None)
+    return local.to_numpy().astype('datetime64[ms]')
+
+
+def columns_to_records(columns: Optional[AnalysisTable]) -> List[Dict[str, Any]]:
+    """
+    Convert analyzer columns into JSON-ready dicts.
+
+    Args:
+        columns: Dict of equal-length arrays or a pyarrow Table
+
+    Returns:
+        List of row dicts (datetime64 values become ISO strings)
+    """
+    if columns is None:
+        return []
+    if PYARROW_AVAILABLE and isinstance(columns, pa.Table):
+        columns = {name: columns.column(name).to_numpy() for name in columns.column_names}
+
+    lists = {}
+    for name, values in columns.items():
+        values = np.asarray(values)
+        if np.issubdtype(values.dtype, np.datetime64):
+            lists[name] = np.datetime_as_string(values, unit='s').tolist()
+        else:
+            lists[name] = values.tolist()
+
+    names = list(lists)
+    return [dict(zip(names, row)) for row in zip(*lists.values())]
+
+
+class RecordBuffer:
+    """
+    Growable structured NumPy array.
+
+    Rows are written in place into preallocated storage whose capacity
+    doubles when full, so recording a bar or trade keeps no Python object
+    alive beyond the row tuple being stored.
+    """
+
+    def __init__(self, dtype: np.dtype, capacity: int = 4096):
+        """
+        Initialize record buffer.
+
+        Args:
+            dtype: Structured dtype of one row
+            capacity: Initial number of preallocated rows
+        """
+        self.dtype = np.dtype(dtype)
+        self._capacity = max(1, int(capacity))
+        self._size = 0
+        self._data = np.empty(self._capacity, dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: tuple):
+        """Store one row (tuple in dtype field order)."""
+        if self._size == self._capacity:
+            self._grow()
+        self._data[self._size] = row
+        self._size += 1
+
+    def _grow(self):
+        """Double the capacity."""
+        self._capacity *= 2
+        grown = np.empty(self._capacity, dtype=self.dtype)
+        grown[:self._size] = self._data[:self._size]
+        self._data = grown
+
+    def records(self) -> np.ndarray:
+        """Get the recorded rows (view, not copy)."""
+        return self._data[:self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """Get one field of the recorded rows as a contiguous array."""
+        return np.ascontiguousarray(self._data[name][:self._size])
+
+
+def _strategy_tz(strategy):
+    """Timezone Backtrader uses for strategy.datetime.datetime()."""
+    return getattr(strategy.datetime, '_tz', None)
+
+
+def _period_bounds(keys: np.ndarray):
+    """First and last row index of each run of equal consecutive keys."""
+    if len(keys) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:] - 1, len(keys) - 1]
+    return starts, ends
+
+
+def _output(columns: Dict[str, np.ndarray], arrow: bool) -> AnalysisTable:
+    """Return columns as-is, or as a pyarrow Table when requested."""
+    if arrow:
+        if PYARROW_AVAILABLE:
+            return pa.table(columns)
+        logger.warning("pyarrow not installed - returning NumPy arrays")
+    return columns
 
 
 class IBPerformanceAnalyzer(bt.Analyzer):
@@ -27,10 +208,14 @@ class IBPerformanceAnalyzer(bt.Analyzer):
     - Maximum drawdown
     """
 
+    params = (
+        ('arrow', False),
+        ('capacity', 4096),
+    )
+
     def __init__(self):
         self.trades = []
-        self.daily_returns = []
-        self.equity_curve = []
+        self.equity = RecordBuffer(VALUE_DTYPE, self.p.capacity)
         self.commissions = 0.0
         self.winning_trades = 0
         self.losing_trades = 0
@@ -75,16 +260,7 @@ class IBPerformanceAnalyzer(bt.Analyzer):
         current_value = self.strategy.broker.getvalue()
 
         # Track equity curve
-        self.equity_curve.append({
-            'datetime': self.strategy.datetime.datetime(0),
-            'value': current_value
-        })
-
-        # Calculate daily return
-        if len(self.equity_curve) > 1:
-            prev_value = self.equity_curve[-2]['value']
-            daily_return = (current_value - prev_value) / prev_value
-            self.daily_returns.append(daily_return)
+        self.equity.append((num2epoch(self.strategy.datetime[0]), current_value))
 
         # Track drawdown
         if current_value > self.peak_value:
@@ -97,6 +273,12 @@ class IBPerformanceAnalyzer(bt.Analyzer):
             self.max_drawdown = drawdown
             self.max_drawdown_pct = drawdown_pct
 
+    @property
+    def daily_returns(self) -> np.ndarray:
+        """Bar-to-bar returns of the portfolio value"""
+        values = self.equity.column('value')
+        return np.diff(values) / values[:-1]
+
     def get_analysis(self):
         """Return analysis results"""
         total_trades = len(self.trades)
@@ -117,14 +299,19 @@ class IBPerformanceAnalyzer(bt.Analyzer):
         gross_loss = abs(sum(losing_pnls)) if losing_pnls else 0
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
 
-        # Calculate Sharpe ratio (annualized)
-        if self.daily_returns:
-            import numpy as np
-            returns_array = np.array(self.daily_returns)
-            sharpe_ratio = np.mean(returns_array) / np.std(returns_array) * np.sqrt(252) if np.std(returns_array) > 0 else 0
+        # Calculate Sharpe ratio (annualized) from bar-to-bar returns
+        values = self.equity.column('value')
+        returns_array = self.daily_returns
+        if len(returns_array) and np.std(returns_array) > 0:
+            sharpe_ratio = np.mean(returns_array) / np.std(returns_array) * np.sqrt(252)
         else:
             sharpe_ratio = 0
 
+        equity_curve = {
+            'datetime': epoch_to_datetime64(self.equity.column('timestamp'), _strategy_tz(self.strategy)),
+            'value': values,
+        }
+
         return {
             'total_trades': total_trades,
             'winning_trades': self.winning_trades,
@@ -144,7 +331,7 @@ class IBPerformanceAnalyzer(bt.Analyzer):
             'total_return': final_value - self.start_value,
             'total_return_pct': ((final_value / self.start_value) - 1) * 100,
             'trades': self.trades,
-            'equity_curve': self.equity_curve,
+            'equity_curve': _output(equity_curve, self.p.arrow),
         }
 
 
@@ -198,39 +385,74 @@ class EquityCurveAnalyzer(bt.Analyzer):
     - Portfolio value
     - Cash balance
     - Position value
-    - Daily returns
+    - Daily values and returns (resampled at stop)
     """
 
+    params = (
+        ('arrow', False),
+        ('capacity', 4096),
+    )
+
     def __init__(self):
-        self.equity_data = []
-        self.dates = []
-        self.values = []
-        self.cash = []
+        self.equity = RecordBuffer(EQUITY_DTYPE, self.p.capacity)
+        self.equity_curve = {}
+        self.daily = {}
 
     def next(self):
         """Record equity on each bar"""
-        dt = self.strategy.datetime.datetime(0)
-        value = self.strategy.broker.getvalue()
-        cash = self.strategy.broker.getcash()
+        broker = self.strategy.broker
+        self.equity.append((num2epoch(self.strategy.datetime[0]), broker.getvalue(), broker.getcash()))
 
-        self.equity_data.append({
-            'datetime': dt,
-            'value': value,
+    @property
+    def dates(self) -> np.ndarray:
+        """Bar datetimes recorded so far"""
+        return epoch_to_datetime64(self.equity.column('timestamp'), _strategy_tz(self.strategy))
+
+    @property
+    def values(self) -> np.ndarray:
+        """Portfolio values recorded so far"""
+        return self.equity.column('value')
+
+    @property
+    def cash(self) -> np.ndarray:
+        """Cash balances recorded so far"""
+        return self.equity.column('cash')
+
+    def stop(self):
+        """Build equity columns and resample them to daily values"""
+        dates = self.dates
+        values = self.values
+        cash = self.cash
+
+        self.equity_curve = {
+            'datetime': dates,
+            'value': values,
             'cash': cash,
-            'position_value': value - cash,
-        })
+            'position_value': values - cash,
+        }
 
-        self.dates.append(dt)
-        self.values.append(value)
-        self.cash.append(cash)
+        # Last bar of each day; the first day's return is measured from its first bar
+        starts, ends = _period_bounds(dates.astype('datetime64[D]'))
+        daily_values = values[ends]
+        previous = np.r_[values[:1], daily_values[:-1]]
+        self.daily = {
+            'date': dates[ends].astype('datetime64[D]'),
+            'value': daily_values,
+            'return': daily_values / previous - 1,
+        }
 
     def get_analysis(self):
         """Return equity curve data"""
+        if not self.equity_curve:
+            self.stop()
         return {
-            'equity_curve': self.equity_data,
-            'dates': self.dates,
-            'values': self.values,
-            'cash': self.cash,
+            'equity_curve': _output(self.equity_curve, self.p.arrow),
+            'daily': _output(self.daily, self.p.arrow),
+            'bar_count': len(self.equity),
+            # Per-bar columns under their previous keys
+            'dates': self.equity_curve['datetime'],
+            'values': self.equity_curve['value'],
+            'cash': self.equity_curve['cash'],
         }
 
 
@@ -244,57 +466,55 @@ class MonthlyReturnsAnalyzer(bt.Analyzer):
     - Best/worst months
     """
 
+    params = (
+        ('arrow', False),
+        ('capacity', 4096),
+    )
+
     def __init__(self):
-        self.monthly_returns = defaultdict(lambda: {'start_value': 0, 'end_value': 0})
-        self.current_month = None
-        self.month_start_value = None
+        self.values = RecordBuffer(VALUE_DTYPE, self.p.capacity)
+        self.monthly_returns = {}
 
     def next(self):
-        """Track monthly performance"""
-        dt = self.strategy.datetime.datetime(0)
-        value = self.strategy.broker.getvalue()
-
-        year_month = (dt.year, dt.month)
-
-        # New month
-        if year_month != self.current_month:
-            if self.current_month is not None and self.month_start_value is not None:
-                # Calculate previous month return
-                prev_value = self.monthly_returns[self.current_month]['end_value']
-                monthly_return = ((prev_value / self.month_start_value) - 1) * 100 if self.month_start_value > 0 else 0
-                self.monthly_returns[self.current_month]['return'] = monthly_return
-
-            # Start new month
-            self.current_month = year_month
-            self.month_start_value = value
-            self.monthly_returns[year_month]['start_value'] = value
-
-        # Update current month end value
-        self.monthly_returns[year_month]['end_value'] = value
+        """Record portfolio value on each bar"""
+        self.values.append((num2epoch(self.strategy.datetime[0]), self.strategy.broker.getvalue()))
 
     def stop(self):
-        """Calculate final month return"""
-        if self.current_month is not None and self.month_start_value is not None:
-            end_value = self.monthly_returns[self.current_month]['end_value']
-            monthly_return = ((end_value / self.month_start_value) - 1) * 100 if self.month_start_value > 0 else 0
-            self.monthly_returns[self.current_month]['return'] = monthly_return
+        """Calculate monthly returns from the recorded values"""
+        dates = epoch_to_datetime64(self.values.column('timestamp'), _strategy_tz(self.strategy))
+        values = self.values.column('value')
+
+        months = dates.astype('datetime64[M]').astype(np.int64)
+        starts, ends = _period_bounds(months)
+        start_values = values[starts]
+        end_values = values[ends]
+
+        monthly_return = np.zeros(len(starts))
+        positive = start_values > 0
+        monthly_return[positive] = (end_values[positive] / start_values[positive] - 1) * 100
+
+        self.monthly_returns = {
+            'year': months[starts] // 12 + 1970,
+            'month': months[starts] % 12 + 1,
+            'return': monthly_return,
+            'start_value': start_values,
+            'end_value': end_values,
+        }
 
     def get_analysis(self):
         """Return monthly returns data"""
-        # Convert to list format
-        returns_list = []
-        for (year, month), data in sorted(self.monthly_returns.items()):
-            returns_list.append({
-                'year': year,
-                'month': month,
-                'return': data.get('return', 0),
-                'start_value': data['start_value'],
-                'end_value': data['end_value'],
-            })
-
+        if not self.monthly_returns:
+            self.stop()
+        monthly = self.monthly_returns
         return {
-            'monthly_returns': returns_list,
-            'monthly_returns_dict': dict(self.monthly_returns),
+            'monthly_returns': _output(monthly, self.p.arrow),
+            # (year, month) -> values, the previous per-month layout
+            'monthly_returns_dict': {
+                (year, month): {'start_value': start, 'end_value': end, 'return': ret}
+                for year, month, start, end, ret in zip(
+                    monthly['year'].tolist(), monthly['month'].tolist(), monthly['start_value'].tolist(),
+                    monthly['end_value'].tolist(), monthly['return'].tolist())
+            },
         }
 
 
@@ -309,35 +529,66 @@ class TradeLogAnalyzer(bt.Analyzer):
     - Max favorable/adverse excursion
     """
 
+    params = (
+        ('arrow', False),
+        ('capacity', 256),
+    )
+
     def __init__(self):
-        self.trades_log = []
+        self.trades_log = RecordBuffer(TRADE_DTYPE, self.p.capacity)
+        self.symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
 
     def notify_trade(self, trade):
         """Log each completed trade"""
         if trade.isclosed:
-            trade_log = {
-                'trade_id': len(self.trades_log) + 1,
-                'symbol': trade.data._name,
-                'direction': 'Long' if trade.size > 0 else 'Short',
-                'entry_date': bt.num2date(trade.dtopen).isoformat(),
-                'exit_date': bt.num2date(trade.dtclose).isoformat(),
-                'entry_price': round(trade.price, 2),
-                'exit_price': round(trade.price + (trade.pnl / trade.size if trade.size != 0 else 0), 2),
-                'size': abs(trade.size),
-                'pnl_gross': round(trade.pnl, 2),
-                'pnl_net': round(trade.pnlcomm, 2),
-                'commission': round(trade.commission, 2),
-                'bars_held': trade.barlen,
-                'pnl_pct': round((trade.pnlcomm / (trade.price * abs(trade.size)) * 100), 2) if trade.size != 0 else 0,
-            }
-
-            self.trades_log.append(trade_log)
+            symbol = trade.data._name
+            symbol_id = self._symbol_ids.get(symbol)
+            if symbol_id is None:
+                symbol_id = self._symbol_ids[symbol] = len(self.symbols)
+                self.symbols.append(symbol)
+
+            self.trades_log.append((
+                symbol_id,
+                1 if trade.size > 0 else -1,
+                num2epoch(trade.dtopen),
+                num2epoch(trade.dtclose),
+                trade.price,
+                trade.price + (trade.pnl / trade.size if trade.size != 0 else 0),
+                abs(trade.size),
+                trade.pnl,
+                trade.pnlcomm,
+                trade.commission,
+                trade.barlen,
+            ))
 
     def get_analysis(self):
         """Return trade log"""
+        rows = self.trades_log.records()
+        names = np.array(self.symbols or [''], dtype=object)
+        notional = rows['entry_price'] * rows['size']
+        pnl_pct = np.zeros(len(rows))
+        np.divide(rows['pnl_net'] * 100, notional, out=pnl_pct, where=notional != 0)
+
+        trades = {
+            'trade_id': np.arange(1, len(rows) + 1),
+            'symbol': names[rows['symbol']],
+            'direction': DIRECTION_LABELS[rows['direction'] + 1].astype(object),
+            'entry_date': epoch_to_datetime64(rows['entry_time']),
+            'exit_date': epoch_to_datetime64(rows['exit_time']),
+            'entry_price': np.round(rows['entry_price'], 2),
+            'exit_price': np.round(rows['exit_price'], 2),
+            'size': rows['size'].copy(),
+            'pnl_gross': np.round(rows['pnl_gross'], 2),
+            'pnl_net': np.round(rows['pnl_net'], 2),
+            'commission': np.round(rows['commission'], 2),
+            'bars_held': rows['bars_held'].copy(),
+            'pnl_pct': np.round(pnl_pct, 2),
+        }
+
         return {
-            'trades': self.trades_log,
-            'trade_count': len(self.trades_log),
+            'trades': _output(trades, self.p.arrow),
+            'trade_count': len(rows),
         }
 
 
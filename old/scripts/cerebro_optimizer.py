@@ -24,6 +24,7 @@ from datetime import datetime
 import itertools
 import multiprocessing as mp
 
+import pandas as pd
 import backtrader as bt
 from backtrader.analyzers import SharpeRatio, DrawDown, Returns, TradeAnalyzer
 
@@ -31,8 +32,8 @@ from backtrader.analyzers import SharpeRatio, DrawDown, Returns, TradeAnalyzer
 sys.path.append(str(Path(__file__).parent.parent))
 
 from scripts.mlflow_logger import MLflowBacktestLogger
-from scripts.data_quality_check import load_data
-from scripts.backtest_parser import BacktestResultParser
+from scripts.data_quality_check import DataValidator
+from scripts.backtest_parser import BacktraderResultParser
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -47,15 +48,18 @@ class CerebroOptimizer:
     combination, as Cerebro handles the optimization internally with proper parallelization.
     """
 
-    def __init__(self, mlflow_tracking_uri: str = "http://mlflow:5000"):
+    def __init__(self, mlflow_tracking_uri: str = "http://mlflow:5000", data_dir: str = "data"):
         """
         Initialize the Cerebro optimizer.
 
         Args:
             mlflow_tracking_uri: MLflow tracking server URI
+            data_dir: Root data directory searched for symbol OHLCV files
         """
-        self.mlflow_logger = MLflowBacktestLogger(tracking_uri=mlflow_tracking_uri)
-        self.parser = BacktestResultParser()
+        # Combinations are logged as child runs, batched from a background thread
+        self.mlflow_logger = MLflowBacktestLogger(tracking_uri=mlflow_tracking_uri, async_logging=True)
+        self.parser = BacktraderResultParser()
+        self.data_dir = data_dir
         logger.info("CerebroOptimizer initialized")
 
     def optimize_strategy(
@@ -106,9 +110,9 @@ class CerebroOptimizer:
 
         # Load data for all symbols
         for symbol in symbols:
-            data = load_data(symbol, start_date, end_date)
+            data = self.load_data(symbol, start_date, end_date)
             if data is not None:
-                cerebro.adddata(data, name=symbol)
+                cerebro.adddata(bt.feeds.PandasData(dataname=data), name=symbol)
                 logger.info("Loaded data for %s: %d bars", symbol, len(data))
             else:
                 logger.warning("Failed to load data for %s", symbol)
@@ -132,10 +136,10 @@ class CerebroOptimizer:
         cerebro.optstrategy(strategy_class, **param_ranges)
 
         # Run optimization
-        results = cerebro.run(maxcpus=maxcpus, optdatas=True)
+        opt_results = cerebro.run(maxcpus=maxcpus, optdatas=True)
 
         # Collect and rank results
-        results = self._collect_optimization_results(cerebro, strategy_class.__name__)
+        results = self._collect_optimization_results(opt_results, strategy_class.__name__)
 
         # Log to MLflow
         self._log_optimization_to_mlflow(
@@ -150,9 +154,35 @@ class CerebroOptimizer:
             strategy_family=strategy_family
         )
 
-        logger.info("Optimization completed. Best Sharpe: %.4f", results['best_result']['sharpe_ratio'])
+        best_sharpe = results['best_result'].get('metrics', {}).get('sharpe_ratio') or 0
+        logger.info("Optimization completed. Best Sharpe: %.4f", best_sharpe)
         return results
 
+    def load_data(self, symbol: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """
+        Load a symbol's OHLCV history from the data directory.
+
+        Args:
+            symbol: Ticker symbol
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD, inclusive)
+
+        Returns:
+            DataFrame indexed by datetime, or None if no data is available
+        """
+        try:
+            df = DataValidator(self.data_dir).load_symbol_data(symbol)
+        except ValueError as e:
+            logger.error("Cannot load data for %s: %s", symbol, e)
+            return None
+        if df is None:
+            return None
+
+        df = df.set_index('datetime').sort_index().loc[start_date:end_date]
+        if df.empty:
+            return None
+        return df[['open', 'high', 'low', 'close', 'volume']]
+
     def _generate_param_combinations(self, param_ranges: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
         """Generate all combinations of parameters for grid search."""
         param_names = list(param_ranges.keys())
@@ -164,14 +194,12 @@ class CerebroOptimizer:
 
         return combinations
 
-    def _collect_optimization_results(self, cerebro: bt.Cerebro, strategy_name: str) -> Dict[str, Any]:
-        """Collect and rank optimization results from Cerebro run."""
+    def _collect_optimization_results(self, opt_results: List[Any], strategy_name: str) -> Dict[str, Any]:
+        """Collect and rank optimization results returned by Cerebro.run()."""
         results = []
 
         # Cerebro.run() with optstrategy returns a list of optimization results
         # Each result contains (strategy_instance, parameter_tuple)
-        opt_results = cerebro.run()
-
         for result in opt_results:
             if len(result) == 2:
                 strategy, param_values = result
@@ -269,7 +297,7 @@ class CerebroOptimizer:
 
         # Rank results by Sharpe ratio (descending), with fallback to total_return
         def sort_key(x):
-            sharpe = x['metrics'].get('sharpe_ratio', 0)
+            sharpe = x['metrics'].get('sharpe_ratio') or 0
             if sharpe != 0:
                 return sharpe
             return x['metrics'].get('total_return', 0)
@@ -295,49 +323,69 @@ class CerebroOptimizer:
         asset_class: str,
         strategy_family: str
     ) -> None:
-        """Log optimization results to MLflow."""
+        """Log optimization results to MLflow (one child run per combination)."""
         try:
-            with self.mlflow_logger.start_run(run_name=f"opt_{strategy_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                                            tags={
-                                                'project': project,
-                                                'asset_class': asset_class,
-                                                'strategy_family': strategy_family,
-                                                'optimization_type': 'grid_search',
-                                                'strategy_name': strategy_name
-                                            }):
-
-                # Log parameters
-                self.mlflow_logger.log_param('strategy_name', strategy_name)
-                self.mlflow_logger.log_param('symbols', ','.join(symbols))
-                self.mlflow_logger.log_param('start_date', start_date)
-                self.mlflow_logger.log_param('end_date', end_date)
-                self.mlflow_logger.log_param('total_combinations', results['total_combinations'])
-
-                # Log parameter ranges
-                for param_name, param_values in param_ranges.items():
-                    self.mlflow_logger.log_param(f'param_range_{param_name}', str(param_values))
-
-                # Log best result metrics
-                if results['best_result']:
-                    best_metrics = results['best_result']['metrics']
-                    for metric_name, metric_value in best_metrics.items():
-                        if isinstance(metric_value, (int, float)):
-                            self.mlflow_logger.log_metric(f'best_{metric_name}', metric_value)
-
-                    # Log best parameters
-                    best_params = results['best_result']['parameters']
-                    for param_name, param_value in best_params.items():
-                        self.mlflow_logger.log_param(f'best_{param_name}', param_value)
-
-                # Log all results as artifact
-                results_file = f"optimization_results_{strategy_name}.json"
-                with open(results_file, 'w') as f:
-                    json.dump(results, f, indent=2, default=str)
-                self.mlflow_logger.log_artifact(results_file)
-
-                # Clean up
-                if os.path.exists(results_file):
-                    os.remove(results_file)
+            experiment_name = self.mlflow_logger._build_experiment_name(
+                project, asset_class, strategy_family, strategy_name
+            )
+            parent_run_id = self.mlflow_logger.start_study(
+                experiment_name=experiment_name,
+                run_name=f"opt_{strategy_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                tags={
+                    'project': project,
+                    'asset_class': asset_class,
+                    'strategy_family': strategy_family,
+                    'optimization_type': 'grid_search',
+                    'strategy_name': strategy_name
+                }
+            )
+            if parent_run_id is None:
+                return
+
+            # Log every combination as a child trial (ranked order)
+            for rank, result in enumerate(results['all_results'], 1):
+                self.mlflow_logger.log_child_trial(
+                    parent_run_id,
+                    trial_params=result['parameters'],
+                    trial_metrics=result['metrics'],
+                    trial_number=rank
+                )
+
+            params = {
+                'strategy_name': strategy_name,
+                'symbols': ','.join(symbols),
+                'start_date': start_date,
+                'end_date': end_date,
+                'total_combinations': results['total_combinations'],
+            }
+
+            # Log parameter ranges
+            for param_name, param_values in param_ranges.items():
+                params[f'param_range_{param_name}'] = str(param_values)
+
+            # Log best result metrics and parameters
+            metrics = {}
+            if results['best_result']:
+                metrics = {
+                    f'best_{metric_name}': metric_value
+                    for metric_name, metric_value in results['best_result']['metrics'].items()
+                }
+                for param_name, param_value in results['best_result']['parameters'].items():
+                    params[f'best_{param_name}'] = param_value
+
+            self.mlflow_logger.finish_study(parent_run_id, params=params, metrics=metrics)
+
+            # Log all results as artifact
+            results_file = f"optimization_results_{strategy_name}.json"
+            with open(results_file, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
+            self.mlflow_logger.client.log_artifact(parent_run_id, results_file)
+
+            # Clean up
+            if os.path.exists(results_file):
+                os.remove(results_file)
+
+            self.mlflow_logger.flush()
 
         except Exception as e:
             logger.error("Failed to log optimization results to MLflow: %s", e)
@@ -426,4 +474,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-<parameter name="filePath">scripts/cerebro_optimizer.py
\ No newline at end of file
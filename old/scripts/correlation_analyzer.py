@@ -5,6 +5,8 @@ Analyzes strategy correlations and implements diversity selection algorithms.
 
 This module provides correlation matrix calculation, filtering algorithms,
 and visualization for strategy diversification in portfolio construction.
+Large universes (e.g. every backtest of an optimization sweep) go through
+BlockwiseCorrelationEngine, which never builds the dense N x N matrix.
 """
 
 import sys
@@ -24,6 +26,9 @@ from utils.results_consolidator import RankingResultsConsolidator
 
 logger = logging.getLogger(__name__)
 
+# Above this many strategies, filtering switches to the blockwise engine
+DENSE_STRATEGY_LIMIT = 2000
+
 
 class CorrelationAnalyzer:
     """
@@ -34,7 +39,8 @@ class CorrelationAnalyzer:
     """
 
     def __init__(self, threshold: float = 0.7, method: str = 'pearson',
-                 min_periods: int = 30):
+                 min_periods: int = 30, cluster_threshold: float = 0.8,
+                 block_size: int = 2048):
         """
         Initialize correlation analyzer.
 
@@ -42,10 +48,14 @@ class CorrelationAnalyzer:
             threshold: Correlation coefficient threshold for filtering (0.7 = 70%)
             method: Correlation method ('pearson', 'spearman', 'kendall')
             min_periods: Minimum overlapping periods required for correlation
+            cluster_threshold: Default threshold for find_correlation_clusters
+            block_size: Strategies per block for the blockwise engine
         """
         self.threshold = threshold
         self.method = method.lower()
         self.min_periods = min_periods
+        self.cluster_threshold = cluster_threshold
+        self.block_size = block_size
 
         if self.method not in ['pearson', 'spearman', 'kendall']:
             raise ValueError(f"Unsupported correlation method: {method}")
@@ -115,6 +125,18 @@ class CorrelationAnalyzer:
             # Return top strategies without correlation filtering
             return rankings_df.head(15)
 
+        # Large universes: blockwise engine instead of a dense pandas matrix
+        if (use_greedy_selection and self.method != 'kendall'
+                and returns_df.shape[1] > DENSE_STRATEGY_LIMIT
+                and len(returns_df) >= self.min_periods):
+            engine = self.create_engine(returns_df)
+            selected_strategies = self._greedy_diversity_selection(rankings_df, engine)
+            filtered_df = rankings_df[rankings_df['strategy'].isin(selected_strategies)].copy()
+            filtered_df = filtered_df.sort_values('composite_score', ascending=False).reset_index(drop=True)
+            logger.info(f"Filtered {len(rankings_df)} strategies to {len(filtered_df)} uncorrelated strategies "
+                        f"(blockwise, {engine.n_strategies} return series)")
+            return filtered_df
+
         # Calculate correlation matrix
         corr_matrix = self.calculate_correlation_matrix(returns_df)
 
@@ -172,49 +194,70 @@ class CorrelationAnalyzer:
 
         return selected
 
-    def _greedy_diversity_selection(self, rankings_df: pd.DataFrame,
-                                  corr_matrix: pd.DataFrame) -> List[str]:
+    def _greedy_diversity_selection(self, rankings: Union[pd.DataFrame, List[str]],
+                                  corr_matrix: Union[pd.DataFrame, 'BlockwiseCorrelationEngine'],
+                                  max_select: int = 20) -> List[str]:
         """
         Greedy algorithm to maximize diversity while maintaining ranking priority.
 
+        Keeps a vector of each strategy's max |correlation| to the selected set,
+        updated with one row per selection, so each candidate check is O(1).
+
         Args:
-            rankings_df: Ranked strategies DataFrame
-            corr_matrix: Correlation matrix
+            rankings: Ranked strategies DataFrame (or strategy names, best first)
+            corr_matrix: Correlation matrix or BlockwiseCorrelationEngine
+            max_select: Maximum number of strategies to select
 
         Returns:
             List of selected strategy names
         """
-        selected = []
-        remaining = rankings_df['strategy'].tolist()
+        names = rankings['strategy'].tolist() if isinstance(rankings, pd.DataFrame) else list(rankings)
 
-        while remaining:
-            # Select highest ranked remaining strategy
-            current_strategy = remaining[0]
-
-            # Check if it correlates too highly with selected strategies
-            should_include = True
+        if isinstance(corr_matrix, BlockwiseCorrelationEngine):
+            engine = corr_matrix
+            positions = {name: i for i, name in enumerate(engine.names)}
+            abs_row = lambda pos: np.abs(engine.correlations_with(pos))
+        else:
+            positions = {name: i for i, name in enumerate(corr_matrix.columns)}
+            abs_corr = np.abs(corr_matrix.to_numpy(dtype=float))
+            abs_row = lambda pos: abs_corr[pos]
 
-            if current_strategy in corr_matrix.columns and selected:
-                max_corr = max(
-                    abs(corr_matrix.loc[current_strategy, selected_strategy])
-                    for selected_strategy in selected
-                    if selected_strategy in corr_matrix.columns
-                )
-                if max_corr > self.threshold:
-                    should_include = False
+        max_corr = np.zeros(len(positions))
+        selected = []
 
-            if should_include:
-                selected.append(current_strategy)
+        for name in names:
+            pos = positions.get(name)
 
-            # Remove from remaining list
-            remaining.remove(current_strategy)
+            # Strategies without correlation data are always included
+            if pos is None or max_corr[pos] <= self.threshold:
+                selected.append(name)
+                if pos is not None:
+                    # fmax ignores NaN correlations (constant or empty returns columns)
+                    np.fmax(max_corr, abs_row(pos), out=max_corr)
 
             # Limit to reasonable number (top 15-20)
-            if len(selected) >= 20:
+            if len(selected) >= max_select:
                 break
 
         return selected
 
+    def create_engine(self, returns: Union[np.ndarray, pd.DataFrame, str, Path],
+                      names: Optional[List[str]] = None,
+                      scratch_path: Optional[Union[str, Path]] = None) -> 'BlockwiseCorrelationEngine':
+        """
+        Build a blockwise correlation engine with this analyzer's settings.
+
+        Args:
+            returns: Returns matrix (periods x strategies), DataFrame or .npy path
+            names: Strategy names for array/.npy input
+            scratch_path: Optional .npy path for the memory-mapped standardized matrix
+
+        Returns:
+            BlockwiseCorrelationEngine
+        """
+        return BlockwiseCorrelationEngine(returns, names=names, method=self.method,
+                                          block_size=self.block_size, scratch_path=scratch_path)
+
     def get_correlation_summary(self, corr_matrix: pd.DataFrame) -> Dict[str, Any]:
         """
         Generate summary statistics for correlation matrix.
@@ -341,48 +384,48 @@ class CorrelationAnalyzer:
         logger.info(f"Correlation matrix exported to {output_path}")
         return str(output_path)
 
-    def find_correlation_clusters(self, corr_matrix: pd.DataFrame,
-                                cluster_threshold: float = 0.8) -> List[List[str]]:
+    def find_correlation_clusters(self, corr_matrix: Union[pd.DataFrame, 'BlockwiseCorrelationEngine'],
+                                cluster_threshold: Optional[float] = None) -> List[List[str]]:
         """
         Identify clusters of highly correlated strategies.
 
+        With a BlockwiseCorrelationEngine, clusters are the connected components
+        of the |correlation| > threshold graph, built without a dense matrix.
+
         Args:
-            corr_matrix: Correlation matrix DataFrame
-            cluster_threshold: Threshold for cluster identification
+            corr_matrix: Correlation matrix DataFrame or BlockwiseCorrelationEngine
+            cluster_threshold: Threshold for cluster identification (defaults to
+                the analyzer's cluster_threshold)
 
         Returns:
             List of strategy clusters (lists of strategy names)
         """
+        if cluster_threshold is None:
+            cluster_threshold = self.cluster_threshold
+
+        if isinstance(corr_matrix, BlockwiseCorrelationEngine):
+            return corr_matrix.find_clusters(cluster_threshold)
+
         if corr_matrix.empty:
             return []
 
         try:
             # Simple clustering based on correlation threshold
             clusters = []
-            processed = set()
+            names = np.asarray(corr_matrix.columns, dtype=object)
+            high = np.abs(corr_matrix.to_numpy(dtype=float)) > cluster_threshold
+            np.fill_diagonal(high, False)
+            processed = np.zeros(len(names), dtype=bool)
 
-            for strategy in corr_matrix.columns:
-                if strategy in processed:
+            for i in range(len(names)):
+                if processed[i]:
                     continue
 
-                # Find strategies highly correlated with this one
-                correlated_strategies = []
-                for other_strategy in corr_matrix.columns:
-                    if (other_strategy != strategy and
-                        abs(corr_matrix.loc[strategy, other_strategy]) > cluster_threshold):
-                        correlated_strategies.append(other_strategy)
-
-                if correlated_strategies:
-                    # Form cluster
-                    cluster = [strategy] + correlated_strategies
-                    clusters.append(sorted(cluster))
-
-                    # Mark as processed
-                    processed.update(cluster)
-                else:
-                    # Singleton cluster
-                    clusters.append([strategy])
-                    processed.add(strategy)
+                # Strategies highly correlated with this one form its cluster
+                members = np.flatnonzero(high[i])
+                cluster = np.concatenate([[i], members])
+                clusters.append(sorted(names[cluster].tolist()))
+                processed[cluster] = True
 
             logger.info(f"Identified {len(clusters)} correlation clusters")
             return clusters
@@ -424,6 +467,246 @@ class CorrelationAnalyzer:
             return 0.0
 
 
+class BlockwiseCorrelationEngine:
+    """
+    Blockwise correlation engine for large strategy universes.
+
+    Works on a (periods x strategies) returns matrix, typically a memory-mapped
+    .npy file, without materializing the dense N x N correlation matrix:
+    returns are standardized once into float32 (demeaned, unit norm), after
+    which any correlation block is a single matrix product Z_i.T @ Z_j.
+
+    Missing returns are replaced by the column mean before standardizing, so
+    correlations use all periods rather than pairwise-complete observations.
+    """
+
+    def __init__(self, returns: Union[np.ndarray, pd.DataFrame, str, Path],
+                 names: Optional[List[str]] = None, method: str = 'pearson',
+                 block_size: int = 2048, scratch_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize correlation engine.
+
+        Args:
+            returns: Returns matrix (periods x strategies) as an array, DataFrame
+                or path to a .npy file (opened memory-mapped)
+            names: Strategy names (defaults to DataFrame columns or column indices)
+            method: 'pearson' or 'spearman' (kendall has no matrix-product form)
+            block_size: Strategies per block
+            scratch_path: Optional .npy path for the standardized matrix
+                (memory-mapped; defaults to an in-memory float32 array)
+        """
+        self.method = method.lower()
+        if self.method not in ('pearson', 'spearman'):
+            raise ValueError(f"Blockwise correlation supports pearson and spearman, not {method}")
+
+        if isinstance(returns, (str, Path)):
+            returns = np.load(returns, mmap_mode='r')
+        elif isinstance(returns, pd.DataFrame):
+            if names is None:
+                names = [str(c) for c in returns.columns]
+            returns = returns.to_numpy(dtype=np.float32)
+
+        if returns.ndim != 2:
+            raise ValueError(f"Returns matrix must be 2-D (periods x strategies), got shape {returns.shape}")
+
+        self.n_periods, self.n_strategies = returns.shape
+        self.names = list(names) if names is not None else [str(i) for i in range(self.n_strategies)]
+        if len(self.names) != self.n_strategies:
+            raise ValueError(f"{len(self.names)} names for {self.n_strategies} strategies")
+
+        self.block_size = max(1, int(block_size))
+        self.z = self._standardize(returns, scratch_path)
+
+    def _block_ranges(self):
+        """Yield (start, end) strategy ranges of at most block_size."""
+        for start in range(0, self.n_strategies, self.block_size):
+            yield start, min(start + self.block_size, self.n_strategies)
+
+    def _standardize(self, returns: np.ndarray, scratch_path: Optional[Union[str, Path]]) -> np.ndarray:
+        """Standardize returns blockwise so that Z.T @ Z is the correlation matrix."""
+        shape = (self.n_periods, self.n_strategies)
+        if scratch_path is not None:
+            z = np.lib.format.open_memmap(scratch_path, mode='w+', dtype=np.float32, shape=shape)
+        else:
+            z = np.empty(shape, dtype=np.float32)
+
+        for start, end in self._block_ranges():
+            block = np.array(returns[:, start:end], dtype=np.float32)
+
+            # Column-mean fill for missing values (zero after demeaning)
+            missing = np.isnan(block)
+            if missing.any():
+                with np.errstate(all='ignore'):
+                    col_means = np.nan_to_num(np.nanmean(block, axis=0))
+                block[missing] = col_means[np.nonzero(missing)[1]]
+
+            if self.method == 'spearman':
+                block = stats.rankdata(block, axis=0).astype(np.float32)
+
+            block -= block.mean(axis=0)
+            norms = np.sqrt(np.einsum('ij,ij->j', block, block))
+            # Constant series have no defined correlation; leave them at zero
+            block /= np.where(norms > 0, norms, np.inf).astype(np.float32)
+            z[:, start:end] = block
+
+        return z
+
+    def correlation_block(self, rows: Union[slice, np.ndarray], cols: Union[slice, np.ndarray]) -> np.ndarray:
+        """Correlations between two sets of strategies (float32)."""
+        return np.clip(self.z[:, rows].T @ self.z[:, cols], -1.0, 1.0)
+
+    def correlations_with(self, index: int) -> np.ndarray:
+        """Correlations of one strategy with every strategy (float32 vector)."""
+        return np.clip(self.z[:, index] @ self.z, -1.0, 1.0)
+
+    def dense_matrix(self) -> pd.DataFrame:
+        """Full correlation matrix as a DataFrame (only sensible for small universes)."""
+        corr = self.correlation_block(slice(None), slice(None))
+        np.fill_diagonal(corr, 1.0)
+        return pd.DataFrame(corr, index=self.names, columns=self.names)
+
+    def top_k_neighbors(self, k: int = 10, absolute: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stream the k most correlated neighbours of every strategy.
+
+        Only one row block x column block of correlations is held at a time;
+        running top-k candidates are merged after each column block.
+
+        Args:
+            k: Neighbours per strategy (excluding itself)
+            absolute: Rank by |correlation| instead of signed correlation
+
+        Returns:
+            Tuple of (indices, correlations), both shaped (strategies, k),
+            sorted by descending strength; correlations keep their sign
+        """
+        k = max(0, min(k, self.n_strategies - 1))
+        indices = np.zeros((self.n_strategies, k), dtype=np.int64)
+        values = np.zeros((self.n_strategies, k), dtype=np.float32)
+        if k == 0:
+            return indices, values
+
+        for row_start, row_end in self._block_ranges():
+            n_rows = row_end - row_start
+            best_idx = np.empty((n_rows, 0), dtype=np.int64)
+            best_corr = np.empty((n_rows, 0), dtype=np.float32)
+            best_score = np.empty((n_rows, 0), dtype=np.float32)
+
+            for col_start, col_end in self._block_ranges():
+                corr = self.correlation_block(slice(row_start, row_end), slice(col_start, col_end))
+                score = np.abs(corr) if absolute else corr.copy()
+
+                # Exclude self-correlation where the blocks overlap
+                overlap = np.arange(max(row_start, col_start), min(row_end, col_end))
+                score[overlap - row_start, overlap - col_start] = -np.inf
+
+                cand_idx = np.concatenate(
+                    [best_idx, np.broadcast_to(np.arange(col_start, col_end), corr.shape)], axis=1)
+                cand_corr = np.concatenate([best_corr, corr], axis=1)
+                cand_score = np.concatenate([best_score, score], axis=1)
+
+                if cand_score.shape[1] > k:
+                    keep = np.argpartition(-cand_score, k - 1, axis=1)[:, :k]
+                    cand_idx = np.take_along_axis(cand_idx, keep, axis=1)
+                    cand_corr = np.take_along_axis(cand_corr, keep, axis=1)
+                    cand_score = np.take_along_axis(cand_score, keep, axis=1)
+                best_idx, best_corr, best_score = cand_idx, cand_corr, cand_score
+
+            order = np.argsort(-best_score, axis=1, kind='stable')
+            indices[row_start:row_end] = np.take_along_axis(best_idx, order, axis=1)
+            values[row_start:row_end] = np.take_along_axis(best_corr, order, axis=1)
+
+        return indices, values
+
+    def neighbors_frame(self, k: int = 10, absolute: bool = True) -> pd.DataFrame:
+        """Top-k neighbours as a long DataFrame (strategy, neighbor, rank, correlation)."""
+        indices, values = self.top_k_neighbors(k, absolute)
+        names = np.asarray(self.names, dtype=object)
+        n, k = indices.shape
+        return pd.DataFrame({
+            'strategy': np.repeat(names, k),
+            'neighbor': names[indices.ravel()],
+            'rank': np.tile(np.arange(1, k + 1), n),
+            'correlation': values.ravel(),
+        })
+
+    def find_clusters(self, cluster_threshold: float = 0.8) -> List[List[str]]:
+        """
+        Group strategies into connected components of |correlation| > threshold.
+
+        Edges are collected blockwise (upper triangle only) into a sparse graph.
+
+        Args:
+            cluster_threshold: Correlation threshold for an edge
+
+        Returns:
+            List of clusters (sorted strategy names), largest first
+        """
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        rows, cols = [], []
+        for row_start, row_end in self._block_ranges():
+            for col_start, col_end in self._block_ranges():
+                if col_end <= row_start:
+                    continue
+                corr = self.correlation_block(slice(row_start, row_end), slice(col_start, col_end))
+                r, c = np.nonzero(np.abs(corr) > cluster_threshold)
+                r, c = r + row_start, c + col_start
+                upper = c > r
+                rows.append(r[upper])
+                cols.append(c[upper])
+
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int64)
+        graph = coo_matrix((np.ones(rows.size, dtype=np.int8), (rows, cols)),
+                           shape=(self.n_strategies, self.n_strategies))
+        _, labels = connected_components(graph, directed=False)
+
+        names = np.asarray(self.names, dtype=object)
+        order = np.argsort(labels, kind='stable')
+        groups = np.split(order, np.flatnonzero(np.diff(labels[order])) + 1)
+        clusters = [sorted(names[group].tolist()) for group in groups]
+        return sorted(clusters, key=len, reverse=True)
+
+
+def run_blockwise_analysis(analyzer: CorrelationAnalyzer, rankings_df: pd.DataFrame,
+                           args: argparse.Namespace) -> int:
+    """Top-k neighbours and optional greedy filtering from a .npy returns matrix."""
+    names = None
+    if args.names:
+        names = [line.strip() for line in Path(args.names).read_text().splitlines() if line.strip()]
+
+    print(f"Standardizing returns matrix {args.returns_npy} (block size {args.block_size})...")
+    engine = analyzer.create_engine(args.returns_npy, names=names)
+    print(f"Strategies: {engine.n_strategies}, periods: {engine.n_periods}")
+
+    if args.filter:
+        selected = analyzer._greedy_diversity_selection(rankings_df, engine)
+        filtered_df = rankings_df[rankings_df['strategy'].isin(selected)]
+        print(f"Selected {len(filtered_df)} uncorrelated strategies (threshold: {args.threshold})")
+        if args.output:
+            filtered_df.to_csv(args.output, index=False)
+            print(f"Filtered strategies exported to: {args.output}")
+        return 0
+
+    neighbors = engine.neighbors_frame(k=args.top_k)
+    if not args.summary_only:
+        print(neighbors.head(20).to_string(index=False))
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if args.format == 'parquet':
+            neighbors.to_parquet(output_path, index=False)
+        elif args.format == 'json':
+            neighbors.to_json(output_path, orient='records', indent=2)
+        else:
+            neighbors.to_csv(output_path, index=False)
+        print(f"Top-{args.top_k} neighbours exported to: {output_path}")
+    return 0
+
+
 def main():
     """Command-line interface for correlation analysis."""
     parser = argparse.ArgumentParser(
@@ -442,6 +725,10 @@ Examples:
 
   # Filter correlated strategies
   python scripts/correlation_analyzer.py --rankings rankings.csv --filter --output filtered_strategies.csv
+
+  # Large sweep: blockwise top-10 neighbours from a memory-mapped returns matrix
+  python scripts/correlation_analyzer.py --rankings rankings.csv --returns-npy returns.npy \\
+      --names strategies.txt --top-k 10 --output neighbors.csv
         """
     )
 
@@ -499,6 +786,32 @@ Examples:
         help='Only show summary statistics, no detailed output'
     )
 
+    parser.add_argument(
+        '--returns-npy',
+        type=str,
+        help='Returns matrix (periods x strategies) .npy file for blockwise analysis (memory-mapped)'
+    )
+
+    parser.add_argument(
+        '--names',
+        type=str,
+        help='Strategy names for --returns-npy columns, one per line (default: column index)'
+    )
+
+    parser.add_argument(
+        '--top-k',
+        type=int,
+        default=10,
+        help='Neighbours per strategy for blockwise analysis (default: 10)'
+    )
+
+    parser.add_argument(
+        '--block-size',
+        type=int,
+        default=2048,
+        help='Strategies per block for blockwise analysis (default: 2048)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -526,9 +839,13 @@ Examples:
         # Initialize analyzer
         analyzer = CorrelationAnalyzer(
             threshold=args.threshold,
-            method=args.method
+            method=args.method,
+            block_size=args.block_size
         )
 
+        if args.returns_npy:
+            return run_blockwise_analysis(analyzer, rankings_df, args)
+
         # Calculate correlation matrix
         print(f"Calculating {args.method} correlation matrix...")
         corr_matrix = analyzer.calculate_correlation_matrix(rankings_df)
@@ -15,6 +15,10 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.utils.market_hours import get_trading_calendar
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -123,17 +127,17 @@ class DataValidator:
         else:
             dates = pd.to_datetime(df.iloc[:, 0])
 
-        # Generate expected trading days (Monday-Friday, excluding holidays)
-        start = dates.min()
-        end = dates.max()
-        expected_dates = pd.bdate_range(start=start, end=end)
+        # Expected trading days (Monday-Friday, excluding holidays)
+        actual_dates = np.unique(np.asarray(dates, dtype="datetime64[D]"))
+        actual_dates = actual_dates[~np.isnat(actual_dates)]
+        if actual_dates.size == 0:
+            return 0, []
+        expected_dates = get_trading_calendar().sessions_between(
+            actual_dates[0], actual_dates[-1]
+        )
 
         # Find missing dates
-        actual_dates = set(
-            dates.dt.date if hasattr(dates, "dt") else [d.date() for d in dates]
-        )
-        expected_dates_set = set(expected_dates.date)
-        missing = sorted(expected_dates_set - actual_dates)
+        missing = np.setdiff1d(expected_dates, actual_dates, assume_unique=True)
 
         return len(missing), [str(d) for d in missing[:10]]  # Return first 10
 
@@ -211,15 +215,17 @@ class DataValidator:
         else:
             dates = pd.to_datetime(df.iloc[:, 0]).sort_values()
 
-        # Calculate gaps in business days
-        gaps = []
-        for i in range(len(dates) - 1):
-            start = dates.iloc[i]
-            end = dates.iloc[i + 1]
-            gap_days = len(pd.bdate_range(start=start, end=end)) - 1
+        # Calculate gaps in trading days
+        days = np.asarray(dates, dtype="datetime64[D]")
+        days = days[~np.isnat(days)]
+        if days.size < 2:
+            return 0, []
+        gap_days = get_trading_calendar().count_sessions(days[:-1], days[1:])
 
-            if gap_days > max_gap_days:
-                gaps.append((str(start.date()), str(end.date()), gap_days))
+        gap_indices = np.flatnonzero(gap_days > max_gap_days)
+        gaps = [
+            (str(days[i]), str(days[i + 1]), int(gap_days[i])) for i in gap_indices
+        ]
 
         return len(gaps), gaps[:10]
 
@@ -7,12 +7,46 @@ Translates cost_config.yaml IB commission structures into Backtrader CommissionI
 Models:
 - ib_standard: Standard per-share commission ($0.005/share, $1.00 min)
 - ib_pro: Tiered pricing ($0.0035/share, $0.35 min)
+
+cost_config.yaml is parsed once per file version (load_cost_config), and
+commission/slippage models offer vectorized batch methods (commissions,
+get_slippage_batch, fill_prices) for pricing whole trade arrays.
 """
 
 import backtrader as bt
+import numpy as np
 import yaml
+from functools import lru_cache
 from pathlib import Path
 
+DEFAULT_COST_CONFIG = Path('/app/config/cost_config.yaml')
+
+
+@lru_cache(maxsize=8)
+def _read_cost_config(path: str, mtime: float) -> dict:
+    """Parse cost_config.yaml (cached per path and modification time)."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
+def load_cost_config(config_path=None) -> dict:
+    """
+    Load cost_config.yaml, parsing it only when the file changed.
+
+    Args:
+        config_path: Path to cost_config.yaml (optional)
+
+    Returns:
+        dict: Scheme name -> scheme configuration (shared, do not mutate)
+    """
+    config_path = Path(config_path) if config_path is not None else DEFAULT_COST_CONFIG
+
+    if not config_path.exists():
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    resolved = config_path.resolve()
+    return _read_cost_config(str(resolved), resolved.stat().st_mtime)
+
 
 class IBCommissionBase(bt.CommInfoBase):
     """
@@ -20,8 +54,13 @@ class IBCommissionBase(bt.CommInfoBase):
 
     Extends Backtrader's CommInfoBase with IB-specific features:
     - Per-share commission with minimum
+    - Optional per-order share tiers
     - SEC fees on sells
     - Slippage modeling
+
+    Parameters are copied into plain attributes and the tier table into
+    NumPy arrays once at construction, so per-fill commissions skip
+    parameter lookups and commissions() prices whole trade arrays at once.
     """
 
     params = (
@@ -29,11 +68,34 @@ class IBCommissionBase(bt.CommInfoBase):
         ('minimum_commission', 1.00),
         ('maximum_commission_rate', 0.01),
         ('sec_fee_rate', 0.0000278),  # $27.80 per $1M
+        ('tiers', ()),  # ((min_shares, commission_per_share), ...) per order size
         ('stocklike', True),
         ('commtype', bt.CommInfoBase.COMM_FIXED),
         ('percabs', False),  # Commission is absolute, not percentage
     )
 
+    def __init__(self):
+        super().__init__()
+        self._per_share = float(self.p.commission_per_share)
+        self._minimum = float(self.p.minimum_commission)
+        self._max_rate = float(self.p.maximum_commission_rate)
+        self._sec_rate = float(self.p.sec_fee_rate)
+
+        # Tier table: order sizes from tier_shares[i] pay tier_rates[i] per share
+        tiers = sorted((float(shares), float(rate)) for shares, rate in self.p.tiers)
+        if tiers and tiers[0][0] > 0:
+            tiers.insert(0, (0.0, self._per_share))
+        self._tier_shares = np.array([shares for shares, _ in tiers] or [0.0])
+        self._tier_rates = np.array([rate for _, rate in tiers] or [self._per_share])
+        self._tiered = len(self._tier_rates) > 1
+
+    def _per_share_rate(self, shares: float) -> float:
+        """Per-share rate for an order of `shares` (from the tier table)."""
+        if not self._tiered:
+            return self._per_share
+        index = int(np.searchsorted(self._tier_shares, shares, side='right')) - 1
+        return float(self._tier_rates[index])
+
     def _getcommission(self, size, price, pseudoexec):
         """
         Calculate commission for a trade
@@ -46,22 +108,51 @@ class IBCommissionBase(bt.CommInfoBase):
         Returns:
             float: Total commission amount
         """
-        # Base commission: per-share rate * number of shares
-        commission = abs(size) * self.p.commission_per_share
+        shares = abs(size)
+        trade_value = abs(size * price)
 
-        # Apply minimum commission
-        commission = max(commission, self.p.minimum_commission)
+        # Base commission: per-share rate * number of shares, with minimum
+        commission = shares * self._per_share_rate(shares)
+        if commission < self._minimum:
+            commission = self._minimum
 
         # Apply maximum commission rate (percentage of trade value)
-        max_commission = abs(size * price) * self.p.maximum_commission_rate
-        commission = min(commission, max_commission)
+        max_commission = trade_value * self._max_rate
+        if commission > max_commission:
+            commission = max_commission
 
         # Add SEC fees for sells
         if size < 0:  # Sell order
-            sec_fees = abs(size * price) * self.p.sec_fee_rate
-            commission += sec_fees
+            commission += trade_value * self._sec_rate
+
+        return float(commission)
 
-        return commission
+    def commissions(self, sizes, prices) -> np.ndarray:
+        """
+        Calculate commissions for arrays of trades
+
+        Args:
+            sizes: Share counts (positive for buy, negative for sell)
+            prices: Execution prices (scalar or same shape as sizes)
+
+        Returns:
+            np.ndarray: Commission per trade (same result as _getcommission)
+        """
+        sizes = np.asarray(sizes, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+
+        shares = np.abs(sizes)
+        trade_value = np.abs(sizes * prices)
+
+        if self._tiered:
+            index = np.searchsorted(self._tier_shares, shares, side='right') - 1
+            rate = self._tier_rates[index]
+        else:
+            rate = self._per_share
+
+        commission = np.maximum(shares * rate, self._minimum)
+        commission = np.minimum(commission, trade_value * self._max_rate)
+        return commission + np.where(sizes < 0, trade_value * self._sec_rate, 0.0)
 
 
 class IBCommissionStandard(IBCommissionBase):
@@ -98,6 +189,12 @@ class IBCommissionPro(IBCommissionBase):
     )
 
 
+COMMISSION_SCHEMES = {
+    'ib_standard': IBCommissionStandard,
+    'ib_pro': IBCommissionPro,
+}
+
+
 class IBSlippageModel:
     """
     IB Slippage Model
@@ -117,6 +214,30 @@ class IBSlippageModel:
         """
         self.market_order_bps = market_order_bps
         self.limit_order_bps = limit_order_bps
+        self._market_fraction = market_order_bps / 10000.0
+        self._limit_fraction = limit_order_bps / 10000.0
+
+    @classmethod
+    def from_config(cls, scheme='ib_standard', config_path=None):
+        """
+        Create slippage model from a cost_config.yaml scheme
+
+        Args:
+            scheme: Commission scheme name ('ib_standard' or 'ib_pro')
+            config_path: Path to cost_config.yaml (optional)
+
+        Returns:
+            IBSlippageModel: Configured slippage model
+        """
+        config = load_cost_config(config_path)
+        if scheme not in config:
+            raise ValueError(f"Unknown commission scheme: {scheme}. Available: {list(config.keys())}")
+
+        slippage = config[scheme].get('slippage', {})
+        return cls(
+            market_order_bps=slippage.get('market_order_bps', 5),
+            limit_order_bps=slippage.get('limit_order_bps', 0),
+        )
 
     def get_slippage(self, price, is_market_order=True):
         """
@@ -129,8 +250,36 @@ class IBSlippageModel:
         Returns:
             float: Slippage amount per share
         """
-        bps = self.market_order_bps if is_market_order else self.limit_order_bps
-        return price * (bps / 10000.0)
+        return price * (self._market_fraction if is_market_order else self._limit_fraction)
+
+    def get_slippage_batch(self, prices, is_market_order=True) -> np.ndarray:
+        """
+        Calculate slippage amounts for arrays of orders
+
+        Args:
+            prices: Order prices
+            is_market_order: Bool or bool array (True for market orders)
+
+        Returns:
+            np.ndarray: Slippage amount per share for each order
+        """
+        fraction = np.where(is_market_order, self._market_fraction, self._limit_fraction)
+        return np.asarray(prices, dtype=np.float64) * fraction
+
+    def fill_prices(self, prices, sizes, is_market_order=True) -> np.ndarray:
+        """
+        Apply slippage against the trader to arrays of orders
+
+        Args:
+            prices: Order prices
+            sizes: Order sizes (positive for buy, negative for sell)
+            is_market_order: Bool or bool array (True for market orders)
+
+        Returns:
+            np.ndarray: Buy prices moved up and sell prices moved down by slippage
+        """
+        slippage = self.get_slippage_batch(prices, is_market_order)
+        return np.asarray(prices, dtype=np.float64) + np.sign(sizes) * slippage
 
 
 def load_commission_from_config(scheme='ib_standard', config_path=None):
@@ -144,43 +293,26 @@ def load_commission_from_config(scheme='ib_standard', config_path=None):
     Returns:
         IBCommissionBase: Configured commission instance
     """
-    if config_path is None:
-        config_path = Path('/app/config/cost_config.yaml')
-
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = load_cost_config(config_path)
 
     if scheme not in config:
         raise ValueError(f"Unknown commission scheme: {scheme}. Available: {list(config.keys())}")
 
     scheme_config = config[scheme]
 
-    # Create appropriate commission class
-    if scheme == 'ib_standard':
-        commission = IBCommissionStandard(
-            commission_per_share=scheme_config['commission_per_share'],
-            minimum_commission=scheme_config['minimum_commission'],
-            maximum_commission_rate=scheme_config['maximum_commission_rate'],
-            sec_fee_rate=scheme_config['sec_fee_rate']
-        )
-    elif scheme == 'ib_pro':
-        commission = IBCommissionPro(
-            commission_per_share=scheme_config['commission_per_share'],
-            minimum_commission=scheme_config['minimum_commission'],
-            maximum_commission_rate=scheme_config['maximum_commission_rate'],
-            sec_fee_rate=scheme_config['sec_fee_rate']
-        )
-    else:
-        # Fallback to base class with config values
-        commission = IBCommissionBase(
-            commission_per_share=scheme_config['commission_per_share'],
-            minimum_commission=scheme_config['minimum_commission'],
-            maximum_commission_rate=scheme_config['maximum_commission_rate'],
-            sec_fee_rate=scheme_config['sec_fee_rate']
-        )
+    # Create appropriate commission class (base class for other schemes)
+    commission_class = COMMISSION_SCHEMES.get(scheme, IBCommissionBase)
+    tiers = tuple(
+        (tier['min_shares'], tier['commission_per_share'])
+        for tier in scheme_config.get('tiers', [])
+    )
+    commission = commission_class(
+        commission_per_share=scheme_config['commission_per_share'],
+        minimum_commission=scheme_config['minimum_commission'],
+        maximum_commission_rate=scheme_config['maximum_commission_rate'],
+        sec_fee_rate=scheme_config['sec_fee_rate'],
+        tiers=tiers,
+    )
 
     return commission
 
@@ -195,12 +327,9 @@ def get_commission_scheme(scheme='ib_standard'):
     Returns:
         IBCommissionBase: Commission instance
     """
-    if scheme == 'ib_standard':
-        return IBCommissionStandard()
-    elif scheme == 'ib_pro':
-        return IBCommissionPro()
-    else:
+    if scheme not in COMMISSION_SCHEMES:
         raise ValueError(f"Unknown scheme: {scheme}. Use 'ib_standard' or 'ib_pro'")
+    return COMMISSION_SCHEMES[scheme]()
 
 
 if __name__ == '__main__':
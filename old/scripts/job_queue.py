@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Redis Job Queue Helpers
+Epic 20: Parallel Backtesting Orchestrator
+
+Job producers push JSON jobs onto per-type Redis sorted sets. Every enqueue
+also increments worker_stats:<job_type>:enqueued so the auto-scaler can
+measure arrival rates directly instead of inferring them from completions.
+"""
+
+from typing import Any
+
+# Per-job-type statistics prefix (shared with unified_worker and auto_scaling_manager)
+STATS_KEY_PREFIX = 'worker_stats'
+
+
+def enqueued_key(job_type: str) -> str:
+    """Redis counter of jobs ever enqueued for a job type."""
+    return f'{STATS_KEY_PREFIX}:{job_type}:enqueued'
+
+
+def enqueue_job(redis_client: Any, queue_name: str, job_type: str, job_json: str, score: float) -> int:
+    """
+    Add a job to a queue and count the arrival in one round trip.
+
+    Args:
+        redis_client: Redis client
+        queue_name: Sorted set the workers pop from
+        job_type: Job type the arrival is counted under
+        job_json: Serialized job
+        score: Sorted set score (lower pops first)
+
+    Returns:
+        Number of members added (ZADD reply)
+    """
+    pipe = redis_client.pipeline()
+    pipe.zadd(queue_name, {job_json: score})
+    pipe.incr(enqueued_key(job_type))
+    added, _ = pipe.execute()
+    return added
@@ -11,14 +11,17 @@ This module provides comprehensive metrics analysis beyond the basic Backtrader
 - HTML tearsheets with quantstats integration
 """
 
-from .quantstats_metrics import QuantStatsAnalyzer
-from .alpha_beta import AlphaBetaAnalyzer
-from .regime_metrics import RegimeAnalyzer
+from .quantstats_metrics import QuantStatsAnalyzer, BatchMetricsEngine
+from .alpha_beta import AlphaBetaAnalyzer, rolling_benchmark_metrics
+from .regime_metrics import RegimeAnalyzer, REGIME_LABELS
 
 __all__ = [
     'QuantStatsAnalyzer',
+    'BatchMetricsEngine',
     'AlphaBetaAnalyzer', 
-    'RegimeAnalyzer'
+    'rolling_benchmark_metrics',
+    'RegimeAnalyzer',
+    'REGIME_LABELS'
 ]
 
 __version__ = '1.0.0'
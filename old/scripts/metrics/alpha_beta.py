@@ -10,6 +10,7 @@ This module provides comprehensive benchmark comparison metrics:
 - Information Ratio calculation
 - Tracking error calculation
 - Jenson Alpha calculation
+- Rolling metrics for one or many strategies via cumulative-sum kernels
 """
 
 import pandas as pd
@@ -23,6 +24,104 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums over [i - window, i) for i = window..n-1 along axis 0."""
+    cumulative = np.cumsum(values, axis=0)
+    cumulative = np.concatenate([np.zeros((1,) + values.shape[1:]), cumulative])
+    return cumulative[window:-1] - cumulative[:-window - 1]
+
+
+def rolling_benchmark_metrics(strategy_returns: np.ndarray, benchmark_returns: np.ndarray,
+                              window: int = 252, daily_rf: float = 0.0,
+                              periods_per_year: int = 252) -> Dict[str, np.ndarray]:
+    """
+    Rolling beta, alpha, tracking error, information ratio and correlation.
+
+    All windows are computed in one pass from cumulative sums of x, y, x^2,
+    y^2 and xy, so the cost is O(n) regardless of the window length. The value
+    at row i uses rows [i - window, i), matching
+    AlphaBetaAnalyzer.calculate_rolling_metrics.
+
+    Args:
+        strategy_returns: Returns of shape (n,) or (n, n_strategies); NaN marks
+            missing observations (windows containing one yield NaN)
+        benchmark_returns: Benchmark returns of shape (n,)
+        window: Rolling window length
+        daily_rf: Per-period risk-free rate subtracted from both series
+        periods_per_year: Annualization factor
+
+    Returns:
+        Dict of metric name -> array of shape (n - window,) or
+        (n - window, n_strategies)
+    """
+    y = np.asarray(strategy_returns, dtype=np.float64)
+    x = np.asarray(benchmark_returns, dtype=np.float64)
+    one_dimensional = y.ndim == 1
+    if one_dimensional:
+        y = y[:, None]
+    x = x[:, None]
+
+    n = len(y)
+    if n <= window:
+        empty = np.empty((0,) if one_dimensional else (0, y.shape[1]))
+        return {name: empty for name in ('beta', 'alpha', 'tracking_error', 'information_ratio', 'correlation')}
+
+    # Centre on full-sample means: the moments below are shift invariant and
+    # centring keeps the cumulative sums of squares well conditioned
+    valid = ~(np.isnan(y) | np.isnan(x))
+    y_center = np.nanmean(np.where(valid, y, np.nan), axis=0)
+    x_center = np.nanmean(x)
+    y_c = np.where(valid, y - y_center, 0.0)
+    x_c = np.where(valid, x - x_center, 0.0)
+
+    count = _window_sums(valid.astype(np.float64), window)
+    sum_x = _window_sums(x_c, window)
+    sum_y = _window_sums(y_c, window)
+    sum_xx = _window_sums(x_c * x_c, window)
+    sum_yy = _window_sums(y_c * y_c, window)
+    sum_xy = _window_sums(x_c * y_c, window)
+
+    complete = count == window
+    w = float(window)
+    mean_x = sum_x / w
+    mean_y = sum_y / w
+    # Co-moments (times window) of the window
+    var_x = np.maximum(sum_xx - w * mean_x ** 2, 0.0)
+    var_y = np.maximum(sum_yy - w * mean_y ** 2, 0.0)
+    cov_xy = sum_xy - w * mean_x * mean_y
+    var_d = np.maximum(var_y + var_x - 2.0 * cov_xy, 0.0)
+
+    # Treat variances at rounding-error level (relative to the full sample) as zero
+    x_floor = 1e-12 * max(np.nanvar(x_c) * w, np.finfo(float).tiny)
+    d_floor = 1e-12 * np.maximum(np.nanvar(np.where(valid, y_c - x_c, np.nan), axis=0) * w,
+                                 np.finfo(float).tiny)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        beta = np.where(var_x > x_floor, cov_xy / var_x, 0.0)
+        # Excess-return means: the centring and the risk-free rate shift both series
+        excess_y = mean_y + y_center - daily_rf
+        excess_x = mean_x + x_center - daily_rf
+        alpha = (excess_y - beta * excess_x) * periods_per_year
+
+        std_d = np.sqrt(var_d / (w - 1))
+        tracking_error = std_d * np.sqrt(periods_per_year)
+        mean_d = (mean_y + y_center) - (mean_x + x_center)
+        information_ratio = np.where(var_d > d_floor, mean_d / std_d * np.sqrt(periods_per_year), 0.0)
+        correlation = cov_xy / np.sqrt(var_x * var_y)
+
+    metrics = {
+        'beta': beta,
+        'alpha': alpha,
+        'tracking_error': tracking_error,
+        'information_ratio': information_ratio,
+        'correlation': correlation,
+    }
+    for name, values in metrics.items():
+        values = np.where(complete, values, np.nan)
+        metrics[name] = values[:, 0] if one_dimensional else values
+    return metrics
+
+
 class AlphaBetaAnalyzer:
     """
     Alpha/Beta analyzer for benchmark comparison in trading strategies.
@@ -130,8 +229,8 @@ class AlphaBetaAnalyzer:
                       benchmark_returns: pd.Series) -> pd.DataFrame:
         """Align strategy and benchmark returns by date."""
         # Ensure proper datetime index
-        strategy_returns = pd.to_datetime(strategy_returns.index)
-        benchmark_returns = pd.to_datetime(benchmark_returns.index)
+        strategy_returns = strategy_returns.set_axis(pd.to_datetime(strategy_returns.index))
+        benchmark_returns = benchmark_returns.set_axis(pd.to_datetime(benchmark_returns.index))
         
         # Combine and drop NaN values
         aligned_data = pd.DataFrame({
@@ -229,68 +328,72 @@ class AlphaBetaAnalyzer:
         else:
             return "Very low volatility (defensive)"
     
-    def calculate_rolling_metrics(self, strategy_returns: pd.Series, 
+    def calculate_rolling_metrics(self, strategy_returns: Union[pd.Series, pd.DataFrame],
                                 benchmark_returns: pd.Series, 
                                 window: int = 252) -> Dict:
         """
         Calculate rolling alpha/beta metrics over time.
         
+        Each value at date i uses the `window` observations before it. Passing
+        a DataFrame computes every strategy (column) against the benchmark in
+        one vectorized pass.
+        
         Args:
-            strategy_returns: Strategy returns series
+            strategy_returns: Strategy returns series, or DataFrame with one
+                column per strategy
             benchmark_returns: Benchmark returns series
             window: Rolling window size (default 252 for 1 year)
             
         Returns:
-            Dictionary with rolling metrics time series
+            Dictionary with rolling metrics time series (DataFrames with one
+            column per strategy for DataFrame input) and summary statistics
         """
         try:
-            aligned_data = self._align_returns(strategy_returns, benchmark_returns)
-            
-            if len(aligned_data) < window:
+            if isinstance(strategy_returns, pd.DataFrame):
+                strategy_returns = strategy_returns.set_axis(pd.to_datetime(strategy_returns.index))
+                benchmark_aligned = benchmark_returns.set_axis(
+                    pd.to_datetime(benchmark_returns.index)
+                ).reindex(strategy_returns.index).dropna()
+                strategy_aligned = strategy_returns.loc[benchmark_aligned.index]
+            else:
+                aligned_data = self._align_returns(strategy_returns, benchmark_returns)
+                strategy_aligned = aligned_data['strategy']
+                benchmark_aligned = aligned_data['benchmark']
+            
+            if len(benchmark_aligned) < window:
                 logger.warning("Insufficient data for rolling calculations")
                 return {}
             
-            strategy_aligned = aligned_data['strategy']
-            benchmark_aligned = aligned_data['benchmark']
-            
-            # Convert to excess returns
             daily_rf = (1 + self.risk_free_rate) ** (1/252) - 1
-            strategy_excess = strategy_aligned - daily_rf
-            benchmark_excess = benchmark_aligned - daily_rf
-            
-            # Rolling calculations
-            rolling_metrics = {}
-            
-            # Rolling beta
-            rolling_beta = []
-            rolling_alpha = []
-            rolling_ir = []
-            
-            for i in range(window, len(strategy_excess)):
-                window_strategy = strategy_excess.iloc[i-window:i]
-                window_benchmark = benchmark_excess.iloc[i-window:i]
-                
-                beta = self._calculate_beta(window_strategy, window_benchmark)
-                alpha = self._calculate_alpha(window_strategy, window_benchmark, beta)
-                ir = self._calculate_information_ratio(window_strategy, window_benchmark)
-                
-                rolling_beta.append(beta)
-                rolling_alpha.append(alpha)
-                rolling_ir.append(ir)
+            kernels = rolling_benchmark_metrics(
+                strategy_aligned.to_numpy(dtype=float), benchmark_aligned.to_numpy(dtype=float),
+                window=window, daily_rf=daily_rf
+            )
             
             # Create time series
-            dates = strategy_excess.index[window:]
-            
-            rolling_metrics['rolling_beta'] = pd.Series(rolling_beta, index=dates)
-            rolling_metrics['rolling_alpha'] = pd.Series(rolling_alpha, index=dates)
-            rolling_metrics['rolling_information_ratio'] = pd.Series(rolling_ir, index=dates)
-            
-            # Summary statistics
-            rolling_metrics['beta_mean'] = np.mean(rolling_beta)
-            rolling_metrics['beta_std'] = np.std(rolling_beta)
-            rolling_metrics['alpha_mean'] = np.mean(rolling_alpha)
-            rolling_metrics['alpha_std'] = np.std(rolling_alpha)
-            rolling_metrics['ir_mean'] = np.mean(rolling_ir)
+            dates = benchmark_aligned.index[window:]
+            if isinstance(strategy_aligned, pd.DataFrame):
+                def wrap(values):
+                    return pd.DataFrame(values, index=dates, columns=strategy_aligned.columns)
+            else:
+                def wrap(values):
+                    return pd.Series(values, index=dates)
+            
+            rolling_metrics = {
+                'rolling_beta': wrap(kernels['beta']),
+                'rolling_alpha': wrap(kernels['alpha']),
+                'rolling_information_ratio': wrap(kernels['information_ratio']),
+                'rolling_tracking_error': wrap(kernels['tracking_error']),
+                'rolling_correlation': wrap(kernels['correlation']),
+            }
+            
+            # Summary statistics (per strategy for DataFrame input)
+            rolling_metrics['beta_mean'] = rolling_metrics['rolling_beta'].mean()
+            rolling_metrics['beta_std'] = rolling_metrics['rolling_beta'].std(ddof=0)
+            rolling_metrics['alpha_mean'] = rolling_metrics['rolling_alpha'].mean()
+            rolling_metrics['alpha_std'] = rolling_metrics['rolling_alpha'].std(ddof=0)
+            rolling_metrics['ir_mean'] = rolling_metrics['rolling_information_ratio'].mean()
+            rolling_metrics['tracking_error_mean'] = rolling_metrics['rolling_tracking_error'].mean()
             
             logger.info(f"Calculated rolling metrics with {window}-day window")
             return rolling_metrics
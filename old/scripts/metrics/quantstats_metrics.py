@@ -9,6 +9,7 @@ This module provides comprehensive quantstats integration for trading backtests:
 - Benchmark metrics: Alpha, Beta, R², Information Ratio
 - Distribution metrics: Skew, Kurtosis, Win Rate, Payoff Ratio
 - HTML tearsheets for comprehensive analysis
+- Column-wise NumPy metrics for whole returns matrices (BatchMetricsEngine)
 """
 
 import pandas as pd
@@ -18,6 +19,8 @@ from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import warnings
 
+from scipy.stats import norm
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -43,6 +46,203 @@ except ImportError:
     logger.warning("Plotly not available for advanced visualizations")
 
 
+class BatchMetricsEngine:
+    """
+    Column-wise performance metrics for a returns matrix (dates x strategies).
+
+    Computes the core QuantStatsAnalyzer metrics for every strategy at once
+    with NumPy, following the quantstats definitions (Sharpe/Sortino on
+    returns in excess of the de-annualized risk-free rate, CAGR over
+    count / periods years, parametric VaR/CVaR, drawdown from a starting
+    value of 1). Missing values are skipped per strategy. Columns are
+    processed in chunks of `chunk_size` to bound temporary memory; quantstats
+    itself is not required.
+
+    Example usage:
+        engine = BatchMetricsEngine(risk_free_rate=0.02)
+        metrics_df = engine.calculate(returns_df, benchmark_returns)
+    """
+
+    METRICS = [
+        'total_return', 'cagr', 'annual_volatility', 'sharpe_ratio', 'sortino_ratio',
+        'calmar_ratio', 'max_drawdown', 'max_drawdown_duration', 'skewness', 'kurtosis',
+        'var_95', 'cvar_95', 'win_rate', 'best_day', 'worst_day', 'observations',
+    ]
+    BENCHMARK_METRICS = ['beta', 'alpha', 'information_ratio', 'r_squared', 'tracking_error']
+
+    def __init__(self, risk_free_rate: float = 0.02, periods_per_year: int = 252,
+                 confidence: float = 0.95, chunk_size: int = 1024):
+        """
+        Initialize batch metrics engine.
+
+        Args:
+            risk_free_rate: Annual risk-free rate for Sharpe/Sortino
+            periods_per_year: Annualization factor
+            confidence: VaR/CVaR confidence level
+            chunk_size: Strategies processed per block
+        """
+        self.risk_free_rate = risk_free_rate
+        self.periods_per_year = periods_per_year
+        self.confidence = confidence
+        self.chunk_size = max(1, int(chunk_size))
+
+    def calculate(self, returns: Union[pd.DataFrame, np.ndarray],
+                  benchmark_returns: Optional[Union[pd.Series, np.ndarray]] = None,
+                  columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Calculate metrics for every strategy.
+
+        Args:
+            returns: Daily returns, one column per strategy (array or DataFrame,
+                e.g. a memory-mapped .npy)
+            benchmark_returns: Optional benchmark returns (aligned by index for
+                a DataFrame, by position for an array)
+            columns: Strategy names for array input
+
+        Returns:
+            DataFrame indexed by strategy with one column per metric
+        """
+        if isinstance(returns, pd.DataFrame):
+            columns = list(returns.columns)
+            if isinstance(benchmark_returns, pd.Series):
+                benchmark_returns = benchmark_returns.reindex(returns.index)
+            returns = returns.to_numpy(dtype=np.float64)
+        else:
+            returns = np.asarray(returns)
+            if returns.ndim == 1:
+                returns = returns[:, None]
+
+        n_strategies = returns.shape[1]
+        if columns is None:
+            columns = list(range(n_strategies))
+
+        benchmark = None
+        if benchmark_returns is not None:
+            benchmark = np.asarray(benchmark_returns, dtype=np.float64).reshape(-1)
+            benchmark = np.where(np.isfinite(benchmark), benchmark, np.nan)
+
+        names = self.METRICS + (self.BENCHMARK_METRICS if benchmark is not None else [])
+        result = np.empty((n_strategies, len(names)))
+        for start in range(0, n_strategies, self.chunk_size):
+            block = np.asarray(returns[:, start:start + self.chunk_size], dtype=np.float64)
+            metrics = self._calculate_block(block, benchmark)
+            result[start:start + block.shape[1]] = np.column_stack([metrics[name] for name in names])
+
+        logger.info(f"Calculated {len(names)} metrics for {n_strategies} strategies")
+        return pd.DataFrame(result, index=columns, columns=names)
+
+    def _calculate_block(self, returns: np.ndarray,
+                         benchmark: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+        """Metrics for one block of strategies (columns)."""
+        periods = self.periods_per_year
+        valid = np.isfinite(returns)
+        r = np.where(valid, returns, 0.0)
+        n = valid.sum(axis=0).astype(np.float64)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = r.sum(axis=0) / n
+            dev = np.where(valid, r - mean, 0.0)
+            m2 = (dev * dev).sum(axis=0)
+            std = np.sqrt(m2 / (n - 1))
+
+            metrics = {'observations': n}
+            growth = np.prod(1.0 + r, axis=0)
+            metrics['total_return'] = growth - 1.0
+            years = n / periods
+            metrics['cagr'] = np.where(growth < 0, np.nan, np.abs(growth) ** (1.0 / years) - 1.0)
+            metrics['annual_volatility'] = std * np.sqrt(periods)
+
+            # Sharpe / Sortino on returns in excess of the de-annualized risk-free rate
+            daily_rf = (1 + self.risk_free_rate) ** (1.0 / periods) - 1 if self.risk_free_rate else 0.0
+            excess_mean = mean - daily_rf
+            metrics['sharpe_ratio'] = excess_mean / std * np.sqrt(periods)
+            excess = np.where(valid, r - daily_rf, 0.0)
+            downside = np.sqrt((np.minimum(excess, 0.0) ** 2).sum(axis=0) / n)
+            metrics['sortino_ratio'] = np.where(downside > 0, excess_mean / downside, np.nan) * np.sqrt(periods)
+
+            drawdown, duration = self._drawdowns(r)
+            metrics['max_drawdown'] = drawdown
+            metrics['max_drawdown_duration'] = duration
+            metrics['calmar_ratio'] = metrics['cagr'] / np.abs(drawdown)
+
+            # Bias-corrected sample skewness and excess kurtosis (pandas definitions)
+            m3 = (dev ** 3).sum(axis=0)
+            m4 = (dev ** 4).sum(axis=0)
+            metrics['skewness'] = np.where(
+                (n > 2) & (m2 > 0), n * np.sqrt(n - 1) / (n - 2) * m3 / m2 ** 1.5, np.nan
+            )
+            metrics['kurtosis'] = np.where(
+                (n > 3) & (m2 > 0),
+                n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)),
+                np.nan,
+            )
+
+            # Parametric (normal) VaR and expected shortfall
+            alpha = 1 - self.confidence
+            z = norm.ppf(alpha)
+            metrics['var_95'] = mean + z * std
+            metrics['cvar_95'] = mean - std * norm.pdf(z) / alpha
+
+            metrics['win_rate'] = ((r > 0) & valid).sum(axis=0) / n
+            # Columns without observations have no best/worst day (not -inf/inf)
+            observed = n > 0
+            metrics['best_day'] = np.where(observed, np.where(valid, returns, -np.inf).max(axis=0), np.nan)
+            metrics['worst_day'] = np.where(observed, np.where(valid, returns, np.inf).min(axis=0), np.nan)
+
+            if benchmark is not None:
+                metrics.update(self._benchmark_block(returns, benchmark))
+
+        return metrics
+
+    @staticmethod
+    def _drawdowns(r: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Maximum drawdown (negative) and longest time under water, per column."""
+        # Log-space cumulative returns avoid overflow for long histories
+        with np.errstate(divide='ignore'):
+            log_wealth = np.cumsum(np.log1p(r), axis=0)
+        peak = np.maximum(np.maximum.accumulate(log_wealth, axis=0), 0.0)
+        underwater = log_wealth - peak
+        max_drawdown = np.expm1(underwater.min(axis=0))
+
+        # Longest run of consecutive periods below the previous peak
+        steps = np.arange(1, len(r) + 1)[:, None]
+        last_peak = np.maximum.accumulate(np.where(underwater < 0, 0, steps), axis=0)
+        duration = (steps - last_peak).max(axis=0).astype(np.float64)
+        return max_drawdown, duration
+
+    def _benchmark_block(self, returns: np.ndarray, benchmark: np.ndarray) -> Dict[str, np.ndarray]:
+        """Beta, alpha, information ratio, R-squared and tracking error per column."""
+        valid = np.isfinite(returns) & np.isfinite(benchmark)[:, None]
+        n = valid.sum(axis=0).astype(np.float64)
+        y = np.where(valid, returns, 0.0)
+        x = np.where(valid, np.nan_to_num(benchmark)[:, None], 0.0)
+
+        mean_y = y.sum(axis=0) / n
+        mean_x = x.sum(axis=0) / n
+        dy = np.where(valid, y - mean_y, 0.0)
+        dx = np.where(valid, x - mean_x, 0.0)
+        var_x = (dx * dx).sum(axis=0)
+        var_y = (dy * dy).sum(axis=0)
+        cov = (dx * dy).sum(axis=0)
+
+        beta = np.where(var_x != 0, cov / var_x, 0.0)
+        # Differences of the active returns
+        d = dy - dx
+        active_mean = mean_y - mean_x
+        active_std = np.sqrt((d * d).sum(axis=0) / (n - 1))
+
+        insufficient = n < 30
+        metrics = {
+            'beta': beta,
+            'alpha': mean_y - beta * mean_x,
+            'information_ratio': np.where(active_std != 0, active_mean / active_std, 0.0),
+            'r_squared': cov ** 2 / (var_x * var_y),
+            'tracking_error': active_std,
+        }
+        return {name: np.where(insufficient, np.nan, values) for name, values in metrics.items()}
+
+
 class QuantStatsAnalyzer:
     """
     Advanced metrics analyzer using QuantStats for comprehensive backtest analysis.
@@ -130,6 +330,23 @@ class QuantStatsAnalyzer:
             logger.error(f"Error calculating metrics: {e}")
             return self._calculate_fallback_metrics(returns)
     
+    def calculate_batch_metrics(self, returns_df: pd.DataFrame,
+                                benchmark_returns: Optional[pd.Series] = None,
+                                chunk_size: int = 1024) -> pd.DataFrame:
+        """
+        Calculate core metrics for many strategies at once.
+        
+        Args:
+            returns_df: Daily returns, one column per strategy
+            benchmark_returns: Optional benchmark returns series
+            chunk_size: Strategies processed per block
+            
+        Returns:
+            DataFrame indexed by strategy with one column per metric
+        """
+        engine = BatchMetricsEngine(risk_free_rate=self.risk_free_rate, chunk_size=chunk_size)
+        return engine.calculate(returns_df, benchmark_returns)
+    
     def _format_returns(self, returns: pd.Series) -> pd.Series:
         """Format returns series for quantstats calculations."""
         # Remove any infinite or NaN values
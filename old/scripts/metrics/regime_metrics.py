@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 import logging
 from typing import Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 # Configure logging
@@ -15,11 +16,35 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Combined regimes as small-int codes: code = 2 * is_bull + is_high_vol
+REGIME_LABELS = ("BEAR_LOW_VOL", "BEAR_HIGH_VOL", "BULL_LOW_VOL", "BULL_HIGH_VOL")
+PRICE_REGIME_LABELS = ("BEAR", "BULL")
+VOLATILITY_REGIME_LABELS = ("LOW_VOL", "HIGH_VOL")
+
+REGIME_METRICS = (
+    "count",
+    "return",
+    "annual_return",
+    "volatility",
+    "sharpe",
+    "max_drawdown",
+    "win_rate",
+)
+
+
 class RegimeAnalyzer:
     """
     Simplified regime analyzer for market condition detection.
+
+    Regimes are encoded as int8 codes indexing REGIME_LABELS. Codes for a
+    price series are cached per (symbol, date range, content fingerprint,
+    parameters) in a process-wide LRU, so attributing a whole optimization
+    sweep to the benchmark's regimes detects them once.
     """
 
+    cache_size = 64
+    _regime_cache: "OrderedDict[tuple, pd.Series]" = OrderedDict()
+
     def __init__(self, sma_period: int = 200, volatility_window: int = 30):
         self.sma_period = sma_period
         self.volatility_window = volatility_window
@@ -27,53 +52,137 @@ class RegimeAnalyzer:
             f"RegimeAnalyzer initialized with SMA: {sma_period}, Volatility window: {volatility_window}"
         )
 
+    @staticmethod
+    def _as_series(data) -> pd.Series:
+        """Return data as a Series with a DatetimeIndex."""
+        if not isinstance(data, pd.Series):
+            data = pd.Series(data)
+        if data.index.dtype != "datetime64[ns]":
+            data = data.set_axis(pd.to_datetime(data.index))
+        return data
+
+    def _cache_key(
+        self,
+        price_data: pd.Series,
+        volatility_data: Optional[pd.Series],
+        symbol: Optional[str],
+    ) -> tuple:
+        """Key of a regime detection: symbol (or content hash), date range, parameters."""
+        source = symbol
+        if source is None:
+            source = int(pd.util.hash_pandas_object(price_data).sum())
+        volatility_key = None
+        if volatility_data is not None:
+            volatility_key = int(pd.util.hash_pandas_object(volatility_data).sum())
+
+        # Cheap fingerprint of the prices (first, last, sum) so a symbol's key
+        # misses when its prices over the same dates were revised
+        start = end = fingerprint = None
+        if len(price_data):
+            start, end = price_data.index[0], price_data.index[-1]
+            values = price_data.to_numpy(dtype=float)
+            fingerprint = (values[[0, -1]].tobytes(), float(np.nansum(values)))
+        return (
+            source,
+            start,
+            end,
+            len(price_data),
+            fingerprint,
+            self.sma_period,
+            self.volatility_window,
+            volatility_key,
+        )
+
+    def detect_regime_codes(
+        self,
+        price_data: pd.Series,
+        volatility_data: Optional[pd.Series] = None,
+        symbol: Optional[str] = None,
+    ) -> pd.Series:
+        """
+        Detect market regimes as int8 codes indexing REGIME_LABELS.
+
+        Args:
+            price_data: Price series (benchmark or equity curve)
+            volatility_data: Optional volatility series (e.g. VIX); rolling
+                volatility of price_data is used otherwise
+            symbol: Optional symbol used as cache key instead of a content hash
+
+        Returns:
+            int8 Series of regime codes on the price index
+        """
+        price_data = self._as_series(price_data)
+        if volatility_data is not None:
+            volatility_data = self._as_series(volatility_data)
+
+        key = self._cache_key(price_data, volatility_data, symbol)
+        cache = RegimeAnalyzer._regime_cache
+        codes = cache.get(key)
+        if codes is not None:
+            cache.move_to_end(key)
+            return codes.copy()
+
+        prices = price_data.to_numpy(dtype=float)
+
+        # Price regime: above the SMA is bull (NaN SMA counts as bear)
+        sma = price_data.rolling(window=self.sma_period).mean().to_numpy()
+        is_bull = prices > sma
+
+        # Volatility regime: above the rolling threshold is high vol
+        if volatility_data is not None:
+            vol_threshold = volatility_data.rolling(252).mean()
+            is_high_vol = volatility_data.to_numpy(dtype=float) > vol_threshold.to_numpy()
+        else:
+            daily_returns = price_data.pct_change()
+            rolling_vol = daily_returns.rolling(
+                window=self.volatility_window
+            ).std() * np.sqrt(252)
+            vol_threshold = rolling_vol.rolling(252).median()
+            is_high_vol = rolling_vol.to_numpy() > vol_threshold.to_numpy()
+
+        codes = pd.Series(
+            (2 * is_bull + is_high_vol).astype(np.int8),
+            index=price_data.index,
+            name="regime_code",
+        )
+
+        cache[key] = codes
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        # Callers get their own copy so mutating it cannot corrupt the cache
+        return codes.copy()
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached regime detections."""
+        cls._regime_cache.clear()
+
     def detect_regimes(
-        self, price_data: pd.Series, volatility_data: Optional[pd.Series] = None
+        self,
+        price_data: pd.Series,
+        volatility_data: Optional[pd.Series] = None,
+        symbol: Optional[str] = None,
     ) -> pd.DataFrame:
         """Detect market regimes using price and volatility data."""
         try:
-            # Ensure proper Series format
-            if not isinstance(price_data, pd.Series):
-                price_data = pd.Series(price_data)
-
-            if price_data.index.dtype != "datetime64[ns]":
-                price_data.index = pd.to_datetime(price_data.index)
-
-            regimes = pd.DataFrame(index=price_data.index)
-
-            # Calculate 200-day SMA and regime
-            sma = price_data.rolling(window=self.sma_period).mean()
-            regimes["price_regime"] = np.where(price_data > sma, "BULL", "BEAR")
-
-            # Calculate volatility regime
-            if volatility_data is not None:
-                if not isinstance(volatility_data, pd.Series):
-                    volatility_data = pd.Series(volatility_data)
-                vol_threshold = volatility_data.rolling(252).mean()
-                volatility_regime = np.where(
-                    volatility_data > vol_threshold, "HIGH_VOL", "LOW_VOL"
-                )
-            else:
-                # Calculate rolling volatility
-                daily_returns = price_data.pct_change()
-                rolling_vol = daily_returns.rolling(
-                    window=self.volatility_window
-                ).std() * np.sqrt(252)
-                vol_threshold = rolling_vol.rolling(252).median()
-
-                volatility_regime = np.where(
-                    rolling_vol > vol_threshold, "HIGH_VOL", "LOW_VOL"
-                )
+            codes = self.detect_regime_codes(price_data, volatility_data, symbol)
+            values = codes.to_numpy()
 
-            regimes["volatility_regime"] = volatility_regime
-
-            # Combine regimes
-            regimes["combined_regime"] = (
-                regimes["price_regime"] + "_" + regimes["volatility_regime"]
+            regimes = pd.DataFrame(index=codes.index)
+            regimes["regime_code"] = values
+            regimes["price_regime"] = pd.Categorical.from_codes(
+                values >> 1, PRICE_REGIME_LABELS
+            )
+            regimes["volatility_regime"] = pd.Categorical.from_codes(
+                values & 1, VOLATILITY_REGIME_LABELS
+            )
+            regimes["combined_regime"] = pd.Categorical.from_codes(
+                values, REGIME_LABELS
             )
 
+            counts = np.bincount(values, minlength=len(REGIME_LABELS))
             logger.info(
-                f"Detected regimes: {regimes['combined_regime'].value_counts().to_dict()}"
+                f"Detected regimes: { {REGIME_LABELS[c]: int(n) for c, n in enumerate(counts) if n} }"
             )
 
             return regimes
@@ -82,76 +191,131 @@ class RegimeAnalyzer:
             logger.error(f"Error detecting regimes: {e}")
             return pd.DataFrame()
 
+    @staticmethod
+    def _regime_codes_from(regimes: Union[pd.DataFrame, pd.Series]) -> pd.Series:
+        """Extract int8 regime codes from detect_regimes output or a code Series."""
+        if isinstance(regimes, pd.Series):
+            return regimes.astype(np.int8)
+        if "regime_code" in regimes:
+            return regimes["regime_code"].astype(np.int8)
+        # Frames with string labels only (e.g. loaded from disk)
+        labels = pd.Categorical(regimes["combined_regime"], categories=REGIME_LABELS)
+        return pd.Series(labels.codes.astype(np.int8), index=regimes.index)
+
+    def calculate_regime_metrics_matrix(
+        self,
+        returns: pd.DataFrame,
+        regimes: Union[pd.DataFrame, pd.Series],
+        periods_per_year: int = 252,
+    ) -> pd.DataFrame:
+        """
+        Calculate per-regime metrics for many return series at once.
+
+        One group-by over the regime codes computes every metric for every
+        column; rows are sorted by regime so each regime is a contiguous
+        block of the returns matrix.
+
+        Args:
+            returns: Returns matrix (dates x strategies); NaN marks missing data
+            regimes: detect_regimes() frame or regime code Series
+            periods_per_year: Annualization factor
+
+        Returns:
+            DataFrame indexed by strategy with "<regime>_<metric>" columns
+            (regime lowercase, regimes in order of first appearance)
+        """
+        if isinstance(returns, pd.Series):
+            returns = returns.to_frame(name=returns.name or "returns")
+
+        codes = self._regime_codes_from(regimes)
+
+        # Handle duplicate indices by taking the last value
+        if returns.index.duplicated().any():
+            logger.warning(
+                f"Returns have {returns.index.duplicated().sum()} duplicate indices, using last value"
+            )
+            returns = returns.groupby(returns.index).last()
+        if codes.index.duplicated().any():
+            logger.warning(
+                f"Regimes have {codes.index.duplicated().sum()} duplicate indices, using last value"
+            )
+            codes = codes.groupby(codes.index).last()
+
+        codes = codes.reindex(returns.index)
+        aligned = codes.notna().to_numpy()
+        if not aligned.any():
+            logger.warning("No aligned data for regime metrics calculation")
+            return pd.DataFrame(index=returns.columns)
+
+        group = codes.to_numpy()[aligned].astype(np.intp)
+        values = returns.to_numpy(dtype=float)[aligned]
+
+        # Regimes in order of first appearance; rows grouped by regime (time order kept)
+        present, first_seen = np.unique(group, return_index=True)
+        present = present[np.argsort(first_seen)]
+        rank = np.empty(len(REGIME_LABELS), dtype=np.intp)
+        rank[present] = np.arange(len(present))
+        order = np.argsort(rank[group], kind="stable")
+        values = values[order]
+        sizes = np.bincount(rank[group], minlength=len(present))
+        starts = np.r_[0, np.cumsum(sizes)[:-1]]
+
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+
+        count = np.add.reduceat(valid.astype(float), starts, axis=0)
+        total = np.add.reduceat(filled, starts, axis=0)
+        wins = np.add.reduceat((filled > 0).astype(float), starts, axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+            deviations = np.where(valid, values - np.repeat(mean, sizes, axis=0), 0.0)
+            variance = np.add.reduceat(deviations**2, starts, axis=0) / (count - 1)
+            std = np.sqrt(np.where(count > 1, variance, np.nan))
+            sharpe = np.where(std == 0, 0.0, mean * np.sqrt(periods_per_year) / std)
+            win_rate = wins / count
+
+            # Max drawdown of compounded returns within each regime block
+            log_wealth = np.log1p(filled)
+            max_drawdown = np.empty_like(total)
+            for i, (start, size) in enumerate(zip(starts, sizes)):
+                wealth = np.cumsum(log_wealth[start:start + size], axis=0)
+                peak = np.maximum.accumulate(wealth, axis=0)
+                max_drawdown[i] = -np.expm1((wealth - peak).min(axis=0))
+
+        metrics = {
+            "count": count,
+            "return": total,
+            "annual_return": mean * periods_per_year,
+            "volatility": std * np.sqrt(periods_per_year),
+            "sharpe": sharpe,
+            "max_drawdown": max_drawdown,
+            "win_rate": win_rate,
+        }
+
+        columns = {}
+        for i, code in enumerate(present):
+            regime_key = REGIME_LABELS[code].lower()
+            for name in REGIME_METRICS:
+                columns[f"{regime_key}_{name}"] = metrics[name][i]
+
+        return pd.DataFrame(columns, index=returns.columns)
+
     def calculate_regime_metrics(
         self, returns: pd.Series, regimes: pd.DataFrame
     ) -> Dict:
         """Calculate performance metrics by regime."""
         try:
-            # Handle duplicate indices by grouping and taking the last value
-            if returns.index.duplicated().any():
-                logger.warning(
-                    f"Returns series has {returns.index.duplicated().sum()} duplicate indices, using last value"
-                )
-                returns = returns.groupby(returns.index).last()
-
-            if regimes.index.duplicated().any():
-                logger.warning(
-                    f"Regimes DataFrame has {regimes.index.duplicated().sum()} duplicate indices, using last value"
-                )
-                regimes = regimes.groupby(regimes.index).last()
-
-            # Align returns with regimes using merge to avoid index issues
-            returns_df = returns.to_frame(name="returns")
-            regimes_df = regimes[["combined_regime"]].copy()
-            aligned_data = returns_df.join(regimes_df, how="inner")
-
-            if len(aligned_data) == 0:
-                logger.warning("No aligned data for regime metrics calculation")
+            matrix = self.calculate_regime_metrics_matrix(
+                returns.to_frame(name="returns"), regimes
+            )
+            if matrix.empty:
                 return {}
 
-            regime_metrics = {}
-
-            # Calculate metrics for each regime
-            for regime in aligned_data["combined_regime"].unique():
-                regime_mask = aligned_data["combined_regime"] == regime
-                regime_returns = aligned_data.loc[regime_mask, "returns"]
-
-                if len(regime_returns) == 0:
-                    continue
-
-                # Ensure regime_returns is a pandas Series
-                if not isinstance(regime_returns, pd.Series):
-                    regime_returns = pd.Series(regime_returns)
-
-                regime_key = regime.lower().replace("_", "_")
-
-                # Basic metrics
-                regime_metrics[f"{regime_key}_count"] = len(regime_returns)
-                regime_metrics[f"{regime_key}_return"] = regime_returns.sum()
-                regime_metrics[f"{regime_key}_annual_return"] = (
-                    regime_returns.mean() * 252
-                )
-                regime_metrics[f"{regime_key}_volatility"] = (
-                    regime_returns.std() * np.sqrt(252)
-                )
-
-                # Risk-adjusted metrics
-                if regime_returns.std() != 0:
-                    regime_metrics[f"{regime_key}_sharpe"] = (
-                        regime_returns.mean()
-                        * 252
-                        / (regime_returns.std() * np.sqrt(252))
-                    )
-                else:
-                    regime_metrics[f"{regime_key}_sharpe"] = 0
-
-                # Drawdown metrics
-                cumulative = (1 + regime_returns).cumprod()
-                running_max = cumulative.expanding().max()
-                drawdown = (cumulative - running_max) / running_max
-
-                regime_metrics[f"{regime_key}_max_drawdown"] = abs(drawdown.min())
-                regime_metrics[f"{regime_key}_win_rate"] = (regime_returns > 0).mean()
+            regime_metrics = {
+                key: int(value) if key.endswith("_count") else value
+                for key, value in matrix.iloc[0].items()
+            }
 
             logger.info(f"Calculated regime metrics for {len(regime_metrics)} metrics")
             return regime_metrics
@@ -11,16 +11,23 @@ Features:
 - Project hierarchy with dot notation and tagging
 - Equity curves, trade logs, strategy plots
 - Error handling and retry logic
+- Batched, optionally asynchronous trial logging
 - <200ms logging overhead
 """
 
 import mlflow
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.tracking import MlflowClient
 import os
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+import atexit
 import logging
 import json
+import queue
+import threading
 import pandas as pd
 import numpy as np
 import time
@@ -29,6 +36,206 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Tracking server limits for a single log_batch request
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_TAGS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+MLFLOW_PARENT_RUN_ID = "mlflow.parentRunId"
+
+_STOP = object()
+
+
+def chunk_batch(metrics: List[Metric], params: List[Param],
+                tags: List[RunTag]) -> Iterator[Tuple[List[Metric], List[Param], List[RunTag]]]:
+    """
+    Split run data into log_batch payloads within the tracking server limits.
+
+    Args:
+        metrics: Metric entities
+        params: Param entities
+        tags: RunTag entities
+
+    Yields:
+        (metrics, params, tags) chunks, each accepted by a single log_batch call
+    """
+    m = p = t = 0
+    while m < len(metrics) or p < len(params) or t < len(tags):
+        n_params = min(len(params) - p, MAX_PARAMS_TAGS_PER_BATCH)
+        n_tags = min(len(tags) - t, MAX_PARAMS_TAGS_PER_BATCH - n_params)
+        n_metrics = min(len(metrics) - m,
+                        MAX_METRICS_PER_BATCH,
+                        MAX_ENTITIES_PER_BATCH - n_params - n_tags)
+        yield metrics[m:m + n_metrics], params[p:p + n_params], tags[t:t + n_tags]
+        m += n_metrics
+        p += n_params
+        t += n_tags
+
+
+@dataclass
+class RunRecord:
+    """
+    Params, metrics and tags destined for one MLflow run.
+
+    A record without run_id creates a new run (in experiment_id, or in the
+    parent run's experiment when only parent_run_id is given).
+    """
+    run_id: Optional[str] = None
+    experiment_id: Optional[str] = None
+    parent_run_id: Optional[str] = None
+    run_name: Optional[str] = None
+    params: List[Param] = field(default_factory=list)
+    metrics: List[Metric] = field(default_factory=list)
+    tags: List[RunTag] = field(default_factory=list)
+    timestamp: int = field(default_factory=lambda: int(time.time() * 1000))
+    terminate: bool = False  # Mark the run FINISHED once written
+
+
+class BatchLogWriter:
+    """
+    Writes RunRecords to MLflow with as few tracking calls as possible.
+
+    Each record costs one log_batch call per server-limit chunk (plus
+    create_run/set_terminated when requested) instead of one call per
+    metric, param and tag. With start() records are queued and written by a
+    background thread; the queue is bounded so producers block instead of
+    growing memory when the tracking server falls behind, and whatever is
+    queued is drained on close() or interpreter exit.
+    """
+
+    def __init__(self, client: MlflowClient, max_queue_size: int = 10000,
+                 max_records_per_flush: int = 256):
+        """
+        Initialize writer.
+
+        Args:
+            client: MLflow tracking client
+            max_queue_size: Maximum queued records before submit() blocks
+            max_records_per_flush: Maximum records taken off the queue per write
+        """
+        self.client = client
+        self.max_records_per_flush = max_records_per_flush
+        self.failed = 0
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._experiment_ids: Dict[str, str] = {}
+
+    @property
+    def running(self) -> bool:
+        """Whether records are being written by the background thread."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background writer thread."""
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="mlflow-batch-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, record: RunRecord):
+        """Queue a record for the background thread (blocks while the queue is full)."""
+        self._queue.put(record)
+
+    def flush(self):
+        """Block until every submitted record has been written."""
+        if self.running:
+            self._queue.join()
+
+    def close(self, timeout: Optional[float] = None):
+        """Drain queued records and stop the background thread."""
+        if not self.running:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        """Background loop: take queued records in groups and write them."""
+        stop = False
+        while not stop:
+            records = [self._queue.get()]
+            while len(records) < self.max_records_per_flush:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if _STOP in records:
+                stop = True
+            self.write_many([r for r in records if r is not _STOP])
+
+            for _ in records:
+                self._queue.task_done()
+
+    def write_many(self, records: List[RunRecord]):
+        """Write records, merging consecutive updates to the same existing run."""
+        merged: List[RunRecord] = []
+        for record in records:
+            last = merged[-1] if merged else None
+            if last is not None and record.run_id is not None and record.run_id == last.run_id:
+                last.params.extend(record.params)
+                last.metrics.extend(record.metrics)
+                last.tags.extend(record.tags)
+                last.terminate = last.terminate or record.terminate
+            else:
+                merged.append(record)
+
+        for record in merged:
+            self.write(record)
+
+    def write(self, record: RunRecord) -> Optional[str]:
+        """
+        Write a single record synchronously.
+
+        Args:
+            record: Record to write
+
+        Returns:
+            Run ID if successful, None otherwise
+        """
+        try:
+            run_id = record.run_id
+            tags = record.tags
+            if run_id is None:
+                # New runs receive their tags at creation
+                run_tags = {tag.key: tag.value for tag in tags}
+                if record.parent_run_id:
+                    run_tags[MLFLOW_PARENT_RUN_ID] = record.parent_run_id
+                run = self.client.create_run(
+                    experiment_id=record.experiment_id or self._parent_experiment_id(record.parent_run_id),
+                    start_time=record.timestamp,
+                    tags=run_tags,
+                    run_name=record.run_name
+                )
+                run_id = run.info.run_id
+                tags = []
+
+            # A param may only be logged once per batch; keep the last value
+            params = list({param.key: param for param in record.params}.values())
+            for metrics_chunk, params_chunk, tags_chunk in chunk_batch(record.metrics, params, tags):
+                self.client.log_batch(run_id, metrics=metrics_chunk,
+                                      params=params_chunk, tags=tags_chunk)
+
+            if record.terminate:
+                self.client.set_terminated(run_id, status="FINISHED")
+
+            return run_id
+
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Failed to write MLflow run record ({record.run_name or record.run_id}): {e}")
+            return None
+
+    def _parent_experiment_id(self, parent_run_id: Optional[str]) -> str:
+        """Experiment of a parent run (looked up once per parent)."""
+        if parent_run_id is None:
+            raise ValueError("RunRecord needs run_id, experiment_id or parent_run_id")
+        if parent_run_id not in self._experiment_ids:
+            self._experiment_ids[parent_run_id] = self.client.get_run(parent_run_id).info.experiment_id
+        return self._experiment_ids[parent_run_id]
+
 
 class MLflowBacktestLogger:
     """
@@ -41,13 +248,17 @@ class MLflowBacktestLogger:
     """
     
     def __init__(self, tracking_uri: Optional[str] = None,
-                 experiment_name: Optional[str] = None):
+                 experiment_name: Optional[str] = None,
+                 async_logging: bool = False,
+                 max_queue_size: int = 10000):
         """
         Initialize MLflow logger.
         
         Args:
             tracking_uri: MLflow tracking server URI
             experiment_name: Default experiment name
+            async_logging: Write trial and run data from a background thread
+            max_queue_size: Maximum records queued before logging blocks
         """
         # Use environment variable if tracking_uri not provided
         if tracking_uri is None:
@@ -60,6 +271,10 @@ class MLflowBacktestLogger:
         # Initialize MLflow client
         try:
             mlflow.set_tracking_uri(tracking_uri)
+            self.client = MlflowClient(tracking_uri=tracking_uri)
+            self.writer = BatchLogWriter(self.client, max_queue_size=max_queue_size)
+            if async_logging:
+                self.writer.start()
             self.mlflow_available = True
             logger.info(f"MLflow logger initialized with tracking URI: {tracking_uri}")
         except Exception as e:
@@ -155,18 +370,17 @@ class MLflowBacktestLogger:
             with mlflow.start_run(run_name=run_name) as run:
                 run_id = run.info.run_id
                 
-                # Log parameters
-                self._log_parameters(parameters)
-                
-                # Log metrics
-                self._log_metrics(metrics)
+                # Log parameters, metrics and tags in batched calls
+                self.writer.write(RunRecord(
+                    run_id=run_id,
+                    params=self._param_entities(parameters),
+                    metrics=self._metric_entities(metrics),
+                    tags=self._tag_entities(tags or {})
+                ))
                 
                 # Log artifacts
                 self._log_artifacts(artifacts, strategy_name)
                 
-                # Log tags
-                self._log_tags(tags or {})
-                
                 logger.info(f"Logged backtest to MLflow: {experiment_name}/{run_id}")
                 
                 # Log logging overhead
@@ -179,33 +393,27 @@ class MLflowBacktestLogger:
             logger.error(f"Failed to log backtest to MLflow: {e}")
             return None
     
-    def _log_parameters(self, parameters: Dict):
-        """Log strategy parameters to MLflow."""
-        try:
-            # Flatten nested parameters
-            flat_params = self._flatten_dict(parameters)
-            
-            for key, value in flat_params.items():
-                if isinstance(value, (str, int, float, bool)):
-                    mlflow.log_param(key, value)
-                else:
-                    mlflow.log_param(key, str(value))
-                    
-        except Exception as e:
-            logger.error(f"Failed to log parameters: {e}")
+    def _param_entities(self, parameters: Dict) -> List[Param]:
+        """Convert (nested) parameters to MLflow Param entities."""
+        # Flatten nested parameters
+        flat_params = self._flatten_dict(parameters)
+        return [Param(key, str(value)) for key, value in flat_params.items()]
     
-    def _log_metrics(self, metrics: Dict):
-        """Log performance metrics to MLflow."""
-        try:
-            # Flatten nested metrics
-            flat_metrics = self._flatten_dict(metrics)
-            
-            for key, value in flat_metrics.items():
-                if isinstance(value, (int, float)) and not np.isnan(value):
-                    mlflow.log_metric(key, float(value))
-                    
-        except Exception as e:
-            logger.error(f"Failed to log metrics: {e}")
+    def _metric_entities(self, metrics: Dict, timestamp: Optional[int] = None,
+                         step: int = 0) -> List[Metric]:
+        """Convert (nested) numeric metrics to MLflow Metric entities, skipping NaN."""
+        timestamp = timestamp or int(time.time() * 1000)
+        # Flatten nested metrics
+        flat_metrics = self._flatten_dict(metrics)
+        return [
+            Metric(key, float(value), timestamp, step)
+            for key, value in flat_metrics.items()
+            if isinstance(value, (int, float)) and not np.isnan(value)
+        ]
+    
+    def _tag_entities(self, tags: Dict) -> List[RunTag]:
+        """Convert tags to MLflow RunTag entities."""
+        return [RunTag(key, str(value)) for key, value in tags.items()]
     
     def _log_artifacts(self, artifacts: Dict, strategy_name: str):
         """Log artifacts to MLflow."""
@@ -228,14 +436,6 @@ class MLflowBacktestLogger:
         except Exception as e:
             logger.error(f"Failed to log artifacts: {e}")
     
-    def _log_tags(self, tags: Dict):
-        """Log tags to MLflow."""
-        try:
-            for key, value in tags.items():
-                mlflow.set_tag(key, str(value))
-        except Exception as e:
-            logger.error(f"Failed to log tags: {e}")
-    
     def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
         """
         Flatten nested dictionary.
@@ -288,9 +488,11 @@ class MLflowBacktestLogger:
                 mlflow.log_metric("best_objective_value", best_value)
                 
                 # Log additional optimization metrics
-                for key, value in optimization_metrics.items():
-                    if isinstance(value, (int, float)):
-                        mlflow.log_metric(f"optimization_{key}", value)
+                mlflow.log_metrics({
+                    f"optimization_{key}": value
+                    for key, value in optimization_metrics.items()
+                    if isinstance(value, (int, float))
+                })
                 
                 # Set study tags
                 study_tags = {
@@ -307,11 +509,89 @@ class MLflowBacktestLogger:
             logger.error(f"Failed to log optimization study: {e}")
             return None
     
+    def start_study(self, experiment_name: str, run_name: Optional[str] = None,
+                    tags: Optional[Dict] = None) -> Optional[str]:
+        """
+        Create the parent run of an optimization study.
+        
+        Trials are attached with log_child_trial() and the study summary with
+        finish_study().
+        
+        Args:
+            experiment_name: Experiment to create the run in
+            run_name: Optional run name
+            tags: Study tags
+            
+        Returns:
+            Parent run ID if successful, None otherwise
+        """
+        if not self.mlflow_available:
+            logger.warning("MLflow not available, skipping study logging")
+            return None
+        
+        experiment_id = self.create_experiment(experiment_name)
+        if experiment_id is None:
+            return None
+        
+        try:
+            study_tags = {"optimization_study": "true", **(tags or {})}
+            run = self.client.create_run(
+                experiment_id=experiment_id,
+                tags={key: str(value) for key, value in study_tags.items()},
+                run_name=run_name or f"study_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            )
+            return run.info.run_id
+        except Exception as e:
+            logger.error(f"Failed to start optimization study {experiment_name}: {e}")
+            return None
+    
+    def finish_study(self, parent_run_id: str, params: Optional[Dict] = None,
+                     metrics: Optional[Dict] = None, tags: Optional[Dict] = None):
+        """
+        Log the study summary to its parent run and mark it finished.
+        
+        Args:
+            parent_run_id: Parent run ID from start_study()
+            params: Summary parameters (e.g. best parameters)
+            metrics: Summary metrics (e.g. best objective value)
+            tags: Additional tags
+        """
+        self.log_run_data(parent_run_id, params=params, metrics=metrics,
+                          tags=tags, terminate=True)
+    
+    def log_run_data(self, run_id: str, params: Optional[Dict] = None,
+                     metrics: Optional[Dict] = None, tags: Optional[Dict] = None,
+                     terminate: bool = False):
+        """
+        Log params, metrics and tags to an existing run in batched calls.
+        
+        Args:
+            run_id: Run ID
+            params: Parameters (nested dicts are flattened)
+            metrics: Numeric metrics (nested dicts are flattened)
+            tags: Tags
+            terminate: Mark the run FINISHED afterwards
+        """
+        if not self.mlflow_available:
+            return
+        
+        self._submit(RunRecord(
+            run_id=run_id,
+            params=self._param_entities(params or {}),
+            metrics=self._metric_entities(metrics or {}),
+            tags=self._tag_entities(tags or {}),
+            terminate=terminate
+        ))
+    
     def log_child_trial(self, parent_run_id: str, trial_params: Dict, 
                        trial_metrics: Dict, trial_number: int) -> Optional[str]:
         """
         Log child trial for optimization study.
         
+        The trial run is created in the parent run's experiment and written
+        with a single log_batch call. With async logging the trial is queued
+        and None is returned; call flush() to wait for queued trials.
+        
         Args:
             parent_run_id: Parent run ID
             trial_params: Trial parameters
@@ -319,28 +599,44 @@ class MLflowBacktestLogger:
             trial_number: Trial number
             
         Returns:
-            Child run ID if successful, None otherwise
+            Child run ID if written synchronously. None when MLflow is
+            unavailable or the trial was queued: queued runs only get an ID
+            once the writer creates them, so after flush() look them up by
+            the parent run and the `trial_number` tag instead.
         """
         if not self.mlflow_available:
             return None
-            
-        try:
-            with mlflow.start_run(run_name=f"trial_{trial_number}", nested=True) as run:
-                run_id = run.info.run_id
-                
-                # Link to parent run
-                mlflow.set_tag("parent_run_id", parent_run_id)
-                mlflow.set_tag("trial_number", str(trial_number))
-                
-                # Log trial data
-                mlflow.log_params(trial_params)
-                mlflow.log_metrics(trial_metrics)
-                
-                return run_id
-                
-        except Exception as e:
-            logger.error(f"Failed to log child trial: {e}")
+        
+        record = RunRecord(
+            parent_run_id=parent_run_id,
+            run_name=f"trial_{trial_number}",
+            params=self._param_entities(trial_params),
+            metrics=self._metric_entities(trial_metrics),
+            # Link to parent run
+            tags=self._tag_entities({
+                "parent_run_id": parent_run_id,
+                "trial_number": str(trial_number)
+            }),
+            terminate=True
+        )
+        return self._submit(record)
+    
+    def _submit(self, record: RunRecord) -> Optional[str]:
+        """Queue a record for the background writer, or write it now."""
+        if self.writer.running:
+            self.writer.submit(record)
             return None
+        return self.writer.write(record)
+    
+    def flush(self):
+        """Block until all queued trial and run data has been written."""
+        if self.mlflow_available:
+            self.writer.flush()
+    
+    def close(self):
+        """Write any queued data and stop the background writer."""
+        if self.mlflow_available:
+            self.writer.close()
     
     def get_experiment_info(self, experiment_name: str) -> Optional[Dict]:
         """
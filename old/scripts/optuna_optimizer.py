@@ -26,8 +26,6 @@ from optuna.study import Study
 from optuna.trial import Trial
 import mlflow
 from mlflow.tracking import MlflowClient
-import threading
-import queue
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -60,51 +58,28 @@ class OptunaOptimizer:
             config_path: Path to Optuna configuration file
         """
         self.config = self._load_config(config_path)
-        self.mlflow_client = MlflowClient(tracking_uri=self.config['optuna']['logging'].get('mlflow_tracking_uri', 'http://mlflow:5000'))
-        self.logger = MLflowBacktestLogger(tracking_uri=self.config['optuna']['logging'].get('mlflow_tracking_uri', 'http://mlflow:5000'))
-
-        # Initialize sampler and pruner
-        self.sampler = self._create_sampler()
-        self.pruner = self._create_pruner()
-
-        # Async logging setup
-        self._async_logging = self.config['optuna']['logging'].get('async_logging', True)
+        logging_config = self.config['optuna']['logging']
+        tracking_uri = logging_config.get('mlflow_tracking_uri', 'http://mlflow:5000')
+        self.mlflow_client = MlflowClient(tracking_uri=tracking_uri)
+
+        # Trials are queued and written in batches by the logger's background thread
+        self._mlflow_tracking = logging_config.get('mlflow_tracking', True)
+        self._async_logging = logging_config.get('async_logging', True)
+        self.logger = MLflowBacktestLogger(
+            tracking_uri=tracking_uri,
+            async_logging=self._async_logging,
+            max_queue_size=logging_config.get('max_log_queue_size', 10000)
+        )
         if self._async_logging:
-            self._log_queue = queue.Queue()
-            self._log_thread = threading.Thread(target=self._async_log_worker, daemon=True)
-            self._log_thread.start()
             logger.info("Async MLflow logging enabled")
         else:
             logger.info("Synchronous MLflow logging enabled")
 
-        logger.info("OptunaOptimizer initialized with config: %s", config_path)
+        # Initialize sampler and pruner
+        self.sampler = self._create_sampler()
+        self.pruner = self._create_pruner()
 
-    def _async_log_worker(self):
-        """Worker thread for asynchronous MLflow logging."""
-        while True:
-            try:
-                # Get log task from queue with timeout
-                log_task = self._log_queue.get(timeout=1.0)
-                if log_task is None:  # Shutdown signal
-                    break
-
-                # Execute the logging function
-                func, args, kwargs = log_task
-                func(*args, **kwargs)
-
-                self._log_queue.task_done()
-            except queue.Empty:
-                continue
-            except Exception as e:
-                logger.error("Error in async logging worker: %s", e)
-
-    def _log_async(self, func, *args, **kwargs):
-        """Submit a logging task to the async worker."""
-        if self._async_logging:
-            self._log_queue.put((func, args, kwargs))
-        else:
-            # Synchronous logging
-            func(*args, **kwargs)
+        logger.info("OptunaOptimizer initialized with config: %s", config_path)
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load Optuna configuration from YAML file."""
@@ -198,6 +173,20 @@ class OptunaOptimizer:
         # Create or load study
         study = self.create_study(study_name)
 
+        # Parent MLflow run that trials are attached to
+        parent_run_id = None
+        if self._mlflow_tracking:
+            parent_run_id = self.logger.start_study(
+                experiment_name=study_name,
+                tags={
+                    "study_type": "optuna",
+                    "project": project,
+                    "asset_class": asset_class,
+                    "strategy_family": strategy_family,
+                    "metric": metric
+                }
+            )
+
         # Create objective function
         objective_fn = self._create_objective_function(
             strategy_path=strategy_path,
@@ -208,7 +197,8 @@ class OptunaOptimizer:
             metric=metric,
             project=project,
             asset_class=asset_class,
-            strategy_family=strategy_family
+            strategy_family=strategy_family,
+            parent_run_id=parent_run_id
         )
 
         # Run optimization
@@ -235,6 +225,16 @@ class OptunaOptimizer:
         logger.info("Optimization completed. Best %s: %.4f", metric, study.best_value)
         logger.info("Best parameters: %s", study.best_params)
 
+        if parent_run_id:
+            self.logger.finish_study(
+                parent_run_id,
+                params=study.best_params,
+                metrics={"best_objective_value": study.best_value,
+                         "optimization_n_trials": len(study.trials)}
+            )
+            # Make the study visible in MLflow before returning
+            self.logger.flush()
+
         return results
 
     def _create_objective_function(
@@ -247,7 +247,8 @@ class OptunaOptimizer:
         metric: str,
         project: str,
         asset_class: str,
-        strategy_family: str
+        strategy_family: str,
+        parent_run_id: Optional[str] = None
     ) -> Callable[[Trial], float]:
         """
         Create objective function for Optuna optimization.
@@ -262,6 +263,7 @@ class OptunaOptimizer:
             project: Project name
             asset_class: Asset class
             strategy_family: Strategy family
+            parent_run_id: MLflow study run to log trials under (None disables trial logging)
 
         Returns:
             Objective function for Optuna
@@ -287,6 +289,15 @@ class OptunaOptimizer:
             # Extract the metric to optimize
             if result and 'performance' in result:
                 metric_value = self._extract_metric(result['performance'], metric)
+                if parent_run_id:
+                    # Queued; written in batches off the optimization thread
+                    trial_metrics = {
+                        key: value for key, value in result['performance'].items()
+                        if isinstance(value, (int, float))
+                    }
+                    if metric_value is not None:
+                        trial_metrics[metric] = metric_value
+                    self.logger.log_child_trial(parent_run_id, params, trial_metrics, trial.number)
                 if metric_value is not None:
                     logger.info("Trial %d: %s = %.4f, Params: %s",
                                trial.number, metric, metric_value, params)
@@ -30,12 +30,14 @@ import tqdm
 # Import with explicit path handling
 try:
     from scripts.run_backtest import BacktestRunner
+    from scripts.job_queue import enqueue_job
     from utils.results_consolidator import ResultsConsolidator
 except ImportError as e:
     # Fallback for when running from different directories
     sys.path.insert(0, os.path.join(project_root, 'scripts'))
     sys.path.insert(0, os.path.join(project_root, 'utils'))
     from run_backtest import BacktestRunner
+    from job_queue import enqueue_job
     from results_consolidator import ResultsConsolidator
 
 # Configure logging (will be updated based on debug flag)
@@ -239,7 +241,7 @@ class ParallelBacktestOrchestrator:
             try:
                 job_json = json.dumps(job.to_dict())
                 # Use negative priority so higher priority (larger number) comes first
-                self.redis.zadd('backtest_jobs', {job_json: -job.priority})
+                enqueue_job(self.redis, 'backtest_jobs', 'backtest', job_json, -job.priority)
                 logger.debug(f"Submitted job {job.job_id} to queue (priority: {job.priority})")
             except Exception as e:
                 logger.error(f"Failed to submit job {job.job_id}: {e}")
@@ -7,21 +7,376 @@ This module provides systematic portfolio allocation using various methodologies
 - Equal weight allocation
 - Volatility-adjusted (risk parity) allocation
 - Risk parity allocation
+- Minimum-variance and mean-variance allocation within position limits
 - Capital and position limit constraints
+
+Risk-based methods share one AllocationEngine per returns matrix, which
+estimates the (optionally Ledoit-Wolf shrunk) covariance once.
 """
 
 import pandas as pd
 import numpy as np
+import copy
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
 from abc import ABC, abstractmethod
+from scipy.linalg import cho_factor, cho_solve
 import yaml
 import argparse
 import sys
 
 logger = logging.getLogger(__name__)
 
+RISK_METHODS = ('volatility_adjusted', 'risk_parity', 'min_variance', 'mean_variance')
+
+
+class AllocationEngine:
+    """
+    Vectorized allocation solver over a returns matrix.
+
+    The covariance matrix (optionally Ledoit-Wolf shrunk) is estimated once
+    and shared by every method, so allocations can be recomputed cheaply for
+    any subset of strategies, e.g. inside an optimization loop.
+    """
+
+    def __init__(self, returns_df: pd.DataFrame, shrinkage: Union[bool, float, None] = True,
+                 periods_per_year: int = 252, min_periods: int = 30):
+        """
+        Initialize allocation engine.
+
+        Args:
+            returns_df: Periodic returns, one column per strategy key
+                ("{strategy}_{symbol}"); non-numeric columns are ignored
+            shrinkage: True for Ledoit-Wolf shrinkage towards a scaled identity,
+                a float in [0, 1] for a fixed shrinkage intensity, False/None for
+                the sample covariance
+            periods_per_year: Annualization factor
+            min_periods: Strategies need more than this many observations to be
+                allocated by risk-based methods
+        """
+        numeric = returns_df.select_dtypes(include=[np.number])
+        self.keys: List[str] = [str(col) for col in numeric.columns]
+        self._positions = {key: i for i, key in enumerate(self.keys)}
+        self.periods_per_year = periods_per_year
+
+        data = numeric.to_numpy(dtype=np.float64, copy=True)
+        observed = ~np.isnan(data)
+        self.counts = observed.sum(axis=0)
+        self.valid = self.counts > min_periods
+
+        # Missing observations contribute nothing once the data is centred
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.nansum(data, axis=0) / np.maximum(self.counts, 1)
+        data -= means
+        data[~observed] = 0.0
+        self.mean_returns = means * periods_per_year
+
+        # Per-strategy sample volatility over its own observations
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variances = np.einsum('ij,ij->j', data, data) / (self.counts - 1)
+        self.column_volatilities = np.sqrt(np.where(self.counts > 1, variances, np.nan) * periods_per_year)
+
+        # Rescale columns with gaps so each variance uses its own observation
+        # count; as a diagonal scaling this keeps the covariance PSD
+        data *= np.sqrt(len(data) / np.maximum(self.counts, 1))
+        self._centered = data
+
+        self.shrinkage = shrinkage
+        self.shrinkage_intensity = 0.0
+        self._shrinkage_target = 0.0
+        self._covariance: Optional[np.ndarray] = None
+        self._shrunk_engine: Optional['AllocationEngine'] = None
+
+    def indices(self, keys: List[str]) -> np.ndarray:
+        """Column positions of `keys` (-1 for unknown keys)."""
+        return np.fromiter((self._positions.get(key, -1) for key in keys), dtype=np.int64, count=len(keys))
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Annualized covariance matrix of all strategies (computed on first use)."""
+        if self._covariance is None:
+            self._covariance = self._estimate_covariance() * self.periods_per_year
+        return self._covariance
+
+    def _estimate_covariance(self) -> np.ndarray:
+        """Sample covariance, shrunk towards mu * I if configured."""
+        x = self._centered
+        n_obs, n_assets = x.shape
+        sample = x.T @ x / max(n_obs, 1)
+
+        if self.shrinkage is None or self.shrinkage is False or n_assets == 0:
+            return sample
+
+        mu = np.trace(sample) / n_assets
+        if self.shrinkage is True:
+            # Ledoit & Wolf (2004): optimal intensity for the scaled identity target
+            sample_norm = np.sum(sample ** 2)
+            delta = sample_norm - n_assets * mu ** 2
+            beta = (np.sum(np.sum(x ** 2, axis=1) ** 2) - n_obs * sample_norm) / n_obs ** 2
+            intensity = 0.0 if delta <= 0 else min(beta, delta) / delta
+        else:
+            intensity = float(np.clip(self.shrinkage, 0.0, 1.0))
+
+        self.shrinkage_intensity = intensity
+        self._shrinkage_target = mu
+        shrunk = (1.0 - intensity) * sample
+        shrunk[np.diag_indices(n_assets)] += intensity * mu
+        return shrunk
+
+    def for_selection(self, idx: np.ndarray) -> 'AllocationEngine':
+        """
+        Engine to solve for the columns `idx` with.
+
+        Without shrinkage, a selection with at least as many strategies as
+        observations has a singular sample covariance (rank <= T - 1), which
+        leaves risk parity without a solution. Such selections are solved on a
+        Ledoit-Wolf shrunk copy of this engine instead.
+
+        Returns:
+            This engine, or its shrunk copy
+        """
+        if self.shrinkage not in (None, False) or len(idx) < self._centered.shape[0]:
+            return self
+        if self._shrunk_engine is None:
+            logger.warning(f"Sample covariance of {len(idx)} strategies over {self._centered.shape[0]} "
+                           f"observations is singular, applying Ledoit-Wolf shrinkage")
+            self._shrunk_engine = copy.copy(self)
+            self._shrunk_engine.shrinkage = True
+            self._shrunk_engine._covariance = None
+        return self._shrunk_engine
+
+    def inverse_volatility_weights(self, idx: np.ndarray) -> np.ndarray:
+        """Weights proportional to 1 / volatility (normalized to sum to 1)."""
+        vol = self.column_volatilities[idx]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            raw = np.where(vol > 0, 1.0 / vol, 1.0)
+        return raw / raw.sum()
+
+    def allocate(self, keys: List[str], method: str = 'risk_parity',
+                 lower: float = 0.0, upper: float = 1.0,
+                 risk_aversion: Optional[float] = None) -> pd.Series:
+        """
+        Allocate across strategies with enough history.
+
+        Args:
+            keys: Strategy keys (returns_df columns)
+            method: 'volatility_adjusted', 'risk_parity', 'min_variance' or
+                'mean_variance'
+            lower: Minimum weight per position (bounded methods only)
+            upper: Maximum weight per position (bounded methods only)
+            risk_aversion: Risk aversion for 'mean_variance'
+
+        Returns:
+            Weights indexed by key; unknown or short-history keys are omitted
+        """
+        idx = self.indices(keys)
+        usable = idx >= 0
+        usable[usable] = self.valid[idx[usable]]
+        idx = idx[usable]
+        if len(idx) == 0:
+            return pd.Series(dtype=float)
+
+        if method == 'volatility_adjusted':
+            weights = self.inverse_volatility_weights(idx)
+        elif method == 'risk_parity':
+            weights = self.for_selection(idx).risk_parity_weights(idx)
+        elif method == 'min_variance':
+            weights = self.for_selection(idx).mean_variance_weights(idx, lower, upper)
+        elif method == 'mean_variance':
+            weights = self.for_selection(idx).mean_variance_weights(
+                idx, lower, upper, risk_aversion=1.0 if risk_aversion is None else risk_aversion
+            )
+        else:
+            raise ValueError(f"Unknown allocation method: {method}")
+
+        return pd.Series(weights, index=[key for key, ok in zip(keys, usable) if ok])
+
+    def _hessian_solver(self, idx: np.ndarray, cov: np.ndarray, scale: float,
+                        diagonal: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Factor H = scale * cov + diag(diagonal) and return a solver for H x = b.
+
+        `cov` must be the covariance block of the columns `idx`.
+
+        With fewer observations than strategies the covariance is low rank plus
+        a multiple of the identity, so H is inverted through the Woodbury
+        identity at O(T^2 n) instead of a dense O(n^3) Cholesky factorization.
+        """
+        n_obs = self._centered.shape[0]
+        if 0 < n_obs < len(idx):
+            factor = scale * (1.0 - self.shrinkage_intensity) * self.periods_per_year / n_obs
+            u = self._centered[:, idx] * np.sqrt(factor)
+            d = diagonal + scale * self.shrinkage_intensity * self._shrinkage_target * self.periods_per_year
+            scaled_u = u / d
+            inner = cho_factor(np.eye(n_obs) + scaled_u @ u.T)
+
+            def solve(rhs: np.ndarray) -> np.ndarray:
+                x = rhs / d[:, None] if rhs.ndim == 2 else rhs / d
+                return x - scaled_u.T @ cho_solve(inner, u @ x)
+            return solve
+
+        hessian = scale * cov
+        hessian[np.diag_indices(len(idx))] += diagonal
+        factor = cho_factor(hessian)
+        return lambda rhs: cho_solve(factor, rhs)
+
+    def risk_parity_weights(self, idx: np.ndarray, budgets: Optional[np.ndarray] = None,
+                            tol: float = 1e-6, max_iter: int = 100) -> np.ndarray:
+        """
+        Equal (or budgeted) risk contribution weights.
+
+        Solves the convex problem min 0.5 y'Σy - Σ b_i log(y_i) with damped
+        Newton steps; the solution normalized to sum to 1 has risk
+        contributions proportional to the budgets.
+
+        Args:
+            idx: Column positions
+            budgets: Risk budgets (default equal), normalized to sum to 1
+            tol: Convergence tolerance on the risk contributions relative to
+                the largest budget
+            max_iter: Maximum Newton steps
+
+        Returns:
+            Weight vector aligned with idx
+        """
+        cov = self.covariance[np.ix_(idx, idx)]
+        n_assets = len(idx)
+        budgets = np.full(n_assets, 1.0 / n_assets) if budgets is None else budgets / budgets.sum()
+
+        def objective(y):
+            return 0.5 * y @ cov @ y - budgets @ np.log(y)
+
+        # Inverse-volatility start, scaled to the optimal overall level (y'Σy = 1)
+        y = budgets / np.sqrt(np.maximum(np.diag(cov), 1e-12))
+        y /= np.sqrt(y @ cov @ y)
+
+        for _ in range(max_iter):
+            sigma_y = cov @ y
+            if np.max(np.abs(y * sigma_y - budgets)) <= tol * budgets.max():
+                break
+
+            gradient = sigma_y - budgets / y
+            direction = self._hessian_solver(idx, cov, 1.0, budgets / (y * y))(gradient)
+
+            # Backtrack to stay in y > 0 and decrease the objective
+            step = 1.0
+            positive = direction > 0
+            if np.any(positive):
+                step = min(1.0, 0.99 * np.min(y[positive] / direction[positive]))
+            current = objective(y)
+            decrease = gradient @ direction
+            while step > 1e-12 and objective(y - step * direction) > current - 0.25 * step * decrease:
+                step *= 0.5
+            if step <= 1e-12:
+                # No further progress possible at working precision
+                break
+            y = y - step * direction
+
+        return y / y.sum()
+
+    def mean_variance_weights(self, idx: np.ndarray, lower: Union[float, np.ndarray] = 0.0,
+                              upper: Union[float, np.ndarray] = 1.0,
+                              risk_aversion: Optional[float] = None,
+                              tol: float = 1e-12, max_iter: int = 100) -> np.ndarray:
+        """
+        Fully invested mean-variance / minimum-variance weights with position bounds.
+
+        Minimizes 0.5 * risk_aversion * w'Σw - μ'w (or 0.5 * w'Σw when
+        risk_aversion is None) subject to sum(w) = 1 and lower <= w <= upper,
+        using a primal-dual interior point method, so the bounds are part of
+        the solution rather than applied afterwards.
+
+        Args:
+            idx: Column positions
+            lower: Minimum weight per position (scalar or per position)
+            upper: Maximum weight per position (scalar or per position)
+            risk_aversion: Trade-off between variance and annualized mean
+                return; None for minimum variance
+            tol: Convergence tolerance on the KKT residuals and duality gap
+            max_iter: Maximum interior point iterations
+
+        Returns:
+            Weight vector aligned with idx
+        """
+        n_assets = len(idx)
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), n_assets)
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), n_assets)
+        if lower.sum() > 1.0 + 1e-12 or upper.sum() < 1.0 - 1e-12:
+            raise ValueError(f"Allocation bounds are infeasible for {n_assets} positions")
+
+        width = upper - lower
+        slack_total = width.sum()
+        if slack_total <= 1e-12 or np.isclose(lower.sum(), 1.0) or np.isclose(upper.sum(), 1.0):
+            # Only one feasible point
+            return lower.copy() if np.isclose(lower.sum(), 1.0) else upper.copy()
+
+        cov = self.covariance[np.ix_(idx, idx)]
+        if risk_aversion is None:
+            scale, mu = 1.0, np.zeros(n_assets)
+        else:
+            scale, mu = float(risk_aversion), self.mean_returns[idx]
+
+        # Strictly interior start: same fraction of each position's range
+        w = lower + width * ((1.0 - lower.sum()) / slack_total)
+        z_lower = np.ones(n_assets)
+        z_upper = np.ones(n_assets)
+        nu = 0.0
+        ones = np.ones(n_assets)
+
+        def fraction_to_boundary(*pairs):
+            step = 1.0
+            for value, change in pairs:
+                shrinking = change < 0
+                if np.any(shrinking):
+                    step = min(step, np.min(-value[shrinking] / change[shrinking]))
+            return step
+
+        for _ in range(max_iter):
+            s_lower = w - lower
+            s_upper = upper - w
+            gap = (s_lower @ z_lower + s_upper @ z_upper) / (2 * n_assets)
+            dual_residual = scale * (cov @ w) - mu + nu - z_lower + z_upper
+            primal_residual = w.sum() - 1.0
+            if gap < tol and np.max(np.abs(dual_residual)) < tol and abs(primal_residual) < tol:
+                break
+
+            # Both Newton systems below share one factorization of the reduced KKT matrix
+            solve = self._hessian_solver(idx, cov, scale, z_lower / s_lower + z_upper / s_upper)
+            x_ones = solve(ones)
+
+            def direction(comp_lower, comp_upper):
+                rhs = -dual_residual + comp_lower / s_lower - comp_upper / s_upper
+                x_rhs = solve(rhs)
+                d_nu = (x_rhs.sum() + primal_residual) / x_ones.sum()
+                d_w = x_rhs - d_nu * x_ones
+                d_lower = (comp_lower - z_lower * d_w) / s_lower
+                d_upper = (comp_upper + z_upper * d_w) / s_upper
+                return d_w, d_nu, d_lower, d_upper
+
+            # Mehrotra predictor-corrector: the affine step sets the centering target
+            d_w, _, d_lower, d_upper = direction(-s_lower * z_lower, -s_upper * z_upper)
+            step = fraction_to_boundary((s_lower, d_w), (s_upper, -d_w), (z_lower, d_lower), (z_upper, d_upper))
+            affine_gap = ((s_lower + step * d_w) @ (z_lower + step * d_lower)
+                          + (s_upper - step * d_w) @ (z_upper + step * d_upper)) / (2 * n_assets)
+            target = gap * (affine_gap / gap) ** 3
+            d_w, d_nu, d_lower, d_upper = direction(
+                target - s_lower * z_lower - d_w * d_lower,
+                target - s_upper * z_upper + d_w * d_upper,
+            )
+
+            step = 0.99 * fraction_to_boundary((s_lower, d_w), (s_upper, -d_w),
+                                               (z_lower, d_lower), (z_upper, d_upper))
+            if step < 1e-10:
+                # Stalled at working precision
+                break
+            w = w + step * d_w
+            nu += step * d_nu
+            z_lower = z_lower + step * d_lower
+            z_upper = z_upper + step * d_upper
+
+        return np.clip(w, lower, upper)
+
 
 class PortfolioOptimizer:
     """
@@ -33,7 +388,8 @@ class PortfolioOptimizer:
 
     def __init__(self, capital: float = 1000, max_positions: int = 3,
                  min_allocation: float = 0.1, max_allocation: float = 0.5,
-                 config_path: str = 'config/ranking_config.yaml'):
+                 config_path: str = 'config/ranking_config.yaml',
+                 shrinkage: Union[bool, float] = False, risk_aversion: float = 1.0):
         """
         Initialize portfolio optimizer.
 
@@ -43,11 +399,16 @@ class PortfolioOptimizer:
             min_allocation: Minimum allocation per position (as fraction)
             max_allocation: Maximum allocation per position (as fraction)
             config_path: Path to configuration file
+            shrinkage: Covariance shrinkage for risk-based methods (True for
+                Ledoit-Wolf, a float for a fixed intensity)
+            risk_aversion: Risk aversion of the mean_variance method
         """
         self.capital = capital
         self.max_positions = max_positions
         self.min_allocation = min_allocation
         self.max_allocation = max_allocation
+        self.shrinkage = shrinkage
+        self.risk_aversion = risk_aversion
 
         # Load configuration
         self.config = self._load_config(config_path)
@@ -66,16 +427,33 @@ class PortfolioOptimizer:
             logger.warning(f"Failed to load config from {config_path}: {e}")
             return {}
 
+    def create_engine(self, returns_df: Optional[pd.DataFrame]) -> Optional[AllocationEngine]:
+        """
+        Build the allocation engine shared by risk-based methods.
+
+        Args:
+            returns_df: Historical returns data
+
+        Returns:
+            AllocationEngine, or None without returns data
+        """
+        if returns_df is None or returns_df.empty:
+            return None
+        return AllocationEngine(returns_df, shrinkage=self.shrinkage)
+
     def optimize_portfolio(self, strategies_df: pd.DataFrame,
                           method: str = 'equal_weight',
-                          returns_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+                          returns_df: Optional[pd.DataFrame] = None,
+                          engine: Optional[AllocationEngine] = None) -> pd.DataFrame:
         """
         Optimize portfolio allocation using specified method.
 
         Args:
             strategies_df: DataFrame with ranked strategies
-            method: Allocation method ('equal_weight', 'volatility_adjusted', 'risk_parity')
+            method: Allocation method ('equal_weight', 'volatility_adjusted', 'risk_parity',
+                'min_variance', 'mean_variance')
             returns_df: Historical returns data for risk-based methods
+            engine: Prebuilt engine for returns_df (reuses its covariance)
 
         Returns:
             DataFrame with allocation details
@@ -89,13 +467,19 @@ class PortfolioOptimizer:
 
         logger.info(f"Optimizing portfolio with {len(selected_strategies)} strategies using {method}")
 
+        if method in RISK_METHODS and engine is None:
+            engine = self.create_engine(returns_df)
+
         # Apply allocation method
         if method == 'equal_weight':
             allocations = self._equal_weight_allocation(selected_strategies)
         elif method == 'volatility_adjusted':
-            allocations = self._volatility_adjusted_allocation(selected_strategies, returns_df)
+            allocations = self._volatility_adjusted_allocation(selected_strategies, returns_df, engine)
         elif method == 'risk_parity':
-            allocations = self._risk_parity_allocation(selected_strategies, returns_df)
+            allocations = self._risk_parity_allocation(selected_strategies, returns_df, engine)
+        elif method in ('min_variance', 'mean_variance'):
+            allocations = self._mean_variance_allocation(selected_strategies, returns_df, engine,
+                                                         minimum_variance=method == 'min_variance')
         else:
             raise ValueError(f"Unknown allocation method: {method}")
 
@@ -135,122 +519,143 @@ class PortfolioOptimizer:
         logger.info(f"Applied equal weight allocation: {equal_weight:.3f} per strategy")
         return allocations
 
+    def _engine_positions(self, strategies_df: pd.DataFrame,
+                          engine: AllocationEngine) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Locate strategies in the engine's returns matrix.
+
+        Returns:
+            Tuple of (strategy keys, column positions, mask of strategies with
+            enough history)
+        """
+        keys = (strategies_df['strategy'].astype(str) + '_' + strategies_df['symbol'].astype(str)).tolist()
+        idx = engine.indices(keys)
+        usable = idx >= 0
+        usable[usable] = engine.valid[idx[usable]]
+        return keys, idx, usable
+
     def _volatility_adjusted_allocation(self, strategies_df: pd.DataFrame,
-                                      returns_df: Optional[pd.DataFrame] = None) -> Dict[str, float]:
+                                      returns_df: Optional[pd.DataFrame] = None,
+                                      engine: Optional[AllocationEngine] = None) -> Dict[str, float]:
         """
         Volatility-adjusted allocation (inverse volatility weighting).
 
         Args:
             strategies_df: Selected strategies DataFrame
             returns_df: Historical returns data
+            engine: Prebuilt engine for returns_df
 
         Returns:
             Dictionary mapping strategy names to allocation weights
         """
-        if returns_df is None or returns_df.empty:
+        engine = engine or self.create_engine(returns_df)
+        if engine is None:
             logger.warning("No returns data available, falling back to equal weight")
             return self._equal_weight_allocation(strategies_df)
 
-        allocations = {}
-
-        for _, strategy in strategies_df.iterrows():
-            strategy_name = strategy['strategy']
-            symbol = strategy['symbol']
-            strategy_key = f"{strategy_name}_{symbol}"
-
-            if strategy_key in returns_df.columns:
-                # Calculate annualized volatility
-                returns = returns_df[strategy_key].dropna()
-                if len(returns) > 30:  # Need sufficient data
-                    volatility = returns.std() * np.sqrt(252)  # Annualized
-                    if volatility > 0:
-                        # Inverse volatility weight
-                        allocations[strategy_name] = 1.0 / volatility
-                    else:
-                        allocations[strategy_name] = 1.0
-                else:
-                    allocations[strategy_name] = 1.0
-            else:
+        # A repeated strategy name keeps its last row, as the allocation dict
+        # would, and is dropped before the weights are normalized
+        strategies_df = strategies_df.drop_duplicates('strategy', keep='last')
+        keys, idx, usable = self._engine_positions(strategies_df, engine)
+        for strategy_key, position in zip(keys, idx):
+            if position < 0:
                 logger.warning(f"No returns data for {strategy_key}, using equal weight")
-                allocations[strategy_name] = 1.0
 
-        # Normalize to sum to 1
-        total_weight = sum(allocations.values())
-        if total_weight > 0:
-            allocations = {k: v / total_weight for k, v in allocations.items()}
+        # Strategies without (enough) data keep a raw weight of 1.0
+        vol = engine.column_volatilities[idx[usable]]
+        raw = np.ones(len(strategies_df))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            raw[usable] = np.where(vol > 0, 1.0 / vol, 1.0)
+
+        weights = raw / raw.sum()
+        allocations = dict(zip(strategies_df['strategy'], weights))
 
         logger.info(f"Applied volatility-adjusted allocation")
         return allocations
 
     def _risk_parity_allocation(self, strategies_df: pd.DataFrame,
-                              returns_df: Optional[pd.DataFrame] = None) -> Dict[str, float]:
+                              returns_df: Optional[pd.DataFrame] = None,
+                              engine: Optional[AllocationEngine] = None) -> Dict[str, float]:
         """
         Risk parity allocation (equal risk contribution).
 
         Args:
             strategies_df: Selected strategies DataFrame
             returns_df: Historical returns data
+            engine: Prebuilt engine for returns_df
 
         Returns:
             Dictionary mapping strategy names to allocation weights
         """
-        if returns_df is None or returns_df.empty:
+        engine = engine or self.create_engine(returns_df)
+        if engine is None:
             logger.warning("No returns data available, falling back to equal weight")
             return self._equal_weight_allocation(strategies_df)
 
         try:
-            # Extract returns for selected strategies
-            strategy_returns = []
-            strategy_names = []
+            selected = strategies_df.drop_duplicates('strategy', keep='last')
+            _, idx, usable = self._engine_positions(selected, engine)
+            if usable.sum() < 2:
+                logger.warning("Insufficient data for risk parity, using equal weight")
+                return self._equal_weight_allocation(strategies_df)
 
-            for _, strategy in strategies_df.iterrows():
-                strategy_name = strategy['strategy']
-                symbol = strategy['symbol']
-                strategy_key = f"{strategy_name}_{symbol}"
+            weights = engine.for_selection(idx[usable]).risk_parity_weights(idx[usable])
+            allocations = dict(zip(selected['strategy'][usable], weights))
 
-                if strategy_key in returns_df.columns:
-                    returns = returns_df[strategy_key].dropna()
-                    if len(returns) > 30:
-                        strategy_returns.append(returns)
-                        strategy_names.append(strategy_name)
+            logger.info(f"Applied risk parity allocation")
+            return allocations
 
-            if len(strategy_returns) < 2:
-                logger.warning("Insufficient data for risk parity, using equal weight")
-                return self._equal_weight_allocation(strategies_df)
+        except Exception as e:
+            logger.error(f"Error in risk parity optimization: {e}")
+            logger.warning("Falling back to equal weight allocation")
+            return self._equal_weight_allocation(strategies_df)
 
-            # Calculate covariance matrix
-            returns_matrix = pd.concat(strategy_returns, axis=1, keys=strategy_names)
-            returns_matrix = returns_matrix.dropna()
-            cov_matrix = returns_matrix.cov() * 252  # Annualized
+    def _mean_variance_allocation(self, strategies_df: pd.DataFrame,
+                                returns_df: Optional[pd.DataFrame] = None,
+                                engine: Optional[AllocationEngine] = None,
+                                minimum_variance: bool = True) -> Dict[str, float]:
+        """
+        Minimum-variance or mean-variance allocation within the position limits.
 
-            # Risk parity optimization (simplified)
-            # Target equal risk contribution
-            n_assets = len(strategy_names)
-            target_risk = 1.0 / n_assets
+        The min/max allocation limits are solver constraints, so the result
+        already satisfies _apply_constraints. Limits that cannot be met with
+        the available strategies are widened to allow equal weights.
 
-            # Initial equal weights
-            weights = np.array([1.0 / n_assets] * n_assets)
+        Args:
+            strategies_df: Selected strategies DataFrame
+            returns_df: Historical returns data
+            engine: Prebuilt engine for returns_df
+            minimum_variance: Ignore expected returns (minimum variance)
 
-            # Simple iterative optimization (can be improved with scipy.optimize)
-            for _ in range(10):  # Limited iterations for simplicity
-                # Calculate portfolio risk contribution
-                portfolio_vol = np.sqrt(weights @ cov_matrix.values @ weights)
-                marginal_risk = cov_matrix.values @ weights / portfolio_vol
-                risk_contribution = weights * marginal_risk
+        Returns:
+            Dictionary mapping strategy names to allocation weights
+        """
+        engine = engine or self.create_engine(returns_df)
+        if engine is None:
+            logger.warning("No returns data available, falling back to equal weight")
+            return self._equal_weight_allocation(strategies_df)
 
-                # Adjust weights to target equal risk contribution
-                target_contribution = target_risk * portfolio_vol
-                weights = weights * (target_contribution / risk_contribution)
-                weights = weights / weights.sum()  # Normalize
+        try:
+            selected = strategies_df.drop_duplicates('strategy', keep='last')
+            _, idx, usable = self._engine_positions(selected, engine)
+            n_assets = int(usable.sum())
+            if n_assets < 2:
+                logger.warning("Insufficient data for mean-variance, using equal weight")
+                return self._equal_weight_allocation(strategies_df)
 
-            # Convert to dictionary
-            allocations = dict(zip(strategy_names, weights))
+            lower = min(self.min_allocation, 1.0 / n_assets)
+            upper = max(self.max_allocation, 1.0 / n_assets)
+            weights = engine.for_selection(idx[usable]).mean_variance_weights(
+                idx[usable], lower, upper,
+                risk_aversion=None if minimum_variance else self.risk_aversion
+            )
+            allocations = dict(zip(selected['strategy'][usable], weights))
 
-            logger.info(f"Applied risk parity allocation")
+            logger.info(f"Applied {'minimum' if minimum_variance else 'mean'}-variance allocation")
             return allocations
 
         except Exception as e:
-            logger.error(f"Error in risk parity optimization: {e}")
+            logger.error(f"Error in mean-variance optimization: {e}")
             logger.warning("Falling back to equal weight allocation")
             return self._equal_weight_allocation(strategies_df)
 
@@ -440,12 +845,15 @@ class PortfolioOptimizer:
         Returns:
             DataFrame comparing allocation methods
         """
-        methods = ['equal_weight', 'volatility_adjusted', 'risk_parity']
+        methods = ['equal_weight', 'volatility_adjusted', 'risk_parity', 'min_variance', 'mean_variance']
         comparisons = []
 
+        # Covariance is estimated once and shared by every method
+        engine = self.create_engine(returns_df)
+
         for method in methods:
             try:
-                allocation_df = self.optimize_portfolio(strategies_df, method, returns_df)
+                allocation_df = self.optimize_portfolio(strategies_df, method, returns_df, engine=engine)
 
                 if not allocation_df.empty:
                     # Summary for this method
@@ -529,11 +937,24 @@ Examples:
     parser.add_argument(
         '--method',
         type=str,
-        choices=['equal_weight', 'volatility_adjusted', 'risk_parity'],
+        choices=['equal_weight', 'volatility_adjusted', 'risk_parity', 'min_variance', 'mean_variance'],
         default='equal_weight',
         help='Allocation method (default: equal_weight)'
     )
 
+    parser.add_argument(
+        '--shrinkage',
+        action='store_true',
+        help='Apply Ledoit-Wolf covariance shrinkage for risk-based methods'
+    )
+
+    parser.add_argument(
+        '--risk-aversion',
+        type=float,
+        default=1.0,
+        help='Risk aversion for mean_variance allocation (default: 1.0)'
+    )
+
     parser.add_argument(
         '--capital',
         type=float,
@@ -632,7 +1053,9 @@ Examples:
             capital=args.capital,
             max_positions=args.max_positions,
             min_allocation=args.min_allocation,
-            max_allocation=args.max_allocation
+            max_allocation=args.max_allocation,
+            shrinkage=args.shrinkage,
+            risk_aversion=args.risk_aversion
         )
 
         if args.compare:
@@ -36,6 +36,7 @@ from scripts.backtrader_analyzers import (
     EquityCurveAnalyzer,
     MonthlyReturnsAnalyzer,
     TradeLogAnalyzer,
+    columns_to_records,
 )
 from scripts.backtest_parser import BacktraderResultParser
 from scripts.mlflow_logger import MLflowBacktestLogger
@@ -339,12 +340,14 @@ class BacktestRunner:
                 "total_pnl_gross": ib_analysis["total_pnl_gross"],
                 "total_pnl_net": ib_analysis["total_pnl"],
             },
-            "equity_curve": [
-                {"datetime": e["datetime"].isoformat(), "value": e["value"]}
-                for e in equity_analysis["equity_curve"]
-            ],
-            "monthly_returns": monthly_analysis["monthly_returns"],
-            "trades": tradelog_analysis["trades"],
+            "equity_curve": columns_to_records(
+                {
+                    "datetime": equity_analysis["equity_curve"]["datetime"],
+                    "value": equity_analysis["equity_curve"]["value"],
+                }
+            ),
+            "monthly_returns": columns_to_records(monthly_analysis["monthly_returns"]),
+            "trades": columns_to_records(tradelog_analysis["trades"]),
         }
 
         # Calculate advanced metrics (Epic 17)
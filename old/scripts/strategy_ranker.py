@@ -16,13 +16,268 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 import argparse
+import io
 import logging
+import zlib
 import yaml
 
 from utils.results_consolidator import RankingResultsConsolidator
 
 logger = logging.getLogger(__name__)
 
+# Columns whose change requires re-scoring a row
+SCORED_METRICS = ('sharpe_ratio', 'win_rate', 'max_drawdown', 'total_trades', 'profit_factor')
+# Result id columns used (first present) to key rows in the ranking table
+ID_COLUMNS = ('backtest_id', 'result_id', 'job_id')
+SCORE_COLUMNS = ('sharpe_score', 'consistency_score', 'drawdown_score',
+                 'frequency_score', 'efficiency_score', 'composite_score')
+
+
+class RankingTable:
+    """
+    Persistent columnar table of scored strategy results.
+
+    Rows are stored in growable NumPy columns keyed by `key_columns`; a top-N
+    list of row ids ordered by composite score is maintained incrementally as
+    rows arrive, so the best strategies are served without re-sorting the
+    table. Full rankings are only sorted when the whole table is requested.
+    """
+
+    def __init__(self, key_columns: Optional[Tuple[str, ...]] = None,
+                 top_capacity: int = 100, capacity: int = 1024):
+        """
+        Initialize ranking table.
+
+        Args:
+            key_columns: Columns identifying a result; a row whose key already
+                exists replaces it. If None (or missing from the input), every
+                row is treated as a new result.
+            top_capacity: Number of best rows kept in score order
+            capacity: Initial number of preallocated rows
+        """
+        self.key_columns = tuple(key_columns) if key_columns else None
+        self.top_capacity = max(1, int(top_capacity))
+        self._capacity = max(1, int(capacity))
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._column_order: List[str] = []
+        self._int_columns = set()
+        self._index: Dict[tuple, int] = {}
+        self._top = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _ensure_column(self, name: str, values: np.ndarray) -> np.ndarray:
+        """Get (creating if needed) the storage array for a column."""
+        column = self._columns.get(name)
+        if column is None:
+            numeric = values.dtype.kind in 'biuf'
+            column = np.full(self._capacity, np.nan if numeric else None,
+                             dtype=np.float64 if numeric else object)
+            if values.dtype.kind in 'iu':
+                self._int_columns.add(name)
+            self._columns[name] = column
+            self._column_order.append(name)
+        return column
+
+    def _grow(self, required: int):
+        """Grow every column to hold at least `required` rows."""
+        if required <= self._capacity:
+            return
+        while self._capacity < required:
+            self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.full(self._capacity, np.nan if column.dtype != object else None, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def _keys(self, df: pd.DataFrame) -> Optional[List[tuple]]:
+        """Row keys for a frame, or None if it lacks the key columns."""
+        if self.key_columns is None or not all(col in df.columns for col in self.key_columns):
+            return None
+        return list(zip(*(df[col].tolist() for col in self.key_columns)))
+
+    def changed_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Which rows of `df` are new or differ in a scored metric.
+
+        Args:
+            df: Incoming results
+
+        Returns:
+            Boolean array (True = needs scoring)
+        """
+        keys = self._keys(df)
+        if keys is None or self._size == 0:
+            return np.ones(len(df), dtype=bool)
+
+        rows = np.fromiter((self._index.get(key, -1) for key in keys), dtype=np.int64, count=len(keys))
+        changed = rows < 0
+        existing = np.flatnonzero(~changed)
+        if existing.size:
+            stored_rows = rows[existing]
+            for metric in SCORED_METRICS:
+                if metric not in df.columns:
+                    continue
+                if metric not in self._columns:
+                    changed[existing] = True
+                    break
+                incoming = pd.to_numeric(df[metric].iloc[existing], errors='coerce').to_numpy(dtype=float)
+                stored = self._columns[metric][stored_rows]
+                differs = ~((incoming == stored) | (np.isnan(incoming) & np.isnan(stored)))
+                changed[existing[differs]] = True
+        return changed
+
+    def upsert(self, scored_df: pd.DataFrame) -> np.ndarray:
+        """
+        Insert or replace scored rows and update the top-N list.
+
+        Args:
+            scored_df: Results with component and composite score columns
+
+        Returns:
+            Row ids written
+        """
+        if scored_df.empty:
+            return np.empty(0, dtype=np.int64)
+
+        keys = self._keys(scored_df)
+        if keys is not None:
+            # Last occurrence of a key within one batch wins
+            keep = ~pd.Series(keys).duplicated(keep='last').to_numpy()
+            scored_df = scored_df[keep]
+            keys = [key for key, k in zip(keys, keep) if k]
+
+        n = len(scored_df)
+        rows = np.empty(n, dtype=np.int64)
+        next_row = self._size
+        for i in range(n):
+            row = self._index.get(keys[i]) if keys is not None else None
+            if row is None:
+                row = next_row
+                next_row += 1
+                if keys is not None:
+                    self._index[keys[i]] = row
+            rows[i] = row
+
+        self._grow(next_row)
+        old_scores = None
+        if 'composite_score' in self._columns:
+            old_scores = self._columns['composite_score'][rows].copy()
+
+        for name in scored_df.columns:
+            values = scored_df[name].to_numpy()
+            column = self._ensure_column(name, values)
+            if column.dtype == object:
+                column[rows] = values.astype(object)
+            else:
+                column[rows] = pd.to_numeric(scored_df[name], errors='coerce').to_numpy(dtype=float)
+        self._size = next_row
+
+        self._update_top(rows, old_scores)
+        return rows
+
+    # ------------------------------------------------------------------
+    # Ranking
+    # ------------------------------------------------------------------
+
+    def _order(self, rows: np.ndarray) -> np.ndarray:
+        """Sort row ids by composite score (desc), then insertion order."""
+        scores = self._columns['composite_score'][rows]
+        return rows[np.lexsort((rows, -np.nan_to_num(scores, nan=-np.inf)))]
+
+    def _rebuild_top(self):
+        """Recompute the top-N list from the whole table."""
+        scores = np.nan_to_num(self._columns['composite_score'][:self._size], nan=-np.inf)
+        if self._size > self.top_capacity:
+            candidates = np.argpartition(-scores, self.top_capacity - 1)[:self.top_capacity]
+            # Include every row tied with the cut-off so insertion order decides ties
+            cutoff = scores[candidates].min()
+            candidates = np.flatnonzero(scores >= cutoff)
+        else:
+            candidates = np.arange(self._size)
+        self._top = self._order(candidates)[:self.top_capacity]
+
+    def _update_top(self, rows: np.ndarray, old_scores: Optional[np.ndarray]):
+        """Merge written rows into the top-N list."""
+        new_scores = self._columns['composite_score'][rows]
+        in_top = np.isin(rows, self._top)
+
+        # A top row whose score dropped may fall below rows outside the list
+        if old_scores is not None and np.any(in_top & ~(new_scores >= old_scores)):
+            self._rebuild_top()
+            return
+
+        candidates = np.union1d(self._top, rows)
+        self._top = self._order(candidates)[:self.top_capacity]
+
+    def _frame(self, rows: np.ndarray) -> pd.DataFrame:
+        """Build a DataFrame for the given row ids."""
+        frame = pd.DataFrame({name: self._columns[name][rows] for name in self._column_order})
+        for name in self._int_columns:
+            if not frame[name].isna().any():
+                frame[name] = frame[name].astype(np.int64)
+        return frame
+
+    @staticmethod
+    def _dense_rank(scores: np.ndarray) -> np.ndarray:
+        """Dense rank (1 = best) of scores already sorted descending."""
+        if scores.size == 0:
+            return np.empty(0, dtype=int)
+        return np.concatenate([[1], 1 + np.cumsum(scores[1:] != scores[:-1])]).astype(int)
+
+    def top(self, n: int = 15) -> pd.DataFrame:
+        """
+        Best `n` rows by composite score with their rank.
+
+        Served from the maintained top-N list (O(n)); asking for more rows
+        than top_capacity enlarges the list once.
+        """
+        if self._size == 0:
+            return pd.DataFrame()
+        if n > self.top_capacity and len(self._top) < min(n, self._size):
+            self.top_capacity = n
+            self._rebuild_top()
+
+        rows = self._top[:n]
+        frame = self._frame(rows)
+        frame['rank'] = self._dense_rank(self._columns['composite_score'][self._top])[:len(rows)]
+        return frame
+
+    def to_frame(self) -> pd.DataFrame:
+        """All rows sorted by composite score with dense rank."""
+        if self._size == 0:
+            return pd.DataFrame()
+        rows = self._order(np.arange(self._size))
+        frame = self._frame(rows)
+        frame['rank'] = self._dense_rank(frame['composite_score'].to_numpy())
+        return frame
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> str:
+        """Write the table (insertion order) to a Parquet file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._frame(np.arange(self._size)).to_parquet(path, index=False)
+        return str(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], key_columns: Optional[Tuple[str, ...]] = None,
+             top_capacity: int = 100) -> 'RankingTable':
+        """Load a table written by save() (scores are stored, not recomputed)."""
+        df = pd.read_parquet(path)
+        table = cls(key_columns=key_columns, top_capacity=top_capacity, capacity=max(len(df), 1))
+        table.upsert(df)
+        return table
+
 
 class StrategyRanker:
     """
@@ -52,6 +307,10 @@ class StrategyRanker:
             logger.warning(f"Scoring weights sum to {total_weight}, not 100. Normalizing...")
             self.scoring_weights = {k: v/total_weight * 100 for k, v in self.scoring_weights.items()}
 
+        # Persistent scored table, updated incrementally by update_rankings()
+        self.ranking_table: Optional[RankingTable] = None
+        self._csv_state: Optional[Dict[str, Any]] = None
+
         logger.info(f"StrategyRanker initialized with {len(self.scoring_weights)} scoring criteria")
         logger.info(f"Scoring weights: {self.scoring_weights}")
 
@@ -101,6 +360,9 @@ class StrategyRanker:
         """
         Rank strategies based on multi-criteria scoring.
 
+        Repeated calls with the same csv_input only parse and score rows
+        appended to the file since the previous call.
+
         Args:
             results_dir: Directory containing backtest results (if results_df not provided)
             results_df: Pre-consolidated results DataFrame
@@ -110,47 +372,78 @@ class StrategyRanker:
             DataFrame with ranked strategies and composite scores
         """
         # Get consolidated results
-        if results_df is None:
-            if csv_input is not None:
-                # Load directly from CSV
-                results_df = self._load_from_csv(csv_input)
-            elif results_dir is not None:
-                # Load from JSON files in directory
-                self.consolidator = RankingResultsConsolidator(results_dir)
-                results_df = self.consolidator.consolidate_to_dataframe()
-            else:
-                # Use default directory
+        if results_df is None and csv_input is not None:
+            self._update_from_csv(csv_input)
+        else:
+            if results_df is None:
+                if results_dir is not None:
+                    # Load from JSON files in directory
+                    self.consolidator = RankingResultsConsolidator(results_dir)
                 results_df = self.consolidator.consolidate_to_dataframe()
 
-        if results_df is None or results_df.empty:
+            self.reset_rankings()
+            if results_df is not None and not results_df.empty:
+                self.update_rankings(results_df)
+
+        if self.ranking_table is None or len(self.ranking_table) == 0:
             logger.warning("No results to rank")
             return pd.DataFrame()
 
-        logger.info(f"Ranking {len(results_df)} strategies using {len(self.scoring_weights)} criteria")
+        ranked_df = self.ranking_table.to_frame()
+
+        logger.info(f"Strategy ranking complete. Top strategy: {ranked_df.iloc[0]['strategy']} "
+                   f"(score: {ranked_df.iloc[0]['composite_score']:.2f})")
+
+        return ranked_df
+
+    def reset_rankings(self):
+        """Drop the ranking table and any CSV read position."""
+        self.ranking_table = None
+        self._csv_state = None
+
+    def update_rankings(self, results_df: pd.DataFrame) -> int:
+        """
+        Score newly arrived results and merge them into the ranking table.
+
+        Rows are keyed by the first result id column present (backtest_id,
+        result_id, job_id); a result whose id is already ranked is re-scored
+        only if one of its scored metrics changed. Without an id column every
+        row is added as a new result.
+
+        Args:
+            results_df: New or updated results
+
+        Returns:
+            Number of rows (re-)scored
+        """
+        if results_df is None or results_df.empty:
+            return 0
+
+        if self.ranking_table is None:
+            key = next((col for col in ID_COLUMNS if col in results_df.columns), None)
+            self.ranking_table = RankingTable(key_columns=(key,) if key else None)
 
-        # Calculate individual scores for each criterion
+        pending = results_df[self.ranking_table.changed_mask(results_df)]
+        if pending.empty:
+            return 0
+
+        self.ranking_table.upsert(self._score_components(pending))
+        logger.info(f"Scored {len(pending)} results ({len(self.ranking_table)} ranked)")
+        return len(pending)
+
+    def _score_components(self, results_df: pd.DataFrame) -> pd.DataFrame:
+        """Add component and composite score columns to a results frame."""
         scored_df = results_df.copy()
 
-        # Calculate each scoring component
+        # Each component uses fixed bounds, so rows can be scored independently
         scored_df['sharpe_score'] = self._calculate_sharpe_score(scored_df)
         scored_df['consistency_score'] = self._calculate_consistency_score(scored_df)
         scored_df['drawdown_score'] = self._calculate_drawdown_score(scored_df)
         scored_df['frequency_score'] = self._calculate_frequency_score(scored_df)
         scored_df['efficiency_score'] = self._calculate_efficiency_score(scored_df)
 
-        # Calculate composite score
         scored_df['composite_score'] = self._calculate_composite_score(scored_df)
-
-        # Rank strategies by composite score
-        scored_df['rank'] = scored_df['composite_score'].rank(ascending=False, method='dense').astype(int)
-
-        # Sort by rank
-        ranked_df = scored_df.sort_values('composite_score', ascending=False).reset_index(drop=True)
-
-        logger.info(f"Strategy ranking complete. Top strategy: {ranked_df.iloc[0]['strategy']} "
-                   f"(score: {ranked_df.iloc[0]['composite_score']:.2f})")
-
-        return ranked_df
+        return scored_df
 
     def _calculate_sharpe_score(self, df: pd.DataFrame) -> pd.Series:
         """Calculate Sharpe ratio score (0-100 scale)."""
@@ -247,58 +540,130 @@ class StrategyRanker:
         try:
             df = pd.read_csv(csv_path)
             logger.info(f"Loaded {len(df)} results from CSV: {csv_path}")
+            return self._prepare_csv_frame(df)
+
+        except Exception as e:
+            logger.error(f"Failed to load CSV from {csv_path}: {e}")
+            return pd.DataFrame()
 
-            # Map CSV columns to expected DataFrame format
-            # The CSV has columns like: symbol, strategy, sharpe_ratio, max_drawdown, etc.
-            # We need to ensure the column names match what the ranking functions expect
+    def _prepare_csv_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Map CSV columns to the names and types the scoring functions expect."""
+        # The CSV has columns like: symbol, strategy, sharpe_ratio, max_drawdown, etc.
+        column_mapping = {
+            'trade_count': 'total_trades',  # CSV uses trade_count, ranking expects total_trades
+        }
 
-            # Rename columns if needed
-            column_mapping = {
-                'trade_count': 'total_trades',  # CSV uses trade_count, ranking expects total_trades
-            }
+        df = df.rename(columns=column_mapping)
+
+        # Ensure required columns exist with defaults
+        required_columns = ['strategy', 'symbol', 'sharpe_ratio', 'max_drawdown', 'win_rate', 'total_trades', 'profit_factor']
+        for col in required_columns:
+            if col not in df.columns:
+                if col in ['sharpe_ratio', 'max_drawdown', 'win_rate', 'profit_factor']:
+                    df[col] = 0.0
+                elif col == 'total_trades':
+                    df[col] = 0
+                else:
+                    df[col] = 'unknown'
+
+        # Convert data types
+        df['total_trades'] = df['total_trades'].fillna(0).astype(int)
+        df['sharpe_ratio'] = df['sharpe_ratio'].fillna(0.0).astype(float)
+        df['max_drawdown'] = df['max_drawdown'].fillna(0.0).astype(float)
+        df['win_rate'] = df['win_rate'].fillna(0.0).astype(float)
+        df['profit_factor'] = df['profit_factor'].fillna(1.0).astype(float)
+
+        logger.info(f"Prepared DataFrame with {len(df)} rows and columns: {list(df.columns)}")
+        return df
+
+    def _update_from_csv(self, csv_path: str) -> int:
+        """
+        Rank rows appended to a results CSV since the last call.
 
-            df = df.rename(columns=column_mapping)
+        The byte offset of the last complete line read is remembered together
+        with a checksum of the bytes before it; if the file was rewritten
+        (shorter, or the checksum changed) the table is rebuilt from scratch.
 
-            # Ensure required columns exist with defaults
-            required_columns = ['strategy', 'symbol', 'sharpe_ratio', 'max_drawdown', 'win_rate', 'total_trades', 'profit_factor']
-            for col in required_columns:
-                if col not in df.columns:
-                    if col in ['sharpe_ratio', 'max_drawdown', 'win_rate', 'profit_factor']:
-                        df[col] = 0.0
-                    elif col == 'total_trades':
-                        df[col] = 0
+        Args:
+            csv_path: Path to CSV file with consolidated results
+
+        Returns:
+            Number of rows (re-)scored
+        """
+        path = str(Path(csv_path).resolve())
+        try:
+            with open(path, 'rb') as f:
+                state = self._csv_state
+                if state is not None and state['path'] == path:
+                    f.seek(0, io.SEEK_END)
+                    if f.tell() < state['offset']:
+                        state = None
                     else:
-                        df[col] = 'unknown'
+                        f.seek(0)
+                        if zlib.crc32(f.read(state['offset'])) != state['crc']:
+                            state = None
+                else:
+                    state = None
+
+                if state is None:
+                    self.reset_rankings()
+                    f.seek(0)
+                    data = f.read()
+                    offset, crc, header = 0, 0, b''
+                else:
+                    data = f.read()
+                    offset, crc, header = state['offset'], state['crc'], state['header']
+
+        except OSError as e:
+            logger.error(f"Failed to load CSV from {csv_path}: {e}")
+            return 0
+
+        # Only consume complete lines; a partially written last row is read next time
+        end = data.rfind(b'\n') + 1
+        data = data[:end]
+        if not header:
+            header_end = data.find(b'\n') + 1
+            header = data[:header_end]
+        else:
+            header_end = 0
 
-            # Convert data types
-            df['total_trades'] = df['total_trades'].fillna(0).astype(int)
-            df['sharpe_ratio'] = df['sharpe_ratio'].fillna(0.0).astype(float)
-            df['max_drawdown'] = df['max_drawdown'].fillna(0.0).astype(float)
-            df['win_rate'] = df['win_rate'].fillna(0.0).astype(float)
-            df['profit_factor'] = df['profit_factor'].fillna(1.0).astype(float)
+        self._csv_state = {
+            'path': path,
+            'offset': offset + end,
+            'crc': zlib.crc32(data, crc),
+            'header': header,
+        }
 
-            logger.info(f"Prepared DataFrame with {len(df)} rows and columns: {list(df.columns)}")
-            return df
+        body = data[header_end:]
+        if not header or not body.strip():
+            return 0
 
-        except Exception as e:
-            logger.error(f"Failed to load CSV from {csv_path}: {e}")
-            return pd.DataFrame()
+        df = pd.read_csv(io.BytesIO(header + body))
+        logger.info(f"Loaded {len(df)} new results from CSV: {csv_path}")
+        return self.update_rankings(self._prepare_csv_frame(df))
 
-    def get_top_strategies(self, ranked_df: pd.DataFrame, top_n: int = 15) -> pd.DataFrame:
+    def get_top_strategies(self, ranked_df: Optional[pd.DataFrame] = None,
+                           top_n: int = 15) -> pd.DataFrame:
         """
         Get top N strategies from ranked results.
 
         Args:
-            ranked_df: Ranked strategies DataFrame
+            ranked_df: Ranked strategies DataFrame. If None, served from the
+                maintained top-N list of the ranking table without sorting.
             top_n: Number of top strategies to return
 
         Returns:
             DataFrame with top N strategies
         """
-        if ranked_df.empty:
+        if ranked_df is None:
+            if self.ranking_table is None:
+                return pd.DataFrame()
+            top_strategies = self.ranking_table.top(top_n)
+        elif ranked_df.empty:
             return pd.DataFrame()
+        else:
+            top_strategies = ranked_df.nlargest(top_n, 'composite_score', keep='first').copy()
 
-        top_strategies = ranked_df.head(top_n).copy()
         logger.info(f"Selected top {len(top_strategies)} strategies for portfolio construction")
 
         return top_strategies
@@ -10,17 +10,46 @@ Docker container worker that processes multiple job types from Redis queues:
 - Data processing jobs (data_processing_queue)
 
 This replaces separate specialized workers with a single unified worker.
+
+Scheduling:
+- One blocking BZPOPMIN across all queues, with the key order drawn by
+  weighted random sampling so higher-weight queues are served first more often
+- Local prefetch buffer of popped jobs waiting for a free process
+- Jobs run concurrently in a process pool sized to the container's cores
+- Results and status updates written in batched Redis pipelines
+
+Delivery:
+- Every popped job (buffered or running) is recorded in the worker's
+  processing hash worker_processing:<worker_id> until its result is stored
+- The worker keeps a worker_heartbeat:<worker_id> lease alive while running
+- On startup, and periodically, processing hashes of this worker and of
+  workers whose lease has expired are moved back to their queues, so jobs
+  survive crashes and SIGKILL (at-least-once delivery)
+- If a pool process dies mid-job (segfault, OOM kill), the running and
+  buffered jobs are requeued and the pool is recreated
+
+Environment:
+- WORKER_CONCURRENCY: Pool processes (default: CPU count)
+- WORKER_PREFETCH: Jobs buffered locally beyond running ones (default: concurrency)
+- QUEUE_WEIGHTS: e.g. "backtest=4,discovery=1,ranking=1,data=1" (default: all 1)
+- WORKER_ID: Stable worker identity (default: <hostname>_<pid>)
 """
 
 import os
 import json
 import time
+import random
 import redis
 import logging
 import signal
+import socket
 import sys
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 import traceback
 
@@ -30,9 +59,10 @@ sys.path.insert(0, os.path.join(project_root, "backend"))
 sys.path.insert(0, os.path.join(project_root, "scripts"))
 sys.path.insert(0, os.path.join(project_root, "utils"))
 
-# Import job handlers
-from scripts.symbol_discovery import SymbolDiscoveryEngine
-from scripts.databento_zip_extractor import DatabentoZipExtractor
+try:
+    from scripts.job_queue import STATS_KEY_PREFIX
+except ImportError:
+    from job_queue import STATS_KEY_PREFIX
 
 # Configure logging
 logging.basicConfig(
@@ -49,16 +79,92 @@ class UnifiedJob:
     job_type: str  # 'backtest', 'discovery', 'ranking', 'data'
     job_id: str
     payload: Dict[str, Any]
+    queue_name: str = ""
+    score: float = 0.0  # Queue score, kept so unstarted jobs can be requeued
+    started_at: float = 0.0
+    raw: str = ""  # Queue member as popped, requeued unchanged
+
+
+# Job durations kept per type under STATS_KEY_PREFIX (read by scripts/auto_scaling_manager.py)
+DURATION_SAMPLES = 500
+
+# Jobs popped but not finished, per worker: hash of "<queue>\n<member>" -> score
+PROCESSING_KEY_PREFIX = "worker_processing"
+HEARTBEAT_KEY_PREFIX = "worker_heartbeat"
+
+
+def _lease_field(queue_name: str, member: str) -> str:
+    """Processing hash field of a popped queue member."""
+    return f"{queue_name}\n{member}"
+
+
+# Per-process handler used by pool workers (set by _init_pool_worker)
+_POOL_WORKER = None
+
+
+def _init_pool_worker():
+    """Process pool initializer: leave shutdown signals to the parent process."""
+    global _POOL_WORKER
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    _POOL_WORKER = UnifiedWorker(install_signal_handlers=False)
+    # Jobs report status and progress through their own connection
+    try:
+        _POOL_WORKER.connect_redis()
+    except Exception:
+        logger.warning("Pool process running without Redis; job status updates are disabled")
+
+
+def _process_job_in_pool(job: UnifiedJob) -> Dict[str, Any]:
+    """Run a job inside a pool process."""
+    _POOL_WORKER._update_job_status(job.job_id, job.job_type, "running", "Job started")
+    return _POOL_WORKER.process_job(job)
+
+
+def _parse_queue_weights(spec: Optional[str]) -> Dict[str, float]:
+    """Parse "backtest=4,data=1" into {'backtest': 4.0, 'data': 1.0}."""
+    weights = {}
+    for item in (spec or "").split(","):
+        if "=" not in item:
+            continue
+        job_type, weight = item.split("=", 1)
+        try:
+            weights[job_type.strip()] = float(weight)
+        except ValueError:
+            logger.warning(f"Ignoring invalid queue weight: {item}")
+    return weights
 
 
 class UnifiedWorker:
     """Unified worker that handles multiple job types"""
 
-    def __init__(self):
-        """Initialize the unified worker"""
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        prefetch: Optional[int] = None,
+        queue_weights: Optional[Dict[str, float]] = None,
+        install_signal_handlers: bool = True,
+    ):
+        """
+        Initialize the unified worker
+
+        Args:
+            concurrency: Pool processes (default: WORKER_CONCURRENCY or CPU count)
+            prefetch: Jobs buffered locally beyond running ones
+                (default: WORKER_PREFETCH or concurrency)
+            queue_weights: Job type -> relative priority (default: QUEUE_WEIGHTS or 1 each)
+            install_signal_handlers: Register SIGTERM/SIGINT for graceful shutdown
+        """
         self.redis_client = None
         self.running = True
-        self.worker_id = os.getenv("WORKER_ID", f"worker_{int(time.time())}")
+        # Stable across container restarts (PID 1) so the restarted worker
+        # reclaims its own jobs; ':' is reserved for key parsing
+        worker_id = os.getenv("WORKER_ID") or f"{socket.gethostname()}_{os.getpid()}"
+        self.worker_id = worker_id.replace(":", "_")
+        self.processing_key = f"{PROCESSING_KEY_PREFIX}:{self.worker_id}"
+        self.heartbeat_key = f"{HEARTBEAT_KEY_PREFIX}:{self.worker_id}"
+        self._last_heartbeat = float("-inf")
+        self._last_recovery = float("-inf")
 
         # Job type to queue mapping
         self.queues = {
@@ -67,10 +173,21 @@ class UnifiedWorker:
             "ranking": "ranking_jobs",
             "data": "data_processing_queue",
         }
+        self.queue_types = {queue: job_type for job_type, queue in self.queues.items()}
+
+        self.concurrency = max(1, concurrency or int(os.getenv("WORKER_CONCURRENCY", 0)) or os.cpu_count() or 1)
+        if prefetch is None:
+            prefetch = int(os.getenv("WORKER_PREFETCH", self.concurrency))
+        self.prefetch = max(0, prefetch)
+
+        weights = {job_type: 1.0 for job_type in self.queues}
+        weights.update(queue_weights or _parse_queue_weights(os.getenv("QUEUE_WEIGHTS")))
+        self.queue_weights = {job_type: max(weights[job_type], 1e-6) for job_type in self.queues}
 
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        if install_signal_handlers:
+            signal.signal(signal.SIGTERM, self._signal_handler)
+            signal.signal(signal.SIGINT, self._signal_handler)
 
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
@@ -140,6 +257,9 @@ class UnifiedWorker:
         logger.info(f"Processing discovery job {job.job_id}")
 
         try:
+            # Import discovery dependencies
+            from scripts.symbol_discovery import SymbolDiscoveryEngine
+
             payload = job.payload
 
             # Create discovery engine
@@ -225,6 +345,9 @@ class UnifiedWorker:
         try:
             payload = job.payload
 
+            # Import data processing dependencies
+            from scripts.databento_zip_extractor import DatabentoZipExtractor
+
             # Create extractor
             extractor = DatabentoZipExtractor(
                 payload["zip_file_path"], payload["output_dir"]
@@ -267,6 +390,241 @@ class UnifiedWorker:
                 "message": f"Unsupported job type: {job.job_type}",
             }
 
+    # ===================================================================
+    # Queue Consumption
+    # ===================================================================
+
+    # Blocking pop timeouts (seconds): long when idle, short while jobs run
+    # so finished jobs are collected promptly
+    IDLE_POP_TIMEOUT = 1.0
+    BUSY_POP_TIMEOUT = 0.05
+
+    def _weighted_queue_order(self) -> List[str]:
+        """
+        Order queue names by weighted random sampling without replacement.
+
+        BZPOPMIN serves the first non-empty key, so a queue with weight w
+        comes first proportionally more often without starving the others.
+        """
+        keyed = [
+            (random.random() ** (1.0 / self.queue_weights[job_type]), queue_name)
+            for job_type, queue_name in self.queues.items()
+        ]
+        return [queue_name for _, queue_name in sorted(keyed, reverse=True)]
+
+    def _decode_job(self, queue_name: str, job_data_str: str, score: float) -> Optional[UnifiedJob]:
+        """Build a UnifiedJob from a popped queue entry (None if invalid)."""
+        job_type = self.queue_types[queue_name]
+        try:
+            job_data = json.loads(job_data_str)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid job data in {queue_name}: {e}")
+            return None
+
+        logger.info(f"Received {job_type} job from queue: {queue_name}")
+        return UnifiedJob(
+            job_type=job_type,
+            job_id=job_data.get("job_id", f"unknown_{int(time.time())}"),
+            payload=job_data,
+            queue_name=queue_name,
+            score=float(score),
+        )
+
+    def _pop_jobs(self, max_jobs: int, timeout: float) -> List[UnifiedJob]:
+        """
+        Pop up to max_jobs jobs across all queues and record them as processing.
+
+        The first pop is a single BZPOPMIN over every queue, blocking up to
+        timeout seconds. Prefetch pops take up to the remaining count from one
+        queue per ZPOPMIN, walking the weighted queue order, and every popped
+        job is added to the processing hash in one HSET right after.
+
+        Args:
+            max_jobs: Maximum number of jobs to pop
+            timeout: Seconds to block waiting for the first job
+
+        Returns:
+            Popped jobs (possibly empty)
+        """
+        result = self.redis_client.bzpopmin(self._weighted_queue_order(), timeout=timeout)
+        if not result:
+            return []
+
+        popped = [result]
+        remaining = max_jobs - 1
+        for queue_name in self._weighted_queue_order():
+            if remaining <= 0:
+                break
+            items = self.redis_client.zpopmin(queue_name, remaining)
+            popped.extend((queue_name, member, score) for member, score in items)
+            remaining -= len(items)
+
+        self.redis_client.hset(self.processing_key, mapping={
+            _lease_field(queue_name, member): score for queue_name, member, score in popped
+        })
+
+        jobs = []
+        for queue_name, member, score in popped:
+            job = self._decode_job(queue_name, member, score)
+            if job:
+                job.raw = member
+                jobs.append(job)
+            else:
+                # Undecodable jobs are dropped, not retried
+                self.redis_client.hdel(self.processing_key, _lease_field(queue_name, member))
+        return jobs
+
+    def _requeue_jobs(self, jobs: List[UnifiedJob]):
+        """Return unfinished jobs (prefetched, or lost with a pool process) to their queues."""
+        if not jobs:
+            return
+        pipe = self.redis_client.pipeline(transaction=True)
+        for job in jobs:
+            pipe.zadd(job.queue_name, {job.raw: job.score})
+            pipe.hdel(self.processing_key, _lease_field(job.queue_name, job.raw))
+        pipe.execute()
+        logger.info(f"Requeued {len(jobs)} unfinished job(s)")
+
+    # ===================================================================
+    # Leases and Recovery
+    # ===================================================================
+
+    # Seconds a worker's heartbeat stays valid; its jobs are recovered after
+    LEASE_SECONDS = 60
+
+    def _heartbeat(self, now: Optional[float] = None):
+        """Renew this worker's lease (at most every third of LEASE_SECONDS)."""
+        now = time.time() if now is None else now
+        if now - self._last_heartbeat >= self.LEASE_SECONDS / 3:
+            self.redis_client.set(self.heartbeat_key, now, ex=self.LEASE_SECONDS)
+            self._last_heartbeat = now
+
+    def _recover_jobs(self, include_own: bool = False) -> int:
+        """
+        Move jobs of dead workers (and optionally this worker) back to their queues.
+
+        A processing hash is claimed with an atomic RENAME to a key owned by
+        this worker before its jobs are requeued, so concurrent recoveries
+        never requeue a job twice, and a crash mid-recovery leaves the claim
+        for this worker's next startup.
+
+        Args:
+            include_own: Also recover this worker's hashes (startup only, before
+                any job has been popped)
+
+        Returns:
+            Number of jobs requeued
+        """
+        recovered = 0
+        prefix = f"{PROCESSING_KEY_PREFIX}:"
+        for key in list(self.redis_client.scan_iter(match=f"{prefix}*")):
+            owner = key[len(prefix):].split(":", 1)[0]
+            if owner == self.worker_id:
+                if not include_own:
+                    continue
+            elif self.redis_client.exists(f"{HEARTBEAT_KEY_PREFIX}:{owner}"):
+                continue
+
+            claim_key = f"{self.processing_key}:recovering:{uuid.uuid4().hex}"
+            try:
+                self.redis_client.rename(key, claim_key)
+            except redis.ResponseError:
+                continue  # Claimed by another worker first
+
+            entries = self.redis_client.hgetall(claim_key)
+            pipe = self.redis_client.pipeline(transaction=True)
+            for field, score in entries.items():
+                queue_name, member = field.split("\n", 1)
+                pipe.zadd(queue_name, {member: float(score)})
+            pipe.delete(claim_key)
+            pipe.execute()
+
+            if entries:
+                logger.warning(f"Recovered {len(entries)} unfinished job(s) from {owner}")
+            recovered += len(entries)
+        return recovered
+
+    def _maintain_leases(self, now: Optional[float] = None):
+        """Renew the heartbeat and periodically recover jobs of dead workers."""
+        now = time.time() if now is None else now
+        self._heartbeat(now)
+        if now - self._last_recovery >= self.LEASE_SECONDS:
+            self._recover_jobs()
+            self._last_recovery = now
+
+    # ===================================================================
+    # Results
+    # ===================================================================
+
+    def _collect_finished(self, in_flight: Dict[Any, UnifiedJob]):
+        """
+        Pop finished futures from in_flight and store their results in one pipeline.
+
+        Raises:
+            BrokenProcessPool: A pool process died; the jobs of the broken
+                futures stay in in_flight (after the other results are stored)
+        """
+        finished = [future for future in in_flight if future.done()]
+        if not finished:
+            return
+
+        completed = []
+        broken = None
+        for future in finished:
+            job = in_flight.pop(future)
+            try:
+                result = future.result()
+            except BrokenProcessPool as e:
+                in_flight[future] = job
+                broken = e
+                continue
+            except Exception as e:
+                logger.error(f"Worker process failed on {job.job_type} job {job.job_id}: {e}")
+                result = {
+                    "status": "failed",
+                    "error": str(e),
+                    "message": f"Worker process failed: {str(e)}",
+                }
+
+            if result["status"] == "completed":
+                logger.info(f"Successfully processed {job.job_type} job: {job.job_id}")
+            else:
+                logger.error(f"Failed to process {job.job_type} job: {job.job_id}")
+            completed.append((job, result))
+
+        if completed:
+            self._store_results(completed)
+        if broken:
+            raise broken
+
+    def _store_results(self, completed: List[Tuple[UnifiedJob, Dict[str, Any]]]):
+        """Write job results, status updates and duration stats in a single Redis pipeline."""
+        try:
+            now = time.time()
+            pipe = self.redis_client.pipeline(transaction=False)
+            for job, result in completed:
+                pipe.hdel(self.processing_key, _lease_field(job.queue_name, job.raw))
+                durations_key = f"{STATS_KEY_PREFIX}:{job.job_type}:durations"
+                pipe.lpush(durations_key, round(now - job.started_at, 3))
+                pipe.ltrim(durations_key, 0, DURATION_SAMPLES - 1)
+                pipe.incr(f"{STATS_KEY_PREFIX}:{job.job_type}:completed")
+
+                pipe.setex(
+                    f"{job.job_type}_job_result:{job.job_id}",
+                    86400,  # 24 hours
+                    json.dumps(result, default=str),
+                )
+                self._queue_status_update(
+                    pipe, job.job_id, job.job_type, result["status"], result["message"]
+                )
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.error(f"Failed to store results for {len(completed)} job(s): {e}")
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        """Start the process pool that runs jobs."""
+        return ProcessPoolExecutor(max_workers=self.concurrency, initializer=_init_pool_worker)
+
     def run(self):
         """Main worker loop"""
         logger.info(f"Starting Unified Worker {self.worker_id}")
@@ -274,93 +632,81 @@ class UnifiedWorker:
         try:
             self.connect_redis()
 
-            logger.info("Worker started, monitoring all job queues...")
+            # Take the lease first so no other worker recovers this one meanwhile
+            self._heartbeat()
+            recovered = self._recover_jobs(include_own=True)
+            if recovered:
+                logger.info(f"Requeued {recovered} job(s) left unfinished by earlier runs")
+            self._last_recovery = time.time()
 
-            while self.running:
-                try:
-                    # Check all queues for jobs (round-robin)
-                    job_found = False
+            logger.info(
+                f"Worker started with {self.concurrency} processes and prefetch "
+                f"{self.prefetch}, monitoring all job queues (weights: {self.queue_weights})..."
+            )
 
-                    for job_type, queue_name in self.queues.items():
-                        try:
-                            # Try to get a job from this queue
-                            result = self.redis_client.bzpopmin(queue_name, timeout=1)
-
-                            if result:
-                                queue_name, job_data_str, score = result
-                                logger.info(
-                                    f"Received {job_type} job from queue: {queue_name}"
-                                )
-
-                                try:
-                                    job_data = json.loads(job_data_str)
-                                    job = UnifiedJob(
-                                        job_type=job_type,
-                                        job_id=job_data.get(
-                                            "job_id", f"unknown_{int(time.time())}"
-                                        ),
-                                        payload=job_data,
-                                    )
-
-                                    # Process the job
-                                    result = self.process_job(job)
-
-                                    # Store result
-                                    result_key = f"{job_type}_job_result:{job.job_id}"
-                                    self.redis_client.setex(
-                                        result_key,
-                                        86400,  # 24 hours
-                                        json.dumps(result),
-                                    )
-
-                                    # Update job status
-                                    self._update_job_status(
-                                        job.job_id,
-                                        job_type,
-                                        result["status"],
-                                        result["message"],
-                                    )
-
-                                    if result["status"] == "completed":
-                                        logger.info(
-                                            f"Successfully processed {job_type} job: {job.job_id}"
-                                        )
-                                    else:
-                                        logger.error(
-                                            f"Failed to process {job_type} job: {job.job_id}"
-                                        )
-
-                                    job_found = True
-                                    break  # Process one job at a time
-
-                                except json.JSONDecodeError as e:
-                                    logger.error(
-                                        f"Invalid job data in {queue_name}: {e}"
-                                    )
-                                except Exception as e:
-                                    logger.error(
-                                        f"Error processing job from {queue_name}: {e}"
-                                    )
-
-                        except redis.ResponseError:
-                            # Queue might be empty, continue to next queue
-                            continue
-
-                    # If no job was found, wait a bit before checking again
-                    if not job_found:
-                        time.sleep(0.1)
-
-                except redis.ConnectionError:
-                    logger.warning("Redis connection lost, attempting to reconnect...")
-                    time.sleep(5)
-                    try:
-                        self.connect_redis()
-                    except Exception:
-                        logger.error("Failed to reconnect to Redis")
+            buffer: deque = deque()
+            in_flight: Dict[Any, UnifiedJob] = {}
 
-                except Exception as e:
-                    logger.error(f"Error in worker loop: {e}")
-                    time.sleep(1)
+            pool = self._create_pool()
+            try:
+                while self.running or in_flight:
+                    try:
+                        self._maintain_leases()
+
+                        # Start buffered jobs on free processes
+                        while self.running and buffer and len(in_flight) < self.concurrency:
+                            job = buffer[0]
+                            job.started_at = time.time()
+                            in_flight[pool.submit(_process_job_in_pool, job)] = job
+                            buffer.popleft()
+
+                        self._collect_finished(in_flight)
+
+                        # Refill the prefetch buffer; the blocking pop doubles as the wait
+                        capacity = self.concurrency + self.prefetch - len(in_flight) - len(buffer)
+                        if self.running and capacity > 0:
+                            timeout = self.BUSY_POP_TIMEOUT if in_flight else self.IDLE_POP_TIMEOUT
+                            buffer.extend(self._pop_jobs(capacity, timeout))
+                        elif in_flight:
+                            wait(in_flight, timeout=self.IDLE_POP_TIMEOUT, return_when=FIRST_COMPLETED)
+
+                    except BrokenProcessPool:
+                        # The job that killed its process is unknown, so every
+                        # unfinished job goes back to its queue
+                        jobs = list(in_flight.values()) + list(buffer)
+                        logger.error(
+                            f"A pool process died; requeueing {len(jobs)} job(s) and restarting the pool"
+                        )
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        in_flight.clear()
+                        buffer.clear()
+                        try:
+                            self._requeue_jobs(jobs)
+                        except redis.RedisError as e:
+                            # Still in the processing hash; recovered once the lease expires
+                            logger.error(f"Failed to requeue {len(jobs)} job(s): {e}")
+                        pool = self._create_pool()
+
+                    except redis.ConnectionError:
+                        logger.warning("Redis connection lost, attempting to reconnect...")
+                        time.sleep(5)
+                        try:
+                            self.connect_redis()
+                        except Exception:
+                            logger.error("Failed to reconnect to Redis")
+
+                    except Exception as e:
+                        logger.error(f"Error in worker loop: {e}")
+                        time.sleep(1)
+            finally:
+                pool.shutdown(wait=True)
+
+            try:
+                self._requeue_jobs(list(buffer))
+                self.redis_client.delete(self.heartbeat_key)
+            except redis.RedisError as e:
+                # Still in the processing hash; recovered once the lease expires
+                logger.error(f"Failed to requeue {len(buffer)} prefetched job(s): {e}")
 
         except Exception as e:
             logger.error(f"Fatal error in unified worker: {e}")
@@ -368,19 +714,24 @@ class UnifiedWorker:
         finally:
             logger.info(f"Unified Worker {self.worker_id} shutting down")
 
+    def _queue_status_update(self, pipe, job_id: str, job_type: str, status: str, message: str):
+        """Add a job status update to a Redis pipeline"""
+        key = f"{job_type}_job:{job_id}"
+        pipe.hset(key, mapping={
+            "status": status,
+            "message": message,
+            "updated_at": time.time(),
+        })
+        # Set expiration (24 hours)
+        pipe.expire(key, 86400)
+
     def _update_job_status(self, job_id: str, job_type: str, status: str, message: str):
         """Update job status in Redis"""
         try:
             if self.redis_client:
-                key = f"{job_type}_job:{job_id}"
-                job_data = {
-                    "status": status,
-                    "message": message,
-                    "updated_at": time.time(),
-                }
-                self.redis_client.hmset(key, job_data)
-                # Set expiration (24 hours)
-                self.redis_client.expire(key, 86400)
+                pipe = self.redis_client.pipeline(transaction=False)
+                self._queue_status_update(pipe, job_id, job_type, status, message)
+                pipe.execute()
         except Exception as e:
             logger.warning(f"Failed to update job status: {e}")
 
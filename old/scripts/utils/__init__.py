@@ -1,7 +1,7 @@
 """Utility modules for live trading platform."""
 
-from .market_hours import MarketHours
-from .pnl_calculator import PnLCalculator
+from .market_hours import MarketHours, TradingCalendar, get_trading_calendar
+from .pnl_calculator import PnLCalculator, PnLEngine
 from .alerting import AlertManager
 
-__all__ = ["MarketHours", "PnLCalculator", "AlertManager"]
+__all__ = ["MarketHours", "TradingCalendar", "get_trading_calendar", "PnLCalculator", "PnLEngine", "AlertManager"]
@@ -3,18 +3,564 @@
 Market Hours Utility - US market hours and trading day calculations.
 
 US-5.1: Live Trading Engine - Market hours handling
+
+Trading days and session times come from a precomputed TradingCalendar
+(1990-2040 by default): a sorted NumPy array of sessions with pre-market,
+open, close and after-hours epochs plus early-close flags. The calendar is
+built once, cached to disk, and answers date lookups in O(1) and timestamp
+lookups in O(log n), for scalars or whole arrays. Queries outside the range
+extend it in place.
 """
 
+import hashlib
 import logging
+import os
+import threading
 from datetime import datetime, date, time, timedelta
-from typing import Optional
+from typing import Dict, List, Optional, Union
 from pathlib import Path
+import numpy as np
+import pandas as pd
 import yaml
 import pytz
 from dateutil.easter import easter
 
 logger = logging.getLogger(__name__)
 
+CALENDAR_START_YEAR = 1990
+CALENDAR_END_YEAR = 2040
+# Under the repository's data directory rather than the working directory;
+# MARKET_CALENDAR_CACHE_DIR overrides it (set it empty to disable caching)
+CALENDAR_CACHE_DIR = os.environ.get(
+    "MARKET_CALENDAR_CACHE_DIR", str(Path(__file__).resolve().parents[2] / "data" / "cache")
+)
+CALENDAR_VERSION = 1
+
+EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+
+# Years whose sessions fit in pandas' nanosecond timestamps
+MIN_CALENDAR_YEAR = pd.Timestamp.min.year + 1
+MAX_CALENDAR_YEAR = pd.Timestamp.max.year - 1
+
+NAT_SECONDS = np.iinfo(np.int64).min // 10**9  # What _to_epoch_seconds yields for NaT
+
+SESSION_DTYPE = np.dtype([
+    ('date', '<i8'),          # Exchange-local date, days since 1970-01-01
+    ('pre_open', '<i8'),      # Epoch seconds (UTC)
+    ('open', '<i8'),
+    ('close', '<i8'),         # Early-close adjusted
+    ('post_close', '<i8'),
+    ('early_close', '?'),
+])
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """
+    Find the nth occurrence of a weekday in a month.
+
+    Args:
+        year: Year
+        month: Month (1-12)
+        weekday: Weekday (0=Monday, 6=Sunday)
+        n: Occurrence number (1=first, 2=second, etc.)
+
+    Returns:
+        Date of the nth weekday
+    """
+    first_day = date(year, month, 1)
+    first_weekday = first_day.weekday()
+
+    # Calculate days until the first occurrence of the target weekday
+    days_until = (weekday - first_weekday) % 7
+    first_occurrence = first_day + timedelta(days=days_until)
+
+    # Add weeks to get to the nth occurrence
+    return first_occurrence + timedelta(weeks=n - 1)
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    """
+    Find the last occurrence of a weekday in a month.
+
+    Args:
+        year: Year
+        month: Month (1-12)
+        weekday: Weekday (0=Monday, 6=Sunday)
+
+    Returns:
+        Date of the last weekday
+    """
+    # Start from the last day of the month
+    if month == 12:
+        last_day = date(year, 12, 31)
+    else:
+        last_day = date(year, month + 1, 1) - timedelta(days=1)
+
+    # Work backwards to find the last occurrence of the weekday
+    while last_day.weekday() != weekday:
+        last_day -= timedelta(days=1)
+
+    return last_day
+
+
+def us_market_holidays(year: int) -> List[date]:
+    """
+    US market holidays of a year, moved off weekends.
+
+    Args:
+        year: Year
+
+    Returns:
+        Observed holiday dates (Saturday holidays move to Friday,
+        Sunday holidays to Monday)
+    """
+    # Fixed holidays
+    holidays = [
+        date(year, 1, 1),   # New Year's Day
+        date(year, 7, 4),   # Independence Day
+        date(year, 12, 25), # Christmas
+    ]
+
+    # MLK Day: 3rd Monday in January
+    holidays.append(_nth_weekday(year, 1, 0, 3))
+
+    # Presidents Day: 3rd Monday in February
+    holidays.append(_nth_weekday(year, 2, 0, 3))
+
+    # Good Friday: 2 days before Easter
+    easter_date = easter(year)
+    holidays.append(easter_date - timedelta(days=2))
+
+    # Memorial Day: Last Monday in May
+    holidays.append(_last_weekday(year, 5, 0))
+
+    # Labor Day: 1st Monday in September
+    holidays.append(_nth_weekday(year, 9, 0, 1))
+
+    # Thanksgiving: 4th Thursday in November
+    holidays.append(_nth_weekday(year, 11, 3, 4))
+
+    # Adjust holidays that fall on weekends
+    adjusted_holidays = []
+    for holiday in holidays:
+        if holiday.weekday() == 5:  # Saturday
+            adjusted_holidays.append(holiday - timedelta(days=1))  # Friday
+        elif holiday.weekday() == 6:  # Sunday
+            adjusted_holidays.append(holiday + timedelta(days=1))  # Monday
+        else:
+            adjusted_holidays.append(holiday)
+
+    return adjusted_holidays
+
+
+def us_early_closes(year: int) -> List[date]:
+    """
+    US market early-close days of a year.
+
+    Args:
+        year: Year
+
+    Returns:
+        Dates closing early: July 3 when July 4 falls Tuesday-Friday, the
+        day after Thanksgiving, and Christmas Eve on weekdays
+    """
+    early = [_nth_weekday(year, 11, 3, 4) + timedelta(days=1)]
+
+    if 1 <= date(year, 7, 4).weekday() <= 4:
+        early.append(date(year, 7, 3))
+
+    christmas_eve = date(year, 12, 24)
+    if christmas_eve.weekday() < 5:
+        early.append(christmas_eve)
+
+    return early
+
+
+def _to_epoch_seconds(values, tz) -> np.ndarray:
+    """
+    Convert timestamps to int64 epoch seconds (floored).
+
+    Args:
+        values: datetime(s), pandas Timestamp(s), datetime64 values or
+            integer epoch seconds; naive values are in `tz`
+        tz: Calendar timezone
+
+    Returns:
+        1-D int64 array (unparseable or nonexistent times map to a large
+        negative value, which never falls inside a session)
+    """
+    if isinstance(values, (datetime, np.datetime64, str)):
+        values = [values]
+    if isinstance(values, (pd.Index, pd.Series)):
+        values = values.array
+    else:
+        values = np.asarray(values).ravel()
+        if values.dtype.kind in 'iu':
+            return values.astype(np.int64)
+
+    index = pd.DatetimeIndex(pd.to_datetime(values))
+    if index.tz is None:
+        index = index.tz_localize(tz, ambiguous='NaT', nonexistent='NaT')
+    return index.as_unit('ns').asi8 // 10**9
+
+
+class TradingCalendar:
+    """
+    Precomputed session calendar for US equity markets.
+
+    `sessions` is a SESSION_DTYPE array sorted by date. Column views
+    (`dates`, `pre_opens`, `opens`, `closes`, `post_closes`, `early_close`)
+    are contiguous, and a dense day -> session index table gives O(1)
+    trading-day lookups. The array is saved to `cache_dir` keyed by the
+    calendar parameters and loaded instead of rebuilt on later runs.
+
+    Lookups outside start_year..end_year extend the calendar to the years
+    they need (extensions are built in memory, not cached).
+    """
+
+    def __init__(
+        self,
+        timezone: str = "America/New_York",
+        market_open: time = time(9, 30),
+        market_close: time = time(16, 0),
+        pre_market_start: time = time(4, 0),
+        after_hours_end: time = time(20, 0),
+        early_close: time = time(13, 0),
+        start_year: int = CALENDAR_START_YEAR,
+        end_year: int = CALENDAR_END_YEAR,
+        cache_dir: Optional[Union[str, Path]] = CALENDAR_CACHE_DIR,
+    ):
+        """
+        Initialize (load or build) the calendar.
+
+        Args:
+            timezone: Exchange timezone
+            market_open: Regular session open (local time)
+            market_close: Regular session close (local time)
+            pre_market_start: Pre-market start (local time)
+            after_hours_end: After-hours end (local time)
+            early_close: Close on early-close days (local time)
+            start_year: First calendar year
+            end_year: Last calendar year (inclusive)
+            cache_dir: Directory for the cached session array (None disables caching)
+        """
+        self.timezone_str = timezone
+        self.timezone = pytz.timezone(timezone)
+        self.market_open = market_open
+        self.market_close = market_close
+        self.pre_market_start = pre_market_start
+        self.after_hours_end = after_hours_end
+        self.early_close_time = early_close
+        self.start_year = start_year
+        self.end_year = end_year
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._extend_lock = threading.Lock()
+
+        self._set_sessions(self._load_or_build())
+
+    def _set_sessions(self, sessions: np.ndarray) -> None:
+        """Install a session array covering start_year..end_year and its lookup views."""
+        self.sessions = sessions
+
+        self.dates = self.sessions['date'].astype('datetime64[D]')
+        self.pre_opens = np.ascontiguousarray(self.sessions['pre_open'])
+        self.opens = np.ascontiguousarray(self.sessions['open'])
+        self.closes = np.ascontiguousarray(self.sessions['close'])
+        self.post_closes = np.ascontiguousarray(self.sessions['post_close'])
+        self.early_close = np.ascontiguousarray(self.sessions['early_close'])
+
+        # Dense day -> session index (-1 for weekends and holidays)
+        self._session_days = np.ascontiguousarray(self.sessions['date'])
+        self._first_day = date(self.start_year, 1, 1).toordinal() - EPOCH_ORDINAL
+        last_day = date(self.end_year, 12, 31).toordinal() - EPOCH_ORDINAL
+        self._day_index = np.full(last_day - self._first_day + 1, -1, dtype=np.int32)
+        self._day_index[self._session_days - self._first_day] = np.arange(len(self.sessions))
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def extend(self, first_year: int, last_year: int) -> None:
+        """
+        Grow the calendar to cover first_year..last_year.
+
+        Years outside MIN_CALENDAR_YEAR..MAX_CALENDAR_YEAR are not built;
+        lookups there behave as before (no sessions).
+
+        Args:
+            first_year: First year that must be covered
+            last_year: Last year that must be covered
+        """
+        first_year = max(first_year, MIN_CALENDAR_YEAR)
+        last_year = min(last_year, MAX_CALENDAR_YEAR)
+        if first_year > last_year or (first_year >= self.start_year and last_year <= self.end_year):
+            return
+
+        with self._extend_lock:
+            first_year = min(first_year, self.start_year)
+            last_year = max(last_year, self.end_year)
+            if first_year == self.start_year and last_year == self.end_year:
+                return  # Extended by another thread meanwhile
+            parts = []
+            if first_year < self.start_year:
+                parts.append(self._build(first_year, self.start_year - 1))
+            parts.append(self.sessions)
+            if last_year > self.end_year:
+                parts.append(self._build(self.end_year + 1, last_year))
+            self.start_year, self.end_year = first_year, last_year
+            self._set_sessions(np.concatenate(parts))
+
+    def _extend_to_days(self, days: np.ndarray) -> None:
+        """Extend the calendar to the years of datetime64[D] values (NaT ignored)."""
+        days = days[~np.isnat(days)]
+        if days.size:
+            years = days.astype('datetime64[Y]').astype(np.int64) + 1970
+            self.extend(int(years.min()), int(years.max()))
+
+    def _extend_to_seconds(self, seconds: np.ndarray, years_ahead: int = 0) -> None:
+        """Extend the calendar to the years of epoch seconds, plus years_ahead after the last."""
+        seconds = seconds[seconds != NAT_SECONDS]
+        if seconds.size:
+            first = datetime.utcfromtimestamp(max(int(seconds.min()), -(2**33))).year
+            last = datetime.utcfromtimestamp(min(int(seconds.max()), 2**37)).year
+            self.extend(first - 1, last + years_ahead)
+
+    @property
+    def cache_key(self) -> str:
+        """Short hash of the parameters that determine the session array."""
+        params = (
+            CALENDAR_VERSION, self.timezone_str, self.market_open, self.market_close,
+            self.pre_market_start, self.after_hours_end, self.early_close_time,
+            self.start_year, self.end_year,
+        )
+        return hashlib.sha1(repr(params).encode()).hexdigest()[:12]
+
+    def _cache_path(self) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"trading_calendar_{self.cache_key}.npy"
+
+    def _load_or_build(self) -> np.ndarray:
+        """Load the cached session array, or build and cache it."""
+        path = self._cache_path()
+        if path is not None and path.exists():
+            try:
+                sessions = np.load(path, allow_pickle=False)
+                if sessions.dtype == SESSION_DTYPE:
+                    return sessions
+                logger.warning(f"Ignoring trading calendar cache with unexpected layout: {path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable trading calendar cache {path}: {e}")
+
+        sessions = self._build(self.start_year, self.end_year)
+
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix('.tmp.npy')
+                np.save(tmp_path, sessions)
+                os.replace(tmp_path, path)
+                logger.debug(f"Saved trading calendar cache: {path}")
+            except OSError as e:
+                logger.warning(f"Failed to save trading calendar cache {path}: {e}")
+
+        return sessions
+
+    def _build(self, start_year: int, end_year: int) -> np.ndarray:
+        """Compute every session between start_year and end_year (inclusive)."""
+        years = range(start_year, end_year + 1)
+        days = np.arange(
+            np.datetime64(f"{start_year:04d}-01-01"),
+            np.datetime64(f"{end_year + 1:04d}-01-01"),
+        )
+        weekday = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+
+        # Holidays only count in their own year (matches per-year holiday checks)
+        holidays = np.array(
+            [h for year in years for h in us_market_holidays(year) if h.year == year],
+            dtype='datetime64[D]',
+        )
+        early = np.array(
+            [d for year in years for d in us_early_closes(year)], dtype='datetime64[D]'
+        )
+
+        is_session = (weekday < 5) & ~np.isin(days, holidays)
+        session_days = days[is_session]
+        is_early = np.isin(session_days, early)
+
+        local_days = pd.DatetimeIndex(session_days)
+
+        def epochs(at: time) -> np.ndarray:
+            offset = pd.Timedelta(hours=at.hour, minutes=at.minute, seconds=at.second)
+            local = (local_days + offset).tz_localize(self.timezone)
+            return local.as_unit('ns').asi8 // 10**9
+
+        sessions = np.empty(len(session_days), dtype=SESSION_DTYPE)
+        sessions['date'] = session_days.astype(np.int64)
+        sessions['pre_open'] = epochs(self.pre_market_start)
+        sessions['open'] = epochs(self.market_open)
+        sessions['close'] = np.where(
+            is_early, epochs(self.early_close_time), epochs(self.market_close)
+        )
+        sessions['post_close'] = epochs(self.after_hours_end)
+        sessions['early_close'] = is_early
+
+        logger.info(
+            f"Built trading calendar {start_year}-{end_year}: "
+            f"{len(sessions)} sessions, {int(is_early.sum())} early closes"
+        )
+        return sessions
+
+    def covers(self, check_date: date) -> bool:
+        """Check whether a date falls inside the range built so far."""
+        return self.start_year <= check_date.year <= self.end_year
+
+    def session_index(self, check_date: date) -> Optional[int]:
+        """
+        Get the session index of a date in O(1).
+
+        Args:
+            check_date: Exchange-local date (the calendar is extended to its year)
+
+        Returns:
+            Index into `sessions`, or None for non-trading dates
+        """
+        if not self.covers(check_date):
+            self.extend(check_date.year, check_date.year)
+        offset = check_date.toordinal() - EPOCH_ORDINAL - self._first_day
+        if not 0 <= offset < len(self._day_index):
+            return None
+        index = int(self._day_index[offset])
+        return index if index >= 0 else None
+
+    def is_session(self, dates) -> np.ndarray:
+        """
+        Vectorized trading-day check.
+
+        Args:
+            dates: Date-like array (datetime64, DatetimeIndex, strings)
+
+        Returns:
+            Boolean array (False for NaT)
+        """
+        days = pd.to_datetime(np.atleast_1d(dates)).values.astype('datetime64[D]')
+        self._extend_to_days(days)
+        days = days.astype(np.int64)
+        offsets = days - self._first_day
+        inside = (offsets >= 0) & (offsets < len(self._day_index))
+        result = np.zeros(len(days), dtype=bool)
+        result[inside] = self._day_index[offsets[inside]] >= 0
+        return result
+
+    def sessions_between(self, start, end) -> np.ndarray:
+        """
+        Get session dates between two dates (inclusive) in O(log n).
+
+        Args:
+            start: First date
+            end: Last date
+
+        Returns:
+            datetime64[D] array of session dates
+        """
+        start = np.datetime64(pd.Timestamp(start).date(), 'D')
+        end = np.datetime64(pd.Timestamp(end).date(), 'D')
+        self._extend_to_days(np.array([start, end]))
+        lo = np.searchsorted(self.dates, start, side='left')
+        hi = np.searchsorted(self.dates, end, side='right')
+        return self.dates[lo:hi]
+
+    def count_sessions(self, start, end) -> np.ndarray:
+        """
+        Vectorized count of sessions after `start` up to and including `end`.
+
+        Args:
+            start: Date-like scalar or array
+            end: Date-like scalar or array (same length as start)
+
+        Returns:
+            int64 array of session counts
+        """
+        start_days = pd.to_datetime(np.atleast_1d(start)).values.astype('datetime64[D]')
+        end_days = pd.to_datetime(np.atleast_1d(end)).values.astype('datetime64[D]')
+        self._extend_to_days(np.concatenate([start_days, end_days]))
+        return (
+            np.searchsorted(self.dates, end_days, side='right')
+            - np.searchsorted(self.dates, start_days, side='right')
+        ).astype(np.int64)
+
+    def _containing_session(self, timestamps) -> tuple:
+        """Epoch seconds and index of the last session whose pre-market started at or before them."""
+        seconds = _to_epoch_seconds(timestamps, self.timezone)
+        self._extend_to_seconds(seconds)
+        index = np.searchsorted(self.pre_opens, seconds, side='right') - 1
+        return seconds, index
+
+    def is_open(self, timestamps, extended: bool = False) -> np.ndarray:
+        """
+        Vectorized market-open check.
+
+        Args:
+            timestamps: Timestamps (naive values are exchange-local) or epoch seconds
+            extended: Include pre-market and after-hours
+
+        Returns:
+            Boolean array
+        """
+        seconds, index = self._containing_session(timestamps)
+        valid = index >= 0
+        safe = np.where(valid, index, 0)
+        if extended:
+            start, end = self.pre_opens[safe], self.post_closes[safe]
+        else:
+            start, end = self.opens[safe], self.closes[safe]
+        return valid & (start <= seconds) & (seconds < end)
+
+    def next_open(self, timestamps) -> np.ndarray:
+        """
+        Vectorized next regular-session open strictly after each timestamp.
+
+        Returns:
+            int64 epoch seconds (-1 past MAX_CALENDAR_YEAR)
+        """
+        seconds = _to_epoch_seconds(timestamps, self.timezone)
+        self._extend_to_seconds(seconds, years_ahead=1)
+        index = np.searchsorted(self.opens, seconds, side='right')
+        found = index < len(self.opens)
+        return np.where(found, self.opens[np.minimum(index, len(self.opens) - 1)], -1)
+
+    def next_close(self, timestamps) -> np.ndarray:
+        """
+        Vectorized next regular-session close strictly after each timestamp.
+
+        Returns:
+            int64 epoch seconds (-1 past MAX_CALENDAR_YEAR)
+        """
+        seconds = _to_epoch_seconds(timestamps, self.timezone)
+        self._extend_to_seconds(seconds, years_ahead=1)
+        index = np.searchsorted(self.closes, seconds, side='right')
+        found = index < len(self.closes)
+        return np.where(found, self.closes[np.minimum(index, len(self.closes) - 1)], -1)
+
+
+_calendars: Dict[tuple, TradingCalendar] = {}
+
+
+def get_trading_calendar(**kwargs) -> TradingCalendar:
+    """
+    Get a shared TradingCalendar instance.
+
+    Args:
+        **kwargs: TradingCalendar arguments (calendars with equal arguments are shared)
+
+    Returns:
+        TradingCalendar
+    """
+    key = tuple(sorted(kwargs.items()))
+    calendar = _calendars.get(key)
+    if calendar is None:
+        calendar = _calendars[key] = TradingCalendar(**kwargs)
+    return calendar
+
 
 class MarketHours:
     """
@@ -24,6 +570,9 @@ class MarketHours:
     after-hours, and US market holidays.
     """
 
+    _nth_weekday = staticmethod(_nth_weekday)
+    _last_weekday = staticmethod(_last_weekday)
+
     def __init__(self, config_path: str = "config/live_trading_config.yaml"):
         """
         Initialize MarketHours with configuration.
@@ -41,6 +590,7 @@ class MarketHours:
 
         self._load_config()
         self._initialize_timezone()
+        self._calendar: Optional[TradingCalendar] = None
         logger.info(f"MarketHours initialized with timezone: {self.timezone}")
 
     def _load_config(self) -> None:
@@ -57,6 +607,7 @@ class MarketHours:
             # Parse regular trading hours
             self.market_open_str = trading_hours.get('market_open', '09:30')
             self.market_close_str = trading_hours.get('market_close', '16:00')
+            self.early_close_str = trading_hours.get('early_close', '13:00')
 
             # Parse extended hours
             self.pre_market_start_str = trading_hours.get('pre_market_start', '04:00')
@@ -76,6 +627,7 @@ class MarketHours:
             # Parse times
             self.market_open_time = self._parse_time(self.market_open_str)
             self.market_close_time = self._parse_time(self.market_close_str)
+            self.early_close_time = self._parse_time(self.early_close_str)
             self.pre_market_start_time = self._parse_time(self.pre_market_start_str)
             self.after_hours_end_time = self._parse_time(self.after_hours_end_str)
 
@@ -102,6 +654,33 @@ class MarketHours:
         except ValueError as e:
             raise ValueError(f"Invalid time format '{time_str}': {e}")
 
+    @property
+    def calendar(self) -> TradingCalendar:
+        """Shared trading calendar for this configuration (built on first use)."""
+        if self._calendar is None:
+            self._calendar = get_trading_calendar(
+                timezone=self.timezone_str,
+                market_open=self.market_open_time,
+                market_close=self.market_close_time,
+                pre_market_start=self.pre_market_start_time,
+                after_hours_end=self.after_hours_end_time,
+                early_close=self.early_close_time,
+            )
+        return self._calendar
+
+    def _localize(self, check_datetime: Optional[datetime]) -> datetime:
+        """Return check_datetime (default now) as an aware datetime in market timezone."""
+        if check_datetime is None:
+            return datetime.now(self.timezone)
+        if check_datetime.tzinfo is None:
+            return self.timezone.localize(check_datetime)
+        return check_datetime.astimezone(self.timezone)
+
+    def _session(self, check_datetime: Optional[datetime]):
+        """Epoch seconds of check_datetime and the session index of its local date."""
+        check_datetime = self._localize(check_datetime)
+        return check_datetime.timestamp(), self.calendar.session_index(check_datetime.date())
+
     def is_trading_day(self, check_date: Optional[date] = None) -> bool:
         """
         Check if a given date is a trading day (Mon-Fri, not a holiday).
@@ -115,15 +694,7 @@ class MarketHours:
         if check_date is None:
             check_date = datetime.now(self.timezone).date()
 
-        # Check if weekend
-        if check_date.weekday() >= 5:  # Saturday=5, Sunday=6
-            return False
-
-        # Check if holiday
-        if self._is_market_holiday(check_date):
-            return False
-
-        return True
+        return self.calendar.session_index(check_date) is not None
 
     def _is_market_holiday(self, check_date: date) -> bool:
         """
@@ -135,98 +706,28 @@ class MarketHours:
         Returns:
             True if market holiday, False otherwise
         """
-        year = check_date.year
-
-        # Fixed holidays
-        holidays = [
-            date(year, 1, 1),   # New Year's Day
-            date(year, 7, 4),   # Independence Day
-            date(year, 12, 25), # Christmas
-        ]
-
-        # MLK Day: 3rd Monday in January
-        holidays.append(self._nth_weekday(year, 1, 0, 3))
-
-        # Presidents Day: 3rd Monday in February
-        holidays.append(self._nth_weekday(year, 2, 0, 3))
-
-        # Good Friday: 2 days before Easter
-        easter_date = easter(year)
-        holidays.append(easter_date - timedelta(days=2))
-
-        # Memorial Day: Last Monday in May
-        holidays.append(self._last_weekday(year, 5, 0))
-
-        # Labor Day: 1st Monday in September
-        holidays.append(self._nth_weekday(year, 9, 0, 1))
-
-        # Thanksgiving: 4th Thursday in November
-        holidays.append(self._nth_weekday(year, 11, 3, 4))
-
-        # Adjust holidays that fall on weekends
-        adjusted_holidays = []
-        for holiday in holidays:
-            if holiday.weekday() == 5:  # Saturday
-                adjusted_holidays.append(holiday - timedelta(days=1))  # Friday
-            elif holiday.weekday() == 6:  # Sunday
-                adjusted_holidays.append(holiday + timedelta(days=1))  # Monday
-            else:
-                adjusted_holidays.append(holiday)
-
-        return check_date in adjusted_holidays
-
-    @staticmethod
-    def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
-        """
-        Find the nth occurrence of a weekday in a month.
+        return check_date in us_market_holidays(check_date.year)
 
-        Args:
-            year: Year
-            month: Month (1-12)
-            weekday: Weekday (0=Monday, 6=Sunday)
-            n: Occurrence number (1=first, 2=second, etc.)
-
-        Returns:
-            Date of the nth weekday
+    def is_early_close(self, check_date: Optional[date] = None) -> bool:
         """
-        first_day = date(year, month, 1)
-        first_weekday = first_day.weekday()
-
-        # Calculate days until the first occurrence of the target weekday
-        days_until = (weekday - first_weekday) % 7
-        first_occurrence = first_day + timedelta(days=days_until)
-
-        # Add weeks to get to the nth occurrence
-        return first_occurrence + timedelta(weeks=n - 1)
-
-    @staticmethod
-    def _last_weekday(year: int, month: int, weekday: int) -> date:
-        """
-        Find the last occurrence of a weekday in a month.
+        Check if a given date is an early-close trading day.
 
         Args:
-            year: Year
-            month: Month (1-12)
-            weekday: Weekday (0=Monday, 6=Sunday)
+            check_date: Date to check (defaults to today)
 
         Returns:
-            Date of the last weekday
+            True if the session closes early, False otherwise
         """
-        # Start from the last day of the month
-        if month == 12:
-            last_day = date(year, 12, 31)
-        else:
-            last_day = date(year, month + 1, 1) - timedelta(days=1)
-
-        # Work backwards to find the last occurrence of the weekday
-        while last_day.weekday() != weekday:
-            last_day -= timedelta(days=1)
+        if check_date is None:
+            check_date = datetime.now(self.timezone).date()
 
-        return last_day
+        index = self.calendar.session_index(check_date)
+        return index is not None and bool(self.calendar.early_close[index])
 
     def is_trading_hours(self, check_datetime: Optional[datetime] = None) -> bool:
         """
-        Check if currently within regular trading hours (9:30 AM - 4:00 PM ET).
+        Check if currently within regular trading hours (9:30 AM - 4:00 PM ET,
+        or the early close on early-close days).
 
         Args:
             check_datetime: Datetime to check (defaults to now)
@@ -234,20 +735,11 @@ class MarketHours:
         Returns:
             True if within trading hours, False otherwise
         """
-        if check_datetime is None:
-            check_datetime = datetime.now(self.timezone)
-        elif check_datetime.tzinfo is None:
-            check_datetime = self.timezone.localize(check_datetime)
-        else:
-            check_datetime = check_datetime.astimezone(self.timezone)
-
-        # Check if trading day
-        if not self.is_trading_day(check_datetime.date()):
+        seconds, index = self._session(check_datetime)
+        if index is None:
             return False
-
-        # Check time range
-        current_time = check_datetime.time()
-        return self.market_open_time <= current_time < self.market_close_time
+        calendar = self.calendar
+        return bool(calendar.opens[index] <= seconds < calendar.closes[index])
 
     def is_pre_market(self, check_datetime: Optional[datetime] = None) -> bool:
         """
@@ -259,20 +751,11 @@ class MarketHours:
         Returns:
             True if pre-market, False otherwise
         """
-        if check_datetime is None:
-            check_datetime = datetime.now(self.timezone)
-        elif check_datetime.tzinfo is None:
-            check_datetime = self.timezone.localize(check_datetime)
-        else:
-            check_datetime = check_datetime.astimezone(self.timezone)
-
-        # Check if trading day
-        if not self.is_trading_day(check_datetime.date()):
+        seconds, index = self._session(check_datetime)
+        if index is None:
             return False
-
-        # Check time range
-        current_time = check_datetime.time()
-        return self.pre_market_start_time <= current_time < self.market_open_time
+        calendar = self.calendar
+        return bool(calendar.pre_opens[index] <= seconds < calendar.opens[index])
 
     def is_after_hours(self, check_datetime: Optional[datetime] = None) -> bool:
         """
@@ -284,20 +767,11 @@ class MarketHours:
         Returns:
             True if after-hours, False otherwise
         """
-        if check_datetime is None:
-            check_datetime = datetime.now(self.timezone)
-        elif check_datetime.tzinfo is None:
-            check_datetime = self.timezone.localize(check_datetime)
-        else:
-            check_datetime = check_datetime.astimezone(self.timezone)
-
-        # Check if trading day
-        if not self.is_trading_day(check_datetime.date()):
+        seconds, index = self._session(check_datetime)
+        if index is None:
             return False
-
-        # Check time range
-        current_time = check_datetime.time()
-        return self.market_close_time <= current_time < self.after_hours_end_time
+        calendar = self.calendar
+        return bool(calendar.closes[index] <= seconds < calendar.post_closes[index])
 
     def is_market_open(self, check_datetime: Optional[datetime] = None) -> bool:
         """
@@ -309,9 +783,11 @@ class MarketHours:
         Returns:
             True if market is open, False otherwise
         """
-        return (self.is_trading_hours(check_datetime) or
-                self.is_pre_market(check_datetime) or
-                self.is_after_hours(check_datetime))
+        seconds, index = self._session(check_datetime)
+        if index is None:
+            return False
+        calendar = self.calendar
+        return bool(calendar.pre_opens[index] <= seconds < calendar.post_closes[index])
 
     def get_market_open_time(self, check_date: Optional[date] = None) -> Optional[datetime]:
         """
@@ -326,16 +802,15 @@ class MarketHours:
         if check_date is None:
             check_date = datetime.now(self.timezone).date()
 
-        if not self.is_trading_day(check_date):
+        index = self.calendar.session_index(check_date)
+        if index is None:
             return None
 
-        # Combine date and time, then localize to timezone
-        naive_datetime = datetime.combine(check_date, self.market_open_time)
-        return self.timezone.localize(naive_datetime)
+        return datetime.fromtimestamp(int(self.calendar.opens[index]), self.timezone)
 
     def get_market_close_time(self, check_date: Optional[date] = None) -> Optional[datetime]:
         """
-        Get market close datetime for a given date.
+        Get market close datetime for a given date (early close on early-close days).
 
         Args:
             check_date: Date to check (defaults to today)
@@ -346,12 +821,11 @@ class MarketHours:
         if check_date is None:
             check_date = datetime.now(self.timezone).date()
 
-        if not self.is_trading_day(check_date):
+        index = self.calendar.session_index(check_date)
+        if index is None:
             return None
 
-        # Combine date and time, then localize to timezone
-        naive_datetime = datetime.combine(check_date, self.market_close_time)
-        return self.timezone.localize(naive_datetime)
+        return datetime.fromtimestamp(int(self.calendar.closes[index]), self.timezone)
 
     def seconds_until_market_open(self, from_datetime: Optional[datetime] = None) -> Optional[int]:
         """
@@ -363,34 +837,19 @@ class MarketHours:
         Returns:
             Seconds until market open, or None if market is currently open
         """
-        if from_datetime is None:
-            from_datetime = datetime.now(self.timezone)
-        elif from_datetime.tzinfo is None:
-            from_datetime = self.timezone.localize(from_datetime)
-        else:
-            from_datetime = from_datetime.astimezone(self.timezone)
+        from_datetime = self._localize(from_datetime)
 
         # If market is currently open, return None
         if self.is_market_open(from_datetime):
             return None
 
-        # Find next trading day
-        check_date = from_datetime.date()
-        max_days = 10  # Prevent infinite loop
-
-        for _ in range(max_days):
-            # Check if today and before market open
-            if self.is_trading_day(check_date):
-                market_open = self.get_market_open_time(check_date)
-                if from_datetime < market_open:
-                    delta = market_open - from_datetime
-                    return int(delta.total_seconds())
-
-            # Move to next day
-            check_date += timedelta(days=1)
+        seconds = from_datetime.timestamp()
+        next_open = int(self.calendar.next_open(int(seconds))[0])
+        if next_open < 0:
+            logger.warning("Could not find next market open before the calendar year limit")
+            return None
 
-        logger.warning("Could not find next market open within 10 days")
-        return None
+        return int(next_open - seconds)
 
     def seconds_until_market_close(self, from_datetime: Optional[datetime] = None) -> Optional[int]:
         """
@@ -402,21 +861,12 @@ class MarketHours:
         Returns:
             Seconds until market close, or None if market is closed
         """
-        if from_datetime is None:
-            from_datetime = datetime.now(self.timezone)
-        elif from_datetime.tzinfo is None:
-            from_datetime = self.timezone.localize(from_datetime)
-        else:
-            from_datetime = from_datetime.astimezone(self.timezone)
+        seconds, index = self._session(from_datetime)
 
         # If market is not open, return None
-        if not self.is_market_open(from_datetime):
-            return None
-
-        # Get today's market close
-        market_close = self.get_market_close_time(from_datetime.date())
-        if market_close is None:
+        if index is None or not (
+            self.calendar.pre_opens[index] <= seconds < self.calendar.post_closes[index]
+        ):
             return None
 
-        delta = market_close - from_datetime
-        return int(delta.total_seconds())
+        return int(self.calendar.closes[index] - seconds)
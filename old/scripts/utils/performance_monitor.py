@@ -4,17 +4,25 @@ Performance Monitor Utility - System performance tracking and monitoring.
 
 Epic 7.5: Performance Monitoring
 US-7.5: Order execution latency, data feed latency, system metrics
+
+Metrics are recorded into per-thread ring buffers of preallocated arrays so the
+measured path never waits on SQLite. A background thread flushes aggregated
+histograms (count/mean/min/max/p50/p95/p99 per metric) to the database on an
+interval, and recent windows are summarized straight from memory.
 """
 
 import logging
 import time
 import threading
-from datetime import datetime, timedelta
+import weakref
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
 import subprocess
 import json
 
+import numpy as np
+
 # Add parent directory to path for imports
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
@@ -31,6 +39,73 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     logger.warning("psutil not available - system metrics will be limited")
 
+DEFAULT_BUFFER_SIZE = 8192      # Samples retained per recording thread
+DEFAULT_FLUSH_INTERVAL = 10.0   # Seconds between aggregated DB flushes
+FLUSH_PERCENTILES = (50, 95, 99)
+
+# Metric type -> (alert type, label, threshold key, unit) checked by get_performance_alerts
+ALERT_RULES = {
+    'CPU_USAGE': ('HIGH_CPU_USAGE', 'CPU usage', 'cpu_usage_percent', '%'),
+    'MEMORY_USAGE': ('HIGH_MEMORY_USAGE', 'Memory usage', 'memory_usage_percent', '%'),
+    'DISK_USAGE': ('HIGH_DISK_USAGE', 'Disk usage', 'disk_usage_percent', '%'),
+    'ORDER_LATENCY': ('HIGH_ORDER_LATENCY', 'Order latency', 'order_latency_ms', 'ms'),
+    'DATA_FEED_LATENCY': ('HIGH_DATA_FEED_LATENCY', 'Data feed latency', 'data_feed_latency_ms', 'ms'),
+}
+
+
+class MetricRingBuffer:
+    """
+    Fixed-size ring buffer of metric samples backed by preallocated arrays.
+
+    Each buffer has a single writer (its owning thread), so appends take no
+    lock. Readers copy a range of slots and drop any that the writer may have
+    overwritten while they were copying.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_BUFFER_SIZE):
+        """
+        Initialize ring buffer.
+
+        Args:
+            capacity: Number of samples retained before the oldest are overwritten
+        """
+        self.capacity = max(1, int(capacity))
+        self.timestamps = np.zeros(self.capacity, dtype=np.float64)
+        self.values = np.zeros(self.capacity, dtype=np.float64)
+        self.keys = np.zeros(self.capacity, dtype=np.int32)
+        self.count = 0      # Total samples ever written (monotonic sequence number)
+        self.flushed = 0    # Sequence number up to which samples were flushed
+
+    def append(self, timestamp: float, key: int, value: float) -> None:
+        """Write one sample (owning thread only)."""
+        i = self.count % self.capacity
+        self.timestamps[i] = timestamp
+        self.keys[i] = key
+        self.values[i] = value
+        self.count += 1
+
+    def snapshot(self, since: int = 0):
+        """
+        Copy samples with sequence numbers >= since.
+
+        Args:
+            since: First sequence number wanted
+
+        Returns:
+            Tuple of (timestamps, keys, values, end sequence, samples lost to overwrite)
+        """
+        end = self.count
+        start = max(since, end - self.capacity)
+        slots = np.arange(start, end) % self.capacity
+        timestamps = self.timestamps[slots]
+        keys = self.keys[slots]
+        values = self.values[slots]
+
+        # Slots older than this may have been rewritten during the copy
+        safe_start = max(start, self.count - self.capacity)
+        trim = safe_start - start
+        return timestamps[trim:], keys[trim:], values[trim:], end, safe_start - since
+
 
 class PerformanceMonitor:
     """
@@ -44,12 +119,19 @@ class PerformanceMonitor:
     - Backtest execution times
     """
 
-    def __init__(self, db_path: str = None):
+    def __init__(
+        self,
+        db_path: str = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ):
         """
         Initialize PerformanceMonitor.
         
         Args:
             db_path: Path to SQLite database (auto-detects if None)
+            buffer_size: Samples retained in memory per recording thread
+            flush_interval: Seconds between aggregated flushes to the database
         """
         # Auto-detect database path if not provided
         if db_path is None:
@@ -58,7 +140,9 @@ class PerformanceMonitor:
             db_path = str(script_dir / "data" / "sqlite" / "trades.db")
 
         # Use read_only=True for monitoring dashboard
+        self.db_path = db_path
         self.db_manager = DBManager(db_path, read_only=True)
+        self._writer_db = None  # Writable DBManager, opened on first flush
         self.is_monitoring = False
         self.monitoring_thread = None
         self.monitoring_interval = 30  # seconds
@@ -72,6 +156,27 @@ class PerformanceMonitor:
             'disk_usage_percent': 90,
             'database_latency_ms': 100
         }
+
+        # In-memory metric buffers (one per recording thread)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.created_at = time.time()
+        self._local = threading.local()
+        self._buffers: List[tuple] = []  # (weakref to owning thread, MetricRingBuffer)
+        self._buffers_lock = threading.Lock()
+        self._flushed_until = 0.0  # Newest sample written to the database so far
+        self._retired_until = 0.0  # _flushed_until when buffers were last dropped
+
+        # Interned (metric_type, metric_name, unit, algorithm) keys
+        self._key_ids: Dict[tuple, int] = {}
+        self._keys: List[tuple] = []
+        self._key_lock = threading.Lock()
+        self._key_context: Dict[int, Dict] = {}  # Latest additional_data per key id
+
+        self._flush_lock = threading.Lock()
+        self._flush_stop = threading.Event()
+        self._flush_thread = None
+        self.dropped_samples = 0
         
         logger.info("PerformanceMonitor initialized")
 
@@ -87,10 +192,11 @@ class PerformanceMonitor:
         logger.info("Performance monitoring started")
 
     def stop_monitoring(self) -> None:
-        """Stop performance monitoring."""
+        """Stop performance monitoring and flush buffered metrics."""
         self.is_monitoring = False
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
+        self.close()
         logger.info("Performance monitoring stopped")
 
     def _monitoring_loop(self) -> None:
@@ -145,7 +251,7 @@ class PerformanceMonitor:
     def _check_thresholds(self) -> None:
         """Check performance thresholds and log alerts."""
         try:
-            latest_metrics = self.db_manager.get_latest_performance_metrics()
+            latest_metrics = self.get_latest_metrics()
             
             # Check CPU usage
             cpu_key = 'CPU_USAGE_cpu_usage'
@@ -185,15 +291,9 @@ class PerformanceMonitor:
             True if successful
         """
         try:
+            # Aggregated per algorithm; a per-order metric name would defeat the histograms
             latency_ms = (fill_time - submit_time).total_seconds() * 1000
-            return self.record_metric(
-                'ORDER_LATENCY', 
-                f'order_{order_id}', 
-                latency_ms, 
-                'ms',
-                algorithm,
-                {'order_id': order_id, 'submit_time': submit_time.isoformat(), 'fill_time': fill_time.isoformat()}
-            )
+            return self.record_metric('ORDER_LATENCY', 'order_fill', latency_ms, 'ms', algorithm)
         except Exception as e:
             logger.error(f"Error recording order latency: {e}")
             return False
@@ -250,7 +350,9 @@ class PerformanceMonitor:
         additional_data: Dict = None
     ) -> bool:
         """
-        Record a performance metric to the database.
+        Record a performance metric into the calling thread's ring buffer.
+
+        The sample reaches the database as part of the next aggregated flush.
         
         Args:
             metric_type: Type of metric
@@ -258,61 +360,354 @@ class PerformanceMonitor:
             metric_value: Value of metric
             unit: Unit of measurement
             algorithm: Algorithm name (optional)
-            additional_data: Additional context data
+            additional_data: Additional context data, kept per metric key (the
+                latest one recorded) and written with the key's flushed rows
             
         Returns:
             True if successful
         """
         try:
-            return self.db_manager.record_performance_metric(
-                metric_type=metric_type,
-                metric_name=metric_name,
-                metric_value=metric_value,
-                unit=unit,
-                algorithm=algorithm,
-                additional_data=additional_data
-            )
+            key = self._key_ids.get((metric_type, metric_name, unit, algorithm))
+            if key is None:
+                key = self._intern_key(metric_type, metric_name, unit, algorithm)
+
+            buffer = getattr(self._local, 'buffer', None)
+            if buffer is None:
+                buffer = self._new_thread_buffer()
+
+            buffer.append(time.time(), key, float(metric_value))
+            if additional_data:
+                self._key_context[key] = additional_data
+
+            if self._flush_thread is None:
+                self._start_flusher()
+            return True
         except Exception as e:
             logger.error(f"Error recording metric: {e}")
             return False
 
-    def get_performance_summary(self, hours_back: int = 24) -> Dict[str, Any]:
+    # ==============================================================================
+    # In-memory buffers and background flush
+    # ==============================================================================
+
+    def _intern_key(self, metric_type: str, metric_name: str, unit: str, algorithm: Optional[str]) -> int:
+        """Assign an integer id to a metric key (first use only)."""
+        key = (metric_type, metric_name, unit, algorithm)
+        with self._key_lock:
+            if key not in self._key_ids:
+                self._keys.append(key)
+                self._key_ids[key] = len(self._keys) - 1
+            return self._key_ids[key]
+
+    def _new_thread_buffer(self) -> MetricRingBuffer:
+        """Create and register the ring buffer for the calling thread."""
+        buffer = MetricRingBuffer(self.buffer_size)
+        with self._buffers_lock:
+            self._buffers.append((weakref.ref(threading.current_thread()), buffer))
+        self._local.buffer = buffer
+        return buffer
+
+    def _retire_dead_buffers(self) -> int:
+        """
+        Unregister fully flushed buffers whose owning thread has exited.
+
+        Short-lived recording threads would otherwise leave one buffer each
+        behind for the life of the monitor. Their samples are in the database
+        by now, so summaries no longer serve windows reaching back before the
+        newest flushed sample from memory.
+
+        Returns:
+            Number of buffers retired
+        """
+        with self._buffers_lock:
+            live = []
+            for thread_ref, buffer in self._buffers:
+                thread = thread_ref()
+                if (thread is None or not thread.is_alive()) and buffer.flushed >= buffer.count:
+                    continue
+                live.append((thread_ref, buffer))
+            retired = len(self._buffers) - len(live)
+            if retired:
+                self._retired_until = self._flushed_until
+            self._buffers = live
+        return retired
+
+    def _start_flusher(self) -> None:
+        """Start the background flush thread."""
+        with self._flush_lock:
+            if self._flush_thread is not None:
+                return
+            self._flush_stop.clear()
+            self._flush_thread = threading.Thread(target=self._flush_loop, name='perf-metrics-flush', daemon=True)
+            self._flush_thread.start()
+
+    def _flush_loop(self) -> None:
+        """Flush aggregated metrics every flush_interval seconds until stopped."""
+        while not self._flush_stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing performance metrics: {e}")
+
+    def _collect(self, since_flush: bool = False, peek: bool = False):
+        """
+        Gather samples from every thread buffer.
+
+        Args:
+            since_flush: Only samples not yet flushed (advances each buffer's flush mark)
+            peek: With since_flush, leave the flush marks where they are
+
+        Returns:
+            Tuple of (timestamps, keys, values) arrays
+        """
+        with self._buffers_lock:
+            buffers = [buffer for _, buffer in self._buffers]
+
+        parts = []
+        for buffer in buffers:
+            timestamps, keys, values, end, lost = buffer.snapshot(buffer.flushed if since_flush else 0)
+            if since_flush and not peek:
+                buffer.flushed = end
+                self.dropped_samples += lost
+            parts.append((timestamps, keys, values))
+
+        if not parts:
+            empty = np.empty(0)
+            return empty, np.empty(0, dtype=np.int32), empty
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    @staticmethod
+    def _group_by_key(keys: np.ndarray, *columns: np.ndarray):
+        """Yield (key, column slices...) for each distinct key."""
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        unique_keys, starts = np.unique(sorted_keys, return_index=True)
+        bounds = list(starts[1:]) + [len(sorted_keys)]
+        sorted_columns = [column[order] for column in columns]
+        for key, start, end in zip(unique_keys, starts, bounds):
+            yield (int(key), *(column[start:end] for column in sorted_columns))
+
+    @staticmethod
+    def _histogram(values: np.ndarray) -> Dict[str, float]:
+        """Aggregate statistics for one metric's samples."""
+        p50, p95, p99 = np.percentile(values, FLUSH_PERCENTILES)
+        return {
+            'count': int(values.size),
+            'mean': float(values.mean()),
+            'min': float(values.min()),
+            'max': float(values.max()),
+            'p50': float(p50),
+            'p95': float(p95),
+            'p99': float(p99),
+        }
+
+    def flush(self) -> int:
+        """
+        Write aggregated histograms of unflushed samples to the database.
+
+        One row per metric key; metric_value holds the mean and
+        additional_data the count/min/max/p50/p95/p99, window bounds and the
+        key's latest recorded context.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            timestamps, keys, values = self._collect(since_flush=True)
+            if timestamps.size:
+                self._flushed_until = max(self._flushed_until, float(timestamps.max()))
+            self._retire_dead_buffers()
+            if keys.size == 0:
+                return 0
+
+            rows = []
+            for key, key_timestamps, key_values in self._group_by_key(keys, timestamps, values):
+                metric_type, metric_name, unit, algorithm = self._keys[key]
+                stats = self._histogram(key_values)
+                stats['window_start'] = datetime.utcfromtimestamp(key_timestamps.min()).isoformat()
+                stats['window_end'] = datetime.utcfromtimestamp(key_timestamps.max()).isoformat()
+                context = self._key_context.get(key)
+                if context:
+                    stats['context'] = context
+                rows.append((metric_type, metric_name, stats['mean'], unit, algorithm,
+                             json.dumps(stats, default=str)))
+
+            insert = """
+                INSERT INTO performance_metrics
+                (metric_type, metric_name, metric_value, unit, algorithm, additional_data)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """
+            try:
+                if self._writer_db is None:
+                    self._writer_db = DBManager(self.db_path)
+                with self._writer_db.get_connection() as conn:
+                    conn.executemany(insert, rows)
+                return len(rows)
+            except Exception as e:
+                logger.warning(f"Batched metric flush failed ({e}), retrying row by row")
+
+            # One rejected row (e.g. a metric type outside the schema CHECK) must not drop the rest
+            written = 0
+            for row in rows:
+                try:
+                    with self._writer_db.get_connection() as conn:
+                        conn.execute(insert, row)
+                    written += 1
+                except Exception as e:
+                    logger.error(f"Failed to flush {row[0]}/{row[1]} performance metrics: {e}")
+            return written
+
+    def close(self) -> None:
+        """Stop the background flush thread and flush remaining samples."""
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(timeout=5)
+            self._flush_thread = None
+        self.flush()
+
+    def _memory_start(self) -> float:
+        """
+        Time from which the in-memory buffers hold every sample this monitor
+        recorded. Anything older (earlier processes, overwritten slots,
+        retired buffers) can only be in the database.
+        """
+        start = max(self.created_at, self._retired_until)
+        with self._buffers_lock:
+            buffers = [buffer for _, buffer in self._buffers]
+        for buffer in buffers:
+            if buffer.count > buffer.capacity:
+                oldest = buffer.timestamps[buffer.count % buffer.capacity]
+                start = max(start, float(oldest))
+        return start
+
+    def get_latest_metrics(self) -> Dict[str, Any]:
+        """
+        Get the latest buffered value of each metric (same keys as
+        DBManager.get_latest_performance_metrics).
+        """
+        timestamps, keys, values = self._collect()
+        latest = {}
+        for key, key_timestamps, key_values in self._group_by_key(keys, timestamps, values):
+            metric_type, metric_name, unit, algorithm = self._keys[key]
+            name = f"{metric_type}_{metric_name}" + (f"_{algorithm}" if algorithm else "")
+            i = int(np.argmax(key_timestamps))
+            latest[name] = {
+                'value': float(key_values[i]),
+                'unit': unit,
+                'timestamp': datetime.utcfromtimestamp(key_timestamps[i]).isoformat()
+            }
+        return latest
+
+    def _summarize_memory(self, cutoff: float) -> Dict[str, Any]:
+        """Summarize buffered samples newer than cutoff, grouped by metric type."""
+        timestamps, keys, values = self._collect()
+        recent = timestamps >= cutoff
+        timestamps, keys, values = timestamps[recent], keys[recent], values[recent]
+        if keys.size == 0:
+            return {'message': 'No performance data available'}
+
+        # Map each sample's metric key to its metric type index
+        type_names = sorted({key[0] for key in self._keys})
+        type_index = np.array([type_names.index(key[0]) for key in self._keys], dtype=np.int32)
+
+        result = {}
+        for type_id, type_timestamps, type_values, type_keys in self._group_by_key(
+            type_index[keys], timestamps, values, keys
+        ):
+            stats = self._histogram(type_values)
+            result[type_names[type_id]] = {
+                'count': stats['count'],
+                'average': stats['mean'],
+                'min': stats['min'],
+                'max': stats['max'],
+                'p50': stats['p50'],
+                'p95': stats['p95'],
+                'p99': stats['p99'],
+                'latest': float(type_values[np.argmax(type_timestamps)]),
+                'unit': self._keys[int(type_keys[0])][2]
+            }
+        return result
+
+    @staticmethod
+    def _row_window_end(metric: Dict[str, Any]) -> float:
+        """Epoch time of the newest sample behind a performance_metrics row."""
+        stats = json.loads(metric.get('additional_data') or '{}')
+        end = stats.get('window_end', metric['timestamp']) if isinstance(stats, dict) else metric['timestamp']
+        return datetime.fromisoformat(end).replace(tzinfo=timezone.utc).timestamp()
+
+    @staticmethod
+    def _row_stats(metric: Dict[str, Any]) -> tuple:
+        """(count, min, max) of a row; flushed rows carry a histogram, older rows are one sample."""
+        value = metric['metric_value']
+        stats = json.loads(metric.get('additional_data') or '{}')
+        if isinstance(stats, dict) and 'count' in stats:
+            return stats['count'], stats.get('min', value), stats.get('max', value)
+        return 1, value, value
+
+    def get_performance_summary(self, hours_back: float = 24) -> Dict[str, Any]:
         """
         Get performance summary for the last N hours.
+
+        Samples this monitor still holds in memory are summarized from the
+        buffers (including p50/p95/p99); database rows cover the part of the
+        window before that. Percentiles are only reported when memory covers
+        the whole window.
         
         Args:
-            hours_back: Number of hours to look back
+            hours_back: Number of hours to look back (fractions allowed)
             
         Returns:
             Dictionary with performance summary
         """
         try:
-            metrics = self.db_manager.get_performance_metrics(hours_back=hours_back)
-            
+            cutoff = time.time() - hours_back * 3600
+            memory_start = self._memory_start()
+            if memory_start <= cutoff:
+                return self._summarize_memory(cutoff)
+
+            # Database rows up to memory_start, buffered samples after it
+            memory = self._summarize_memory(np.nextafter(memory_start, np.inf))
+            # Window bounds are stored to the microsecond, which can round past memory_start
+            db_until = datetime.fromtimestamp(memory_start, timezone.utc).timestamp()
+            metrics = [
+                metric for metric in self.db_manager.get_performance_metrics(hours_back=hours_back)
+                if self._row_window_end(metric) <= db_until
+            ]
             if not metrics:
-                return {'message': 'No performance data available'}
+                return memory
             
-            # Group metrics by type
-            summary = {}
-            for metric in metrics:
-                metric_type = metric['metric_type']
-                if metric_type not in summary:
-                    summary[metric_type] = []
-                summary[metric_type].append(metric)
-            
-            # Calculate averages for each metric type
+            # Group metrics by type (weighted by the samples behind each row)
             result = {}
-            for metric_type, type_metrics in summary.items():
-                values = [m['metric_value'] for m in type_metrics]
-                result[metric_type] = {
-                    'count': len(values),
-                    'average': sum(values) / len(values),
-                    'min': min(values),
-                    'max': max(values),
-                    'latest': values[0] if values else 0,
-                    'unit': type_metrics[0]['unit'] if type_metrics else ''
-                }
-            
+            for metric in metrics:
+                count, low, high = self._row_stats(metric)
+                entry = result.get(metric['metric_type'])
+                if entry is None:
+                    # Rows are newest first
+                    result[metric['metric_type']] = {
+                        'count': count, 'total': metric['metric_value'] * count,
+                        'min': low, 'max': high,
+                        'latest': metric['metric_value'], 'unit': metric['unit']
+                    }
+                else:
+                    entry['count'] += count
+                    entry['total'] += metric['metric_value'] * count
+                    entry['min'] = min(entry['min'], low)
+                    entry['max'] = max(entry['max'], high)
+
+            for metric_type, recent in memory.items():
+                if not isinstance(recent, dict):
+                    continue  # 'message' when memory holds nothing in the window
+                entry = result.setdefault(metric_type, {
+                    'count': 0, 'total': 0.0, 'min': recent['min'], 'max': recent['max'], 'unit': recent['unit']
+                })
+                entry['count'] += recent['count']
+                entry['total'] += recent['average'] * recent['count']
+                entry['min'] = min(entry['min'], recent['min'])
+                entry['max'] = max(entry['max'], recent['max'])
+                entry['latest'] = recent['latest']
+
+            for entry in result.values():
+                entry['average'] = entry.pop('total') / entry['count']
             return result
             
         except Exception as e:
@@ -322,73 +717,50 @@ class PerformanceMonitor:
     def get_performance_alerts(self, hours_back: int = 24) -> List[Dict[str, Any]]:
         """
         Get performance alerts based on threshold breaches.
+
+        Flushed rows are checked by the max of their window (metric_value is
+        the window mean, which would hide short spikes); samples not yet
+        flushed are checked straight from the buffers.
         
         Args:
             hours_back: Number of hours to look back
             
         Returns:
-            List of performance alerts
+            List of performance alerts (newest first)
         """
         try:
-            metrics = self.db_manager.get_performance_metrics(hours_back=hours_back)
-            alerts = []
-            
+            cutoff = time.time() - hours_back * 3600
+            # Under the flush lock no sample is both in the database and unflushed
+            with self._flush_lock:
+                metrics = self.db_manager.get_performance_metrics(hours_back=hours_back)
+                timestamps, keys, values = self._collect(since_flush=True, peek=True)
+
+            # (metric_type, peak value, timestamp) per buffered key, then per flushed row
+            peaks = []
+            recent = timestamps >= cutoff
+            for key, key_timestamps, key_values in self._group_by_key(keys[recent], timestamps[recent], values[recent]):
+                i = int(np.argmax(key_values))
+                timestamp = datetime.utcfromtimestamp(key_timestamps[i]).isoformat()
+                peaks.append((self._keys[key][0], float(key_values[i]), timestamp))
             for metric in metrics:
-                alert = None
-                
-                # Check thresholds based on metric type
-                if metric['metric_type'] == 'CPU_USAGE' and metric['metric_value'] > self.thresholds['cpu_usage_percent']:
-                    alert = {
-                        'type': 'HIGH_CPU_USAGE',
-                        'message': f"CPU usage {metric['metric_value']:.1f}% exceeds threshold {self.thresholds['cpu_usage_percent']}%",
-                        'severity': 'WARNING',
-                        'timestamp': metric['timestamp'],
-                        'value': metric['metric_value'],
-                        'threshold': self.thresholds['cpu_usage_percent']
-                    }
-                
-                elif metric['metric_type'] == 'MEMORY_USAGE' and metric['metric_value'] > self.thresholds['memory_usage_percent']:
-                    alert = {
-                        'type': 'HIGH_MEMORY_USAGE',
-                        'message': f"Memory usage {metric['metric_value']:.1f}% exceeds threshold {self.thresholds['memory_usage_percent']}%",
-                        'severity': 'WARNING',
-                        'timestamp': metric['timestamp'],
-                        'value': metric['metric_value'],
-                        'threshold': self.thresholds['memory_usage_percent']
-                    }
-                
-                elif metric['metric_type'] == 'DISK_USAGE' and metric['metric_value'] > self.thresholds['disk_usage_percent']:
-                    alert = {
-                        'type': 'HIGH_DISK_USAGE',
-                        'message': f"Disk usage {metric['metric_value']:.1f}% exceeds threshold {self.thresholds['disk_usage_percent']}%",
-                        'severity': 'WARNING',
-                        'timestamp': metric['timestamp'],
-                        'value': metric['metric_value'],
-                        'threshold': self.thresholds['disk_usage_percent']
-                    }
-                
-                elif metric['metric_type'] == 'ORDER_LATENCY' and metric['metric_value'] > self.thresholds['order_latency_ms']:
-                    alert = {
-                        'type': 'HIGH_ORDER_LATENCY',
-                        'message': f"Order latency {metric['metric_value']:.1f}ms exceeds threshold {self.thresholds['order_latency_ms']}ms",
-                        'severity': 'WARNING',
-                        'timestamp': metric['timestamp'],
-                        'value': metric['metric_value'],
-                        'threshold': self.thresholds['order_latency_ms']
-                    }
-                
-                elif metric['metric_type'] == 'DATA_FEED_LATENCY' and metric['metric_value'] > self.thresholds['data_feed_latency_ms']:
-                    alert = {
-                        'type': 'HIGH_DATA_FEED_LATENCY',
-                        'message': f"Data feed latency {metric['metric_value']:.1f}ms exceeds threshold {self.thresholds['data_feed_latency_ms']}ms",
+                peaks.append((metric['metric_type'], self._row_stats(metric)[2], metric['timestamp']))
+
+            alerts = []
+            for metric_type, peak, timestamp in peaks:
+                rule = ALERT_RULES.get(metric_type)
+                if rule is None:
+                    continue
+                alert_type, label, threshold_key, unit = rule
+                threshold = self.thresholds[threshold_key]
+                if peak > threshold:
+                    alerts.append({
+                        'type': alert_type,
+                        'message': f"{label} {peak:.1f}{unit} exceeds threshold {threshold}{unit}",
                         'severity': 'WARNING',
-                        'timestamp': metric['timestamp'],
-                        'value': metric['metric_value'],
-                        'threshold': self.thresholds['data_feed_latency_ms']
-                    }
-                
-                if alert:
-                    alerts.append(alert)
+                        'timestamp': timestamp,
+                        'value': peak,
+                        'threshold': threshold
+                    })
             
             return alerts
             
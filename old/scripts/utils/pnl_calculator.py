@@ -3,13 +3,21 @@
 P&L Calculator Utility - Profit and Loss calculations for trading positions.
 
 US-5.2: Live Trading Engine - P&L tracking and calculations
+
+PnLEngine reconciles fills held in FILL_DTYPE structured arrays (FIFO or
+average cost basis, realized/unrealized P&L per symbol) with vectorized
+group operations, rounding only the returned values. It serves both live
+fill reconciliation and backtest post-processing.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 
+import numpy as np
+import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +75,54 @@ class PnLCalculator:
         )
         return float(rounded)
 
+    def _round_array(self, values: np.ndarray) -> np.ndarray:
+        """Round an array to configured precision (same rule as _round)."""
+        return round_half_up(values, self.precision)
+
+    @staticmethod
+    def _position_arrays(
+        positions: List[Position],
+        current_prices: Dict[str, float]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gather priced positions into arrays.
+
+        Args:
+            positions: List of Position objects
+            current_prices: Dictionary mapping symbols to current prices
+
+        Returns:
+            Tuple of (symbols, quantity, entry_price, current_price); positions
+            missing from current_prices are skipped with a warning, and
+            positions without a usable price are skipped with an error
+        """
+        symbols, rows = [], []
+        for position in positions:
+            if position.symbol not in current_prices:
+                logger.warning(f"No price available for {position.symbol}, skipping")
+                continue
+
+            # A None price falls back to the position's own price, as in calculate_position_pnl
+            price = current_prices[position.symbol]
+            if price is None:
+                price = position.current_price
+
+            try:
+                if price is None:
+                    raise ValueError(f"No current price available for {position.symbol}")
+                row = (float(position.quantity), float(position.entry_price), float(price))
+                if not np.isfinite(row).all():
+                    raise ValueError(f"Non-finite quantity or price for {position.symbol}")
+            except Exception as e:
+                logger.error(f"Error calculating P&L for {position.symbol}: {e}")
+                continue
+
+            symbols.append(position.symbol)
+            rows.append(row)
+
+        values = np.array(rows, dtype=np.float64).reshape(-1, 3)
+        return symbols, values[:, 0], values[:, 1], values[:, 2]
+
     def calculate_position_pnl(
         self,
         position: Position,
@@ -139,27 +195,32 @@ class PnLCalculator:
         Returns:
             Dictionary mapping symbols to P&L details
         """
-        results = {}
-
-        for position in positions:
-            if position.symbol not in current_prices:
-                logger.warning(f"No price available for {position.symbol}, skipping")
-                continue
+        arrays = self._position_arrays(positions, current_prices)
+        symbols, quantity, entry_price, price = arrays
+
+        cost_basis = np.abs(quantity) * entry_price
+        market_value = np.abs(quantity) * price
+        unrealized_pnl = (price - entry_price) * quantity
+        unrealized_pnl_pct = np.divide(
+            unrealized_pnl * 100, cost_basis, out=np.zeros(len(symbols)), where=cost_basis > 0
+        )
 
-            try:
-                pnl = self.calculate_position_pnl(
-                    position,
-                    current_prices[position.symbol]
-                )
-                results[position.symbol] = pnl
-            except Exception as e:
-                logger.error(f"Error calculating P&L for {position.symbol}: {e}")
-                continue
+        columns = [
+            self._round_array(unrealized_pnl),
+            self._round_array(unrealized_pnl_pct),
+            self._round_array(cost_basis),
+            self._round_array(market_value),
+        ]
+        keys = ('unrealized_pnl', 'unrealized_pnl_pct', 'cost_basis', 'market_value')
+        results = {
+            symbol: dict(zip(keys, values))
+            for symbol, values in zip(symbols, zip(*(c.tolist() for c in columns)))
+        }
 
-        # Calculate total P&L
-        total_unrealized_pnl = sum(p['unrealized_pnl'] for p in results.values())
-        total_cost_basis = sum(p['cost_basis'] for p in results.values())
-        total_market_value = sum(p['market_value'] for p in results.values())
+        # Calculate total P&L (from unrounded values)
+        total_unrealized_pnl = float(unrealized_pnl.sum())
+        total_cost_basis = float(cost_basis.sum())
+        total_market_value = float(market_value.sum())
 
         if total_cost_basis > 0:
             total_pnl_pct = (total_unrealized_pnl / total_cost_basis) * 100
@@ -316,14 +377,13 @@ class PnLCalculator:
                 'total_commission': 0.0
             }
 
-        total_shares = 0
-        weighted_price_sum = 0.0
-        total_commission = 0.0
+        quantity = np.array([trade.quantity for trade in trades])
+        price = np.array([trade.price for trade in trades], dtype=np.float64)
+        commission = np.array([trade.commission for trade in trades], dtype=np.float64)
 
-        for trade in trades:
-            total_shares += trade.quantity
-            weighted_price_sum += trade.quantity * trade.price
-            total_commission += trade.commission
+        total_shares = quantity.sum().item()
+        weighted_price_sum = float(np.dot(quantity, price))
+        total_commission = float(commission.sum())
 
         # Calculate average price
         if total_shares != 0:
@@ -370,27 +430,18 @@ class PnLCalculator:
                 - net_exposure: Net market exposure
                 - gross_exposure: Gross market exposure
         """
-        pnl_results = self.calculate_unrealized_pnl(positions, current_prices)
-        total_pnl = pnl_results.get('_total', {})
+        symbols, quantity, entry_price, price = self._position_arrays(positions, current_prices)
 
-        total_market_value = total_pnl.get('market_value', 0.0)
-        unrealized_pnl = total_pnl.get('unrealized_pnl', 0.0)
-        total_cost_basis = total_pnl.get('cost_basis', 0.0)
+        cost_basis = np.abs(quantity) * entry_price
+        market_values = np.abs(quantity) * price
 
-        # Calculate exposures
-        long_exposure = 0.0
-        short_exposure = 0.0
+        total_market_value = float(market_values.sum())
+        unrealized_pnl = float(np.dot(price - entry_price, quantity))
+        total_cost_basis = float(cost_basis.sum())
 
-        for position in positions:
-            if position.symbol not in current_prices:
-                continue
-
-            market_value = abs(position.quantity) * current_prices[position.symbol]
-
-            if position.quantity > 0:
-                long_exposure += market_value
-            elif position.quantity < 0:
-                short_exposure += market_value
+        # Calculate exposures
+        long_exposure = float(market_values[quantity > 0].sum())
+        short_exposure = float(market_values[quantity < 0].sum())
 
         net_exposure = long_exposure - short_exposure
         gross_exposure = long_exposure + short_exposure
@@ -419,3 +470,359 @@ class PnLCalculator:
                    f"P&L=${unrealized_pnl:,.2f} ({portfolio_pnl_pct:.2f}%)")
 
         return result
+
+
+# Fill record used by PnLEngine
+FILL_DTYPE = np.dtype([
+    ('symbol', '<i4'),        # Index into PnLEngine.symbols
+    ('side', 'i1'),           # 1 = BUY, -1 = SELL
+    ('quantity', '<f8'),      # Unsigned fill quantity
+    ('price', '<f8'),
+    ('fee', '<f8'),
+    ('timestamp', '<i8'),     # Epoch milliseconds (ties keep input order)
+])
+
+COST_METHODS = ('fifo', 'average')
+
+
+def round_half_up(values, precision: int = 2) -> np.ndarray:
+    """
+    Vectorized ROUND_HALF_UP matching PnLCalculator._round.
+
+    Values are snapped to 6 extra decimals first so binary representation
+    error (1.005 stored as 1.00499...) rounds like the decimal string.
+
+    Args:
+        values: Scalar or array
+        precision: Decimal places
+
+    Returns:
+        Rounded float array
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10.0 ** precision
+    scaled = np.round(np.abs(values) * scale, 6)
+    return np.copysign(np.floor(scaled + 0.5) / scale, values)
+
+
+def _segment_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Cumulative sum restarting at each True in `starts` (starts[0] must be True)."""
+    total = np.cumsum(values)
+    base = (total - values)[starts]
+    return total - base[np.cumsum(starts) - 1]
+
+
+def _run_starts(keys: np.ndarray) -> np.ndarray:
+    """Mask of rows whose key differs from the previous row."""
+    starts = np.empty(len(keys), dtype=bool)
+    starts[:1] = True
+    np.not_equal(keys[1:], keys[:-1], out=starts[1:])
+    return starts
+
+
+def _fill_order(fills: np.ndarray) -> np.ndarray:
+    """Stable (symbol, timestamp) order of fills."""
+    symbol = fills['symbol'].astype(np.int64)
+    timestamp = fills['timestamp']
+    if len(fills) == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    # One composite int64 key sorts about twice as fast as lexsort
+    span = int(timestamp.max()) - int(timestamp.min())
+    if span < (1 << 40) and 0 <= symbol.min() and symbol.max() < (1 << 22):
+        key = (symbol << 40) + (timestamp - timestamp.min())
+        return np.argsort(key, kind='stable')
+    return np.lexsort((timestamp, symbol))
+
+
+def _affine_scan(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Solve x[i] = a[i] * x[i-1] + b[i] (x[-1] = 0) with a log-depth scan.
+
+    Composing the affine maps pairwise only multiplies factors in [0, 1],
+    so long sequences never overflow the way a cumulative product would.
+    """
+    a = a.copy()
+    b = b.copy()
+    step = 1
+    while step < len(a):
+        b[step:] = a[step:] * b[:-step] + b[step:]
+        a[step:] = a[step:] * a[:-step]
+        step *= 2
+    return b
+
+
+class PnLEngine:
+    """
+    Array-based P&L engine over FILL_DTYPE fills.
+
+    Fills are sorted by (symbol, timestamp) once. Positions come from
+    segmented cumulative sums; FIFO cost is read off the cumulative opening
+    notional curve and average cost from an affine scan, so no step loops
+    over trades in Python. A fill that flips a position is split into a
+    closing and an opening part. Values stay unrounded until reconcile()
+    returns.
+    """
+
+    def __init__(self, symbols: Optional[List[str]] = None, precision: Optional[int] = 2):
+        """
+        Initialize PnLEngine.
+
+        Args:
+            symbols: Known symbols (ids are their list positions)
+            precision: Decimal places of reconcile() output (None disables rounding)
+        """
+        self.symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
+        self.precision = precision
+        for symbol in symbols or []:
+            self.symbol_id(symbol)
+
+    def symbol_id(self, symbol: str) -> int:
+        """Get (registering if needed) the id of a symbol."""
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = self._symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return symbol_id
+
+    def fills_from_trades(self, trades: List[Trade]) -> np.ndarray:
+        """
+        Convert Trade objects (signed quantity) to a FILL_DTYPE array.
+
+        Args:
+            trades: List of Trade objects
+
+        Returns:
+            FILL_DTYPE array in input order
+        """
+        fills = np.zeros(len(trades), dtype=FILL_DTYPE)
+        if not trades:
+            return fills
+
+        quantity = np.array([t.quantity for t in trades], dtype=np.float64)
+        fills['symbol'] = [self.symbol_id(t.symbol) for t in trades]
+        fills['side'] = np.where(quantity >= 0, 1, -1)
+        fills['quantity'] = np.abs(quantity)
+        fills['price'] = [t.price for t in trades]
+        fills['fee'] = [t.commission for t in trades]
+
+        timestamps = pd.DatetimeIndex(pd.to_datetime([t.timestamp for t in trades], utc=True))
+        fills['timestamp'] = np.where(timestamps.isna(), 0, timestamps.as_unit('ms').asi8)
+        return fills
+
+    @staticmethod
+    def _sorted_rows(fills: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Sort fills by (symbol, timestamp) and split position flips.
+
+        Returns:
+            Dict of row arrays; `order` maps each row to its input fill
+        """
+        order = _fill_order(fills)
+        symbol = fills['symbol'][order].astype(np.int64)
+        signed = fills['side'][order] * fills['quantity'][order].astype(np.float64)
+        new_symbol = _run_starts(symbol)
+
+        position = _segment_cumsum(signed, new_symbol)
+        before = position - signed
+
+        flips = (before != 0) & (position != 0) & (np.sign(position) != np.sign(before))
+        first_part = np.ones(len(order), dtype=bool)
+        if flips.any():
+            repeat = 1 + flips
+            order = np.repeat(order, repeat)
+            symbol = np.repeat(symbol, repeat)
+            signed = np.repeat(signed, repeat)
+            before = np.repeat(before, repeat)
+            position = np.repeat(position, repeat)
+            new_symbol = np.repeat(new_symbol, repeat)
+
+            # First part closes the old position, second opens the remainder
+            first_part = _run_starts(order)
+            split = np.repeat(flips, repeat)
+            closing_part = split & first_part
+            opening_part = split & ~first_part
+            signed[closing_part] = -before[closing_part]
+            position[closing_part] = 0.0
+            signed[opening_part] = position[opening_part]
+            before[opening_part] = 0.0
+            new_symbol &= first_part
+
+        return {
+            'order': order,
+            'symbol': symbol,
+            'signed': signed,
+            'before': before,
+            'position': position,
+            'new_symbol': new_symbol,
+            'price': fills['price'][order].astype(np.float64),
+            'fee': np.where(first_part, fills['fee'][order], 0.0),  # Fee charged once per fill
+        }
+
+    def _match(self, fills: np.ndarray, method: str) -> Dict[str, np.ndarray]:
+        """
+        Compute realized P&L per row and the cost of open quantity after each row.
+
+        Args:
+            fills: FILL_DTYPE array
+            method: 'fifo' or 'average'
+
+        Returns:
+            _sorted_rows() dict plus 'realized', 'open_cost', 'bought', 'sold'
+        """
+        if method not in COST_METHODS:
+            raise ValueError(f"Unknown cost method '{method}', expected one of {COST_METHODS}")
+
+        rows = self._sorted_rows(fills)
+        signed, before, price = rows['signed'], rows['before'], rows['price']
+        position = rows['position']
+
+        quantity = np.abs(signed)
+        closing = (before != 0) & (np.sign(signed) != np.sign(before))
+        opened = np.where(closing, 0.0, quantity)
+        closed = quantity - opened
+        notional = opened * price
+
+        if method == 'fifo':
+            # Closes consume opening quantity in time order, so the cost of a
+            # close is the opening notional between its start and end quantity
+            # on the cumulative (quantity, notional) curve of the symbol's opens.
+            # Every earlier leg of a symbol is flat, so one curve serves all legs.
+            opened_cum = np.cumsum(opened)
+            notional_cum = np.cumsum(notional)
+            closed_cum = np.cumsum(closed)
+
+            starts = rows['new_symbol']
+            offset = (opened_cum - opened - (closed_cum - closed))[starts]
+            consumed = closed_cum + offset[np.cumsum(starts) - 1]
+
+            open_rows = opened > 0
+            curve_quantity = np.concatenate(([0.0], opened_cum[open_rows]))
+            curve_notional = np.concatenate(([0.0], notional_cum[open_rows]))
+            consumed_notional = np.interp(consumed, curve_quantity, curve_notional)
+            cost = consumed_notional - np.interp(consumed - closed, curve_quantity, curve_notional)
+            open_cost = notional_cum - consumed_notional
+        else:
+            # Average cost: basis = a * basis_prev + b, with a = 0 when a leg
+            # starts, the remaining fraction on reductions and 1 on additions
+            a = np.ones(len(signed))
+            a[before == 0] = 0.0
+            a[closing] = np.abs(position[closing]) / np.abs(before[closing])
+            open_cost = _affine_scan(a, notional)
+
+            basis_before = np.concatenate(([0.0], open_cost[:-1]))
+            average_before = np.divide(
+                basis_before, np.abs(before), out=np.zeros(len(before)), where=before != 0
+            )
+            cost = closed * average_before
+
+        # Closing a long earns exit - cost, closing a short earns cost - exit
+        rows['realized'] = np.where(closing, np.sign(before) * (closed * price - cost), 0.0)
+        rows['open_cost'] = open_cost
+        rows['bought'] = np.where(signed > 0, quantity, 0.0)
+        rows['sold'] = np.where(signed < 0, quantity, 0.0)
+        return rows
+
+    def fill_pnl(self, fills: np.ndarray, method: str = 'fifo') -> np.ndarray:
+        """
+        Realized P&L (before fees) of each fill, in input order.
+
+        Args:
+            fills: FILL_DTYPE array
+            method: 'fifo' or 'average'
+
+        Returns:
+            float64 array aligned with `fills` (0 for opening fills)
+        """
+        if len(fills) == 0:
+            return np.zeros(0)
+        rows = self._match(fills, method)
+        return np.bincount(rows['order'], weights=rows['realized'], minlength=len(fills))
+
+    def reconcile(
+        self,
+        fills: np.ndarray,
+        marks: Optional[Union[Dict[str, float], np.ndarray]] = None,
+        method: str = 'fifo',
+    ) -> Dict[str, np.ndarray]:
+        """
+        Per-symbol positions, cost basis and realized/unrealized P&L.
+
+        Args:
+            fills: FILL_DTYPE array
+            marks: Current prices as {symbol: price} or an array indexed by
+                symbol id (NaN or missing leaves unrealized P&L as NaN)
+            method: 'fifo' or 'average' cost basis
+
+        Returns:
+            Dict of arrays, one row per traded symbol (sorted by id):
+                symbol, symbol_id, position, average_cost, cost_basis,
+                bought, sold, realized_pnl, fees, net_realized_pnl, and with
+                marks also mark, market_value, unrealized_pnl, total_pnl
+        """
+        if len(fills) == 0:
+            rows = None
+            symbol_ids = np.zeros(0, dtype=np.int64)
+        else:
+            rows = self._match(fills, method)
+            starts = np.flatnonzero(_run_starts(rows['symbol']))
+            last = np.append(starts[1:], len(rows['symbol'])) - 1
+            symbol_ids = rows['symbol'][starts]
+
+        def per_symbol(name: str) -> np.ndarray:
+            if rows is None:
+                return np.zeros(0)
+            return np.add.reduceat(rows[name], starts)
+
+        position = rows['position'][last] if rows is not None else np.zeros(0)
+        cost_basis = rows['open_cost'][last] if rows is not None else np.zeros(0)
+        cost_basis = np.where(position == 0, 0.0, cost_basis)
+        average_cost = np.divide(
+            cost_basis, np.abs(position), out=np.zeros(len(position)), where=position != 0
+        )
+        realized = per_symbol('realized')
+        fees = per_symbol('fee')
+
+        names = np.array(self.symbols + [''], dtype=object)
+        result = {
+            'symbol': names[np.minimum(symbol_ids, len(self.symbols))],
+            'symbol_id': symbol_ids,
+            'position': position,
+            'average_cost': average_cost,
+            'cost_basis': cost_basis,
+            'bought': per_symbol('bought'),
+            'sold': per_symbol('sold'),
+            'realized_pnl': realized,
+            'fees': fees,
+            'net_realized_pnl': realized - fees,
+        }
+
+        if marks is not None:
+            if isinstance(marks, dict):
+                mark_array = np.full(len(self.symbols), np.nan)
+                for symbol, price in marks.items():
+                    if symbol in self._symbol_ids:
+                        mark_array[self._symbol_ids[symbol]] = price
+            else:
+                mark_array = np.asarray(marks, dtype=np.float64)
+            mark = np.full(len(symbol_ids), np.nan)
+            known = symbol_ids < len(mark_array)
+            mark[known] = mark_array[symbol_ids[known]]
+
+            market_value = np.abs(position) * mark
+            unrealized = np.sign(position) * (market_value - cost_basis)
+            result.update({
+                'mark': mark,
+                'market_value': market_value,
+                'unrealized_pnl': unrealized,
+                'total_pnl': result['net_realized_pnl'] + unrealized,
+            })
+
+        if self.precision is not None:
+            for name in ('average_cost', 'cost_basis', 'realized_pnl', 'fees',
+                         'net_realized_pnl', 'market_value', 'unrealized_pnl', 'total_pnl'):
+                if name in result:
+                    result[name] = round_half_up(result[name], self.precision)
+
+        return result
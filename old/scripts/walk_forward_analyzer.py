@@ -8,6 +8,15 @@ windows of out-of-sample data to detect overfitting and ensure robustness.
 
 Features:
 - Rolling window validation (in-sample optimization, out-of-sample testing)
+- Symbol history loaded once and shared by every window
+- Concurrent per-window optimization on a process pool, with each
+  out-of-sample test scheduled as soon as its window's optimum is known
+- Sequential runs use the same window scheduler and tasks as the process pool
+- Windows whose optimization fails are reported as such, without an
+  out-of-sample test
+- Warm-started incremental re-optimization: each window searches around the
+  previous window's best parameters, with training runs cached per window
+  so repeated analyses only backtest what changed
 - Performance degradation analysis
 - Stationarity tests
 - MLflow experiment tracking
@@ -17,7 +26,11 @@ Features:
 import os
 import sys
 import json
+import itertools
 import logging
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
@@ -32,25 +45,359 @@ from backtrader.analyzers import SharpeRatio, DrawDown, Returns, TradeAnalyzer
 sys.path.append(str(Path(__file__).parent.parent))
 
 from scripts.mlflow_logger import MLflowBacktestLogger
-from scripts.data_quality_check import load_data
-from scripts.backtest_parser import BacktestResultParser
-
-# Import parallel backtesting for distributed execution
-PARALLEL_BACKTEST_AVAILABLE = False
-ParallelBacktestOrchestrator = None
-
-try:
-    from scripts.parallel_backtest import ParallelBacktestOrchestrator
-    PARALLEL_BACKTEST_AVAILABLE = True
-    print("✅ Parallel backtesting available for walk-forward analysis")
-except ImportError as e:
-    print(f"⚠️  Parallel backtesting not available, using sequential execution: {e}")
+from scripts.data_quality_check import DataValidator
+from scripts.backtest_parser import BacktraderResultParser
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Window Tasks (module level so they can run in a process pool)
+# ============================================================================
+
+# Symbol histories shared by every task in a worker process (set by _init_window_worker)
+_WORKER_HISTORIES: Dict[str, pd.DataFrame] = {}
+
+
+def _init_window_worker(histories: Dict[str, pd.DataFrame]) -> None:
+    """Process pool initializer: receive the symbol histories once per worker."""
+    global _WORKER_HISTORIES
+    _WORKER_HISTORIES = histories
+
+
+class _InlineExecutor:
+    """
+    Executor that runs each task in this process as it is submitted.
+
+    Lets the window scheduler run with one worker on exactly the same task
+    functions as the process pool.
+    """
+
+    def __init__(self, histories: Dict[str, pd.DataFrame]):
+        self.histories = histories
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, histories=self.histories))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def _metric_score(metrics: Dict[str, Any], optimization_metric: str) -> float:
+    """Score a backtest for optimization (higher is better)."""
+    value = metrics.get(optimization_metric)
+    if value is None or not np.isfinite(value):
+        return float('-inf')
+    # Drawdown is reported as a positive percentage; smaller is better
+    if optimization_metric == 'max_drawdown':
+        return -value
+    return float(value)
+
+
+def _run_window_backtest(
+    strategy_class: bt.Strategy,
+    params: Dict[str, Any],
+    histories: Dict[str, pd.DataFrame],
+    symbols: List[str],
+    start: str,
+    end: str,
+    initial_cash: float,
+    commission: float
+) -> Dict[str, Any]:
+    """
+    Run one backtest on a date slice of preloaded symbol histories.
+
+    Returns:
+        Metrics dictionary (empty if no data falls inside the slice)
+    """
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.broker.setcash(initial_cash)
+    cerebro.broker.setcommission(commission=commission)
+
+    feeds = 0
+    for symbol in symbols:
+        history = histories.get(symbol)
+        if history is None:
+            continue
+        frame = history.loc[start:end]
+        if frame.empty:
+            continue
+        cerebro.adddata(bt.feeds.PandasData(dataname=frame), name=symbol)
+        feeds += 1
+
+    if feeds == 0:
+        logger.warning("No data for %s between %s and %s", symbols, start, end)
+        return {}
+
+    cerebro.addstrategy(strategy_class, **params)
+    cerebro.addanalyzer(SharpeRatio, _name='sharpe', timeframe=bt.TimeFrame.Days, annualize=True)
+    cerebro.addanalyzer(DrawDown, _name='drawdown')
+    cerebro.addanalyzer(Returns, _name='returns', timeframe=bt.TimeFrame.NoTimeFrame)
+    cerebro.addanalyzer(TradeAnalyzer, _name='trades')
+
+    strategy = cerebro.run()[0]
+
+    metrics = {}
+    try:
+        metrics['sharpe_ratio'] = strategy.analyzers.sharpe.get_analysis().get('sharperatio') or 0
+        metrics['max_drawdown'] = strategy.analyzers.drawdown.get_analysis().get('max', {}).get('drawdown', 0)
+        metrics['total_return'] = strategy.analyzers.returns.get_analysis().get('rtot', 0)
+
+        trade_results = strategy.analyzers.trades.get_analysis()
+        metrics['total_trades'] = trade_results.get('total', {}).get('total', 0)
+        metrics['win_trades'] = trade_results.get('won', {}).get('total', 0)
+        total_trades = metrics['total_trades']
+        metrics['win_rate'] = metrics['win_trades'] / total_trades if total_trades > 0 else 0
+
+        final_value = cerebro.broker.getvalue()
+        metrics['final_portfolio_value'] = final_value
+        metrics['total_pnl'] = final_value - initial_cash
+    except Exception as e:
+        logger.warning("Failed to extract metrics: %s", e)
+
+    return metrics
+
+
+def _optimize_window_task(
+    window_index: int,
+    strategy_class: bt.Strategy,
+    param_combinations: List[Dict[str, Any]],
+    symbols: List[str],
+    train_start: str,
+    train_end: str,
+    optimization_metric: str,
+    initial_cash: float,
+    commission: float,
+    histories: Optional[Dict[str, pd.DataFrame]] = None
+) -> Tuple[str, int, Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Grid-search parameters on one training slice.
+
+    Returns:
+        ('train', window_index, (best_params, best_in_sample_metrics)); both
+        empty if no parameter set produced a backtest
+    """
+    histories = _WORKER_HISTORIES if histories is None else histories
+
+    best_params: Dict[str, Any] = {}
+    best_metrics: Dict[str, Any] = {}
+    best_score = float('-inf')
+
+    for params in param_combinations:
+        try:
+            metrics = _run_window_backtest(
+                strategy_class, params, histories, symbols,
+                train_start, train_end, initial_cash, commission
+            )
+        except Exception as e:
+            logger.warning("Failed to optimize with params %s: %s", params, e)
+            continue
+        if not metrics:
+            continue
+
+        score = _metric_score(metrics, optimization_metric)
+        if score > best_score or not best_params:
+            best_score = score
+            best_params = dict(params)
+            best_metrics = metrics
+
+    if not best_params:
+        logger.warning("Window %d optimization failed: no parameter set produced a backtest",
+                       window_index + 1)
+    else:
+        logger.info("Window %d best training params: %s (%s: %.4f)",
+                    window_index + 1, best_params, optimization_metric, best_score)
+    return 'train', window_index, (best_params, best_metrics)
+
+
+def _test_window_task(
+    window_index: int,
+    strategy_class: bt.Strategy,
+    params: Dict[str, Any],
+    symbols: List[str],
+    test_start: str,
+    test_end: str,
+    initial_cash: float,
+    commission: float,
+    histories: Optional[Dict[str, pd.DataFrame]] = None
+) -> Tuple[str, int, Dict[str, Any]]:
+    """
+    Run the out-of-sample test for one window.
+
+    Returns:
+        ('test', window_index, out_of_sample_metrics)
+    """
+    histories = _WORKER_HISTORIES if histories is None else histories
+    try:
+        metrics = _run_window_backtest(
+            strategy_class, params, histories, symbols,
+            test_start, test_end, initial_cash, commission
+        )
+    except Exception as e:
+        logger.error("Failed out-of-sample test for window %d: %s", window_index + 1, e)
+        metrics = {}
+    return 'test', window_index, metrics
+
+
+class _EquityCurve(bt.Analyzer):
+    """Record the end-of-day portfolio value and each trade's open/close dates and P&L."""
+
+    def start(self):
+        self.dates: List[str] = []
+        self.values: List[float] = []
+        self.trades: List[list] = []  # [open date, close date or None, pnl net of commission]
+        self._open: Dict[int, list] = {}
+
+    def next(self):
+        date = self.strategy.datetime.date(0).isoformat()
+        if self.dates and self.dates[-1] == date:
+            self.values[-1] = self.strategy.broker.getvalue()
+        else:
+            self.dates.append(date)
+            self.values.append(self.strategy.broker.getvalue())
+
+    def notify_trade(self, trade):
+        date = self.strategy.datetime.date(0).isoformat()
+        if trade.justopened:
+            self._open[trade.ref] = [date, None, 0.0]
+            self.trades.append(self._open[trade.ref])
+        if trade.isclosed and trade.ref in self._open:
+            record = self._open.pop(trade.ref)
+            record[1], record[2] = date, trade.pnlcomm
+
+    def get_analysis(self):
+        return {'dates': self.dates, 'values': self.values, 'trades': self.trades}
+
+
+def _run_equity_curve(
+    strategy_class: bt.Strategy,
+    params: Dict[str, Any],
+    histories: Dict[str, pd.DataFrame],
+    symbols: List[str],
+    start: str,
+    end: str,
+    initial_cash: float,
+    commission: float
+) -> Dict[str, Any]:
+    """
+    Run one backtest over start..end and record its equity curve.
+
+    Backtests are causal, so the curve up to any date equals that of a run
+    ending on that date; _window_metrics scores any slice of it.
+
+    Returns:
+        Dict with dates, values, closed trades and the requested end date
+        (empty if no data falls inside the range)
+    """
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.broker.setcash(initial_cash)
+    cerebro.broker.setcommission(commission=commission)
+
+    feeds = 0
+    for symbol in symbols:
+        history = histories.get(symbol)
+        if history is None:
+            continue
+        frame = history.loc[start:end]
+        if frame.empty:
+            continue
+        cerebro.adddata(bt.feeds.PandasData(dataname=frame), name=symbol)
+        feeds += 1
+
+    if feeds == 0:
+        logger.warning("No data for %s between %s and %s", symbols, start, end)
+        return {}
+
+    cerebro.addstrategy(strategy_class, **params)
+    cerebro.addanalyzer(_EquityCurve, _name='equity')
+    strategy = cerebro.run()[0]
+    return {**strategy.analyzers.equity.get_analysis(), 'end': end}
+
+
+def _window_metrics(curve: Dict[str, Any], start: str, end: str, initial_cash: float) -> Dict[str, Any]:
+    """
+    Metrics of the start..end slice of an equity curve, rebased to initial_cash.
+
+    Same fields as _run_window_backtest: annualized Sharpe of daily returns
+    with a 1% risk-free rate (backtrader's SharpeRatio defaults), max drawdown
+    in percent, log total return, and trades counted like TradeAnalyzer:
+    trades closed inside the slice plus trades opened in it and still open.
+
+    Returns:
+        Metrics dictionary (empty if the curve has no bars in the slice)
+    """
+    dates = curve.get('dates', [])
+    lo, hi = bisect_left(dates, start), bisect_right(dates, end)
+    if hi <= lo:
+        return {}
+
+    base = curve['values'][lo - 1] if lo > 0 else initial_cash
+    values = np.asarray([base] + list(curve['values'][lo:hi]), dtype=float)
+
+    excess = values[1:] / values[:-1] - 1.0 - (pow(1.01, 1.0 / 252) - 1.0)
+    std = excess.std()
+    sharpe = float(np.sqrt(252) * excess.mean() / std) if std > 0 else 0
+
+    peaks = np.maximum.accumulate(values)
+    closed = [pnl for opened, closed_on, pnl in curve.get('trades', [])
+              if closed_on is not None and start <= closed_on <= end]
+    still_open = sum(1 for opened, closed_on, _ in curve.get('trades', [])
+                     if start <= opened <= end and (closed_on is None or closed_on > end))
+    total_trades = len(closed) + still_open
+    final_value = initial_cash * values[-1] / values[0]
+
+    metrics = {
+        'sharpe_ratio': sharpe,
+        'max_drawdown': float(((peaks - values) / peaks).max() * 100),
+        'total_return': float(np.log(values[-1] / values[0])),
+        'total_trades': total_trades,
+        'win_trades': sum(1 for pnl in closed if pnl >= 0),
+    }
+    metrics['win_rate'] = metrics['win_trades'] / total_trades if total_trades > 0 else 0
+    metrics['final_portfolio_value'] = final_value
+    metrics['total_pnl'] = final_value - initial_cash
+    return metrics
+
+
+def _equity_curves_task(
+    strategy_class: bt.Strategy,
+    param_sets: List[Dict[str, Any]],
+    symbols: List[str],
+    start: str,
+    end: str,
+    initial_cash: float,
+    commission: float,
+    histories: Optional[Dict[str, pd.DataFrame]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run a chunk of parameter sets over one date range.
+
+    Returns:
+        Equity curve for each parameter set, in order (empty dict on failure)
+    """
+    histories = _WORKER_HISTORIES if histories is None else histories
+    results = []
+    for params in param_sets:
+        try:
+            results.append(_run_equity_curve(
+                strategy_class, params, histories, symbols, start, end, initial_cash, commission
+            ))
+        except Exception as e:
+            logger.warning("Failed to backtest params %s: %s", params, e)
+            results.append({})
+    return results
+
+
 class WalkForwardAnalyzer:
     """
     Walk-forward analysis for strategy validation.
@@ -62,15 +409,27 @@ class WalkForwardAnalyzer:
     4. Results are analyzed for consistency and overfitting
     """
 
-    def __init__(self, mlflow_tracking_uri: str = "http://mlflow:5000"):
+    def __init__(
+        self,
+        mlflow_tracking_uri: str = "http://mlflow:5000",
+        data_dir: str = "data",
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize the walk-forward analyzer.
 
         Args:
             mlflow_tracking_uri: MLflow tracking server URI
+            data_dir: Root directory containing symbol data
+            cache_path: Optional JSON file persisting warm-start training runs
+                between analyses
         """
         self.mlflow_logger = MLflowBacktestLogger(tracking_uri=mlflow_tracking_uri)
-        self.parser = BacktestResultParser()
+        self.parser = BacktraderResultParser()
+        self.data_dir = data_dir
+        self.cache_path = cache_path
+        self._backtest_cache: Dict[str, Dict[str, Any]] = {}
+        self._load_backtest_cache()
         logger.info("WalkForwardAnalyzer initialized")
 
     def run_walk_forward_analysis(
@@ -87,11 +446,21 @@ class WalkForwardAnalyzer:
         commission: float = 0.001,
         project: str = "walk_forward",
         asset_class: str = "equities",
-        strategy_family: str = "unknown"
+        strategy_family: str = "unknown",
+        max_workers: Optional[int] = None,
+        warm_start: bool = False,
+        warm_start_top_k: int = 3,
+        warm_start_budget: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Run complete walk-forward analysis.
 
+        Symbol histories are loaded once for the whole analysis. Windows are
+        optimized concurrently on a process pool and each out-of-sample test
+        is scheduled as soon as its window's optimum is known, so the total
+        run time approaches that of the slowest window. With one worker the
+        same scheduler runs every task in this process.
+
         Args:
             strategy_class: Backtrader strategy class
             param_ranges: Parameter ranges for optimization
@@ -106,6 +475,11 @@ class WalkForwardAnalyzer:
             project: Project name for MLflow
             asset_class: Asset class for tagging
             strategy_family: Strategy family for tagging
+            max_workers: Worker processes (default: CPU count; 1 runs windows sequentially)
+            warm_start: Seed each window's search with the previous window's best
+                parameter sets and their grid neighbours instead of the full grid
+            warm_start_top_k: Previous-window parameter sets used as seeds
+            warm_start_budget: Maximum candidates per warm-started window (None for no limit)
 
         Returns:
             Dictionary with walk-forward analysis results
@@ -120,24 +494,36 @@ class WalkForwardAnalyzer:
         )
         logger.info("Generated %d analysis windows", len(windows))
 
-        # Run analysis for each window
-        window_results = []
-        for i, window in enumerate(windows):
-            logger.info("Processing window %d/%d: %s to %s (train: %s to %s, test: %s to %s)",
-                       i+1, len(windows), window['start'], window['end'],
-                       window['train_start'], window['train_end'],
-                       window['test_start'], window['test_end'])
+        # Load every symbol's history once; windows slice it by date
+        histories = self._load_symbol_histories(symbols)
 
-            result = self._analyze_window(
+        workers = min(max_workers or os.cpu_count() or 1, len(windows))
+        if warm_start:
+            window_results = self._analyze_windows_warm_started(
                 strategy_class=strategy_class,
                 param_ranges=param_ranges,
                 symbols=symbols,
-                window=window,
+                windows=windows,
+                histories=histories,
                 optimization_metric=optimization_metric,
                 initial_cash=initial_cash,
-                commission=commission
+                commission=commission,
+                max_workers=max_workers or os.cpu_count() or 1,
+                top_k=warm_start_top_k,
+                budget=warm_start_budget
+            )
+        else:
+            window_results = self._analyze_windows(
+                strategy_class=strategy_class,
+                param_ranges=param_ranges,
+                symbols=symbols,
+                windows=windows,
+                histories=histories,
+                optimization_metric=optimization_metric,
+                initial_cash=initial_cash,
+                commission=commission,
+                max_workers=workers
             )
-            window_results.append(result)
 
         # Analyze overall results
         analysis_results = self._analyze_walk_forward_results(
@@ -207,323 +593,375 @@ class WalkForwardAnalyzer:
 
         return windows
 
-    def _analyze_window(
+    def _load_symbol_histories(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Load the full OHLCV history of each symbol once.
+
+        Args:
+            symbols: Symbols to load
+
+        Returns:
+            Dict of symbol -> DataFrame indexed by datetime (missing symbols omitted)
+        """
+        validator = DataValidator(self.data_dir)
+        histories = {}
+        for symbol in symbols:
+            df = validator.load_symbol_data(symbol)
+            if df is None or df.empty:
+                logger.warning("No history loaded for %s", symbol)
+                continue
+            df = df.set_index(pd.to_datetime(df['datetime'])).sort_index()
+            histories[symbol] = df[['open', 'high', 'low', 'close', 'volume']]
+            logger.info("Loaded %d bars for %s", len(df), symbol)
+        return histories
+
+    @staticmethod
+    def _generate_param_combinations(param_ranges: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """Expand parameter ranges into the full grid of combinations."""
+        param_names = list(param_ranges.keys())
+        return [dict(zip(param_names, combo)) for combo in itertools.product(*param_ranges.values())]
+
+    def _build_window_result(
         self,
-        strategy_class: bt.Strategy,
-        param_ranges: Dict[str, List[Any]],
-        symbols: List[str],
         window: Dict[str, str],
-        optimization_metric: str,
-        initial_cash: float,
-        commission: float
+        best_params: Dict[str, Any],
+        in_sample_metrics: Dict[str, Any],
+        out_of_sample_metrics: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Analyze a single window: optimize on train data, test on test data.
-        """
-        # Optimize parameters on training data
-        best_params = self._optimize_on_training_data(
-            strategy_class=strategy_class,
-            param_ranges=param_ranges,
-            symbols=symbols,
-            train_start=window['train_start'],
-            train_end=window['train_end'],
-            optimization_metric=optimization_metric,
-            initial_cash=initial_cash,
-            commission=commission
-        )
-
-        # Test optimized parameters on out-of-sample data
-        test_results = self._test_on_out_of_sample_data(
-            strategy_class=strategy_class,
-            params=best_params,
-            symbols=symbols,
-            test_start=window['test_start'],
-            test_end=window['test_end'],
-            initial_cash=initial_cash,
-            commission=commission
-        )
+        Assemble the result record for one window.
 
+        Windows without optimized parameters get status 'optimization_failed'
+        and are left out of the walk-forward statistics.
+        """
         return {
             'window': window,
+            'status': 'completed' if best_params else 'optimization_failed',
             'best_params': best_params,
-            'in_sample_metrics': {},  # Would be populated from optimization
-            'out_of_sample_metrics': test_results.get('metrics', {}),
-            'performance_degradation': self._calculate_performance_degradation({}, test_results.get('metrics', {}))
+            'in_sample_metrics': in_sample_metrics,
+            'out_of_sample_metrics': out_of_sample_metrics,
+            'performance_degradation': self._calculate_performance_degradation(
+                in_sample_metrics, out_of_sample_metrics
+            )
         }
 
-    def _optimize_on_training_data(
+    def _analyze_windows(
         self,
         strategy_class: bt.Strategy,
         param_ranges: Dict[str, List[Any]],
         symbols: List[str],
-        train_start: str,
-        train_end: str,
+        windows: List[Dict[str, str]],
+        histories: Dict[str, pd.DataFrame],
         optimization_metric: str,
         initial_cash: float,
-        commission: float
-    ) -> Dict[str, Any]:
-        """
-        Optimize strategy parameters on training data.
-        For simplicity, we'll use a basic grid search here.
-        In production, this could use the CerebroOptimizer.
+        commission: float,
+        max_workers: int
+    ) -> List[Dict[str, Any]]:
         """
-        # Simple parameter optimization - try all combinations
-        param_combinations = []
-        param_names = list(param_ranges.keys())
-        param_values = list(param_ranges.values())
-
-        for combo in itertools.product(*param_values):
-            param_combinations.append(dict(zip(param_names, combo)))
+        Optimize and test all windows on a shared process pool.
 
-        best_params = {}
-        best_score = float('-inf')
+        At most max_workers tasks are in flight. Whenever a training task
+        finishes, its out-of-sample test is submitted ahead of any remaining
+        training tasks, so results stream in while other windows optimize.
+        Windows whose optimization failed are not tested. With max_workers=1
+        the tasks run in this process, in the same order.
 
-        for params in param_combinations[:5]:  # Limit to first 5 for speed
-            try:
-                # Run backtest with these parameters
-                cerebro = bt.Cerebro()
-                cerebro.broker.setcash(initial_cash)
-                cerebro.broker.setcommission(commission=commission)
-
-                # Load training data
-                for symbol in symbols:
-                    data = load_data(symbol, train_start, train_end)
-                    if data:
-                        cerebro.adddata(data, name=symbol)
-
-                # Add strategy with fixed parameters
-                cerebro.addstrategy(strategy_class, **params)
-
-                # Add analyzers
-                cerebro.addanalyzer(SharpeRatio, _name='sharpe', timeframe=bt.TimeFrame.Days, annualize=True)
-                cerebro.addanalyzer(Returns, _name='returns', timeframe=bt.TimeFrame.NoTimeFrame)
-
-                # Run backtest
-                results = cerebro.run()
-                strategy = results[0]
-
-                # Extract metric
-                score = 0
-                if hasattr(strategy.analyzers, 'sharpe'):
+        Returns:
+            Window results in window order
+        """
+        param_combinations = self._generate_param_combinations(param_ranges)
+        train_queue = deque(range(len(windows)))
+        test_queue: deque = deque()
+        optimized: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        results: Dict[int, Dict[str, Any]] = {}
+
+        logger.info("Analyzing %d windows on %d worker processes (%d parameter sets each)",
+                   len(windows), max_workers, len(param_combinations))
+
+        if max_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=max_workers,
+                                           initializer=_init_window_worker,
+                                           initargs=(histories,))
+        else:
+            executor = _InlineExecutor(histories)
+
+        with executor as pool:
+            in_flight: Dict[Any, Tuple[str, int]] = {}
+
+            def submit_next():
+                if test_queue:
+                    i = test_queue.popleft()
+                    window = windows[i]
+                    future = pool.submit(
+                        _test_window_task, i, strategy_class, optimized[i][0], symbols,
+                        window['test_start'], window['test_end'], initial_cash, commission
+                    )
+                    in_flight[future] = ('test', i)
+                elif train_queue:
+                    i = train_queue.popleft()
+                    window = windows[i]
+                    future = pool.submit(
+                        _optimize_window_task, i, strategy_class, param_combinations, symbols,
+                        window['train_start'], window['train_end'], optimization_metric,
+                        initial_cash, commission
+                    )
+                    in_flight[future] = ('train', i)
+
+            while len(in_flight) < max_workers and train_queue:
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, i = in_flight.pop(future)
                     try:
-                        sharpe_results = strategy.analyzers.sharpe.get_analysis()
-                        score = sharpe_results.get('sharperatio', 0)
-                    except:
-                        score = 0
+                        _, _, payload = future.result()
+                    except Exception as e:
+                        logger.error("Window %d %s task failed: %s", i + 1, stage, e)
+                        payload = ({}, {}) if stage == 'train' else {}
+
+                    if stage == 'train' and payload[0]:
+                        optimized[i] = payload
+                        test_queue.append(i)
+                        continue
+
+                    if stage == 'train':
+                        results[i] = self._build_window_result(windows[i], {}, {}, {})
+                    else:
+                        best_params, in_sample_metrics = optimized[i]
+                        results[i] = self._build_window_result(
+                            windows[i], best_params, in_sample_metrics, payload
+                        )
+                    logger.info("Window %d/%d %s (%d/%d done)",
+                               i + 1, len(windows), results[i]['status'], len(results), len(windows))
 
-                if score > best_score:
-                    best_score = score
-                    best_params = params.copy()
+                while len(in_flight) < max_workers and (test_queue or train_queue):
+                    submit_next()
 
-            except Exception as e:
-                logger.warning("Failed to optimize with params %s: %s", params, e)
-                continue
+        return [results[i] for i in range(len(windows))]
 
-        logger.info("Best training params: %s (score: %.4f)", best_params, best_score)
-        return best_params
+    # ========================================================================
+    # Warm-Started Incremental Re-Optimization
+    # ========================================================================
 
-    def _test_on_out_of_sample_data(
+    def _backtest_cache_key(
         self,
         strategy_class: bt.Strategy,
         params: Dict[str, Any],
         symbols: List[str],
-        test_start: str,
-        test_end: str,
+        start: str,
+        end: str,
         initial_cash: float,
         commission: float
-    ) -> Dict[str, Any]:
-        """
-        Test optimized parameters on out-of-sample data.
-        Uses parallel backtesting if available, otherwise falls back to sequential execution.
+    ) -> str:
+        """Cache key identifying one (strategy, params, symbols, start..end) run."""
+        return json.dumps([
+            f"{strategy_class.__module__}.{strategy_class.__qualname__}",
+            sorted(params.items()), list(symbols), start, end, initial_cash, commission
+        ], default=str)
+
+    def _load_backtest_cache(self) -> None:
+        """Load persisted equity curves from cache_path (if it exists)."""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as f:
+                self._backtest_cache.update(json.load(f))
+            logger.info("Loaded %d cached equity curves from %s",
+                       len(self._backtest_cache), self.cache_path)
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable backtest cache %s: %s", self.cache_path, e)
+
+    def _save_backtest_cache(self) -> None:
+        """Persist equity curves to cache_path (if configured)."""
+        if not self.cache_path:
+            return
+        try:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self._backtest_cache, f, default=str)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("Failed to save backtest cache %s: %s", self.cache_path, e)
+
+    @staticmethod
+    def _warm_start_candidates(
+        seeds: List[Dict[str, Any]],
+        param_ranges: Dict[str, List[Any]],
+        budget: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        # Get strategy path for parallel backtesting
-        strategy_path = self._get_strategy_path(strategy_class)
-
-        # Use parallel backtesting if available
-        if PARALLEL_BACKTEST_AVAILABLE and len(symbols) > 1:
-            logger.info("Using parallel backtesting for %d symbols", len(symbols))
-            return self._test_parallel(
-                strategy_path=strategy_path,
-                params=params,
-                symbols=symbols,
-                test_start=test_start,
-                test_end=test_end,
-                initial_cash=initial_cash,
-                commission=commission
-            )
-        else:
-            logger.info("Using sequential backtesting")
-            return self._test_sequential(
-                strategy_class=strategy_class,
-                params=params,
-                symbols=symbols,
-                test_start=test_start,
-                test_end=test_end,
-                initial_cash=initial_cash,
-                commission=commission
-            )
-
-    def _get_strategy_path(self, strategy_class: bt.Strategy) -> str:
-        """Get the file path for a strategy class."""
-        # This is a simplified approach - in practice, you'd need to map class to file
-        # For now, we'll use a mapping or require the path to be passed
-        strategy_name = strategy_class.__name__.lower()
-        possible_paths = [
-            f"strategies/{strategy_name}.py",
-            f"strategies/{strategy_name}_strategy.py",
-            f"strategies/{strategy_name}_risk_managed.py"
-        ]
+        Build a window's search set from the previous window's best parameters.
 
-        for path in possible_paths:
-            if os.path.exists(path):
-                return path
+        Each seed is followed by its grid neighbours (one parameter moved one
+        step up or down its range), in seed rank order, without duplicates.
 
-        # Fallback - this would need to be improved
-        return f"strategies/{strategy_name}.py"
+        Args:
+            seeds: Previous window's top parameter sets, best first
+            param_ranges: Parameter ranges for optimization
+            budget: Maximum number of candidates (None for no limit)
 
-    def _test_parallel(
+        Returns:
+            Candidate parameter sets
+        """
+        candidates = []
+        seen = set()
+
+        def add(params):
+            key = tuple(sorted(params.items()))
+            if key not in seen:
+                seen.add(key)
+                candidates.append(params)
+
+        for seed in seeds:
+            add(dict(seed))
+            for name, values in param_ranges.items():
+                values = list(values)
+                if seed.get(name) not in values:
+                    continue
+                index = values.index(seed[name])
+                for step in (-1, 1):
+                    if 0 <= index + step < len(values):
+                        add({**seed, name: values[index + step]})
+
+        return candidates[:budget] if budget else candidates
+
+    def _evaluate_candidates(
         self,
-        strategy_path: str,
-        params: Dict[str, Any],
+        pool: Optional[ProcessPoolExecutor],
+        max_workers: int,
+        strategy_class: bt.Strategy,
+        param_sets: List[Dict[str, Any]],
         symbols: List[str],
-        test_start: str,
-        test_end: str,
+        start: str,
+        end: str,
         initial_cash: float,
-        commission: float
-    ) -> Dict[str, Any]:
-        """Test using parallel backtesting system."""
-        try:
-            # Initialize parallel orchestrator
-            orchestrator = ParallelBacktestOrchestrator(
-                redis_host='redis',
-                redis_port=6379
-            )
-
-            # Prepare strategy parameters for each symbol
-            strategy_params = {symbol: params for symbol in symbols}
+        commission: float,
+        histories: Dict[str, pd.DataFrame]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Equity curves of parameter sets over start..end, reusing cached runs.
 
-            # Run parallel backtests
-            results_df = orchestrator.execute_batch(
-                symbols=symbols,
-                strategies=[strategy_path],
-                strategy_params=strategy_params,
-                show_progress=False  # Disable progress for walk-forward
-            )
+        Uncached parameter sets are split into one chunk per worker.
 
-            # Aggregate results across all symbols
-            if not results_df.empty:
-                # Calculate weighted averages based on number of trades or returns
-                total_return = results_df['total_return'].mean()
-                sharpe_ratio = results_df['sharpe_ratio'].mean()
-                max_drawdown = results_df['max_drawdown'].max()  # Worst case
-                total_trades = results_df['total_trades'].sum()
-
-                metrics = {
-                    'total_return': total_return,
-                    'sharpe_ratio': sharpe_ratio,
-                    'max_drawdown': max_drawdown,
-                    'total_trades': total_trades,
-                    'symbols_tested': len(symbols),
-                    'execution_method': 'parallel'
-                }
-
-                return {
-                    'success': True,
-                    'metrics': metrics,
-                    'raw_results': results_df.to_dict('records')
-                }
+        Returns:
+            Tuple of (equity curve for each parameter set in order, cache hit count)
+        """
+        keys = [
+            self._backtest_cache_key(strategy_class, params, symbols, start, end, initial_cash, commission)
+            for params in param_sets
+        ]
+        missing = [i for i, key in enumerate(keys) if key not in self._backtest_cache]
+
+        if missing:
+            todo = [param_sets[i] for i in missing]
+            if pool is None:
+                computed = _equity_curves_task(
+                    strategy_class, todo, symbols, start, end, initial_cash, commission,
+                    histories=histories
+                )
             else:
-                return {
-                    'success': False,
-                    'error': 'No results from parallel backtesting',
-                    'metrics': {}
-                }
-
-        except Exception as e:
-            print(f"Parallel backtesting failed: {e}")
-            # Fallback to sequential - but we need strategy_class, so this is tricky
-            # For now, return error
-            return {
-                'success': False,
-                'error': f'Parallel backtesting failed: {e}',
-                'metrics': {}
-            }
-
-    def _test_sequential(
+                chunk_size = -(-len(todo) // max_workers)
+                futures = [
+                    pool.submit(_equity_curves_task, strategy_class, todo[i:i + chunk_size],
+                                symbols, start, end, initial_cash, commission)
+                    for i in range(0, len(todo), chunk_size)
+                ]
+                computed = [curve for future in futures for curve in future.result()]
+            for i, curve in zip(missing, computed):
+                if curve:
+                    self._backtest_cache[keys[i]] = curve
+
+        results = [self._backtest_cache.get(key, {}) for key in keys]
+        return results, len(param_sets) - len(missing)
+
+    def _analyze_windows_warm_started(
         self,
         strategy_class: bt.Strategy,
-        params: Dict[str, Any],
+        param_ranges: Dict[str, List[Any]],
         symbols: List[str],
-        test_start: str,
-        test_end: str,
+        windows: List[Dict[str, str]],
+        histories: Dict[str, pd.DataFrame],
+        optimization_metric: str,
         initial_cash: float,
-        commission: float
-    ) -> Dict[str, Any]:
+        commission: float,
+        max_workers: int,
+        top_k: int,
+        budget: Optional[int]
+    ) -> List[Dict[str, Any]]:
         """
-        Test optimized parameters on out-of-sample data (sequential fallback).
-        """
-        try:
-            cerebro = bt.Cerebro()
-            cerebro.broker.setcash(initial_cash)
-            cerebro.broker.setcommission(commission=commission)
-
-            # Load test data
-            for symbol in symbols:
-                data = load_data(symbol, test_start, test_end)
-                if data:
-                    cerebro.adddata(data, name=symbol)
-
-            # Add strategy with optimized parameters
-            cerebro.addstrategy(strategy_class, **params)
-
-            # Add analyzers
-            cerebro.addanalyzer(SharpeRatio, _name='sharpe', timeframe=bt.TimeFrame.Days, annualize=True)
-            cerebro.addanalyzer(DrawDown, _name='drawdown')
-            cerebro.addanalyzer(Returns, _name='returns', timeframe=bt.TimeFrame.NoTimeFrame)
-            cerebro.addanalyzer(TradeAnalyzer, _name='trades')
-
-            # Run backtest
-            results = cerebro.run()
-            strategy = results[0]
-
-            # Extract metrics
-            metrics = {}
-            try:
-                if hasattr(strategy.analyzers, 'sharpe'):
-                    sharpe_results = strategy.analyzers.sharpe.get_analysis()
-                    metrics['sharpe_ratio'] = sharpe_results.get('sharperatio', 0)
-
-                if hasattr(strategy.analyzers, 'drawdown'):
-                    dd_results = strategy.analyzers.drawdown.get_analysis()
-                    metrics['max_drawdown'] = dd_results.get('max', {}).get('drawdown', 0)
-
-                if hasattr(strategy.analyzers, 'returns'):
-                    ret_results = strategy.analyzers.returns.get_analysis()
-                    metrics['total_return'] = ret_results.get('rtot', 0)
-
-                if hasattr(strategy.analyzers, 'trades'):
-                    trade_results = strategy.analyzers.trades.get_analysis()
-                    metrics['total_trades'] = trade_results.get('total', {}).get('total', 0)
-                    metrics['win_trades'] = trade_results.get('won', {}).get('total', 0)
-
-                    total_trades = metrics['total_trades']
-                    if total_trades > 0:
-                        metrics['win_rate'] = metrics['win_trades'] / total_trades
-                    else:
-                        metrics['win_rate'] = 0
-
-                final_value = cerebro.broker.getvalue()
-                metrics['final_portfolio_value'] = final_value
-                metrics['total_pnl'] = final_value - initial_cash
+        Optimize windows in order, seeding each search with the previous optimum.
 
-            except Exception as e:
-                logger.warning("Failed to extract metrics: %s", e)
+        The first window searches the full grid. Every later window only
+        searches the previous window's top_k parameter sets and their grid
+        neighbours, since consecutive training slices mostly overlap.
 
-            return {'metrics': metrics}
+        Candidates and the out-of-sample test run standalone over their own
+        window, exactly as in _analyze_windows, so a search that covers the
+        full grid gives the same results. Training runs are cached by window,
+        and re-running an analysis only backtests new windows and candidates.
 
-        except Exception as e:
-            logger.error("Failed out-of-sample test: %s", e)
-            return {'metrics': {}}
+        Returns:
+            Window results in window order
+        """
+        full_grid = self._generate_param_combinations(param_ranges)
+        pool = None
+        if max_workers > 1:
+            pool = ProcessPoolExecutor(max_workers=max_workers,
+                                       initializer=_init_window_worker,
+                                       initargs=(histories,))
+
+        results = []
+        try:
+            seeds: List[Dict[str, Any]] = []
+            for i, window in enumerate(windows):
+                candidates = self._warm_start_candidates(seeds, param_ranges, budget) if seeds else full_grid
+
+                curves, cache_hits = self._evaluate_candidates(
+                    pool, max_workers, strategy_class, candidates, symbols,
+                    window['train_start'], window['train_end'], initial_cash, commission, histories
+                )
+                metrics_list = [
+                    _window_metrics(curve, window['train_start'], window['train_end'], initial_cash)
+                    if curve else {}
+                    for curve in curves
+                ]
+
+                ranked = sorted(
+                    (j for j in range(len(candidates)) if metrics_list[j]),
+                    key=lambda j: _metric_score(metrics_list[j], optimization_metric),
+                    reverse=True
+                )
+                if ranked:
+                    best = ranked[0]
+                    seeds = [candidates[j] for j in ranked[:top_k]]
+                    test_args = (i, strategy_class, candidates[best], symbols,
+                                 window['test_start'], window['test_end'], initial_cash, commission)
+                    if pool is None:
+                        _, _, out_of_sample_metrics = _test_window_task(*test_args, histories=histories)
+                    else:
+                        _, _, out_of_sample_metrics = pool.submit(_test_window_task, *test_args).result()
+                    result = self._build_window_result(
+                        window, candidates[best], metrics_list[best], out_of_sample_metrics
+                    )
+                    logger.info("Window %d/%d: %d candidates (%d cached), best %s (%s: %.4f)",
+                               i + 1, len(windows), len(candidates), cache_hits, candidates[best],
+                               optimization_metric, _metric_score(metrics_list[best], optimization_metric))
+                else:
+                    result = self._build_window_result(window, {}, {}, {})
+                    logger.warning("Window %d/%d optimization failed: no candidate has data in %s to %s",
+                                   i + 1, len(windows), window['train_start'], window['train_end'])
+
+                result['optimization_candidates'] = len(candidates)
+                result['cache_hits'] = cache_hits
+                results.append(result)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            self._save_backtest_cache()
+
+        return results
 
     def _calculate_performance_degradation(
         self,
@@ -551,20 +989,27 @@ class WalkForwardAnalyzer:
         """
         Analyze overall walk-forward results for consistency and overfitting.
         """
-        # Extract out-of-sample metrics
+        # Extract out-of-sample metrics (failed windows have none)
+        completed = [r for r in window_results if r.get('status', 'completed') == 'completed']
         out_of_sample_sharpes = []
         out_of_sample_returns = []
         out_of_sample_win_rates = []
 
-        for result in window_results:
+        for result in completed:
             metrics = result.get('out_of_sample_metrics', {})
             out_of_sample_sharpes.append(metrics.get('sharpe_ratio', 0))
             out_of_sample_returns.append(metrics.get('total_return', 0))
             out_of_sample_win_rates.append(metrics.get('win_rate', 0))
 
+        if not completed:
+            logger.warning("No walk-forward window completed optimization")
+            nan = float('nan')
+            out_of_sample_sharpes = out_of_sample_returns = out_of_sample_win_rates = [nan]
+
         # Calculate summary statistics
         summary = {
             'total_windows': len(window_results),
+            'failed_windows': len(window_results) - len(completed),
             'avg_out_of_sample_sharpe': np.mean(out_of_sample_sharpes),
             'std_out_of_sample_sharpe': np.std(out_of_sample_sharpes),
             'avg_out_of_sample_return': np.mean(out_of_sample_returns),
@@ -589,9 +1034,9 @@ class WalkForwardAnalyzer:
         # Performance degradation analysis
         degradation_analysis = {
             'avg_sharpe_degradation': np.mean([r.get('performance_degradation', {}).get('sharpe_ratio_degradation', 0)
-                                             for r in window_results]),
+                                             for r in completed] or [float('nan')]),
             'sharpe_degradation_std': np.std([r.get('performance_degradation', {}).get('sharpe_ratio_degradation', 0)
-                                            for r in window_results])
+                                            for r in completed] or [float('nan')])
         }
 
         return {
@@ -674,6 +1119,13 @@ def main():
     parser.add_argument("--project", default="walk_forward", help="Project name")
     parser.add_argument("--asset-class", default="equities", help="Asset class")
     parser.add_argument("--strategy-family", default="unknown", help="Strategy family")
+    parser.add_argument("--data-dir", default="data", help="Root directory containing symbol data")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--warm-start", action="store_true",
+                        help="Seed each window with the previous window's best parameters")
+    parser.add_argument("--warm-start-top-k", type=int, default=3, help="Seed parameter sets per window")
+    parser.add_argument("--warm-start-budget", type=int, default=None, help="Max candidates per warm-started window")
+    parser.add_argument("--cache", help="JSON file caching backtest results between runs")
     parser.add_argument("--output-json", help="Output file for results")
 
     args = parser.parse_args()
@@ -692,7 +1144,7 @@ def main():
         sys.exit(1)
 
     # Initialize analyzer
-    analyzer = WalkForwardAnalyzer()
+    analyzer = WalkForwardAnalyzer(data_dir=args.data_dir, cache_path=args.cache)
 
     # Run walk-forward analysis
     results = analyzer.run_walk_forward_analysis(
@@ -708,7 +1160,11 @@ def main():
         commission=args.commission,
         project=args.project,
         asset_class=args.asset_class,
-        strategy_family=args.strategy_family
+        strategy_family=args.strategy_family,
+        max_workers=args.workers,
+        warm_start=args.warm_start,
+        warm_start_top_k=args.warm_start_top_k,
+        warm_start_budget=args.warm_start_budget
     )
 
     # Print results
@@ -717,6 +1173,7 @@ def main():
     print("="*70)
     print(f"Strategy: {args.strategy}")
     print(f"Total windows analyzed: {results['summary']['total_windows']}")
+    print(f"Windows with failed optimization: {results['summary']['failed_windows']}")
 
     summary = results['summary']
     print(f"\nOUT-OF-SAMPLE PERFORMANCE:")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Alpha/Beta Analyzer - rolling benchmark metrics.
+The cumulative-sum kernel is checked against the former per-window loop over
+the analyzer's own beta, alpha, information ratio and tracking error helpers.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+from scripts.metrics.alpha_beta import AlphaBetaAnalyzer, rolling_benchmark_metrics
+
+WINDOW = 60
+
+
+def market_returns(seed, n_obs=400, n_strategies=4):
+    """Benchmark returns and strategies with differing betas and drifts."""
+    rng = np.random.default_rng(seed)
+    benchmark = rng.normal(0.0004, 0.011, n_obs)
+    betas = rng.uniform(0.3, 1.6, n_strategies)
+    noise = rng.normal(0.0, 0.006, (n_obs, n_strategies))
+    strategies = 0.0002 + benchmark[:, None] * betas + noise
+    return strategies, benchmark
+
+
+def per_window_loop(analyzer, strategy, benchmark, window, daily_rf):
+    """The per-window .iloc loop calculate_rolling_metrics used to run."""
+    strategy_excess = pd.Series(strategy) - daily_rf
+    benchmark_excess = pd.Series(benchmark) - daily_rf
+    expected = {name: [] for name in ('beta', 'alpha', 'information_ratio', 'tracking_error', 'correlation')}
+    for i in range(window, len(strategy_excess)):
+        window_strategy = strategy_excess.iloc[i - window:i]
+        window_benchmark = benchmark_excess.iloc[i - window:i]
+        if window_strategy.isna().any():
+            for values in expected.values():
+                values.append(np.nan)
+            continue
+        beta = analyzer._calculate_beta(window_strategy, window_benchmark)
+        expected['beta'].append(beta)
+        expected['alpha'].append(analyzer._calculate_alpha(window_strategy, window_benchmark, beta))
+        expected['information_ratio'].append(
+            analyzer._calculate_information_ratio(window_strategy, window_benchmark))
+        expected['tracking_error'].append(
+            analyzer._calculate_tracking_error(window_strategy, window_benchmark))
+        expected['correlation'].append(window_strategy.corr(window_benchmark))
+    return {name: np.array(values) for name, values in expected.items()}
+
+
+class TestRollingBenchmarkMetrics(unittest.TestCase):
+    """Test cases comparing the kernel with the per-window loop."""
+
+    def setUp(self):
+        """Set up returns and the analyzer's daily risk-free rate."""
+        self.analyzer = AlphaBetaAnalyzer(risk_free_rate=0.03)
+        self.daily_rf = (1 + 0.03) ** (1 / 252) - 1
+        self.strategies, self.benchmark = market_returns(0)
+
+    def assertMatchesLoop(self, metrics, strategy):
+        expected = per_window_loop(self.analyzer, strategy, self.benchmark, WINDOW, self.daily_rf)
+        for name, values in expected.items():
+            np.testing.assert_allclose(metrics[name], values, rtol=1e-10, atol=1e-13, err_msg=name)
+
+    def test_matches_per_window_loop(self):
+        """Test every metric of a single strategy against the loop."""
+        strategy = self.strategies[:, 0]
+        metrics = rolling_benchmark_metrics(strategy, self.benchmark, WINDOW, self.daily_rf)
+
+        self.assertEqual(metrics['beta'].shape, (len(strategy) - WINDOW,))
+        self.assertMatchesLoop(metrics, strategy)
+
+    def test_two_dimensional_input(self):
+        """Test each column of an (n, k) input equals its own 1-D run."""
+        metrics = rolling_benchmark_metrics(self.strategies, self.benchmark, WINDOW, self.daily_rf)
+
+        for j in range(self.strategies.shape[1]):
+            with self.subTest(strategy=j):
+                single = rolling_benchmark_metrics(self.strategies[:, j], self.benchmark, WINDOW, self.daily_rf)
+                for name, values in single.items():
+                    self.assertEqual(metrics[name].shape, (len(self.benchmark) - WINDOW, self.strategies.shape[1]))
+                    np.testing.assert_allclose(metrics[name][:, j], values, rtol=1e-10, atol=1e-13, err_msg=name)
+                self.assertMatchesLoop({name: values[:, j] for name, values in metrics.items()},
+                                       self.strategies[:, j])
+
+    def test_windows_with_nan(self):
+        """Test windows containing a missing return are NaN and the rest still match."""
+        strategies = self.strategies.copy()
+        strategies[[100, 250], 1] = np.nan
+        metrics = rolling_benchmark_metrics(strategies, self.benchmark, WINDOW, self.daily_rf)
+
+        # Row i covers returns [i, i + WINDOW)
+        rows = np.arange(len(self.benchmark) - WINDOW)
+        hit = ((rows <= 100) & (100 < rows + WINDOW)) | ((rows <= 250) & (250 < rows + WINDOW))
+        for name, values in metrics.items():
+            np.testing.assert_array_equal(np.isnan(values[:, 1]), hit, err_msg=name)
+            self.assertFalse(np.isnan(values[:, [0, 2, 3]]).any(), msg=name)
+        self.assertMatchesLoop({name: values[:, 1] for name, values in metrics.items()}, strategies[:, 1])
+
+    def test_short_input(self):
+        """Test inputs no longer than the window give empty results."""
+        metrics = rolling_benchmark_metrics(self.strategies[:WINDOW], self.benchmark[:WINDOW], WINDOW)
+        self.assertEqual(metrics['beta'].shape, (0, self.strategies.shape[1]))
+
+    def test_calculate_rolling_metrics(self):
+        """Test the analyzer's Series and DataFrame paths against the loop."""
+        index = pd.bdate_range('2022-01-03', periods=len(self.benchmark))
+        frame = pd.DataFrame(self.strategies, index=index, columns=list('ABCD'))
+        benchmark = pd.Series(self.benchmark, index=index)
+
+        series_result = self.analyzer.calculate_rolling_metrics(frame['A'], benchmark, window=WINDOW)
+        frame_result = self.analyzer.calculate_rolling_metrics(frame, benchmark, window=WINDOW)
+        expected = per_window_loop(self.analyzer, self.strategies[:, 0], self.benchmark, WINDOW, self.daily_rf)
+
+        self.assertTrue(series_result['rolling_beta'].index.equals(index[WINDOW:]))
+        for name in ('beta', 'alpha', 'information_ratio', 'tracking_error', 'correlation'):
+            np.testing.assert_allclose(series_result[f'rolling_{name}'].to_numpy(), expected[name],
+                                       rtol=1e-10, atol=1e-13, err_msg=name)
+            pd.testing.assert_series_equal(frame_result[f'rolling_{name}']['A'], series_result[f'rolling_{name}'],
+                                           check_names=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Auto-Scaling Manager - worker sizing decisions.
+Redis and docker are replaced with mocks.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Import the modules to test
+import sys
+sys.path.append('scripts')
+from auto_scaling_manager import AutoScalingManager, JobTypeStats
+
+
+class TestAutoScalingManager(unittest.TestCase):
+    """Test cases for scaling decisions."""
+
+    def setUp(self):
+        """Set up a manager with two running workers."""
+        patcher = patch.object(AutoScalingManager, '_get_current_worker_count', return_value=2)
+        self.worker_count = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.manager = AutoScalingManager(
+            min_workers=1,
+            max_workers=10,
+            target_drain_seconds=300.0,
+            scale_down_margin=0.25,
+            scale_up_cooldown=60.0,
+            scale_down_cooldown=300.0,
+            rate_smoothing=1.0,
+            queues={'backtest': 'backtest_jobs'},
+        )
+        self.manager.redis = MagicMock()
+        self.pipe = self.manager.redis.pipeline.return_value
+
+    def _stats(self, queue_length=0, arrival_rate=0.0, duration=60.0):
+        return {'backtest': JobTypeStats(queue_length=queue_length, arrival_rate=arrival_rate,
+                                         duration_mean=duration, duration_p95=duration,
+                                         duration_samples=10)}
+
+    def test_scale_up_to_drain_backlog(self):
+        """Test backlog work / drain target sets the worker count."""
+        # 30 jobs x 60s = 1800s of work, drained in 300s -> 6 workers
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=30), now=1000.0)
+        self.assertEqual(decision['required_workers'], 6)
+        self.assertEqual(decision['target_workers'], 6)
+        self.assertEqual(decision['action'], 'scale_up')
+
+    def test_arrivals_add_steady_state_load(self):
+        """Test arrival rate x mean duration is covered on top of the backlog."""
+        decision = self.manager._calculate_target_workers(
+            self._stats(queue_length=10, arrival_rate=0.05), now=1000.0
+        )
+        # 10 * 60 / 300 + 0.05 * 60 = 5 workers
+        self.assertEqual(decision['required_workers'], 5)
+
+    def test_p95_wait_target(self):
+        """Test a p95 wait target tighter than the drain target adds workers."""
+        self.manager.target_p95_wait_seconds = 100.0
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=20), now=1000.0)
+        # max(20 * 60 / 300, 0.95 * 20 * 60 / 100) = 11.4 -> 12, capped at max_workers
+        self.assertEqual(decision['required_workers'], 10)
+
+        self.manager.target_p95_wait_seconds = 400.0
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=20), now=1000.0)
+        # max(4.0, 2.85) -> 4
+        self.assertEqual(decision['required_workers'], 4)
+
+    def test_scale_up_cooldown(self):
+        """Test scale-ups wait for the up cool-down after a scaling action."""
+        self.manager._last_scale_time = 980.0
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=30), now=1000.0)
+        self.assertEqual(decision['action'], 'hold')
+        self.assertEqual(decision['reason'], 'scale_up_cooldown')
+        self.assertEqual(decision['target_workers'], 2)
+
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=30), now=1041.0)
+        self.assertEqual(decision['action'], 'scale_up')
+
+    def test_scale_down_hysteresis(self):
+        """Test small drops in demand stay inside the hysteresis band."""
+        self.manager.current_workers = 8
+        # 35 * 60 / 300 = 7 workers, within 25% of 8
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=35), now=1000.0)
+        self.assertEqual(decision['action'], 'hold')
+        self.assertEqual(decision['reason'], 'hysteresis')
+
+        # 20 * 60 / 300 = 4 workers, below the band
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=20), now=1000.0)
+        self.assertEqual(decision['action'], 'scale_down')
+        self.assertEqual(decision['target_workers'], 4)
+
+    def test_scale_down_cooldown(self):
+        """Test scale-downs wait for the longer down cool-down."""
+        self.manager.current_workers = 8
+        self.manager._last_scale_time = 900.0
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=5), now=1000.0)
+        self.assertEqual(decision['reason'], 'scale_down_cooldown')
+
+        decision = self.manager._calculate_target_workers(self._stats(queue_length=5), now=1201.0)
+        self.assertEqual(decision['action'], 'scale_down')
+        self.assertEqual(decision['target_workers'], 1)
+
+    def test_min_workers_without_demand(self):
+        """Test an idle system scales down to min_workers, never below."""
+        self.manager.current_workers = 4
+        decision = self.manager._calculate_target_workers(self._stats(), now=1000.0)
+        self.assertEqual(decision['target_workers'], 1)
+
+    def test_arrivals_from_enqueue_counter(self):
+        """Test arrivals come from the enqueued counter, not from completions."""
+        # queue length, enqueued, completed, durations
+        self.pipe.execute.side_effect = [
+            [100, '500', '10', ['60'] * 10],
+            [160, '560', '10', ['60'] * 10],  # 60 new jobs in 60s, none completed
+        ]
+        self.manager._collect_stats(now=0.0)
+        stats = self.manager._collect_stats(now=60.0)
+
+        self.assertAlmostEqual(stats['backtest'].arrival_rate, 1.0)
+        self.assertAlmostEqual(stats['backtest'].completion_rate, 0.0)
+        self.assertEqual(stats['backtest'].queue_length, 160)
+        self.assertAlmostEqual(stats['backtest'].duration_p95, 60.0)
+
+    def test_evaluate_replaces_lost_workers(self):
+        """Test every cycle re-reads docker so crashed workers are replaced."""
+        self.pipe.execute.return_value = [20, '0', '0', ['60'] * 10]  # needs 4 workers
+        self.manager.current_workers = 4
+        self.worker_count.return_value = 1  # three containers died
+
+        decision = self.manager.evaluate(now=1000.0)
+        self.assertEqual(decision['current_workers'], 1)
+        self.assertEqual(decision['target_workers'], 4)
+        self.assertEqual(decision['action'], 'scale_up')
+
+    def test_evaluate_keeps_count_when_docker_unavailable(self):
+        """Test a failed docker query keeps the last known worker count."""
+        self.pipe.execute.return_value = [0, '0', '0', []]
+        self.manager.current_workers = 3
+        self.worker_count.return_value = None
+
+        decision = self.manager.evaluate(now=1000.0)
+        self.assertEqual(decision['current_workers'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
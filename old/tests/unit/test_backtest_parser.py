@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Backtest Parser - custom analyzers through a real Cerebro run.
+Parsed equity, monthly returns and trades are checked against per-bar values
+recorded by a plain analyzer and against Backtrader's TradeAnalyzer.
+"""
+
+import unittest
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+from scripts.backtest_parser import BacktraderResultParser
+from scripts.backtrader_analyzers import (
+    PYARROW_AVAILABLE, CommissionAnalyzer, EquityCurveAnalyzer, IBPerformanceAnalyzer,
+    MonthlyReturnsAnalyzer, TradeLogAnalyzer
+)
+
+
+class SmaCross(bt.Strategy):
+    """Long while the fast SMA is above the slow SMA."""
+
+    params = (('fast', 5), ('slow', 20))
+
+    def __init__(self):
+        self.crossover = bt.indicators.CrossOver(
+            bt.indicators.SMA(period=self.p.fast), bt.indicators.SMA(period=self.p.slow)
+        )
+
+    def next(self):
+        if not self.position and self.crossover > 0:
+            self.buy(size=50)
+        elif self.position and self.crossover < 0:
+            self.close()
+
+
+class ValueRecorder(bt.Analyzer):
+    """Datetime, value and cash of every bar as plain lists."""
+
+    def __init__(self):
+        self.rows = []
+
+    def next(self):
+        broker = self.strategy.broker
+        self.rows.append((self.strategy.datetime.datetime(0), broker.getvalue(), broker.getcash()))
+
+    def get_analysis(self):
+        return self.rows
+
+
+def price_frame(seed=0, n_days=300):
+    """Random-walk daily OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, n_days)))
+    return pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.002, n_days)),
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': 1000.0,
+    }, index=pd.bdate_range('2023-01-02', periods=n_days))
+
+
+def run_cerebro(arrow=False):
+    """Run SmaCross with the custom analyzers under their run_backtest names."""
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.PandasData(dataname=price_frame()), name='TEST')
+    cerebro.addstrategy(SmaCross)
+    cerebro.broker.setcash(100000.0)
+    cerebro.broker.setcommission(commission=0.001)
+    cerebro.addanalyzer(IBPerformanceAnalyzer, _name='ibperformance', arrow=arrow)
+    cerebro.addanalyzer(CommissionAnalyzer, _name='commission')
+    cerebro.addanalyzer(EquityCurveAnalyzer, _name='equity', arrow=arrow)
+    cerebro.addanalyzer(MonthlyReturnsAnalyzer, _name='monthly', arrow=arrow)
+    cerebro.addanalyzer(TradeLogAnalyzer, _name='tradelog', arrow=arrow)
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+    cerebro.addanalyzer(ValueRecorder, _name='_recorder')
+    return cerebro.run()
+
+
+def parse(results):
+    result = BacktraderResultParser().parse_cerebro_results(
+        results, 'bt-1', 'SmaCross', ['TEST'], '2023-01-02', '2024-02-23'
+    )
+    result.pop('parsed_at')
+    return result
+
+
+class TestBacktraderResultParser(unittest.TestCase):
+    """Test cases for parsing custom analyzers after cerebro.run()."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Run the backtest once for all tests."""
+        cls.results = run_cerebro()
+        cls.strategy = cls.results[0]
+        cls.result = parse(cls.results)
+        cls.recorded = cls.strategy.analyzers._recorder.get_analysis()
+
+    def test_equity_curve(self):
+        """Test the parsed equity curve matches the value of every bar."""
+        self.assertEqual(self.result['equity_curve'], [
+            {'datetime': dt.isoformat(), 'value': value} for dt, value, _ in self.recorded
+        ])
+        self.assertEqual(self.result['final_value'], self.recorded[-1][1])
+
+    def test_monthly_returns(self):
+        """Test monthly returns run from each month's first to last bar."""
+        values = pd.Series([v for _, v, _ in self.recorded], index=[dt for dt, _, _ in self.recorded])
+        months = values.groupby([values.index.year, values.index.month])
+        expected = pd.DataFrame({'start_value': months.first(), 'end_value': months.last()})
+
+        monthly = self.result['monthly_returns']
+        self.assertEqual([(row['year'], row['month']) for row in monthly], list(expected.index))
+        for row, (_, month) in zip(monthly, expected.iterrows()):
+            self.assertAlmostEqual(row['start_value'], month['start_value'])
+            self.assertAlmostEqual(row['end_value'], month['end_value'])
+            self.assertAlmostEqual(row['return'], (month['end_value'] / month['start_value'] - 1) * 100)
+
+    def test_trades(self):
+        """Test parsed trades agree with Backtrader's TradeAnalyzer."""
+        trade_analysis = self.strategy.analyzers.trades.get_analysis()
+        trades = self.result['trades']
+        self.assertGreater(len(trades), 0)
+        self.assertEqual(len(trades), trade_analysis.total.closed)
+        self.assertAlmostEqual(sum(t['pnl_net'] for t in trades), trade_analysis.pnl.net.total)
+        self.assertEqual(self.result['metrics']['total_trades'], trade_analysis.total.total)
+
+        # The trade log analyzer records the same trades
+        logged = BacktraderResultParser()._parse_trades({
+            'tradelog': self.strategy.analyzers.tradelog.get_analysis()
+        })
+        self.assertEqual([t['pnl_net'] for t in logged], [round(t['pnl_net'], 2) for t in trades])
+        self.assertEqual([t['exit_date'] for t in logged], [t['exit_date'] for t in trades])
+        self.assertEqual(self.result['commissions']['total'],
+                         self.strategy.analyzers.commission.get_analysis()['total_commission'])
+
+    def test_previous_analysis_keys(self):
+        """Test the per-bar lists of earlier analyzer versions are still exposed."""
+        dates, values, cash = (np.array(column) for column in zip(*self.recorded))
+
+        equity = self.strategy.analyzers.equity
+        analysis = equity.get_analysis()
+        np.testing.assert_array_equal(analysis['dates'], dates.astype('datetime64[ms]'))
+        np.testing.assert_array_equal(analysis['values'], values)
+        np.testing.assert_array_equal(analysis['cash'], cash)
+        np.testing.assert_array_equal(equity.values, values)
+        np.testing.assert_array_equal(equity.cash, cash)
+        self.assertEqual(len(equity.dates), analysis['bar_count'])
+
+        np.testing.assert_allclose(self.strategy.analyzers.ibperformance.daily_returns,
+                                   np.diff(values) / values[:-1])
+
+        monthly = self.strategy.analyzers.monthly.get_analysis()['monthly_returns_dict']
+        for row in self.result['monthly_returns']:
+            self.assertEqual(monthly[(row['year'], row['month'])], {
+                'start_value': row['start_value'], 'end_value': row['end_value'], 'return': row['return']
+            })
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_arrow_tables_parse_the_same(self):
+        """Test analyzers returning pyarrow Tables parse to the same result."""
+        self.assertEqual(parse(run_cerebro(arrow=True)), self.result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,7 +15,7 @@ from pathlib import Path
 # Import the modules to test
 import sys
 sys.path.append('scripts')
-from correlation_analyzer import CorrelationAnalyzer
+from correlation_analyzer import CorrelationAnalyzer, BlockwiseCorrelationEngine
 
 
 class TestCorrelationAnalyzer(unittest.TestCase):
@@ -149,6 +149,23 @@ class TestCorrelationAnalyzer(unittest.TestCase):
         self.assertIn('Uncorrelated', selected)
         self.assertEqual(len(selected), 2)
 
+    def test_greedy_selection_with_nan_correlations(self):
+        """A constant returns column (NaN correlations) does not block later candidates."""
+        analyzer = CorrelationAnalyzer(threshold=0.7)
+        returns = pd.DataFrame({
+            'A': np.random.normal(0, 0.01, 50),
+            'B': np.zeros(50),  # Constant: correlations are NaN
+            'C': np.random.normal(0, 0.01, 50),
+        })
+        corr = returns.corr()
+        self.assertTrue(corr['B'].isna().all())
+
+        selected = analyzer._greedy_diversity_selection(['A', 'B', 'C'], corr)
+        self.assertEqual(selected, ['A', 'B', 'C'])
+
+        engine_selected = analyzer._greedy_diversity_selection(['A', 'B', 'C'], analyzer.create_engine(returns))
+        self.assertEqual(engine_selected, ['A', 'B', 'C'])
+
     def test_get_correlation_summary(self):
         """Test correlation summary generation."""
         analyzer = CorrelationAnalyzer(threshold=0.7)
@@ -285,5 +302,80 @@ class TestCorrelationAnalyzer(unittest.TestCase):
         self.assertEqual(score, 0.0)
 
 
+class TestBlockwiseCorrelationEngine(unittest.TestCase):
+    """Test cases for BlockwiseCorrelationEngine."""
+
+    def setUp(self):
+        """Set up a returns matrix with clustered strategies."""
+        rng = np.random.default_rng(7)
+        factors = rng.normal(size=(120, 4))
+        loadings = rng.integers(0, 4, 30)
+        self.returns = pd.DataFrame(
+            factors[:, loadings] + rng.normal(scale=0.5, size=(120, 30)),
+            columns=[f'strategy_{i}' for i in range(30)]
+        )
+
+    def test_blocks_match_dense_correlation(self):
+        """Blockwise float32 correlations match pandas."""
+        engine = BlockwiseCorrelationEngine(self.returns, block_size=7)
+        np.testing.assert_allclose(engine.dense_matrix().values, self.returns.corr().values, atol=1e-5)
+
+    def test_memmap_input(self):
+        """A .npy path is opened memory-mapped and standardized to a scratch file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'returns.npy')
+            np.save(path, self.returns.to_numpy(dtype=np.float32))
+            engine = BlockwiseCorrelationEngine(path, block_size=8,
+                                                scratch_path=os.path.join(tmp, 'z.npy'))
+            self.assertIsInstance(engine.z, np.memmap)
+            np.testing.assert_allclose(engine.dense_matrix().values, self.returns.corr().values, atol=1e-5)
+            del engine
+
+    def test_top_k_neighbors(self):
+        """Streamed top-k neighbours equal the k largest |correlations| per row."""
+        engine = BlockwiseCorrelationEngine(self.returns, block_size=8)
+        indices, values = engine.top_k_neighbors(k=3)
+
+        dense = self.returns.corr().to_numpy(copy=True)
+        np.fill_diagonal(dense, 0.0)
+        expected = np.sort(np.argsort(-np.abs(dense), axis=1)[:, :3], axis=1)
+        np.testing.assert_array_equal(np.sort(indices, axis=1), expected)
+        np.testing.assert_allclose(values, np.take_along_axis(dense, indices, axis=1), atol=1e-5)
+
+    def test_greedy_selection_matches_dense(self):
+        """Greedy selection is identical on the engine and the dense matrix."""
+        analyzer = CorrelationAnalyzer(threshold=0.5, block_size=8)
+        rankings = pd.DataFrame({'strategy': self.returns.columns})
+
+        dense_selected = analyzer._greedy_diversity_selection(rankings, self.returns.corr())
+        engine_selected = analyzer._greedy_diversity_selection(rankings, analyzer.create_engine(self.returns))
+
+        self.assertEqual(dense_selected, engine_selected)
+        self.assertLess(len(dense_selected), len(rankings))
+
+    def test_find_clusters(self):
+        """Connected components cover every strategy exactly once."""
+        engine = BlockwiseCorrelationEngine(self.returns, block_size=8)
+        clusters = engine.find_clusters(cluster_threshold=0.6)
+
+        members = [name for cluster in clusters for name in cluster]
+        self.assertEqual(sorted(members), sorted(self.returns.columns))
+        self.assertGreater(len(clusters[0]), 1)
+
+    def test_cluster_threshold_zero(self):
+        """An explicit threshold of 0.0 is not replaced by the analyzer default."""
+        analyzer = CorrelationAnalyzer(cluster_threshold=0.99, block_size=8)
+        engine = analyzer.create_engine(self.returns)
+
+        self.assertEqual(len(analyzer.find_correlation_clusters(engine)), 30)
+        self.assertEqual(analyzer.find_correlation_clusters(engine, cluster_threshold=0.0),
+                         [sorted(self.returns.columns)])
+
+    def test_kendall_not_supported(self):
+        """Kendall has no matrix-product form."""
+        with self.assertRaises(ValueError):
+            BlockwiseCorrelationEngine(self.returns, method='kendall')
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
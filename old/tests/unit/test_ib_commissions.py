@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for IB Commissions - batch commission and slippage methods and the
+cost_config.yaml cache. Batch results are checked against the per-fill
+_getcommission / get_slippage paths Backtrader calls.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+# Import the modules to test
+from scripts.ib_commissions import (
+    IBCommissionBase, IBCommissionPro, IBCommissionStandard, IBSlippageModel,
+    load_commission_from_config, load_cost_config
+)
+
+TIERS = ((300, 0.0035), (3000, 0.002), (20000, 0.0015))
+
+
+def per_fill(commission, sizes, prices):
+    return np.array([commission._getcommission(size, price, False) for size, price in zip(sizes, prices)])
+
+
+class TestCommissions(unittest.TestCase):
+    """Test cases comparing commissions() with _getcommission."""
+
+    def _check(self, commission, sizes, prices):
+        sizes = np.asarray(sizes, dtype=float)
+        prices = np.broadcast_to(np.asarray(prices, dtype=float), sizes.shape)
+        expected = per_fill(commission, sizes, prices)
+        np.testing.assert_allclose(commission.commissions(sizes, prices), expected, rtol=1e-15, atol=0)
+        return expected
+
+    def test_buys_and_sells(self):
+        """Test random buys and sells for both schemes, sells paying the SEC fee."""
+        rng = np.random.default_rng(0)
+        sizes = rng.integers(1, 50000, 500) * rng.choice([-1, 1], 500)
+        prices = rng.uniform(0.5, 900, 500)
+        for commission in (IBCommissionStandard(), IBCommissionPro()):
+            with self.subTest(scheme=type(commission).__name__):
+                expected = self._check(commission, sizes, prices)
+                buys = commission.commissions(np.abs(sizes), prices)
+                sells = commission.commissions(-np.abs(sizes), prices)
+                np.testing.assert_allclose(sells - buys, np.abs(sizes) * prices * commission._sec_rate)
+                self.assertIsInstance(commission._getcommission(100, 10.0, False), float)
+                self.assertIsInstance(commission._getcommission(np.int64(100), np.float64(10.0), False), float)
+                self.assertEqual(len(expected), 500)
+
+    def test_minimum_and_maximum_clamps(self):
+        """Test the per-order minimum and the maximum rate of trade value."""
+        commission = IBCommissionStandard()
+        # 10 shares at $50: $0.05 raised to the $1.00 minimum
+        # 10 shares at $5: minimum capped at 1% of $50
+        # 1000 shares at $0.10: $5.00 capped at 1% of $100
+        sizes = [10, 10, 1000, -1000, 10000]
+        prices = [50.0, 5.0, 0.10, 0.10, 20.0]
+        expected = self._check(commission, sizes, prices)
+        np.testing.assert_allclose(expected[:3], [1.00, 0.50, 1.00])
+        self.assertAlmostEqual(expected[3], 1.00 + 100 * commission._sec_rate)
+        self.assertAlmostEqual(expected[4], 50.0)
+
+    def test_tier_boundaries(self):
+        """Test an order of exactly min_shares pays that tier's rate."""
+        commission = IBCommissionBase(commission_per_share=0.005, minimum_commission=0.0, tiers=TIERS)
+        sizes = [1, 299, 300, 301, 2999, 3000, 3001, 19999, 20000, 50000]
+        rates = [0.005, 0.005, 0.0035, 0.0035, 0.0035, 0.002, 0.002, 0.002, 0.0015, 0.0015]
+        expected = self._check(commission, sizes, 100.0)
+        np.testing.assert_allclose(expected, np.array(sizes) * rates)
+        self._check(commission, -np.array(sizes), 100.0)
+        for size, rate in zip(sizes, rates):
+            self.assertEqual(commission._per_share_rate(size), rate)
+
+    def test_tiers_from_config(self):
+        """Test tiers loaded from cost_config.yaml price like the per-fill path."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        path = Path(temp_dir) / 'cost_config.yaml'
+        path.write_text(yaml.safe_dump({'tiered': {
+            'commission_per_share': 0.005, 'minimum_commission': 0.35,
+            'maximum_commission_rate': 0.01, 'sec_fee_rate': 0.0000278,
+            'tiers': [{'min_shares': shares, 'commission_per_share': rate} for shares, rate in TIERS],
+        }}))
+        commission = load_commission_from_config('tiered', path)
+        self.assertIs(type(commission), IBCommissionBase)
+        self._check(commission, [100, 300, -3000, 20000, -25000], [10.0, 10.0, 10.0, 10.0, 10.0])
+
+
+class TestSlippage(unittest.TestCase):
+    """Test cases for batch slippage."""
+
+    def setUp(self):
+        self.model = IBSlippageModel(market_order_bps=5, limit_order_bps=1)
+
+    def test_slippage_batch_matches_scalar(self):
+        """Test per-order market/limit flags against get_slippage."""
+        prices = np.array([10.0, 250.0, 99.5, 1.25])
+        market = np.array([True, False, True, False])
+        expected = [self.model.get_slippage(p, m) for p, m in zip(prices, market)]
+        np.testing.assert_allclose(self.model.get_slippage_batch(prices, market), expected)
+        np.testing.assert_allclose(self.model.get_slippage_batch(prices), prices * 0.0005)
+
+    def test_fill_prices_move_against_the_trader(self):
+        """Test buys fill higher, sells lower and zero sizes at the order price."""
+        prices = np.array([100.0, 100.0, 100.0, 50.0])
+        sizes = np.array([10, -10, 0, -5])
+        fills = self.model.fill_prices(prices, sizes)
+        np.testing.assert_allclose(fills, [100.05, 99.95, 100.0, 49.975])
+        np.testing.assert_allclose(self.model.fill_prices(prices, sizes, False), [100.01, 99.99, 100.0, 49.995])
+
+
+class TestLoadCostConfig(unittest.TestCase):
+    """Test cases for the cost_config.yaml cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.path = Path(self.temp_dir) / 'cost_config.yaml'
+
+    def _write(self, minimum, mtime):
+        self.path.write_text(yaml.safe_dump({'ib_standard': {'minimum_commission': minimum}}))
+        os.utime(self.path, (mtime, mtime))
+
+    def test_reread_when_mtime_changes(self):
+        """Test the file is parsed once per modification time."""
+        self._write(1.0, 1_000_000)
+        first = load_cost_config(self.path)
+        self.assertIs(load_cost_config(str(self.path)), first)
+
+        # Same modification time: still the cached parse
+        self._write(2.0, 1_000_000)
+        self.assertIs(load_cost_config(self.path), first)
+
+        self._write(3.0, 1_000_001)
+        self.assertEqual(load_cost_config(self.path)['ib_standard']['minimum_commission'], 3.0)
+        self.assertEqual(first['ib_standard']['minimum_commission'], 1.0)
+
+    def test_missing_file(self):
+        """Test a missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            load_cost_config(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
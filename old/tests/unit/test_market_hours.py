@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Market Hours - trading calendar range, extension and the
+calendar-based data quality checks.
+"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+from scripts.data_quality_check import DataValidator
+from scripts.utils.market_hours import (
+    CALENDAR_CACHE_DIR, MarketHours, TradingCalendar, us_market_holidays,
+)
+
+
+def brute_force_sessions(year):
+    """Weekdays of a year that are not market holidays."""
+    holidays = set(us_market_holidays(year))
+    day, sessions = date(year, 1, 1), []
+    while day.year == year:
+        if day.weekday() < 5 and day not in holidays:
+            sessions.append(day)
+        day += timedelta(days=1)
+    return sessions
+
+
+class TestTradingCalendar(unittest.TestCase):
+    """Test cases for lazily extended calendars."""
+
+    def setUp(self):
+        """Set up a small uncached calendar."""
+        self.calendar = TradingCalendar(start_year=2020, end_year=2021, cache_dir=None)
+
+    def test_extends_forward_for_dates(self):
+        """Test a date after the range is answered instead of returning None."""
+        self.assertIsNone(self.calendar.session_index(date(2045, 7, 4)))  # Independence Day
+        self.assertIsNotNone(self.calendar.session_index(date(2045, 7, 5)))
+        self.assertEqual(self.calendar.end_year, 2045)
+
+        sessions = self.calendar.sessions_between('2045-01-01', '2045-12-31')
+        self.assertEqual(list(sessions.astype(object)), brute_force_sessions(2045))
+
+        # Lookups inside the original range still work after the rebuild
+        self.assertIsNotNone(self.calendar.session_index(date(2020, 3, 2)))
+
+    def test_extends_backward_for_arrays(self):
+        """Test vectorized lookups before the range extend the calendar."""
+        result = self.calendar.is_session(['1985-12-25', '1985-12-26', '2021-12-27'])
+        self.assertEqual(result.tolist(), [False, True, True])
+        self.assertEqual(self.calendar.start_year, 1985)
+        self.assertEqual(self.calendar.count_sessions('1985-12-20', '1986-01-03')[0], 8)
+
+    def test_next_open_past_range(self):
+        """Test next_open after the last built session finds the next year's open."""
+        after_close = pd.Timestamp('2021-12-31 17:00', tz='America/New_York')
+        next_open = self.calendar.next_open(after_close)[0]
+        self.assertEqual(pd.Timestamp(next_open, unit='s', tz='America/New_York'),
+                         pd.Timestamp('2022-01-03 09:30', tz='America/New_York'))
+
+    def test_unbuildable_years(self):
+        """Test years beyond pandas timestamps stay sessionless without building."""
+        self.assertIsNone(self.calendar.session_index(date(3000, 1, 2)))
+        self.assertEqual(self.calendar.end_year, 2021)
+
+    def test_cache_dir_is_not_cwd_relative(self):
+        """Test the default cache directory does not depend on the working directory."""
+        self.assertTrue(Path(CALENDAR_CACHE_DIR).is_absolute())
+
+
+class TestMarketHours(unittest.TestCase):
+    """Test cases for MarketHours beyond the default calendar range."""
+
+    def setUp(self):
+        """Set up market hours from the live trading config."""
+        self.market_hours = MarketHours('config/live_trading_config.yaml')
+
+    def test_dates_after_default_range(self):
+        """Test open/close times exist for sessions after 2040."""
+        self.assertTrue(self.market_hours.is_trading_day(date(2050, 6, 1)))
+        self.assertFalse(self.market_hours.is_trading_day(date(2050, 12, 26)))  # Christmas observed
+        open_time = self.market_hours.get_market_open_time(date(2050, 6, 1))
+        self.assertEqual((open_time.hour, open_time.minute), (9, 30))
+        self.assertTrue(self.market_hours.is_trading_hours(datetime(2050, 6, 1, 10, 0)))
+
+
+class TestDataQualityCalendarChecks(unittest.TestCase):
+    """Test cases for calendar-based missing date and gap checks."""
+
+    def setUp(self):
+        """Set up a validator on a temporary data directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.validator = DataValidator(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_no_dates(self):
+        """Test frames without usable dates report nothing instead of raising."""
+        for df in (pd.DataFrame({'date': []}),
+                   pd.DataFrame({'date': [None, None], 'close': [1.0, 2.0]})):
+            self.assertEqual(self.validator.check_missing_dates(df, 'TEST'), (0, []))
+            self.assertEqual(self.validator.check_gaps(df), (0, []))
+
+    def test_holidays_are_not_missing(self):
+        """Test missing dates and gaps are counted in trading sessions."""
+        sessions = [str(d) for d in brute_force_sessions(2021)]
+        df = pd.DataFrame({'date': sessions[:20] + sessions[30:]})
+
+        count, missing = self.validator.check_missing_dates(df, 'TEST')
+        self.assertEqual(count, 10)
+        self.assertEqual(missing, sessions[20:30])
+
+        gaps, details = self.validator.check_gaps(df, max_gap_days=5)
+        self.assertEqual(gaps, 1)
+        self.assertEqual(details[0], (sessions[19], sessions[30], 11))
+
+
+if __name__ == '__main__':
+    unittest.main()
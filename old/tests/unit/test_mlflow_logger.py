@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for MLflow Backtest Logger - batched and asynchronous trial logging.
+Runs against a local file-store tracking URI.
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import backtrader as bt
+
+# The file store is in maintenance mode in recent MLflow releases
+os.environ.setdefault("MLFLOW_ALLOW_FILE_STORE", "true")
+
+# Import the modules to test
+import sys
+sys.path.append('scripts')
+from mlflow.entities import Metric, Param, RunTag
+from mlflow_logger import (
+    MLflowBacktestLogger,
+    chunk_batch,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_TAGS_PER_BATCH,
+    MAX_ENTITIES_PER_BATCH,
+)
+from scripts.cerebro_optimizer import CerebroOptimizer
+
+
+class SmaCross(bt.Strategy):
+    """Minimal strategy for optimization tests."""
+
+    params = (('fast', 5), ('slow', 20))
+
+    def __init__(self):
+        self.crossover = bt.indicators.CrossOver(
+            bt.indicators.SMA(period=self.p.fast), bt.indicators.SMA(period=self.p.slow)
+        )
+
+    def next(self):
+        if not self.position and self.crossover > 0:
+            self.buy()
+        elif self.position and self.crossover < 0:
+            self.close()
+
+
+class TestChunkBatch(unittest.TestCase):
+    """Test cases for splitting run data into log_batch payloads."""
+
+    def test_chunks_respect_server_limits(self):
+        """Test every chunk fits a single log_batch request and nothing is lost."""
+        metrics = [Metric(f"m{i}", float(i), 0, 0) for i in range(2500)]
+        params = [Param(f"p{i}", str(i)) for i in range(250)]
+        tags = [RunTag(f"t{i}", str(i)) for i in range(30)]
+
+        chunks = list(chunk_batch(metrics, params, tags))
+
+        for m, p, t in chunks:
+            self.assertLessEqual(len(m), MAX_METRICS_PER_BATCH)
+            self.assertLessEqual(len(p) + len(t), MAX_PARAMS_TAGS_PER_BATCH)
+            self.assertLessEqual(len(m) + len(p) + len(t), MAX_ENTITIES_PER_BATCH)
+
+        self.assertEqual(sum(len(m) for m, _, _ in chunks), 2500)
+        self.assertEqual(sum(len(p) for _, p, _ in chunks), 250)
+        self.assertEqual(sum(len(t) for _, _, t in chunks), 30)
+
+    def test_empty(self):
+        """Test no chunks are produced without data."""
+        self.assertEqual(list(chunk_batch([], [], [])), [])
+
+
+class TestMLflowBacktestLogger(unittest.TestCase):
+    """Test cases for trial logging against a file-store tracking URI."""
+
+    def setUp(self):
+        """Set up a temporary tracking store."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tracking_uri = Path(self.temp_dir).as_uri()
+
+    def tearDown(self):
+        """Clean up the tracking store."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _child_runs(self, logger, parent_run_id):
+        experiment_id = logger.client.get_run(parent_run_id).info.experiment_id
+        return logger.client.search_runs(
+            [experiment_id],
+            filter_string=f"tags.`mlflow.parentRunId` = '{parent_run_id}'"
+        )
+
+    def test_sync_child_trial(self):
+        """Test synchronous trial logging returns the child run ID."""
+        logger = MLflowBacktestLogger(tracking_uri=self.tracking_uri)
+        parent_run_id = logger.start_study("test.sync")
+
+        run_id = logger.log_child_trial(
+            parent_run_id,
+            trial_params={"fast": 10, "slow": {"period": 30}},
+            trial_metrics={"sharpe_ratio": 1.5, "bad": float("nan")},
+            trial_number=3
+        )
+
+        run = logger.client.get_run(run_id)
+        self.assertEqual(run.info.status, "FINISHED")
+        self.assertEqual(run.info.run_name, "trial_3")
+        self.assertEqual(run.data.params, {"fast": "10", "slow.period": "30"})
+        self.assertEqual(run.data.metrics, {"sharpe_ratio": 1.5})
+        self.assertEqual(run.data.tags["mlflow.parentRunId"], parent_run_id)
+
+    def test_async_trials_are_batched_and_flushed(self):
+        """Test queued trials (above the per-batch param limit) are all written."""
+        logger = MLflowBacktestLogger(tracking_uri=self.tracking_uri, async_logging=True,
+                                      max_queue_size=4)
+        parent_run_id = logger.start_study("test.async")
+
+        params = {f"p{i}": i for i in range(MAX_PARAMS_TAGS_PER_BATCH + 20)}
+        for trial_number in range(12):
+            self.assertIsNone(logger.log_child_trial(
+                parent_run_id, params, {"value": float(trial_number)}, trial_number
+            ))
+        logger.finish_study(parent_run_id, params={"best_p0": 0},
+                            metrics={"best_objective_value": 11.0})
+        logger.flush()
+
+        runs = self._child_runs(logger, parent_run_id)
+        self.assertEqual(len(runs), 12)
+        for run in runs:
+            self.assertEqual(run.info.status, "FINISHED")
+            self.assertEqual(len(run.data.params), len(params))
+        self.assertEqual(sorted(run.data.metrics["value"] for run in runs),
+                         [float(i) for i in range(12)])
+
+        parent = logger.client.get_run(parent_run_id)
+        self.assertEqual(parent.info.status, "FINISHED")
+        self.assertEqual(parent.data.metrics["best_objective_value"], 11.0)
+        self.assertEqual(logger.writer.failed, 0)
+        logger.close()
+
+    def test_close_drains_queue(self):
+        """Test close() writes trials still waiting in the queue."""
+        logger = MLflowBacktestLogger(tracking_uri=self.tracking_uri, async_logging=True)
+        parent_run_id = logger.start_study("test.drain")
+
+        for trial_number in range(5):
+            logger.log_child_trial(parent_run_id, {"x": trial_number}, {"y": 1.0}, trial_number)
+        logger.close()
+
+        self.assertFalse(logger.writer.running)
+        self.assertEqual(len(self._child_runs(logger, parent_run_id)), 5)
+
+
+class TestCerebroOptimizerLogging(unittest.TestCase):
+    """Test a grid search logged through the batched writer."""
+
+    def setUp(self):
+        """Set up a data directory with one symbol and a tracking store."""
+        self.temp_dir = tempfile.mkdtemp()
+        processed = Path(self.temp_dir, "data", "processed")
+        processed.mkdir(parents=True)
+
+        rng = np.random.default_rng(0)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 250)))
+        pd.DataFrame({
+            "datetime": pd.bdate_range("2023-01-02", periods=250),
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": 1000,
+        }).to_csv(processed / "TEST.csv", index=False)
+
+        self.optimizer = CerebroOptimizer(
+            mlflow_tracking_uri=Path(self.temp_dir, "mlruns").as_uri(),
+            data_dir=str(Path(self.temp_dir, "data"))
+        )
+
+    def tearDown(self):
+        """Clean up data and tracking store."""
+        self.optimizer.mlflow_logger.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_optimization_logs_every_combination(self):
+        """Test each parameter combination becomes a finished child run."""
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)  # results artifact is written to the working directory
+        try:
+            results = self.optimizer.optimize_strategy(
+                SmaCross, {"fast": [5, 10], "slow": [20, 30]}, ["TEST"],
+                "2023-01-01", "2023-12-31", maxcpus=1
+            )
+        finally:
+            os.chdir(cwd)
+
+        self.assertEqual(results["total_combinations"], 4)
+        self.assertEqual(
+            sorted((r["parameters"]["fast"], r["parameters"]["slow"]) for r in results["all_results"]),
+            [(5, 20), (5, 30), (10, 20), (10, 30)]
+        )
+
+        client = self.optimizer.mlflow_logger.client
+        parent = client.search_runs(
+            [e.experiment_id for e in client.search_experiments()],
+            filter_string="tags.optimization_type = 'grid_search'"
+        )
+        self.assertEqual(len(parent), 1)
+        self.assertEqual(parent[0].info.status, "FINISHED")
+        self.assertEqual(parent[0].data.params["total_combinations"], "4")
+
+        children = client.search_runs(
+            [parent[0].info.experiment_id],
+            filter_string=f"tags.`mlflow.parentRunId` = '{parent[0].info.run_id}'"
+        )
+        self.assertEqual(len(children), 4)
+        self.assertTrue(all(run.info.status == "FINISHED" for run in children))
+        self.assertEqual(self.optimizer.mlflow_logger.writer.failed, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Performance Monitor - ring buffers, flushes and summaries.
+Uses a temporary SQLite database.
+"""
+
+import itertools
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Import the modules to test
+from scripts.db_manager import DBManager
+from scripts.utils.performance_monitor import PerformanceMonitor
+
+
+class TestPerformanceMonitor(unittest.TestCase):
+    """Test cases for buffered metrics."""
+
+    def setUp(self):
+        """Set up a monitor on an empty database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = str(Path(self.temp_dir) / 'trades.db')
+        DBManager(self.db_path).create_schema()
+        self.monitor = PerformanceMonitor(db_path=self.db_path, flush_interval=3600)
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.monitor.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _record_in_threads(self, n_threads, samples=3):
+        def work(i):
+            for j in range(samples):
+                self.monitor.record_metric('CPU_USAGE', 'cpu_usage', 10.0 * i + j, '%')
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(n_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _db_rows(self):
+        with DBManager(self.db_path).get_connection() as conn:
+            return [dict(row) for row in conn.execute("SELECT * FROM performance_metrics")]
+
+    def test_dead_thread_buffers_are_retired(self):
+        """Test buffers of exited threads are dropped once their samples are flushed."""
+        self._record_in_threads(5)
+        self.assertEqual(len(self.monitor._buffers), 5)
+        self.assertEqual(self.monitor.get_performance_summary(1)['CPU_USAGE']['count'], 15)
+
+        self.assertEqual(self.monitor.flush(), 1)
+        self.assertEqual(len(self.monitor._buffers), 0)
+        self.assertEqual(json.loads(self._db_rows()[0]['additional_data'])['count'], 15)
+
+        # Live threads keep their buffer
+        self.monitor.record_metric('CPU_USAGE', 'cpu_usage', 1.0, '%')
+        self.monitor.flush()
+        self.assertEqual(len(self.monitor._buffers), 1)
+
+    def test_retired_samples_come_from_database(self):
+        """Test a window reaching back before retired buffers counts each sample once."""
+        # Clock ticks that round up to the next microsecond in the stored window_end
+        now = int(time.time()) + 7e-7
+        ticks = itertools.count()
+        self.monitor.created_at = now - 60
+        with patch('scripts.utils.performance_monitor.time.time', side_effect=lambda: now + 0.001 * next(ticks)):
+            self.monitor.record_metric('CPU_USAGE', 'cpu_usage', 50.0, '%')  # Live buffer, flushed below
+            self._record_in_threads(2)
+            self.monitor.flush()
+            self.monitor.record_metric('CPU_USAGE', 'cpu_usage', 100.0, '%')
+
+            summary = self.monitor.get_performance_summary(1)
+        self.assertEqual(summary['CPU_USAGE']['count'], 8)
+        self.assertEqual(summary['CPU_USAGE']['max'], 100.0)
+        self.assertEqual(summary['CPU_USAGE']['latest'], 100.0)
+
+    def test_new_monitor_summarizes_memory(self):
+        """Test a window longer than the uptime is served from memory when the database has nothing older."""
+        for value in range(1, 101):
+            self.monitor.record_metric('ORDER_LATENCY', 'order_fill', float(value), 'ms')
+
+        summary = self.monitor.get_performance_summary(24)
+        self.assertEqual(summary['ORDER_LATENCY']['count'], 100)
+        self.assertAlmostEqual(summary['ORDER_LATENCY']['p95'], 95.05)
+        self.assertEqual(summary['ORDER_LATENCY']['latest'], 100.0)
+
+    def test_older_database_rows_are_merged(self):
+        """Test rows from before this monitor started are combined with buffered samples."""
+        with DBManager(self.db_path).get_connection() as conn:
+            conn.execute(
+                """INSERT INTO performance_metrics
+                   (timestamp, metric_type, metric_name, metric_value, unit, additional_data)
+                   VALUES (datetime('now', '-2 hours'), 'ORDER_LATENCY', 'order_fill', 10.0, 'ms', ?)""",
+                (json.dumps({'count': 4, 'min': 5.0, 'max': 15.0}),)
+            )
+        self.monitor.record_metric('ORDER_LATENCY', 'order_fill', 20.0, 'ms')
+
+        summary = self.monitor.get_performance_summary(24)['ORDER_LATENCY']
+        self.assertEqual(summary['count'], 5)
+        self.assertAlmostEqual(summary['average'], 12.0)
+        self.assertEqual(summary['min'], 5.0)
+        self.assertEqual(summary['max'], 20.0)
+        self.assertEqual(summary['latest'], 20.0)
+        self.assertNotIn('p95', summary)
+
+        # A window inside the monitor's lifetime ignores the database
+        self.monitor.created_at = time.time() - 3600
+        summary = self.monitor.get_performance_summary(0.5)['ORDER_LATENCY']
+        self.assertEqual(summary['count'], 1)
+        self.assertIn('p95', summary)
+
+    def test_alerts_use_window_max(self):
+        """Test a spike alerts although its flushed window mean is below the threshold."""
+        for value in [50.0] * 9 + [95.0]:
+            self.monitor.record_metric('CPU_USAGE', 'cpu_usage', value, '%')
+        self.monitor.record_metric('MEMORY_USAGE', 'memory_usage', 60.0, '%')
+        self.monitor.flush()
+        self.assertLess(self._db_rows()[0]['metric_value'], self.monitor.thresholds['cpu_usage_percent'])
+
+        # Not flushed yet: checked from the buffer
+        self.monitor.record_metric('ORDER_LATENCY', 'order_fill', 1500.0, 'ms')
+        self.monitor.record_metric('ORDER_LATENCY', 'order_fill', 10.0, 'ms')
+
+        alerts = self.monitor.get_performance_alerts(1)
+        self.assertEqual([(alert['type'], alert['value']) for alert in alerts],
+                         [('HIGH_ORDER_LATENCY', 1500.0), ('HIGH_CPU_USAGE', 95.0)])
+        self.assertEqual(alerts[1]['message'], "CPU usage 95.0% exceeds threshold 80%")
+
+        # Alerting leaves the unflushed samples for the next flush
+        self.assertEqual(self.monitor.flush(), 1)
+        self.assertEqual(len(self.monitor.get_performance_alerts(1)), 2)
+
+    def test_context_is_flushed(self):
+        """Test additional_data reaches the flushed rows of its metric key."""
+        self.monitor.record_data_feed_latency('IB', 250.0)
+        self.monitor.record_data_feed_latency('IB', 260.0)
+        self.monitor.record_backtest_time('momentum', 45.2)
+        self.monitor.record_metric('CPU_USAGE', 'cpu_usage', 10.0, '%')
+        self.monitor.flush()
+
+        stats = {row['metric_type']: json.loads(row['additional_data']) for row in self._db_rows()}
+        self.assertEqual(stats['DATA_FEED_LATENCY']['context'], {'data_source': 'IB'})
+        self.assertEqual(stats['DATA_FEED_LATENCY']['count'], 2)
+        self.assertEqual(stats['BACKTEST_TIME']['context'], {'backtest_name': 'momentum'})
+        self.assertNotIn('context', stats['CPU_USAGE'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for P&L Calculator - vectorized position totals and PnLEngine.
+PnLEngine results are checked against a trade-by-trade lot matcher.
+"""
+
+import unittest
+from collections import deque
+
+import numpy as np
+
+# Import the modules to test
+from scripts.utils.pnl_calculator import PnLCalculator, PnLEngine, Position, Trade
+
+
+def brute_force_pnl(trades, method):
+    """
+    Match trades one at a time, returning realized P&L per trade and the
+    final (position, cost_basis, realized) per symbol.
+    """
+    lots = {}       # symbol -> deque of [signed quantity, price] (fifo)
+    average = {}    # symbol -> [position, cost_basis] (average)
+    realized = {}
+    per_trade = []
+
+    for trade in trades:
+        pnl = 0.0
+        remaining = float(trade.quantity)
+
+        if method == 'fifo':
+            book = lots.setdefault(trade.symbol, deque())
+            while remaining and book and np.sign(book[0][0]) != np.sign(remaining):
+                lot = book[0]
+                matched = min(abs(remaining), abs(lot[0]))
+                pnl += np.sign(lot[0]) * matched * (trade.price - lot[1])
+                lot[0] -= np.sign(lot[0]) * matched
+                remaining -= np.sign(remaining) * matched
+                if lot[0] == 0:
+                    book.popleft()
+            if remaining:
+                book.append([remaining, trade.price])
+        else:
+            state = average.setdefault(trade.symbol, [0.0, 0.0])
+            position, basis = state
+            if position and np.sign(position) != np.sign(remaining):
+                matched = min(abs(remaining), abs(position))
+                average_cost = basis / abs(position)
+                pnl += np.sign(position) * matched * (trade.price - average_cost)
+                basis -= matched * average_cost
+                position -= np.sign(position) * matched
+                remaining -= np.sign(remaining) * matched
+            if remaining:
+                basis += abs(remaining) * trade.price
+                position += remaining
+            state[:] = [position, basis if position else 0.0]
+
+        realized[trade.symbol] = realized.get(trade.symbol, 0.0) + pnl
+        per_trade.append(pnl)
+
+    final = {}
+    for symbol in realized:
+        if method == 'fifo':
+            book = lots[symbol]
+            position = sum(q for q, _ in book)
+            basis = sum(abs(q) * p for q, p in book)
+        else:
+            position, basis = average[symbol]
+        final[symbol] = (position, basis, realized[symbol])
+    return per_trade, final
+
+
+def random_trades(seed, n=300):
+    """Random trades over a few symbols with frequent position flips."""
+    rng = np.random.default_rng(seed)
+    symbols = ['AAA', 'BBB', 'CCC']
+    trades = []
+    for i in range(n):
+        trades.append(Trade(
+            symbol=symbols[rng.integers(len(symbols))],
+            quantity=int(rng.choice([-1, 1]) * rng.integers(1, 40)),
+            price=float(np.round(rng.uniform(50, 150), 2)),
+            commission=float(np.round(rng.uniform(0, 2), 2)),
+            timestamp=f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}",
+        ))
+    return trades
+
+
+class TestPnLEngine(unittest.TestCase):
+    """Test cases comparing PnLEngine with a trade-by-trade matcher."""
+
+    def _check(self, trades, method):
+        engine = PnLEngine(precision=None)
+        fills = engine.fills_from_trades(trades)
+        expected_per_trade, expected = brute_force_pnl(trades, method)
+
+        np.testing.assert_allclose(engine.fill_pnl(fills, method), expected_per_trade,
+                                   rtol=1e-9, atol=1e-6)
+
+        marks = {symbol: 100.0 for symbol in expected}
+        result = engine.reconcile(fills, marks, method)
+        for i, symbol in enumerate(result['symbol']):
+            position, basis, realized = expected[symbol]
+            self.assertAlmostEqual(result['position'][i], position, places=6)
+            self.assertAlmostEqual(result['cost_basis'][i], basis, places=6)
+            self.assertAlmostEqual(result['realized_pnl'][i], realized, places=6)
+            self.assertAlmostEqual(result['unrealized_pnl'][i],
+                                   np.sign(position) * (abs(position) * 100.0 - basis), places=6)
+
+            fees = sum(t.commission for t in trades if t.symbol == symbol)
+            self.assertAlmostEqual(result['fees'][i], fees, places=6)
+        self.assertEqual(sorted(result['symbol']), sorted(expected))
+
+    def test_fifo_matches_brute_force(self):
+        """Test FIFO realized P&L and open cost on random trades with flips."""
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self._check(random_trades(seed), 'fifo')
+
+    def test_average_matches_brute_force(self):
+        """Test average-cost realized P&L and open cost on random trades with flips."""
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                self._check(random_trades(seed), 'average')
+
+    def test_position_flip(self):
+        """Test a fill through zero closes the old leg and opens the remainder."""
+        trades = [
+            Trade('AAA', 10, 100.0, timestamp="2024-01-01T00:00:00"),
+            Trade('AAA', 10, 110.0, timestamp="2024-01-01T00:00:01"),
+            Trade('AAA', -25, 120.0, timestamp="2024-01-01T00:00:02"),
+        ]
+        engine = PnLEngine(precision=None)
+        fills = engine.fills_from_trades(trades)
+
+        np.testing.assert_allclose(engine.fill_pnl(fills, 'fifo'), [0.0, 0.0, 300.0])
+        result = engine.reconcile(fills, {'AAA': 115.0}, 'fifo')
+        self.assertEqual(result['position'][0], -5)
+        self.assertAlmostEqual(result['average_cost'][0], 120.0)
+        self.assertAlmostEqual(result['unrealized_pnl'][0], 25.0)
+
+    def test_empty(self):
+        """Test no fills produce empty per-symbol arrays."""
+        engine = PnLEngine()
+        result = engine.reconcile(engine.fills_from_trades([]), {}, 'fifo')
+        self.assertEqual(len(result['position']), 0)
+
+    def test_unknown_method(self):
+        """Test an unknown cost method is rejected."""
+        engine = PnLEngine()
+        fills = engine.fills_from_trades([Trade('AAA', 1, 1.0)])
+        with self.assertRaises(ValueError):
+            engine.fill_pnl(fills, 'lifo')
+
+
+class TestPnLCalculator(unittest.TestCase):
+    """Test cases for unrealized P&L and portfolio totals."""
+
+    def setUp(self):
+        """Set up calculator and positions."""
+        self.calculator = PnLCalculator()
+        self.positions = [
+            Position('A', 10, 100.0, current_price=101.5),
+            Position('B', -5, 50.0),
+        ]
+
+    def test_unrealized_pnl(self):
+        """Test long and short unrealized P&L and totals."""
+        result = self.calculator.calculate_unrealized_pnl(self.positions, {'A': 101.5, 'B': 48.0})
+        self.assertEqual(result['A']['unrealized_pnl'], 15.0)
+        self.assertEqual(result['B']['unrealized_pnl'], 10.0)
+        self.assertEqual(result['_total']['unrealized_pnl'], 25.0)
+        self.assertEqual(result['_total']['cost_basis'], 1250.0)
+
+    def test_none_price_falls_back_to_position_price(self):
+        """Test a None quote uses Position.current_price."""
+        result = self.calculator.calculate_unrealized_pnl(self.positions[:1], {'A': None})
+        self.assertEqual(result['A']['unrealized_pnl'], 15.0)
+        self.assertEqual(result['_total']['unrealized_pnl'], 15.0)
+
+    def test_bad_position_is_skipped(self):
+        """Test positions without a usable price do not poison the totals."""
+        result = self.calculator.calculate_unrealized_pnl(
+            self.positions, {'A': 101.5, 'B': float('nan')}
+        )
+        self.assertNotIn('B', result)
+        self.assertEqual(result['_total']['unrealized_pnl'], 15.0)
+
+        metrics = self.calculator.calculate_portfolio_metrics(
+            self.positions, {'A': None, 'B': None}, cash=1000.0
+        )
+        self.assertEqual(metrics['unrealized_pnl'], 15.0)
+        self.assertEqual(metrics['total_equity'], 2015.0)
+        self.assertEqual(metrics['long_exposure'], 1015.0)
+        self.assertEqual(metrics['short_exposure'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Portfolio Optimizer - AllocationEngine solvers and shrinkage.
+Engine weights are checked against SLSQP solutions of the same problems and
+the shrinkage intensity against the Ledoit-Wolf (2004) definition.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+
+# Import the modules to test
+import sys
+sys.path.append('scripts')
+from portfolio_optimizer import AllocationEngine, PortfolioOptimizer
+
+
+def factor_returns(seed, n_obs=250, n_assets=8):
+    """Correlated daily returns with differing volatilities and drifts."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0004, 0.01, (n_obs, 1))
+    loadings = rng.uniform(0.2, 1.5, n_assets)
+    idiosyncratic = rng.normal(0.0, 1.0, (n_obs, n_assets)) * rng.uniform(0.005, 0.02, n_assets)
+    drift = rng.uniform(-0.0002, 0.0008, n_assets)
+    data = market * loadings + idiosyncratic + drift
+    return pd.DataFrame(data, columns=[f"S{i}_SYM" for i in range(n_assets)])
+
+
+def ledoit_wolf_reference(data):
+    """Shrinkage intensity and target from the per-observation definitions."""
+    x = data - data.mean(axis=0)
+    n_obs, n_assets = x.shape
+    sample = x.T @ x / n_obs
+    mu = np.trace(sample) / n_assets
+    d2 = np.sum((sample - mu * np.eye(n_assets)) ** 2)
+    b2 = sum(np.sum((np.outer(row, row) - sample) ** 2) for row in x) / n_obs ** 2
+    intensity = min(b2, d2) / d2
+    return intensity, (1 - intensity) * sample + intensity * mu * np.eye(n_assets)
+
+
+def slsqp(objective, n_assets, lower=0.0, upper=1.0):
+    """Fully invested weights within bounds minimizing `objective`."""
+    result = minimize(objective, np.full(n_assets, 1.0 / n_assets), method='SLSQP',
+                      bounds=[(lower, upper)] * n_assets,
+                      constraints=[{'type': 'eq', 'fun': lambda w: w.sum() - 1.0}],
+                      options={'ftol': 1e-15, 'maxiter': 1000})
+    return result.x
+
+
+class TestLedoitWolf(unittest.TestCase):
+    """Test cases for the engine's covariance estimate."""
+
+    def test_intensity_matches_definition(self):
+        """Test the optimal intensity and shrunk covariance match Ledoit-Wolf."""
+        for n_obs, n_assets in [(250, 8), (40, 60)]:
+            with self.subTest(n_obs=n_obs, n_assets=n_assets):
+                returns = factor_returns(1, n_obs, n_assets)
+                engine = AllocationEngine(returns, shrinkage=True, periods_per_year=1)
+                intensity, expected = ledoit_wolf_reference(returns.to_numpy())
+
+                np.testing.assert_allclose(engine.covariance, expected, rtol=1e-10, atol=1e-14)
+                self.assertAlmostEqual(engine.shrinkage_intensity, intensity, places=10)
+
+    def test_fixed_intensity_and_sample(self):
+        """Test a fixed intensity and no shrinkage against the sample covariance."""
+        returns = factor_returns(2)
+        sample = returns.cov(ddof=0).to_numpy() * 252
+        mu = np.trace(sample) / len(sample)
+
+        engine = AllocationEngine(returns, shrinkage=False)
+        np.testing.assert_allclose(engine.covariance, sample, rtol=1e-10)
+
+        engine = AllocationEngine(returns, shrinkage=0.3)
+        np.testing.assert_allclose(engine.covariance, 0.7 * sample + 0.3 * mu * np.eye(len(sample)),
+                                   rtol=1e-10)
+
+
+class TestSolverParity(unittest.TestCase):
+    """Test cases comparing engine weights with SLSQP."""
+
+    def _engine(self, n_obs=250, n_assets=8):
+        returns = factor_returns(3, n_obs, n_assets)
+        engine = AllocationEngine(returns, shrinkage=True)
+        return engine, list(returns.columns), engine.covariance
+
+    def test_risk_parity(self):
+        """Test equal risk contributions match SLSQP on the same covariance."""
+        engine, keys, cov = self._engine()
+        n_assets = len(keys)
+
+        def dispersion(w):
+            contributions = w * (cov @ w) / (w @ cov @ w)
+            return 1e4 * np.sum((contributions - 1.0 / n_assets) ** 2)
+
+        weights = engine.allocate(keys, 'risk_parity').to_numpy()
+        np.testing.assert_allclose(weights, slsqp(dispersion, n_assets, 1e-6), atol=1e-4)
+
+        contributions = weights * (cov @ weights)
+        np.testing.assert_allclose(contributions / contributions.sum(), 1.0 / n_assets, atol=1e-6)
+
+    def test_bounded_min_variance(self):
+        """Test bounded minimum variance matches SLSQP, on both solver paths."""
+        for n_obs, n_assets in [(250, 8), (40, 60)]:
+            with self.subTest(n_obs=n_obs, n_assets=n_assets):
+                engine, keys, cov = self._engine(n_obs, n_assets)
+                upper = 2.5 / n_assets
+
+                weights = engine.allocate(keys, 'min_variance', 0.0, upper).to_numpy()
+                expected = slsqp(lambda w: 1e4 * w @ cov @ w, n_assets, 0.0, upper)
+
+                self.assertAlmostEqual(weights.sum(), 1.0, places=9)
+                self.assertLessEqual(weights.max(), upper + 1e-12)
+                self.assertAlmostEqual(weights @ cov @ weights, expected @ cov @ expected, places=7)
+                np.testing.assert_allclose(weights, expected, atol=1e-3)
+
+    def test_mean_variance(self):
+        """Test mean-variance weights match SLSQP for the same risk aversion."""
+        engine, keys, cov = self._engine()
+        mu = engine.mean_returns
+        n_assets = len(keys)
+
+        for risk_aversion in (1.0, 10.0):
+            with self.subTest(risk_aversion=risk_aversion):
+                weights = engine.allocate(keys, 'mean_variance', 0.05, 0.4,
+                                          risk_aversion=risk_aversion).to_numpy()
+                expected = slsqp(lambda w: 0.5 * risk_aversion * w @ cov @ w - mu @ w,
+                                 n_assets, 0.05, 0.4)
+                np.testing.assert_allclose(weights, expected, atol=1e-4)
+
+
+class TestPortfolioOptimizer(unittest.TestCase):
+    """Test cases for allocation edge cases."""
+
+    def setUp(self):
+        """Set up an optimizer without position limits."""
+        self.optimizer = PortfolioOptimizer(capital=10000, max_positions=100)
+        self.optimizer.min_allocation = 0.0
+        self.optimizer.max_allocation = 1.0
+
+    def _strategies(self, returns):
+        names = [col.rsplit('_', 1)[0] for col in returns.columns]
+        return pd.DataFrame({'strategy': names, 'symbol': 'SYM'})
+
+    def test_singular_covariance_is_shrunk(self):
+        """Test fewer observations than strategies shrink instead of falling back."""
+        returns = factor_returns(4, n_obs=35, n_assets=50)
+        strategies = self._strategies(returns)
+
+        with self.assertLogs('portfolio_optimizer', level='WARNING') as logs:
+            allocations = self.optimizer._risk_parity_allocation(strategies, returns)
+        self.assertIn('singular', ''.join(logs.output))
+
+        expected = AllocationEngine(returns, shrinkage=True).allocate(list(returns.columns))
+        np.testing.assert_allclose(list(allocations.values()), expected.to_numpy(), atol=1e-9)
+        self.assertFalse(np.allclose(list(allocations.values()), 1.0 / len(strategies)))
+
+    def test_duplicate_strategy_names(self):
+        """Test repeated names keep the last row before normalizing."""
+        returns = factor_returns(5, n_assets=3)
+        returns.columns = ['A_X', 'A_Y', 'B_X']
+        strategies = pd.DataFrame({'strategy': ['A', 'A', 'B'], 'symbol': ['X', 'Y', 'X']})
+
+        allocations = self.optimizer._volatility_adjusted_allocation(strategies, returns)
+        self.assertAlmostEqual(sum(allocations.values()), 1.0)
+
+        engine = AllocationEngine(returns)
+        expected = engine.inverse_volatility_weights(engine.indices(['A_Y', 'B_X']))
+        np.testing.assert_allclose([allocations['A'], allocations['B']], expected)
+
+        for method in ('risk_parity', 'min_variance'):
+            with self.subTest(method=method):
+                result = self.optimizer.optimize_portfolio(strategies, method, returns)
+                self.assertEqual(len(result), 2)
+                self.assertAlmostEqual(result['allocation_weight'].sum(), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
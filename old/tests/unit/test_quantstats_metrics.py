@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for QuantStats Metrics - BatchMetricsEngine.
+Column-wise metrics are checked against the per-series QuantStatsAnalyzer
+helpers; quantstats itself is stubbed when not installed, which leaves only
+the pandas-based helpers to compare against.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+from scripts.metrics import quantstats_metrics
+from scripts.metrics.quantstats_metrics import BatchMetricsEngine, QuantStatsAnalyzer
+
+
+def random_returns(seed, n_obs=300, n_strategies=6):
+    """Daily returns with scattered and leading gaps."""
+    rng = np.random.default_rng(seed)
+    data = rng.normal(0.0005, 0.012, (n_obs, n_strategies))
+    data[rng.random((n_obs, n_strategies)) < 0.05] = np.nan
+    data[:40, 0] = np.nan
+    index = pd.bdate_range('2022-01-03', periods=n_obs)
+    return pd.DataFrame(data, index=index, columns=[f"strategy_{i}" for i in range(n_strategies)])
+
+
+class TestBatchMetricsEngine(unittest.TestCase):
+    """Test cases comparing the batch engine with per-series calculations."""
+
+    def setUp(self):
+        """Set up an analyzer, stubbing quantstats if it is not installed."""
+        if not quantstats_metrics.QUANTSTATS_AVAILABLE:
+            patcher = patch.multiple(quantstats_metrics, QUANTSTATS_AVAILABLE=True,
+                                     qs=MagicMock(), create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.analyzer = QuantStatsAnalyzer(risk_free_rate=0.02)
+        self.returns = random_returns(0)
+        self.metrics = BatchMetricsEngine(risk_free_rate=0.02, chunk_size=4).calculate(self.returns)
+
+    def test_matches_per_series_helpers(self):
+        """Test best/worst day, win rate, skew and kurtosis per strategy."""
+        for column in self.returns:
+            with self.subTest(column=column):
+                series = self.analyzer._format_returns(self.returns[column])
+                expected = self.analyzer._calculate_return_metrics(series)
+                expected.update(self.analyzer._calculate_distribution_metrics(series))
+                row = self.metrics.loc[column]
+
+                self.assertEqual(row['observations'], len(series))
+                for name in ('best_day', 'worst_day', 'win_rate', 'skewness', 'kurtosis'):
+                    self.assertAlmostEqual(row[name], expected[name], places=10, msg=name)
+                self.assertAlmostEqual(row['annual_volatility'], series.std() * np.sqrt(252), places=10)
+                self.assertAlmostEqual(row['total_return'], (1 + series).prod() - 1, places=10)
+
+    @unittest.skipUnless(quantstats_metrics.QUANTSTATS_AVAILABLE, "quantstats not installed")
+    def test_matches_quantstats(self):
+        """Test quantstats-defined metrics against calculate_metrics."""
+        for column in self.returns:
+            with self.subTest(column=column):
+                expected = self.analyzer.calculate_metrics(self.returns[column])
+                row = self.metrics.loc[column]
+                for name in ('total_return', 'annual_volatility', 'sharpe_ratio', 'max_drawdown'):
+                    self.assertAlmostEqual(row[name], expected[name], places=8, msg=name)
+
+    def test_all_nan_column(self):
+        """Test a strategy without observations has NaN best/worst day."""
+        returns = self.returns.copy()
+        returns['empty'] = np.nan
+        metrics = BatchMetricsEngine().calculate(returns)
+
+        self.assertEqual(metrics.loc['empty', 'observations'], 0)
+        self.assertTrue(np.isnan(metrics.loc['empty', 'best_day']))
+        self.assertTrue(np.isnan(metrics.loc['empty', 'worst_day']))
+        self.assertFalse(np.isinf(metrics[['best_day', 'worst_day']].to_numpy()).any())
+        pd.testing.assert_frame_equal(metrics.drop(index='empty'),
+                                      BatchMetricsEngine().calculate(self.returns))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Regime Analyzer - regime code cache.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+from scripts.metrics.regime_metrics import RegimeAnalyzer
+
+
+class TestRegimeCache(unittest.TestCase):
+    """Test cases for the process-wide regime code cache."""
+
+    def setUp(self):
+        """Set up a random-walk price series and an empty cache."""
+        RegimeAnalyzer.clear_cache()
+        self.addCleanup(RegimeAnalyzer.clear_cache)
+        rng = np.random.default_rng(0)
+        index = pd.bdate_range("2020-01-01", periods=600)
+        self.prices = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.01, 600))), index=index)
+        self.analyzer = RegimeAnalyzer(sma_period=50, volatility_window=20)
+
+    def test_revised_prices_miss_the_cache(self):
+        """Test a symbol's key changes when its prices over the same dates change."""
+        codes = self.analyzer.detect_regime_codes(self.prices, symbol="SPY")
+        revised = self.prices * np.linspace(1.3, 0.7, len(self.prices))
+
+        result = self.analyzer.detect_regime_codes(revised, symbol="SPY")
+        pd.testing.assert_series_equal(
+            result, RegimeAnalyzer(50, 20).detect_regime_codes(revised)
+        )
+        self.assertFalse(result.equals(codes))
+        self.assertEqual(len(RegimeAnalyzer._regime_cache), 3)
+
+    def test_hits_return_copies(self):
+        """Test mutating returned codes leaves the cached detection intact."""
+        codes = self.analyzer.detect_regime_codes(self.prices, symbol="SPY")
+        expected = codes.copy()
+        codes[:] = 0
+
+        cached = self.analyzer.detect_regime_codes(self.prices, symbol="SPY")
+        pd.testing.assert_series_equal(cached, expected)
+        cached[:] = 0
+        pd.testing.assert_series_equal(
+            self.analyzer.detect_regime_codes(self.prices, symbol="SPY"), expected
+        )
+        self.assertEqual(len(RegimeAnalyzer._regime_cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Results Consolidator - streaming consolidation.
+stream_consolidate output is checked against the in-memory ranking path.
+"""
+
+import json
+import math
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+from utils import results_consolidator
+from utils.results_consolidator import (
+    PYARROW_AVAILABLE, RANKING_INFO_FIELDS, RANKING_METRIC_FIELDS,
+    RankingResultsConsolidator, _float_column
+)
+
+
+def backtest_result(i, algorithm, symbol, n_days=30, seed=0):
+    """Backtest result JSON with metrics (percent or decimal) and an equity curve."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2024-01-01', periods=n_days) + pd.Timedelta(days=i % 3)
+    values = 10000 * np.cumprod(1 + rng.normal(0.001, 0.01, n_days))
+    metrics = {
+        'total_return': float(rng.uniform(-20, 40)) if i % 2 else float(rng.uniform(-0.2, 0.4)),
+        'sharpe_ratio': float(rng.normal(1, 0.5)),
+        'max_drawdown': float(rng.uniform(0.02, 0.3)),
+        'win_rate': float(rng.uniform(30, 70)),
+    }
+    if i % 4 == 0:
+        metrics['beta'] = float(rng.uniform(0.5, 1.5))
+    return {
+        'backtest_id': f"bt{i}",
+        'algorithm': algorithm,
+        'symbol': symbol,
+        'status': 'completed',
+        'period': {'start': str(dates[0].date()), 'end': str(dates[-1].date())},
+        'trade_count': int(rng.integers(0, 50)),
+        'metrics': metrics,
+        'equity_curve': [{'date': str(d.date()), 'value': float(v)} for d, v in zip(dates, values)],
+    }
+
+
+class TestStreamConsolidate(unittest.TestCase):
+    """Test cases comparing stream_consolidate with the in-memory methods."""
+
+    def setUp(self):
+        """Set up a results directory with repeated strategy names."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.results_dir = self.temp_dir / 'backtests'
+        self.consolidator = RankingResultsConsolidator(str(self.results_dir))
+
+        results = [backtest_result(i, f"Strategy{i % 5}", ['SPY', 'QQQ', 'IWM'][i % 3], seed=i)
+                   for i in range(24)]
+        # Repeated names where one of the two results has no returns (a single equity point)
+        for pair in ('pair0', 'pair1', 'pair2'):
+            results.append(dict(backtest_result(30, pair, 'SPY'), backtest_id=f"{pair}_full"))
+            results.append(dict(backtest_result(31, pair, 'SPY', n_days=1), backtest_id=f"{pair}_short"))
+        results.append({'backtest_id': 'no_curve', 'algorithm': 'Strategy2', 'symbol': 'IWM'})
+        for result in results:
+            (self.results_dir / f"{result['backtest_id']}.json").write_text(json.dumps(result))
+        (self.results_dir / 'broken.json').write_text('{not json')
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def assertNestedEqual(self, actual, expected, path='summary'):
+        if isinstance(expected, dict):
+            self.assertEqual(sorted(actual), sorted(expected), msg=path)
+            for key in expected:
+                self.assertNestedEqual(actual[key], expected[key], f"{path}.{key}")
+        elif isinstance(expected, float) and math.isnan(expected):
+            self.assertTrue(math.isnan(actual), msg=path)
+        else:
+            self.assertAlmostEqual(float(actual), float(expected), places=9, msg=path)
+
+    def _check(self, output_name, read, max_workers=1):
+        report = self.consolidator.stream_consolidate(
+            self.temp_dir / output_name, returns_path=self.temp_dir / 'returns.npy',
+            batch_size=5, max_workers=max_workers
+        )
+        expected = self.consolidator.consolidate_to_dataframe()
+        streamed = read(self.temp_dir / output_name)
+
+        self.assertEqual((report['rows'], report['skipped']), (len(expected), 1))
+        self.assertEqual(len(streamed), len(expected))
+        for field in RANKING_INFO_FIELDS:
+            self.assertEqual([None if pd.isna(v) else str(v) for v in streamed[field]],
+                             [None if pd.isna(v) else str(v) for v in expected[field]], msg=field)
+        for field in RANKING_METRIC_FIELDS:
+            np.testing.assert_allclose(streamed[field].to_numpy(dtype=np.float64),
+                                       _float_column(expected[field].tolist()), err_msg=field)
+
+        self.assertNestedEqual(report['summary'], self.consolidator.get_summary_stats(expected))
+
+        matrix, names, periods = RankingResultsConsolidator.open_returns_matrix(report['returns_path'])
+        returns = pd.DataFrame(np.asarray(matrix, dtype=np.float64), index=periods, columns=names)
+        expected_returns = self.consolidator.get_returns_series().sort_index()
+        pd.testing.assert_frame_equal(returns, expected_returns, rtol=1e-6,
+                                      check_names=False, check_freq=False, check_index_type=False)
+        return returns
+
+    def test_csv_matches_in_memory(self):
+        """Test rows, summary and returns of a CSV stream match the in-memory path."""
+        returns = self._check('ranking.csv', pd.read_csv)
+
+        # The later of two results for a name owns its column, even without returns
+        order = [path.stem for path in self.results_dir.glob('*.json')]
+        for pair in ('pair0', 'pair1', 'pair2'):
+            self.assertEqual(returns[f"{pair}_SPY"].isna().all(),
+                             order.index(f"{pair}_short") > order.index(f"{pair}_full"))
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_parquet_matches_in_memory(self):
+        """Test a Parquet stream matches the in-memory path."""
+        self._check('ranking.parquet', pd.read_parquet)
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+    def test_arrow_with_worker_processes(self):
+        """Test an Arrow IPC stream parsed in worker processes matches the in-memory path."""
+        # Several tasks per worker so results arrive from more than one in-flight task
+        with patch.object(results_consolidator, 'FILES_PER_TASK', 3):
+            self._check('ranking.arrow', pd.read_feather, max_workers=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the RollingStats LEAN library.
+Rolling results are checked against brute-force window calculations.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# The library lives in the LEAN projects tree, not in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'lean_projects' / 'Library'))
+from RollingStats.rolling_stats import RollingMax, RollingMin, RollingSlope, RollingStats
+
+
+def windows(values, period):
+    """Trailing windows of up to `period` values, one per added value."""
+    return [values[max(0, i + 1 - period):i + 1] for i in range(len(values))]
+
+
+class TestRollingExtremes(unittest.TestCase):
+    """Test monotonic-deque extremes against max()/min() over each window."""
+
+    def _series(self, seed):
+        rng = np.random.default_rng(seed)
+        # Rounded values force ties, runs of equal values and monotonic stretches
+        values = np.round(rng.normal(0, 3, 400)).tolist()
+        values += list(range(20)) + list(range(20, 0, -1)) + [5.0] * 10
+        return values
+
+    def test_extremes_match_brute_force(self):
+        """Test RollingMax/RollingMin equal max/min of the trailing window."""
+        for seed in range(3):
+            values = self._series(seed)
+            for period in (1, 2, 3, 7, 30):
+                with self.subTest(seed=seed, period=period):
+                    rolling_max, rolling_min = RollingMax(period), RollingMin(period)
+                    for i, window in enumerate(windows(values, period)):
+                        rolling_max.add(values[i])
+                        rolling_min.add(values[i])
+                        self.assertEqual(rolling_max.value, max(window))
+                        self.assertEqual(rolling_min.value, min(window))
+                        self.assertEqual(rolling_max.count, len(window))
+                        self.assertEqual(rolling_max.is_ready, len(window) == period)
+
+    def test_empty_and_invalid(self):
+        """Test no value before the first add and period validation."""
+        self.assertIsNone(RollingMax(5).value)
+        self.assertFalse(RollingMin(5).is_ready)
+        with self.assertRaises(ValueError):
+            RollingMax(0)
+
+
+class TestRollingStats(unittest.TestCase):
+    """Test rolling mean/variance/slope against numpy over each window."""
+
+    def setUp(self):
+        """Set up a price-like series with a large offset."""
+        rng = np.random.default_rng(11)
+        self.values = (1e4 + np.cumsum(rng.normal(0, 1, 500))).tolist()
+
+    def test_stats_match_brute_force(self):
+        """Test mean, population std and z-score over the trailing window."""
+        for period in (1, 5, 50):
+            with self.subTest(period=period):
+                stats = RollingStats(period)
+                for i, window in enumerate(windows(self.values, period)):
+                    stats.add(self.values[i])
+                    self.assertAlmostEqual(stats.mean, np.mean(window), places=6)
+                    self.assertAlmostEqual(stats.std, np.std(window), places=6)
+                    if np.std(window) > 0:
+                        self.assertAlmostEqual(stats.zscore(self.values[i]),
+                                               (self.values[i] - np.mean(window)) / np.std(window),
+                                               places=6)
+
+    def test_slope_matches_polyfit(self):
+        """Test the running-sum slope equals a least-squares fit of each window."""
+        slope = RollingSlope(10)
+        for i, window in enumerate(windows(self.values, 10)):
+            slope.add(self.values[i])
+            expected = np.polyfit(np.arange(len(window)), window, 1)[0] if len(window) > 1 else 0.0
+            self.assertAlmostEqual(slope.slope, expected, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
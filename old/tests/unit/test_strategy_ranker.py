@@ -15,7 +15,7 @@ from pathlib import Path
 # Import the modules to test
 import sys
 sys.path.append('scripts')
-from strategy_ranker import StrategyRanker
+from strategy_ranker import StrategyRanker, RankingTable
 
 
 class TestStrategyRanker(unittest.TestCase):
@@ -259,6 +259,79 @@ class TestStrategyRanker(unittest.TestCase):
         summary = ranker.get_ranking_summary(empty_df)
         self.assertEqual(summary, {})
 
+    def _random_results(self, n, start=0, seed=0):
+        """Random results keyed by backtest_id."""
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({
+            'backtest_id': [f'bt_{i}' for i in range(start, start + n)],
+            'strategy': [f'strategy_{i % 7}' for i in range(start, start + n)],
+            'symbol': 'SPY',
+            'sharpe_ratio': rng.normal(1.0, 1.0, n),
+            'max_drawdown': rng.uniform(0.0, 0.5, n),
+            'win_rate': rng.uniform(0.4, 0.8, n),
+            'total_trades': rng.integers(0, 500, n),
+            'profit_factor': rng.uniform(0.5, 3.0, n),
+        })
+
+    def test_incremental_updates_match_full_ranking(self):
+        """Test that batch-wise updates (including score drops) equal a full re-rank."""
+        results = self._random_results(600)
+        ranker = StrategyRanker(self.temp_config.name)
+        for start in range(0, len(results), 100):
+            ranker.update_rankings(results.iloc[start:start + 100])
+
+        # Worsen the current leaders so they fall out of the top-N list
+        leaders = ranker.get_top_strategies(top_n=5)['backtest_id']
+        updated = results[results['backtest_id'].isin(leaders)].copy()
+        updated['sharpe_ratio'] = -5.0
+        self.assertEqual(ranker.update_rankings(updated), 5)
+        self.assertEqual(ranker.update_rankings(updated), 0)  # Unchanged rows are skipped
+
+        expected_input = results.copy()
+        expected_input.loc[expected_input['backtest_id'].isin(leaders), 'sharpe_ratio'] = -5.0
+        expected = StrategyRanker(self.temp_config.name).rank_strategies(results_df=expected_input)
+
+        self.assertEqual(len(ranker.ranking_table), 600)
+        top = ranker.get_top_strategies(top_n=20)
+        self.assertEqual(list(top['backtest_id']), list(expected['backtest_id'][:20]))
+        self.assertEqual(list(top['rank']), list(expected['rank'][:20]))
+        np.testing.assert_allclose(ranker.ranking_table.to_frame()['composite_score'],
+                                   expected['composite_score'])
+
+    def test_csv_input_reads_only_appended_rows(self):
+        """Test that re-ranking a growing CSV only scores the new rows."""
+        results = self._random_results(50)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / 'results.csv'
+            results.iloc[:30].to_csv(csv_path, index=False)
+
+            ranker = StrategyRanker(self.temp_config.name)
+            self.assertEqual(len(ranker.rank_strategies(csv_input=str(csv_path))), 30)
+
+            with patch.object(ranker, 'update_rankings', wraps=ranker.update_rankings) as update:
+                with open(csv_path, 'a') as f:
+                    f.write(results.iloc[30:].to_csv(index=False, header=False))
+                rankings = ranker.rank_strategies(csv_input=str(csv_path))
+
+            self.assertEqual(len(update.call_args[0][0]), 20)
+            expected = StrategyRanker(self.temp_config.name).rank_strategies(results_df=results)
+            self.assertEqual(list(rankings['backtest_id']), list(expected['backtest_id']))
+
+            # A rewritten file is ranked from scratch
+            results.iloc[:10].to_csv(csv_path, index=False)
+            self.assertEqual(len(ranker.rank_strategies(csv_input=str(csv_path))), 10)
+
+    def test_ranking_table_save_and_load(self):
+        """Test ranking table persistence."""
+        ranker = StrategyRanker(self.temp_config.name)
+        ranker.update_rankings(self._random_results(40))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = ranker.ranking_table.save(Path(temp_dir) / 'rankings.parquet')
+            table = RankingTable.load(path, key_columns=('backtest_id',))
+
+        pd.testing.assert_frame_equal(table.top(10), ranker.get_top_strategies(top_n=10))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
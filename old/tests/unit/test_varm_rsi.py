@@ -10,6 +10,7 @@ import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -23,6 +24,22 @@ except ImportError:
     BACKTRADER_AVAILABLE = False
     print("Backtrader not available - running limited tests")
 
+# Slope parity runs against the root strategies package and its benchmark
+REPO_ROOT = Path(__file__).resolve().parents[3]
+try:
+    import backtrader as bt
+
+    sys.path.insert(0, str(REPO_ROOT))
+    from strategies.varm_rsi import RollingSlope, VARM_RSI as RootVARM_RSI
+    from scripts.benchmark_varm_rsi import (
+        BENCHMARK_PARAMS, LegacySlopeVARM_RSI, generate_minute_data, run_backtest,
+    )
+    sys.path.remove(str(REPO_ROOT))
+
+    SLOPE_PARITY_AVAILABLE = True
+except ImportError:
+    SLOPE_PARITY_AVAILABLE = False
+
 
 class TestVARM_RSI(unittest.TestCase):
     """Test cases for VARM-RSI strategy."""
@@ -266,5 +283,71 @@ class TestVARM_RSI(unittest.TestCase):
         self.assertLessEqual(low_correlation, correlation_threshold)
 
 
+if SLOPE_PARITY_AVAILABLE:
+    class SlopeRecorder(RootVARM_RSI):
+        """Records RollingSlope filter values next to the legacy polyfit slopes."""
+
+        def __init__(self):
+            super().__init__()
+            self.slopes = {'obv': [], 'atr': [], 'sma': []}
+
+        def next(self):
+            for name, rolling, source, period in (
+                ('obv', self.obv_slope, self.obv, 5),
+                ('atr', self.atr_slope, self.atr, 10),
+                ('sma', self.sma_slope, self.sma, 5),
+            ):
+                legacy = LegacySlopeVARM_RSI._polyfit_slope(source, period)
+                self.slopes[name].append((rolling[0], legacy))
+                self.slopes[name].append((self._calculate_slope(source, period), legacy))
+            super().next()
+
+
+@unittest.skipUnless(SLOPE_PARITY_AVAILABLE, "Backtrader or root strategies not available")
+class TestSlopeParity(unittest.TestCase):
+    """Test RollingSlope filters keep the legacy polyfit slope convention."""
+
+    def _run_slope(self, runonce):
+        values = 100 + np.cumsum(np.random.default_rng(7).normal(0, 1, 200))
+        df = pd.DataFrame({'open': values, 'high': values, 'low': values, 'close': values,
+                           'volume': 1000.0}, index=pd.date_range('2024-01-01', periods=200))
+
+        class Probe(bt.Strategy):
+            def __init__(self):
+                self.slope = RollingSlope(self.data.close, period=5, reverse=True)
+                self.pairs = []
+
+            def next(self):
+                self.pairs.append((self.slope[0],
+                                   LegacySlopeVARM_RSI._polyfit_slope(self.data.close, 5)))
+
+        cerebro = bt.Cerebro(stdstats=False, runonce=runonce)
+        cerebro.adddata(bt.feeds.PandasData(dataname=df))
+        cerebro.addstrategy(Probe)
+        return np.array(cerebro.run()[0].pairs)
+
+    def test_rolling_slope_matches_polyfit(self):
+        """Test RollingSlope(reverse=True) equals the legacy helper in both run modes."""
+        for runonce in (True, False):
+            with self.subTest(runonce=runonce):
+                pairs = self._run_slope(runonce)
+                self.assertGreater(len(pairs), 150)
+                np.testing.assert_allclose(pairs[:, 0], pairs[:, 1], rtol=1e-9, atol=1e-9)
+
+    def test_filter_signals_match_legacy(self):
+        """Test the OBV/ATR/SMA filters see the same slopes and take the same trades."""
+        df = generate_minute_data(days=30)
+        _, strat, _ = run_backtest(SlopeRecorder, df)
+        for name, pairs in strat.slopes.items():
+            with self.subTest(slope=name):
+                pairs = np.array(pairs)
+                self.assertGreater(len(pairs), 0)
+                np.testing.assert_allclose(pairs[:, 0], pairs[:, 1], rtol=1e-7, atol=1e-9)
+
+        _, legacy, _ = run_backtest(LegacySlopeVARM_RSI, df)
+        self.assertEqual(strat.trade_count, legacy.trade_count)
+        self.assertEqual(strat.broker.getvalue(), legacy.broker.getvalue())
+
+
 if __name__ == "__main__":
     unittest.main()
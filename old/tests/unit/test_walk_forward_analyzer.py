@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Walk-Forward Analyzer - window scheduling, failed windows and
+warm-start curve reuse. Runs on synthetic daily bars; MLflow is mocked.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+import sys
+sys.path.append('scripts')
+import walk_forward_analyzer
+from walk_forward_analyzer import WalkForwardAnalyzer, _run_equity_curve, _run_window_backtest, _window_metrics
+
+
+class SmaCross(bt.Strategy):
+    """Long when the fast SMA is above the slow SMA."""
+
+    params = (('fast', 5), ('slow', 20))
+
+    def __init__(self):
+        self.crossover = bt.ind.CrossOver(bt.ind.SMA(period=self.p.fast), bt.ind.SMA(period=self.p.slow))
+
+    def next(self):
+        if not self.position and self.crossover > 0:
+            self.buy(size=100)
+        elif self.position and self.crossover < 0:
+            self.close()
+
+
+def synthetic_history(start, periods, seed):
+    """Random-walk daily OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(start, periods=periods)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, periods)))
+    return pd.DataFrame({
+        'open': close, 'high': close * 1.005, 'low': close * 0.995,
+        'close': close, 'volume': 1e6,
+    }, index=index)
+
+
+PARAM_RANGES = {'fast': [5, 10], 'slow': [20, 40]}
+
+
+class TestWalkForwardAnalyzer(unittest.TestCase):
+    """Test cases for walk-forward window analysis."""
+
+    def setUp(self):
+        """Set up an analyzer on synthetic histories."""
+        patcher = patch.object(walk_forward_analyzer, 'MLflowBacktestLogger')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.histories = {
+            'AAA': synthetic_history('2019-01-01', 1000, seed=1),
+            'BBB': synthetic_history('2019-01-01', 1000, seed=2),
+        }
+        self.analyzer = WalkForwardAnalyzer(mlflow_tracking_uri='file:///tmp/unused')
+
+    def _run(self, histories=None, **kwargs):
+        with patch.object(WalkForwardAnalyzer, '_load_symbol_histories',
+                          return_value=histories or self.histories):
+            return self.analyzer.run_walk_forward_analysis(
+                strategy_class=SmaCross, param_ranges=PARAM_RANGES, symbols=['AAA', 'BBB'],
+                start_date='2019-01-01', end_date='2021-12-31',
+                window_size_months=12, step_size_months=6, **kwargs
+            )
+
+    def test_sequential_matches_concurrent(self):
+        """Test one worker and a process pool produce identical window results."""
+        sequential = self._run(max_workers=1)['window_results']
+        concurrent = self._run(max_workers=2)['window_results']
+
+        self.assertEqual(len(sequential), 4)
+        for one, many in zip(sequential, concurrent):
+            self.assertEqual(one, many)
+            self.assertEqual(one['status'], 'completed')
+            self.assertTrue(one['out_of_sample_metrics'])
+
+    def test_failed_optimization_skips_test(self):
+        """Test windows without training data are marked failed and never tested."""
+        late = {symbol: history.loc['2020-02-01':] for symbol, history in self.histories.items()}
+        with patch.object(walk_forward_analyzer, '_test_window_task',
+                          wraps=walk_forward_analyzer._test_window_task) as test_task:
+            results = self._run(histories=late, max_workers=1)
+
+        statuses = [r['status'] for r in results['window_results']]
+        self.assertEqual(statuses[0], 'optimization_failed')
+        self.assertEqual(results['window_results'][0]['best_params'], {})
+        self.assertEqual(results['window_results'][0]['out_of_sample_metrics'], {})
+        self.assertEqual(test_task.call_count, statuses.count('completed'))
+        self.assertEqual(results['summary']['failed_windows'], statuses.count('optimization_failed'))
+
+    def test_warm_start_matches_cold_run(self):
+        """Test a warm-started search covering the full grid gives the cold results."""
+        cold = self._run(max_workers=1)['window_results']
+        warm = self._run(max_workers=1, warm_start=True, warm_start_top_k=4)['window_results']
+
+        self.assertEqual(len(warm), len(cold))
+        for warm_result, cold_result in zip(warm, cold):
+            self.assertEqual(warm_result['optimization_candidates'], 4)
+            self.assertEqual(warm_result['best_params'], cold_result['best_params'])
+            self.assertEqual(warm_result['out_of_sample_metrics'], cold_result['out_of_sample_metrics'])
+            for name, value in cold_result['in_sample_metrics'].items():
+                self.assertAlmostEqual(warm_result['in_sample_metrics'][name], value, places=6, msg=name)
+
+    def test_warm_start_reuses_cached_runs(self):
+        """Test a repeated analysis reuses every training run and still tests out of sample."""
+        with patch.object(walk_forward_analyzer, '_run_equity_curve',
+                          wraps=walk_forward_analyzer._run_equity_curve) as run:
+            first = self._run(max_workers=1, warm_start=True, warm_start_top_k=1)['window_results']
+            runs = run.call_count
+            second = self._run(max_workers=1, warm_start=True, warm_start_top_k=1)['window_results']
+
+        self.assertEqual(runs, sum(r['optimization_candidates'] for r in first))
+        self.assertEqual(run.call_count, runs)
+        self.assertEqual(first[0]['optimization_candidates'], 4)
+        for before, after in zip(first, second):
+            self.assertEqual(after['cache_hits'], after['optimization_candidates'])
+            self.assertEqual(after['status'], 'completed')
+            self.assertEqual(after['out_of_sample_metrics'], before['out_of_sample_metrics'])
+
+    def test_window_metrics_match_backtest(self):
+        """Test slice metrics of a run starting at the slice equal a backtest of the slice."""
+        params = {'fast': 5, 'slow': 20}
+        args = (SmaCross, params, self.histories, ['AAA'], '2019-01-01', '2020-06-30', 100000.0, 0.001)
+        expected = _run_window_backtest(*args)
+        curve = _run_equity_curve(*args)
+        metrics = _window_metrics(curve, '2019-01-01', '2020-06-30', 100000.0)
+
+        self.assertGreater(expected['total_trades'], 0)
+        for name, value in expected.items():
+            self.assertAlmostEqual(metrics[name], value, places=6, msg=name)
+
+        # A later slice is rebased to the initial cash
+        later = _window_metrics(curve, '2020-01-01', '2020-06-30', 100000.0)
+        start = curve['values'][curve['dates'].index('2019-12-31')]
+        self.assertAlmostEqual(later['final_portfolio_value'], 100000.0 * curve['values'][-1] / start)
+        self.assertEqual(_window_metrics(curve, '2018-01-01', '2018-12-31', 100000.0), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
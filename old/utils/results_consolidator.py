@@ -5,12 +5,17 @@ Epic 20: US-20.3 - Results Consolidation System
 Epic 21: Strategy Ranking & Portfolio Optimizer
 
 Consolidates results from parallel backtest executions into a unified DataFrame.
-Extended for strategy ranking and portfolio optimization workflows.
+Extended for strategy ranking and portfolio optimization workflows, including a
+streaming mode for result directories too large to load at once.
 """
 
+import os
+import itertools
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
 from pathlib import Path
 import logging
 import json
@@ -18,6 +23,317 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # Optional dependency
+    PYARROW_AVAILABLE = False
+
+# Ranking row layout shared by the in-memory and streaming consolidation paths
+RANKING_INFO_FIELDS = [
+    'backtest_id', 'strategy', 'symbol', 'start_date', 'end_date', 'status', 'source_file'
+]
+RANKING_METRIC_FIELDS = [
+    'total_return', 'annualized_return', 'sharpe_ratio', 'sortino_ratio', 'max_drawdown',
+    'win_rate', 'profit_factor', 'total_trades', 'avg_win', 'avg_loss',
+    'var_95', 'cvar_95', 'annual_volatility', 'tail_ratio', 'omega_ratio',
+    'skewness', 'kurtosis', 'avg_rolling_volatility',
+    'beta', 'alpha', 'information_ratio', 'r_squared', 'tracking_error'
+]
+# Benchmark metrics have no default (None when absent)
+BENCHMARK_FIELDS = ['beta', 'alpha', 'information_ratio', 'r_squared', 'tracking_error']
+# Fields reported either as percentages or decimals
+PCT_FIELDS = ['total_return', 'annualized_return', 'max_drawdown', 'win_rate', 'avg_win', 'avg_loss']
+
+# On-disk spool of (strategy column, result ordinal, period, return) records for the returns matrix
+RETURNS_SPOOL_DTYPE = np.dtype([
+    ('column', np.int64), ('result', np.int64), ('period', np.int64), ('value', np.float64)
+])
+
+# Result files handed to a worker process per task
+FILES_PER_TASK = 64
+
+
+def _pct_to_decimal(value: Any) -> Any:
+    """Convert a percentage to a decimal (values below 10 are assumed to be decimals already)."""
+    if isinstance(value, (int, float)) and abs(value) >= 10:
+        return value / 100
+    return value
+
+
+def _ranking_row(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the ranking fields of one backtest result."""
+    row = {
+        'backtest_id': result.get('backtest_id', 'unknown'),
+        'strategy': result.get('algorithm', 'unknown'),
+        'symbol': result.get('symbol', 'unknown'),
+        'start_date': result.get('period', {}).get('start'),
+        'end_date': result.get('period', {}).get('end'),
+        'status': result.get('status', 'unknown'),
+        'source_file': result.get('_source_file', 'unknown')
+    }
+
+    metrics = result.get('metrics', {})
+    for field in RANKING_METRIC_FIELDS:
+        if field == 'total_trades':
+            row[field] = result.get('trade_count', 0)
+        elif field in BENCHMARK_FIELDS:
+            row[field] = metrics.get(field)
+        else:
+            row[field] = metrics.get(field, 0)
+
+    for field in PCT_FIELDS:
+        row[field] = _pct_to_decimal(row[field])
+
+    return row
+
+
+def _equity_returns(result: Dict[str, Any]) -> Optional[Tuple[str, np.ndarray, np.ndarray]]:
+    """
+    Daily returns of a result's equity curve.
+
+    Returns:
+        (strategy name, period timestamps as int64 ns, returns) or None
+    """
+    equity_curve = result.get('equity_curve', [])
+    if not equity_curve:
+        return None
+
+    equity_df = pd.DataFrame(equity_curve)
+    if 'date' not in equity_df.columns or 'value' not in equity_df.columns:
+        return None
+
+    equity_df['date'] = pd.to_datetime(equity_df['date'])
+    equity_df = equity_df.set_index('date').sort_index()
+    returns = equity_df['value'].pct_change().dropna()
+
+    strategy_name = f"{result.get('algorithm', 'unknown')}_{result.get('symbol', 'unknown')}"
+    return strategy_name, returns.index.as_unit('ns').asi8, returns.to_numpy(dtype=np.float64)
+
+
+def _parse_result_files(paths: List[str], with_returns: bool) -> List[Tuple[Optional[Dict], Optional[tuple]]]:
+    """
+    Parse result files into (ranking row, equity returns) pairs (worker process entry point).
+
+    Only the compact row and returns arrays travel back to the parent process.
+    Invalid files yield (None, None).
+    """
+    parsed = []
+    for path in paths:
+        try:
+            with open(path, 'r') as f:
+                result = json.load(f)
+            result['_source_file'] = Path(path).name
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Skipping invalid file {path}: {e}")
+            parsed.append((None, None))
+            continue
+
+        try:
+            row = _ranking_row(result)
+        except Exception as e:
+            logger.warning(f"Error processing result {result.get('backtest_id', 'unknown')}: {e}")
+            row = None
+
+        returns = None
+        if with_returns and row is not None:
+            try:
+                returns = _equity_returns(result)
+            except Exception as e:
+                logger.warning(f"Error extracting returns for {result.get('backtest_id', 'unknown')}: {e}")
+
+        parsed.append((row, returns))
+    return parsed
+
+
+def _float_column(values: List[Any]) -> np.ndarray:
+    """Convert metric values to float64 (None and non-numeric values become NaN)."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        column = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                column[i] = float(value)
+            except (TypeError, ValueError):
+                pass
+        return column
+
+
+class StreamingSummary:
+    """
+    Ranking summary statistics accumulated batch by batch.
+
+    Means and standard deviations are merged per batch (Chan et al. pairwise
+    update), so memory depends on the number of distinct symbols and
+    strategies, not on the number of results. Produces the same layout as
+    RankingResultsConsolidator.get_summary_stats.
+    """
+
+    STATS_FIELDS = ('sharpe_ratio', 'max_drawdown', 'win_rate', 'total_trades')
+
+    def __init__(self):
+        """Initialize empty accumulators."""
+        self.rows = 0
+        self.strategies: set = set()
+        self.symbols: set = set()
+        self.strategies_by_symbol: Dict[str, int] = {}
+        self._n = dict.fromkeys(self.STATS_FIELDS, 0)
+        self._mean = dict.fromkeys(self.STATS_FIELDS, 0.0)
+        self._m2 = dict.fromkeys(self.STATS_FIELDS, 0.0)
+        self._sum = dict.fromkeys(self.STATS_FIELDS, 0.0)
+        self._min = dict.fromkeys(self.STATS_FIELDS, np.inf)
+        self._max = dict.fromkeys(self.STATS_FIELDS, -np.inf)
+
+    def update(self, columns: Dict[str, Any]) -> 'StreamingSummary':
+        """
+        Add a batch of ranking rows.
+
+        Args:
+            columns: Column name -> values for the batch (strategy, symbol and
+                the STATS_FIELDS metrics as float arrays)
+
+        Returns:
+            self
+        """
+        strategies = columns['strategy']
+        symbols = columns['symbol']
+        self.rows += len(strategies)
+        self.strategies.update(s for s in strategies if s is not None)
+        self.symbols.update(s for s in symbols if s is not None)
+        for symbol, strategy in zip(symbols, strategies):
+            if symbol is not None and strategy is not None:
+                self.strategies_by_symbol[symbol] = self.strategies_by_symbol.get(symbol, 0) + 1
+
+        for field in self.STATS_FIELDS:
+            values = np.asarray(columns[field], dtype=np.float64)
+            values = values[~np.isnan(values)]
+            n_b = values.size
+            if n_b == 0:
+                continue
+
+            mean_b = values.mean()
+            m2_b = np.square(values - mean_b).sum()
+            n_a, mean_a = self._n[field], self._mean[field]
+            n = n_a + n_b
+            delta = mean_b - mean_a
+
+            self._mean[field] = mean_a + delta * n_b / n
+            self._m2[field] += m2_b + delta * delta * n_a * n_b / n
+            self._n[field] = n
+            self._sum[field] += values.sum()
+            self._min[field] = min(self._min[field], values.min())
+            self._max[field] = max(self._max[field], values.max())
+
+        return self
+
+    def mean(self, field: str) -> float:
+        return self._mean[field] if self._n[field] else np.nan
+
+    def std(self, field: str) -> float:
+        """Sample standard deviation (ddof=1, as pandas)."""
+        n = self._n[field]
+        return float(np.sqrt(self._m2[field] / (n - 1))) if n > 1 else np.nan
+
+    def _distribution(self, field: str, median: float) -> Dict[str, float]:
+        has_values = self._n[field] > 0
+        return {
+            'mean': self.mean(field),
+            'std': self.std(field),
+            'min': self._min[field] if has_values else np.nan,
+            'max': self._max[field] if has_values else np.nan,
+            'median': median
+        }
+
+    def result(self, medians: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Summary statistics in the get_summary_stats layout.
+
+        Args:
+            medians: Medians of sharpe_ratio and max_drawdown (not streamable;
+                NaN when not supplied)
+
+        Returns:
+            Dictionary with summary statistics (empty if no rows were added)
+        """
+        if self.rows == 0:
+            return {}
+
+        medians = medians or {}
+        return {
+            'total_strategies': self.rows,
+            'unique_strategies': len(self.strategies),
+            'unique_symbols': len(self.symbols),
+            'avg_sharpe_ratio': self.mean('sharpe_ratio'),
+            'avg_max_drawdown': self.mean('max_drawdown'),
+            'avg_win_rate': self.mean('win_rate'),
+            'total_trades': self._sum['total_trades'],
+            'strategies_by_symbol': dict(sorted(self.strategies_by_symbol.items())),
+            'performance_distribution': {
+                field: self._distribution(field, medians.get(field, np.nan))
+                for field in ('sharpe_ratio', 'max_drawdown')
+            }
+        }
+
+
+class _RecordBatchWriter:
+    """Appends fixed-schema ranking batches to a Parquet, Arrow IPC or CSV file."""
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.format = output_path.suffix.lower().lstrip('.')
+        if self.format not in ('parquet', 'arrow', 'feather', 'csv'):
+            raise ValueError(f"Unsupported format: {self.format}")
+        if self.format != 'csv' and not PYARROW_AVAILABLE:
+            raise ImportError(f"pyarrow is required to write {self.format} files")
+
+        self._writer = None
+        self._header = True
+        if self.format != 'csv':
+            self.schema = pa.schema(
+                [(field, pa.string()) for field in RANKING_INFO_FIELDS] +
+                [(field, pa.float64()) for field in RANKING_METRIC_FIELDS]
+            )
+            if self.format == 'parquet':
+                self._writer = pq.ParquetWriter(str(output_path), self.schema)
+            else:
+                self._writer = pa.ipc.new_file(str(output_path), self.schema)
+
+    def write(self, columns: Dict[str, Any]):
+        if self._writer is not None:
+            batch = pa.RecordBatch.from_pydict(columns, schema=self.schema)
+            self._writer.write_batch(batch)
+        else:
+            pd.DataFrame(columns).to_csv(self.output_path, mode='w' if self._header else 'a',
+                                         header=self._header, index=False)
+            self._header = False
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self._header:
+            # No batches written: leave an empty file with the header
+            pd.DataFrame(columns=RANKING_INFO_FIELDS + RANKING_METRIC_FIELDS).to_csv(
+                self.output_path, index=False)
+
+    def read_column(self, name: str) -> np.ndarray:
+        """Read back a single column of the written file."""
+        if self.format == 'parquet':
+            return pq.read_table(str(self.output_path), columns=[name]).column(0).to_numpy()
+        if self.format != 'csv':
+            # Only this column's buffers are touched in the memory-mapped batches
+            with pa.memory_map(str(self.output_path)) as source:
+                reader = pa.ipc.open_file(source)
+                index = reader.schema.get_field_index(name)
+                chunks = [reader.get_batch(i).column(index).to_numpy(zero_copy_only=False)
+                          for i in range(reader.num_record_batches)]
+                return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float64)
+        return pd.read_csv(self.output_path, usecols=[name])[name].to_numpy(dtype=np.float64)
+
 
 class ResultsConsolidator:
     """Consolidates parallel backtest results into unified DataFrame"""
@@ -323,20 +639,29 @@ class RankingResultsConsolidator:
         Returns:
             List of backtest result dictionaries
         """
-        results = []
+        results = list(self.iter_results(pattern))
+        logger.info(f"Loaded {len(results)} backtest results")
+        return results
+
+    def iter_results(self, pattern: str = "*.json") -> Iterator[Dict[str, Any]]:
+        """
+        Yield backtest results matching the pattern one file at a time.
 
+        Args:
+            pattern: Glob pattern for result files (default: *.json)
+
+        Yields:
+            Backtest result dictionaries
+        """
         for result_file in self.results_dir.glob(pattern):
             try:
                 with open(result_file, 'r') as f:
                     data = json.load(f)
                     data['_source_file'] = str(result_file.name)
-                    results.append(data)
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning(f"Skipping invalid file {result_file}: {e}")
                 continue
-
-        logger.info(f"Loaded {len(results)} backtest results")
-        return results
+            yield data
 
     def consolidate_to_dataframe(self, results: Optional[List[Dict]] = None) -> pd.DataFrame:
         """
@@ -349,84 +674,23 @@ class RankingResultsConsolidator:
             DataFrame with consolidated results optimized for ranking
         """
         if results is None:
-            results = self.load_all_results()
-
-        if not results:
-            logger.warning("No results to consolidate")
-            return pd.DataFrame()
+            results = self.iter_results()
 
         # Extract key fields for ranking
         consolidated_data = []
 
         for result in results:
             try:
-                # Extract basic info
-                row = {
-                    'backtest_id': result.get('backtest_id', 'unknown'),
-                    'strategy': result.get('algorithm', 'unknown'),
-                    'symbol': result.get('symbol', 'unknown'),
-                    'start_date': result.get('period', {}).get('start'),
-                    'end_date': result.get('period', {}).get('end'),
-                    'status': result.get('status', 'unknown'),
-                    'source_file': result.get('_source_file', 'unknown')
-                }
-
-                # Extract metrics
-                metrics = result.get('metrics', {})
-
-                # Basic performance metrics
-                row.update({
-                    'total_return': metrics.get('total_return', 0),
-                    'annualized_return': metrics.get('annualized_return', 0),
-                    'sharpe_ratio': metrics.get('sharpe_ratio', 0),
-                    'sortino_ratio': metrics.get('sortino_ratio', 0),
-                    'max_drawdown': metrics.get('max_drawdown', 0),
-                    'win_rate': metrics.get('win_rate', 0),
-                    'profit_factor': metrics.get('profit_factor', 0),
-                    'total_trades': result.get('trade_count', 0),
-                    'avg_win': metrics.get('avg_win', 0),
-                    'avg_loss': metrics.get('avg_loss', 0),
-                })
-
-                # Risk metrics
-                row.update({
-                    'var_95': metrics.get('var_95', 0),
-                    'cvar_95': metrics.get('cvar_95', 0),
-                    'annual_volatility': metrics.get('annual_volatility', 0),
-                    'tail_ratio': metrics.get('tail_ratio', 0),
-                    'omega_ratio': metrics.get('omega_ratio', 0),
-                })
-
-                # Distribution metrics
-                row.update({
-                    'skewness': metrics.get('skewness', 0),
-                    'kurtosis': metrics.get('kurtosis', 0),
-                    'avg_rolling_volatility': metrics.get('avg_rolling_volatility', 0),
-                })
-
-                # Benchmark metrics (if available)
-                row.update({
-                    'beta': metrics.get('beta'),
-                    'alpha': metrics.get('alpha'),
-                    'information_ratio': metrics.get('information_ratio'),
-                    'r_squared': metrics.get('r_squared'),
-                    'tracking_error': metrics.get('tracking_error'),
-                })
-
-                consolidated_data.append(row)
-
+                consolidated_data.append(_ranking_row(result))
             except Exception as e:
                 logger.warning(f"Error processing result {result.get('backtest_id', 'unknown')}: {e}")
                 continue
 
-        df = pd.DataFrame(consolidated_data)
+        if not consolidated_data:
+            logger.warning("No results to consolidate")
+            return pd.DataFrame()
 
-        # Convert percentage fields to decimals if needed
-        pct_fields = ['total_return', 'annualized_return', 'max_drawdown', 'win_rate', 'avg_win', 'avg_loss']
-        for field in pct_fields:
-            if field in df.columns:
-                # Check if values are already in decimal form (assume < 10 means decimal)
-                df[field] = df[field].apply(lambda x: x if abs(x) < 10 else x / 100)
+        df = pd.DataFrame(consolidated_data)
 
         logger.info(f"Consolidated {len(df)} results into DataFrame with {len(df.columns)} columns")
         return df
@@ -442,7 +706,7 @@ class RankingResultsConsolidator:
             DataFrame with returns series (dates as index, strategies as columns)
         """
         if results is None:
-            results = self.load_all_results()
+            results = self.iter_results()
 
         returns_data = {}
 
@@ -474,6 +738,224 @@ class RankingResultsConsolidator:
             logger.warning("No returns series could be extracted")
             return pd.DataFrame()
 
+    def _iter_parsed(self, pattern: str, with_returns: bool,
+                     max_workers: Optional[int]) -> Iterator[Tuple[Optional[Dict], Optional[tuple]]]:
+        """
+        Parse result files in worker processes, yielding in file order.
+
+        At most two tasks per worker are in flight, so parsed results never
+        pile up faster than the caller consumes them.
+        """
+        files = (str(path) for path in self.results_dir.glob(pattern))
+        tasks = iter(lambda: list(itertools.islice(files, FILES_PER_TASK)), [])
+
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers <= 1:
+            for paths in tasks:
+                yield from _parse_result_files(paths, with_returns)
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            in_flight: deque = deque()
+            for paths in tasks:
+                in_flight.append(pool.submit(_parse_result_files, paths, with_returns))
+                if len(in_flight) >= 2 * max_workers:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+    def stream_consolidate(self, output_path: Union[str, Path],
+                           pattern: str = "*.json",
+                           returns_path: Optional[Union[str, Path]] = None,
+                           batch_size: int = 4096,
+                           max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Consolidate results with memory independent of the number of result files.
+
+        Files are parsed in a process pool and ranking rows are written in
+        fixed-size record batches to a Parquet, Arrow IPC (.arrow/.feather) or
+        CSV file, chosen by the output suffix. Summary statistics are
+        accumulated per batch. When returns_path is given, equity-curve returns
+        are spooled to disk and assembled into a memory-mapped float32 .npy
+        matrix (periods x strategies, NaN where a strategy has no return),
+        the input format of BlockwiseCorrelationEngine, with strategy names in
+        <returns>.names.txt and period timestamps in <returns>.periods.npy.
+        Columns hold the latest result per strategy, as in get_returns_series.
+
+        Args:
+            output_path: Output file for the consolidated ranking rows
+            pattern: Glob pattern for result files (default: *.json)
+            returns_path: Optional .npy path for the returns matrix
+            batch_size: Rows per record batch
+            max_workers: Worker processes (defaults to CPU count; 1 parses in-process)
+
+        Returns:
+            Dictionary with output paths, row counts and summary statistics
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        writer = _RecordBatchWriter(output_path)
+        summary = StreamingSummary()
+
+        with_returns = returns_path is not None
+        if with_returns:
+            returns_path = Path(returns_path)
+            returns_path.parent.mkdir(parents=True, exist_ok=True)
+            spool_path = returns_path.with_suffix('.spool')
+            spool = open(spool_path, 'wb')
+            spool_buffer: List[np.ndarray] = []
+            spool_pending = 0
+            columns_by_name: Dict[str, int] = {}
+            # Ordinal of the latest result per strategy column (later results replace earlier ones)
+            latest_result: List[int] = []
+
+        batch: Dict[str, list] = {field: [] for field in RANKING_INFO_FIELDS + RANKING_METRIC_FIELDS}
+        rows = skipped = 0
+
+        def write_batch():
+            columns = {
+                field: [None if v is None else str(v) for v in batch[field]]
+                for field in RANKING_INFO_FIELDS
+            }
+            columns.update({field: _float_column(batch[field]) for field in RANKING_METRIC_FIELDS})
+            writer.write(columns)
+            summary.update(columns)
+            for values in batch.values():
+                values.clear()
+
+        def flush_spool():
+            nonlocal spool_pending
+            np.concatenate(spool_buffer).tofile(spool)
+            spool_buffer.clear()
+            spool_pending = 0
+
+        try:
+            for row, returns in self._iter_parsed(pattern, with_returns, max_workers):
+                if row is None:
+                    skipped += 1
+                    continue
+
+                for field, value in row.items():
+                    batch[field].append(value)
+                rows += 1
+                if len(batch['strategy']) >= batch_size:
+                    write_batch()
+
+                if returns is not None:
+                    # A later equity curve replaces the column even when it has no
+                    # returns (all NaN), as in get_returns_series
+                    name, dates, values = returns
+                    column = columns_by_name.setdefault(name, len(columns_by_name))
+                    if column == len(latest_result):
+                        latest_result.append(rows)
+                    else:
+                        latest_result[column] = rows
+                    records = np.empty(len(values), dtype=RETURNS_SPOOL_DTYPE)
+                    records['column'] = column
+                    records['result'] = rows
+                    records['period'] = dates
+                    records['value'] = values
+                    spool_buffer.append(records)
+                    spool_pending += len(records)
+                    if spool_pending >= batch_size * 64:
+                        flush_spool()
+
+            if batch['strategy']:
+                write_batch()
+        finally:
+            writer.close()
+            if with_returns:
+                if spool_buffer:
+                    flush_spool()
+                spool.close()
+
+        medians = {}
+        if rows:
+            for field in ('sharpe_ratio', 'max_drawdown'):
+                values = writer.read_column(field).astype(np.float64)
+                medians[field] = float(np.nanmedian(values)) if (~np.isnan(values)).any() else np.nan
+
+        report = {
+            'output_path': str(output_path),
+            'rows': rows,
+            'skipped': skipped,
+            'summary': summary.result(medians),
+        }
+
+        if with_returns:
+            try:
+                report.update(self._build_returns_matrix(
+                    returns_path, spool_path, list(columns_by_name),
+                    np.asarray(latest_result, dtype=np.int64), batch_size * 64
+                ))
+            finally:
+                spool_path.unlink(missing_ok=True)
+
+        logger.info(f"Streamed {rows} results to {output_path} ({skipped} skipped)")
+        return report
+
+    @staticmethod
+    def _build_returns_matrix(returns_path: Path, spool_path: Path, names: List[str],
+                              latest_result: np.ndarray, chunk_size: int) -> Dict[str, Any]:
+        """
+        Scatter spooled returns into a memory-mapped (periods x strategies) matrix.
+
+        Makes two chunked passes over the spool: the first collects the
+        periods of each strategy's latest result, the second writes values.
+        """
+        spooled = np.memmap(spool_path, dtype=RETURNS_SPOOL_DTYPE, mode='r') \
+            if spool_path.stat().st_size else np.empty(0, dtype=RETURNS_SPOOL_DTYPE)
+
+        def latest_chunks():
+            for start in range(0, len(spooled), chunk_size):
+                chunk = spooled[start:start + chunk_size]
+                yield chunk[chunk['result'] == latest_result[chunk['column']]]
+
+        periods = np.empty(0, dtype=np.int64)
+        for chunk in latest_chunks():
+            periods = np.union1d(periods, chunk['period'])
+
+        matrix = np.lib.format.open_memmap(
+            returns_path, mode='w+', dtype=np.float32, shape=(len(periods), len(names))
+        )
+        matrix[:] = np.nan
+        for chunk in latest_chunks():
+            matrix[np.searchsorted(periods, chunk['period']), chunk['column']] = chunk['value']
+
+        matrix.flush()
+        del matrix, spooled
+
+        names_path = returns_path.with_suffix('.names.txt')
+        names_path.write_text(''.join(f"{name}\n" for name in names))
+        periods_path = returns_path.with_suffix('.periods.npy')
+        np.save(periods_path, periods.astype('datetime64[ns]'))
+
+        logger.info(f"Built returns matrix {returns_path}: {len(periods)} periods x {len(names)} strategies")
+        return {
+            'returns_path': str(returns_path),
+            'names_path': str(names_path),
+            'periods_path': str(periods_path),
+            'n_strategies': len(names),
+            'n_periods': len(periods),
+        }
+
+    @staticmethod
+    def open_returns_matrix(returns_path: Union[str, Path]) -> Tuple[np.ndarray, List[str], pd.DatetimeIndex]:
+        """
+        Open a returns matrix written by stream_consolidate.
+
+        Args:
+            returns_path: Path to the returns .npy file
+
+        Returns:
+            (read-only memory-mapped matrix, strategy names, period index)
+        """
+        returns_path = Path(returns_path)
+        matrix = np.load(returns_path, mmap_mode='r')
+        names = returns_path.with_suffix('.names.txt').read_text().splitlines()
+        periods = pd.DatetimeIndex(np.load(returns_path.with_suffix('.periods.npy')))
+        return matrix, names, periods
+
     def filter_by_criteria(self, df: pd.DataFrame,
                           min_sharpe: float = 0,
                           max_drawdown: float = 1.0,
@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark Suite
+Times each stage of the backtesting pipeline on synthetic, deterministically
+generated OHLCV data and compares the timings against a stored JSON baseline.
+
+Stages:
+- load:      loading bars into the Backtrader feeds a backtest runs on, from
+             CSV (GenericCSVData) vs. cached DataFrames (pickle, parquet)
+- resample:  1-minute feed resampled to 5m / 1h / daily with
+             Cerebro.resampledata, as in benchmark_varm_rsi
+- strategy:  one Backtrader run of each strategy class in strategies/
+- grid:      parameter grid generation (OptimizationService, optimize_runner)
+- parse:     LEAN result JSON parsing in scripts/results_importer.py
+- db_insert: results_importer.insert_backtest_result throughput against the
+             PostgreSQL database configured for results_importer (rows go to
+             a session-local temporary backtest_results table)
+
+Each benchmark runs several rounds and records min/median/mean/max seconds.
+A run fails (exit 1) when any benchmark's --stat (default: min, the least
+noise-sensitive) exceeds the baseline's by more than --threshold, and when
+any benchmark errors, so a broken stage never passes the gate. Baselines are
+not saved from runs with errors.
+
+Strategies that fail to import or run are recorded under "broken", apart from
+the timed benchmarks: they do not block a baseline, but a strategy timed in
+the baseline that breaks later fails the gate.
+
+Usage:
+    python scripts/benchmark_suite.py --save-baseline          # record baseline
+    python scripts/benchmark_suite.py                          # compare to baseline
+    python scripts/benchmark_suite.py --stages load,resample --bars 20000
+    python scripts/benchmark_suite.py --stages load,resample,strategy,grid,parse   # no database
+    python scripts/benchmark_suite.py --threshold 0.10 --output results.json
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = PROJECT_ROOT / 'benchmarks' / 'baseline.json'
+
+STAGES = ('load', 'resample', 'strategy', 'grid', 'parse', 'db_insert')
+
+# strategies/ modules that hold shared infrastructure rather than strategies
+STRATEGY_HELPER_MODULES = {'base_strategy', 'db_logger', 'eod_strategy', 'order_history', 'risk_manager'}
+
+# LEAN (QuantConnect) algorithms in strategies/ are not Backtrader strategies
+LEAN_IMPORT = 'from AlgorithmImports import'
+
+# Columns of backtest_results written by results_importer.insert_backtest_result
+# (types as in db_schema.sql, without the foreign keys)
+RESULT_COLUMNS = (
+    'optimization_run_id', 'strategy_id', 'parameters', 'sharpe_ratio', 'sortino_ratio',
+    'total_return', 'annual_return', 'compounding_annual_return', 'max_drawdown',
+    'annual_std_dev', 'annual_variance', 'total_trades', 'win_rate', 'loss_rate', 'avg_win',
+    'avg_loss', 'profit_loss_ratio', 'total_fees', 'net_profit', 'portfolio_turnover',
+    'estimated_capacity', 'alpha', 'beta', 'meets_criteria', 'rejection_reasons',
+    'backtest_id', 'backtest_name',
+)
+RESULT_COLUMN_TYPES = {
+    'optimization_run_id': 'INT',
+    'strategy_id': 'INT',
+    'parameters': 'JSONB NOT NULL',
+    'total_trades': 'INT',
+    'meets_criteria': 'BOOLEAN DEFAULT false',
+    'rejection_reasons': 'TEXT[]',
+    'backtest_id': 'VARCHAR(100) UNIQUE',
+    'backtest_name': 'VARCHAR(200)',
+}
+
+
+# ============================================================================
+# Synthetic Data
+# ============================================================================
+
+def generate_ohlcv(bars: int, freq: str = 'B', start: str = '2000-01-03', seed: int = 42) -> pd.DataFrame:
+    """Deterministic random-walk OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=bars, freq=freq, name='datetime')
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.004, bars)) * close
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.integers(100_000, 5_000_000, bars).astype(float),
+    }, index=index)
+
+
+def generate_lean_results(directory: Path, count: int, seed: int = 42):
+    """Write LEAN-style optimization result JSON files."""
+    rng = np.random.default_rng(seed)
+    for i in range(count):
+        stats = {
+            'Sharpe Ratio': f"{rng.normal(0.8, 0.5):.3f}",
+            'Sortino Ratio': f"{rng.normal(1.1, 0.6):.3f}",
+            'Compounding Annual Return': f"{rng.normal(12, 8):.3f}%",
+            'Drawdown': f"{abs(rng.normal(15, 5)):.3f}%",
+            'Annual Standard Deviation': f"{abs(rng.normal(0.15, 0.05)):.3f}",
+            'Annual Variance': f"{abs(rng.normal(0.02, 0.01)):.4f}",
+            'Total Orders': str(int(rng.integers(10, 500))),
+            'Win Rate': f"{rng.integers(30, 70)}%",
+            'Loss Rate': f"{rng.integers(30, 70)}%",
+            'Average Win': f"{abs(rng.normal(1.5, 0.5)):.2f}%",
+            'Average Loss': f"{-abs(rng.normal(1.0, 0.4)):.2f}%",
+            'Profit-Loss Ratio': f"{abs(rng.normal(1.4, 0.3)):.2f}",
+            'Total Fees': f"${abs(rng.normal(250, 80)):.2f}",
+            'Net Profit': f"{rng.normal(20, 15):.3f}%",
+            'Portfolio Turnover': f"{abs(rng.normal(5, 2)):.2f}%",
+            'Estimated Strategy Capacity': f"${int(rng.integers(1e5, 1e8))}",
+            'Alpha': f"{rng.normal(0.02, 0.03):.3f}",
+            'Beta': f"{rng.normal(0.9, 0.2):.3f}",
+        }
+        payload = {
+            'BacktestId': f'bench-{seed}-{i:05d}',
+            'Name': f'Benchmark {i}',
+            'Statistics': stats,
+            'ParameterSet': {'fast_period': int(rng.integers(5, 50)), 'slow_period': int(rng.integers(50, 200))},
+        }
+        with open(directory / f'backtest-{i:05d}.json', 'w') as f:
+            json.dump(payload, f)
+
+
+# ============================================================================
+# Benchmark Harness
+# ============================================================================
+
+def measure(func, rounds: int, setup=None, warmup: bool = True) -> dict:
+    """
+    Time func over several rounds.
+
+    Args:
+        func: Callable to time (receives setup()'s return value if setup is given)
+        rounds: Number of timed rounds
+        setup: Optional untimed callable run before each round
+        warmup: Run once untimed first (imports, caches, allocator)
+
+    Returns:
+        Timing statistics in seconds
+    """
+    if warmup:
+        func(setup()) if setup else func()
+
+    times = []
+    for _ in range(rounds):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg) if setup else func()
+        times.append(time.perf_counter() - start)
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'mean': statistics.fmean(times),
+        'max': max(times),
+        'rounds': rounds,
+    }
+
+
+def run_cerebro(*feeds, resample=None):
+    """
+    Run Cerebro over feeds with the no-op base strategy.
+
+    Every bar is loaded (and resampled) exactly as for a real backtest, so the
+    timing covers the feed path without any strategy logic.
+
+    Args:
+        feeds: Backtrader data feeds
+        resample: Optional (timeframe, compression) applied to each feed
+    """
+    cerebro = bt.Cerebro(stdstats=False)
+    for feed in feeds:
+        if resample:
+            timeframe, compression = resample
+            cerebro.resampledata(feed, timeframe=timeframe, compression=compression)
+        else:
+            cerebro.adddata(feed)
+    cerebro.addstrategy(bt.Strategy)
+    cerebro.run()
+
+
+def bench_load(args, workdir: Path) -> dict:
+    """CSV vs. cached-DataFrame loading of the same daily bars into Backtrader feeds."""
+    df = generate_ohlcv(args.bars)
+    csv_path = workdir / 'bars.csv'
+    pickle_path = workdir / 'bars.pkl'
+    df.to_csv(csv_path, date_format='%Y-%m-%d')
+    df.to_pickle(pickle_path)
+
+    def csv_feed():
+        return bt.feeds.GenericCSVData(
+            dataname=str(csv_path), dtformat='%Y-%m-%d', datetime=0, open=1, high=2,
+            low=3, close=4, volume=5, openinterest=-1,
+        )
+
+    loaders = {
+        'csv': csv_feed,
+        'pickle': lambda: bt.feeds.PandasData(dataname=pd.read_pickle(pickle_path)),
+    }
+    try:
+        parquet_path = workdir / 'bars.parquet'
+        df.to_parquet(parquet_path)
+        loaders['parquet'] = lambda: bt.feeds.PandasData(dataname=pd.read_parquet(parquet_path))
+    except ImportError:
+        logger.warning("parquet engine not installed, skipping load.parquet")
+
+    return {
+        f'load.{fmt}': measure(lambda loader=loader: run_cerebro(loader()), args.rounds)
+        for fmt, loader in loaders.items()
+    }
+
+
+def bench_resample(args, workdir: Path) -> dict:
+    """1-minute feed resampled to 5m, 1h and daily bars by Cerebro."""
+    minutes = generate_ohlcv(args.minute_bars, freq='min')
+    targets = {
+        '5min': (bt.TimeFrame.Minutes, 5),
+        '1h': (bt.TimeFrame.Minutes, 60),
+        '1D': (bt.TimeFrame.Days, 1),
+    }
+
+    def run(target):
+        feed = bt.feeds.PandasData(dataname=minutes, timeframe=bt.TimeFrame.Minutes, compression=1)
+        run_cerebro(feed, resample=target)
+
+    return {
+        f'resample.{rule}': measure(lambda target=target: run(target), args.rounds)
+        for rule, target in targets.items()
+    }
+
+
+def discover_strategies() -> tuple:
+    """
+    Find every bt.Strategy subclass defined in strategies/.
+
+    Returns:
+        ([(name, class)], {module name: import error}) - LEAN algorithms are skipped
+    """
+    found, failed = [], {}
+    for path in sorted((PROJECT_ROOT / 'strategies').glob('*.py')):
+        if path.stem in STRATEGY_HELPER_MODULES or path.stem.startswith('_'):
+            continue
+        if LEAN_IMPORT in path.read_text():
+            continue
+        module_name = f'strategies.{path.stem}'
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            failed[path.stem] = f'{type(e).__name__}: {e}'
+            continue
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, bt.Strategy) and cls.__module__ == module_name:
+                found.append((f'{path.stem}.{name}', cls))
+    return found, failed
+
+
+def bench_strategy(args, workdir: Path) -> dict:
+    """One Backtrader run of each strategy on the synthetic daily bars."""
+    df = generate_ohlcv(args.bars)
+    strategies, failed = discover_strategies()
+    results = {
+        f'strategy.{module}': {'broken': f'import failed: {error}'}
+        for module, error in failed.items()
+        if not args.strategy_filter or args.strategy_filter in module
+    }
+    for name, strategy_cls in strategies:
+        if args.strategy_filter and args.strategy_filter not in name:
+            continue
+
+        def run(strategy_cls=strategy_cls):
+            cerebro = bt.Cerebro(stdstats=False)
+            cerebro.adddata(bt.feeds.PandasData(dataname=df), name='SYN')
+            cerebro.addstrategy(strategy_cls)
+            cerebro.broker.setcash(100000)
+            # Strategies print their own trade logs; keep them off the report
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                cerebro.run()
+
+        try:
+            results[f'strategy.{name}'] = measure(run, args.strategy_rounds, warmup=False)
+        except Exception as e:
+            results[f'strategy.{name}'] = {'broken': f'{type(e).__name__}: {e}'}
+    return results
+
+
+def bench_grid(args, workdir: Path) -> dict:
+    """Parameter grid generation as used by the optimization service and runner."""
+    from backend.schemas.optimization import ParameterRange
+    from backend.services.optimization_service import OptimizationService
+    from scripts.optimize_runner import calculate_combinations
+
+    # grid_size values per parameter, four parameters
+    n = args.grid_size
+    ranges = {f'p{i}': {'start': 1, 'end': n, 'step': 1} for i in range(4)}
+    service = OptimizationService(db_session=None)
+    typed_ranges = {name: ParameterRange(**spec) for name, spec in ranges.items()}
+
+    return {
+        'grid.optimization_service': measure(lambda: service._generate_combinations(typed_ranges), args.rounds),
+        'grid.calculate_combinations': measure(lambda: calculate_combinations(ranges), args.rounds),
+    }
+
+
+def bench_parse(args, workdir: Path) -> dict:
+    """Finding and parsing LEAN optimization result files."""
+    from scripts.results_importer import find_optimization_results, parse_backtest_result
+
+    results_dir = workdir / 'optimization'
+    results_dir.mkdir(exist_ok=True)
+    generate_lean_results(results_dir, args.result_files)
+
+    def parse_all():
+        return [parse_backtest_result(f) for f in find_optimization_results(results_dir)]
+
+    return {'parse.results_importer': measure(parse_all, args.rounds)}
+
+
+def bench_db_insert(args, workdir: Path) -> dict:
+    """results_importer.insert_backtest_result throughput (one commit per row)."""
+    import psycopg2
+    from scripts import results_importer as importer
+
+    results_dir = workdir / 'optimization'
+    if not results_dir.exists():
+        results_dir.mkdir()
+        generate_lean_results(results_dir, args.result_files)
+    parsed = [r for r in (importer.parse_backtest_result(f)
+                          for f in importer.find_optimization_results(results_dir)) if r]
+    criteria = importer.load_success_criteria()
+    evaluated = [(r, *importer.evaluate_result(r, criteria)) for r in parsed]
+
+    conn = psycopg2.connect(
+        dbname=importer.DB_NAME,
+        user=importer.DB_USER,
+        password=importer.DB_PASSWORD,
+        host=importer.DB_HOST,
+        port=importer.DB_PORT,
+        connect_timeout=10,
+    )
+    try:
+        # A temporary table shadows backtest_results for this session only
+        columns = ', '.join(f"{name} {RESULT_COLUMN_TYPES.get(name, 'DOUBLE PRECISION')}"
+                            for name in RESULT_COLUMNS)
+        with conn.cursor() as cursor:
+            cursor.execute(f"CREATE TEMPORARY TABLE backtest_results (id SERIAL PRIMARY KEY, {columns})")
+        conn.commit()
+
+        def empty_table():
+            with conn.cursor() as cursor:
+                cursor.execute("TRUNCATE pg_temp.backtest_results")
+            conn.commit()
+
+        def insert_all(_):
+            for result, meets_criteria, reasons in evaluated:
+                if not importer.insert_backtest_result(conn, 1, 1, result, meets_criteria, reasons):
+                    raise RuntimeError(f"insert_backtest_result failed for {result['backtest_id']}")
+
+        stats = measure(insert_all, args.rounds, setup=empty_table)
+    finally:
+        conn.close()
+
+    stats['rows_per_second'] = len(evaluated) / stats['median'] if stats['median'] else None
+    return {'db_insert.results_importer': stats}
+
+
+STAGE_FUNCTIONS = {
+    'load': bench_load,
+    'resample': bench_resample,
+    'strategy': bench_strategy,
+    'grid': bench_grid,
+    'parse': bench_parse,
+    'db_insert': bench_db_insert,
+}
+
+
+# ============================================================================
+# Baselines
+# ============================================================================
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float, stat: str = 'min') -> list:
+    """
+    Compare timings against a baseline.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Allowed fractional slowdown
+        stat: Timing statistic to compare (min, median, mean, max)
+
+    Returns:
+        List of (name, baseline seconds, current seconds, ratio) regressions
+    """
+    regressions = []
+    for name, current in results['benchmarks'].items():
+        previous = baseline.get('benchmarks', {}).get(name)
+        if not previous or stat not in previous or stat not in current:
+            continue
+        ratio = current[stat] / previous[stat] if previous[stat] else float('inf')
+        if ratio > 1 + threshold:
+            regressions.append((name, previous[stat], current[stat], ratio))
+    return regressions
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Benchmark backtesting pipeline stages against a baseline')
+    parser.add_argument('--stages', default=','.join(STAGES), help=f'Comma-separated stages (default: all of {",".join(STAGES)})')
+    parser.add_argument('--bars', type=int, default=5000, help='Daily bars for load/strategy stages (default: 5000)')
+    parser.add_argument('--minute-bars', type=int, default=390 * 63, help='Minute bars for resampling (default: one quarter)')
+    parser.add_argument('--grid-size', type=int, default=10, help='Values per parameter in the 4-parameter grid (default: 10)')
+    parser.add_argument('--result-files', type=int, default=1000, help='LEAN result files to parse/insert (default: 1000)')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed rounds per benchmark (default: 5)')
+    parser.add_argument('--strategy-rounds', type=int, default=1, help='Timed rounds per strategy run (default: 1)')
+    parser.add_argument('--strategy-filter', help='Only run strategies whose name contains this text')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline JSON path')
+    parser.add_argument('--save-baseline', action='store_true', help='Write results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.20, help='Allowed slowdown vs. baseline (default: 0.20)')
+    parser.add_argument('--stat', default='min', choices=('min', 'median', 'mean', 'max'),
+                        help='Timing statistic compared against the baseline (default: min)')
+    parser.add_argument('--output', help='Also write results JSON to this path')
+    return parser.parse_args()
+
+
+def main():
+    """Main execution flow"""
+    args = parse_args()
+    logging.disable(logging.INFO)
+
+    stages = [s.strip() for s in args.stages.split(',') if s.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        print(f"Unknown stages: {', '.join(sorted(unknown))}")
+        return 2
+
+    config = {
+        'bars': args.bars, 'minute_bars': args.minute_bars, 'grid_size': args.grid_size,
+        'result_files': args.result_files,
+    }
+    results = {
+        'meta': {
+            'created': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'config': config,
+        },
+        'benchmarks': {},
+        'broken': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix='bench_') as tmp:
+        workdir = Path(tmp)
+        for stage in stages:
+            print(f"Running {stage}...")
+            try:
+                stage_results = STAGE_FUNCTIONS[stage](args, workdir)
+            except Exception as e:
+                stage_results = {stage: {'error': f'{type(e).__name__}: {e}'}}
+            for name, stats in stage_results.items():
+                if 'broken' in stats:
+                    results['broken'][name] = stats['broken']
+                    print(f"  {name:<55} BROKEN {stats['broken']}")
+                    continue
+                results['benchmarks'][name] = stats
+                if 'error' in stats:
+                    print(f"  {name:<55} ERROR {stats['error']}")
+                else:
+                    print(f"  {name:<55} median {stats['median'] * 1000:10.2f} ms  "
+                          f"min {stats['min'] * 1000:10.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    errors = [name for name, stats in results['benchmarks'].items() if 'error' in stats]
+    if results['broken']:
+        print(f"\nSkipped {len(results['broken'])} broken strategy benchmark(s): "
+              f"{', '.join(results['broken'])}")
+    if errors:
+        print(f"\nERRORS in {len(errors)} benchmark(s): {', '.join(errors)}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        if errors:
+            print("Baseline not saved")
+            return 1
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(baseline_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved: {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path} (run with --save-baseline to create one)")
+        return 1 if errors else 0
+
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)
+    if baseline.get('meta', {}).get('config') != config:
+        print(f"\nBaseline was recorded with different data sizes: {baseline.get('meta', {}).get('config')}")
+        return 2
+
+    # Broken strategies only pass the gate if they were already broken at the baseline
+    newly_broken = [name for name in results['broken'] if name in baseline.get('benchmarks', {})]
+    if newly_broken:
+        print(f"\nBROKEN since baseline: {', '.join(newly_broken)}")
+        errors += newly_broken
+
+    regressions = compare_to_baseline(results, baseline, args.threshold, args.stat)
+    if regressions:
+        print(f"\nREGRESSIONS ({args.stat} > {args.threshold:.0%} slower than baseline):")
+        for name, before, after, ratio in regressions:
+            print(f"  {name:<55} {before * 1000:10.2f} ms -> {after * 1000:10.2f} ms ({ratio:.2f}x)")
+        return 1
+
+    print(f"\nNo regressions beyond {args.threshold:.0%} against {baseline_path}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+VARM-RSI Filter Benchmark
+Profiles VARM_RSI on synthetic 1-minute data resampled to 5m/1h/4h/daily,
+comparing the RollingSlope/line-indicator filters against the legacy
+per-bar np.polyfit slope implementation.
+
+Entry/exit thresholds are relaxed so every filter is evaluated on every
+bar (worst case for the legacy implementation).
+
+Usage:
+    python scripts/benchmark_varm_rsi.py              # one year of minute bars
+    python scripts/benchmark_varm_rsi.py --days 20    # quick run
+    python scripts/benchmark_varm_rsi.py --profile    # include cProfile top functions
+"""
+
+import argparse
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import time
+from pathlib import Path
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from strategies.varm_rsi import VARM_RSI  # noqa: E402
+
+# Every filter evaluated on every bar
+BENCHMARK_PARAMS = {
+    'rsi_entry_threshold': 101,
+    'atr_min_volatility': -1.0,
+    'volume_multiplier': 0.0,
+    'sma_slope_threshold': -1e9,
+    'rsi_1h_threshold': -1,
+    'use_market_filters': False,
+    'exclude_earnings': False,
+    'printlog': False,
+    'log_signals': False,
+    'log_orders': False,
+    'log_trades': False,
+}
+
+
+class TimedFilters:
+    """Mixin accumulating wall time spent in should_enter()/should_exit()."""
+
+    filter_seconds = 0.0
+
+    def should_enter(self) -> bool:
+        start = time.perf_counter()
+        try:
+            return super().should_enter()
+        finally:
+            self.filter_seconds += time.perf_counter() - start
+
+    def should_exit(self, symbol):
+        start = time.perf_counter()
+        try:
+            return super().should_exit(symbol)
+        finally:
+            self.filter_seconds += time.perf_counter() - start
+
+
+class TimedVARM_RSI(TimedFilters, VARM_RSI):
+    """VARM_RSI with RollingSlope/line-indicator filters."""
+
+
+class LegacySlopeVARM_RSI(VARM_RSI):
+    """VARM_RSI with the previous list + np.polyfit slope filters."""
+
+    @staticmethod
+    def _polyfit_slope(indicator, period):
+        if len(indicator) < period + 1:
+            return 0.0
+        y = [indicator[-i] for i in range(period + 1)]
+        x = list(range(period + 1))
+        try:
+            return np.polyfit(x, y, 1)[0]
+        except Exception:
+            return 0.0
+
+    def should_enter(self) -> bool:
+        if self.rsi[0] >= self.p.rsi_entry_threshold:
+            return False
+        if self.atr[0] <= self.p.atr_min_volatility:
+            return False
+        if self.primary_data.volume[0] <= self.volume_sma[0] * self.p.volume_multiplier:
+            return False
+        if self.data_daily is not None:
+            if self._polyfit_slope(self.sma, 5) <= self.p.sma_slope_threshold:
+                return False
+        if self.rsi_1h is not None and self.rsi_1h[0] <= self.p.rsi_1h_threshold:
+            return False
+        if self._polyfit_slope(self.obv, 5) <= 0:
+            return False
+        if self.bear_power[0] >= -self.atr[0]:
+            return False
+        return True
+
+    def should_exit(self, symbol):
+        if self.rsi_4h is not None and self.rsi_4h[0] < self.p.rsi_4h_exit_threshold:
+            return True, "momentum_failure"
+        if self._polyfit_slope(self.atr, 10) < -0.1:
+            return True, "volatility_contraction"
+        return False, ""
+
+
+class TimedLegacySlopeVARM_RSI(TimedFilters, LegacySlopeVARM_RSI):
+    """Legacy filters with timing."""
+
+
+def generate_minute_data(days: int, seed: int = 42) -> pd.DataFrame:
+    """Deterministic random-walk OHLCV at 1-minute resolution (390 bars/day)."""
+    rng = np.random.default_rng(seed)
+    sessions = pd.bdate_range('2023-01-02', periods=days)
+    index = (sessions.repeat(390) + pd.Timedelta(hours=9, minutes=30)
+             + pd.to_timedelta(np.tile(np.arange(390), days), unit='min'))
+
+    n = len(index)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.0008, n)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.0005, n)) * close
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + spread,
+        'low': np.minimum(open_, close) - spread,
+        'close': close,
+        'volume': rng.integers(1_000, 50_000, n).astype(float),
+    }, index=index)
+
+
+def run_backtest(strategy_cls, df: pd.DataFrame, symbol: str = 'SYN', profile: bool = False):
+    """Run one backtest and return (elapsed seconds, strategy, optional profile text)."""
+    cerebro = bt.Cerebro(stdstats=False)
+    minute = bt.feeds.PandasData(dataname=df, timeframe=bt.TimeFrame.Minutes, compression=1)
+    cerebro.resampledata(minute, timeframe=bt.TimeFrame.Minutes, compression=5, name=f'{symbol}_5m')
+    cerebro.resampledata(minute, timeframe=bt.TimeFrame.Minutes, compression=60, name=f'{symbol}_1h')
+    cerebro.resampledata(minute, timeframe=bt.TimeFrame.Minutes, compression=240, name=f'{symbol}_4h')
+    cerebro.resampledata(minute, timeframe=bt.TimeFrame.Days, compression=1, name=f'{symbol}_daily')
+    cerebro.addstrategy(strategy_cls, **BENCHMARK_PARAMS)
+    cerebro.broker.setcash(100000)
+
+    profiler = cProfile.Profile() if profile else None
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    strat = cerebro.run()[0]
+    if profiler:
+        profiler.disable()
+    elapsed = time.perf_counter() - start
+
+    report = None
+    if profiler:
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats('cumulative').print_stats(15)
+        report = buffer.getvalue()
+
+    return elapsed, strat, report
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Benchmark VARM-RSI slope/filter indicators')
+    parser.add_argument('--days', type=int, default=252, help='Trading days of minute data (default: 252)')
+    parser.add_argument('--profile', action='store_true', help='Print cProfile top functions for each run')
+    return parser.parse_args()
+
+
+def main():
+    """Main execution flow"""
+    args = parse_args()
+    logging.disable(logging.CRITICAL)
+
+    df = generate_minute_data(args.days)
+    print(f"Synthetic data: {len(df):,} minute bars over {args.days} trading days")
+
+    results = {}
+    for label, strategy_cls in (('legacy polyfit', TimedLegacySlopeVARM_RSI),
+                                ('RollingSlope', TimedVARM_RSI)):
+        elapsed, strat, report = run_backtest(strategy_cls, df, profile=args.profile)
+        results[label] = (elapsed, strat.filter_seconds)
+        print(f"{label:>15}: total {elapsed:8.2f}s  filters {strat.filter_seconds:7.3f}s  "
+              f"trades={strat.trade_count}")
+        if report:
+            print(report)
+
+    legacy, rolling = results['legacy polyfit'], results['RollingSlope']
+    print(f"Speedup: total {legacy[0] / rolling[0]:.2f}x, filters {legacy[1] / rolling[1]:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -28,6 +28,7 @@ CREATE TABLE IF NOT EXISTS backtest_jobs (
     container_id VARCHAR(100),               -- Docker container tracking
     result_path VARCHAR(500),                -- LEAN output directory path
     error_message TEXT,                      -- Failure details
+    stage_timings JSONB,                     -- Stage durations in seconds {"container_start": 1.2, "lean_execution": 84.5}
     created_at TIMESTAMP DEFAULT NOW(),
     started_at TIMESTAMP,
     completed_at TIMESTAMP
@@ -42,6 +43,7 @@ CREATE TABLE IF NOT EXISTS optimization_batches (
     completed_jobs INT DEFAULT 0,            -- Jobs completed so far
     status VARCHAR(50) DEFAULT 'running',    -- running, completed, failed
     best_result_id INT REFERENCES backtest_jobs(id), -- Best performing job
+    stage_timings JSONB,                     -- Batch-level stage durations {"combination_generation": 0.02}
     created_at TIMESTAMP DEFAULT NOW(),
     completed_at TIMESTAMP
 );
@@ -194,6 +196,10 @@ JOIN backtest_jobs bj ON br.job_id = bj.id
 GROUP BY DATE(br.created_at)
 ORDER BY date DESC;
 
+-- Stage profiling columns for databases created before they were added
+ALTER TABLE backtest_jobs ADD COLUMN IF NOT EXISTS stage_timings JSONB;
+ALTER TABLE optimization_batches ADD COLUMN IF NOT EXISTS stage_timings JSONB;
+
 -- Indexes for V2 performance
 CREATE INDEX IF NOT EXISTS idx_jobs_batch ON backtest_jobs(batch_id);
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON backtest_jobs(status);
@@ -14,6 +14,15 @@ import psycopg2
 from psycopg2.extras import Json
 from dotenv import load_dotenv
 
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.services.profiling import (  # noqa: E402
+    StageTimer,
+    start_metrics_server,
+    summarize_stage_timings,
+)
+
 # Load environment variables
 load_dotenv()
 
@@ -51,6 +60,11 @@ def parse_args():
         action='store_true',
         help='Parse files but do not insert into database'
     )
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        help='Expose stage durations on a local Prometheus scrape endpoint (requires prometheus_client)'
+    )
 
     return parser.parse_args()
 
@@ -377,17 +391,36 @@ def update_optimization_run_status(conn, run_id, total_results, passed_results):
         return False
 
 
+def print_stage_profile(run_timer, result_timers):
+    """Print run-level stage durations and per-result stage percentiles"""
+    print("\nStage profile (seconds):")
+    for stage, seconds in run_timer.timings.items():
+        print(f"  {stage:<16} {seconds:10.4f}")
+
+    for stage, stats in summarize_stage_timings(t.timings for t in result_timers).items():
+        print(f"  {stage:<16} {stats['total']:10.4f}  "
+              f"n={stats['count']} p50={stats['p50'] * 1000:.2f}ms "
+              f"p95={stats['p95'] * 1000:.2f}ms p99={stats['p99'] * 1000:.2f}ms")
+
+
 def main():
     """Main execution flow"""
     args = parse_args()
 
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port)
+
+    run_timer = StageTimer(component="results_importer")
+    result_timers = []
+
     print("\n" + "="*60)
     print("LEAN OPTIMIZATION RESULTS IMPORTER")
     print("="*60)
 
     # Find result files
     try:
-        json_files = find_optimization_results(args.optimization_dir)
+        with run_timer.span('find'):
+            json_files = find_optimization_results(args.optimization_dir)
         print(f"\n✅ Found {len(json_files)} JSON files in {args.optimization_dir}")
     except Exception as e:
         print(f"\n❌ Error finding results: {e}")
@@ -401,9 +434,12 @@ def main():
     print(f"\nParsing backtest results...")
     parsed_results = []
     for json_file in json_files:
-        result = parse_backtest_result(json_file)
+        timer = StageTimer(component="results_importer")
+        with timer.span('parse'):
+            result = parse_backtest_result(json_file)
         if result:
             parsed_results.append(result)
+            result_timers.append(timer)
             print(f"  ✅ Parsed: {json_file.name}")
         else:
             print(f"  ⚠️  Skipped: {json_file.name}")
@@ -419,8 +455,9 @@ def main():
     passed_count = 0
     evaluations = []
 
-    for result in parsed_results:
-        meets_criteria, reasons = evaluate_result(result, criteria)
+    for result, timer in zip(parsed_results, result_timers):
+        with timer.span('evaluate'):
+            meets_criteria, reasons = evaluate_result(result, criteria)
         evaluations.append((result, meets_criteria, reasons))
 
         if meets_criteria:
@@ -433,17 +470,19 @@ def main():
         print("\n" + "="*60)
         print("DRY RUN MODE - No database insertion")
         print("="*60)
+        print_stage_profile(run_timer, result_timers)
         return 0
 
     # Connect to database
     try:
-        conn = psycopg2.connect(
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            host=DB_HOST,
-            port=DB_PORT
-        )
+        with run_timer.span('db_connect'):
+            conn = psycopg2.connect(
+                dbname=DB_NAME,
+                user=DB_USER,
+                password=DB_PASSWORD,
+                host=DB_HOST,
+                port=DB_PORT
+            )
         print(f"\n✅ Connected to PostgreSQL: {DB_NAME}")
     except psycopg2.Error as e:
         print(f"\n❌ Database connection failed: {e}")
@@ -478,8 +517,9 @@ def main():
     print(f"\nInserting {len(evaluations)} results into database...")
     inserted_count = 0
 
-    for result, meets_criteria, reasons in evaluations:
-        success = insert_backtest_result(conn, run_id, strategy_id, result, meets_criteria, reasons)
+    for (result, meets_criteria, reasons), timer in zip(evaluations, result_timers):
+        with timer.span('db_insert'):
+            success = insert_backtest_result(conn, run_id, strategy_id, result, meets_criteria, reasons)
         if success:
             inserted_count += 1
 
@@ -500,6 +540,7 @@ def main():
     print(f"Passed criteria: {passed_count}")
     print(f"Inserted to DB: {inserted_count}")
     print("="*60)
+    print_stage_profile(run_timer, result_timers)
 
     return 0
 
@@ -20,9 +20,18 @@ import backtrader as bt
 import logging
 from datetime import time
 
+from strategies.order_history import OrderHistoryBuffer
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+}
+
 
 class BaseStrategy(bt.Strategy):
     """
@@ -34,6 +43,11 @@ class BaseStrategy(bt.Strategy):
     - Position sizing helpers
     - Logging integration
     - Notification handlers
+
+    Logging modes (log_mode param):
+    - 'text': formatted log lines, built only when the level is enabled
+    - 'silent': no log messages are built at all (optimization sweeps);
+      executions are still recorded in the columnar order_history
     """
 
     params = (
@@ -42,6 +56,9 @@ class BaseStrategy(bt.Strategy):
         ('printlog', True),             # Enable logging
         ('log_trades', True),           # Log trade execution
         ('log_orders', True),           # Log order events
+        ('log_mode', 'text'),           # 'text' or 'silent' (no log formatting at all)
+        ('order_history_capacity', 1024),  # Preallocated order history rows
+        ('order_trace_file', None),     # Optional binary order trace path (see order_history.replay_trace)
     )
 
     def __init__(self):
@@ -58,8 +75,11 @@ class BaseStrategy(bt.Strategy):
         # Track pending orders (one per data feed)
         self.orders = {}  # data -> order mapping
 
-        # Track order history for analysis
-        self.order_history = []
+        # Track order history for analysis (columnar NumPy buffer)
+        self.order_history = OrderHistoryBuffer(
+            capacity=self.params.order_history_capacity,
+            trace_path=self.params.order_trace_file,
+        )
 
         # Initialize counters
         self.bar_count = 0
@@ -67,16 +87,33 @@ class BaseStrategy(bt.Strategy):
 
         logger.info(f"{self.__class__.__name__} initialized")
 
-    def log(self, txt, dt=None, level='INFO'):
+    def log_enabled(self, level='INFO'):
+        """
+        Check whether a message at this level would be emitted.
+
+        Guard expensive message construction with this in hot paths.
+
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
+
+        Returns:
+            True if log() would output a message at this level
+        """
+        return (self.params.printlog
+                and self.params.log_mode != 'silent'
+                and logger.isEnabledFor(LOG_LEVELS.get(level, logging.INFO)))
+
+    def log(self, txt, *args, dt=None, level='INFO'):
         """
         Logging function with timestamp.
 
         Args:
-            txt: Message to log
+            txt: Message to log, or a %-style format string when args are given
+            *args: Format arguments; formatting is deferred until the record is emitted
             dt: Optional datetime (uses current bar time if None)
-            level: Log level (INFO, WARNING, ERROR)
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
         """
-        if not self.params.printlog:
+        if not self.log_enabled(level):
             return
 
         # Check if data is available
@@ -88,14 +125,11 @@ class BaseStrategy(bt.Strategy):
             from datetime import datetime
             timestamp = datetime.now().isoformat()
 
-        if level == 'INFO':
-            logger.info(f'{timestamp} | {txt}')
-        elif level == 'WARNING':
-            logger.warning(f'{timestamp} | {txt}')
-        elif level == 'ERROR':
-            logger.error(f'{timestamp} | {txt}')
+        levelno = LOG_LEVELS.get(level, logging.INFO)
+        if args:
+            logger.log(levelno, '%s | ' + txt, timestamp, *args)
         else:
-            logger.info(f'{timestamp} | {txt}')
+            logger.log(levelno, '%s | %s', timestamp, txt)
 
     # ===================================================================
     # Order Notification Methods (Equivalent to LEAN's OnOrderEvent)
@@ -116,46 +150,53 @@ class BaseStrategy(bt.Strategy):
 
         # Pending states
         if order.status in [order.Submitted, order.Accepted]:
-            if self.params.log_orders:
-                self.log(f'Order {order.ref} {"SUBMITTED" if order.status == order.Submitted else "ACCEPTED"}: '
-                        f'{order.tradeid} {data._name} '
-                        f'{"BUY" if order.isbuy() else "SELL"} {order.created.size}')
+            if self.params.log_orders and self.log_enabled('INFO'):
+                self.log('Order %s %s: %s %s %s %s',
+                         order.ref,
+                         'SUBMITTED' if order.status == order.Submitted else 'ACCEPTED',
+                         order.tradeid, data._name,
+                         'BUY' if order.isbuy() else 'SELL', order.created.size)
             return
 
         # Completed orders
         if order.status in [order.Completed]:
-            if order.isbuy():
-                self.log(f'BUY EXECUTED: {data._name} | '
-                        f'Price: ${order.executed.price:.2f} | '
-                        f'Size: {order.executed.size} | '
-                        f'Cost: ${order.executed.value:.2f} | '
-                        f'Comm: ${order.executed.comm:.2f}',
-                        level='INFO' if self.params.log_trades else 'DEBUG')
-
-            elif order.issell():
-                self.log(f'SELL EXECUTED: {data._name} | '
-                        f'Price: ${order.executed.price:.2f} | '
-                        f'Size: {order.executed.size} | '
-                        f'Value: ${order.executed.value:.2f} | '
-                        f'Comm: ${order.executed.comm:.2f}',
-                        level='INFO' if self.params.log_trades else 'DEBUG')
+            executed = order.executed
+            level = 'INFO' if self.params.log_trades else 'DEBUG'
+
+            if self.log_enabled(level):
+                if order.isbuy():
+                    self.log('BUY EXECUTED: %s | Price: $%.2f | Size: %s | Cost: $%.2f | Comm: $%.2f',
+                             data._name, executed.price, executed.size, executed.value, executed.comm,
+                             level=level)
+                elif order.issell():
+                    self.log('SELL EXECUTED: %s | Price: $%.2f | Size: %s | Value: $%.2f | Comm: $%.2f',
+                             data._name, executed.price, executed.size, executed.value, executed.comm,
+                             level=level)
 
             # Record order execution
-            self.order_history.append({
-                'datetime': self.datas[0].datetime.datetime(0),
-                'type': 'BUY' if order.isbuy() else 'SELL',
-                'symbol': data._name,
-                'size': order.executed.size,
-                'price': order.executed.price,
-                'value': order.executed.value,
-                'commission': order.executed.comm,
-            })
+            self.order_history.append(
+                self.datas[0].datetime[0],
+                order.isbuy(),
+                data._name,
+                executed.size,
+                executed.price,
+                executed.value,
+                executed.comm,
+            )
 
         # Failed orders
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
-            self.log(f'Order {order.ref} FAILED: '
-                    f'{"CANCELED" if order.status == order.Canceled else "MARGIN" if order.status == order.Margin else "REJECTED"}',
-                    level='WARNING')
+            if self.log_enabled('WARNING'):
+                self.log('Order %s FAILED: %s',
+                         order.ref,
+                         "CANCELED" if order.status == order.Canceled else "MARGIN" if order.status == order.Margin else "REJECTED",
+                         level='WARNING')
+
+        # Keep risk manager position state in sync with fills
+        if order.status in [order.Partial, order.Completed]:
+            risk_manager = getattr(self, 'risk_manager', None)
+            if risk_manager:
+                risk_manager.on_order_notify(order)
 
         # Clear the order reference
         if data in self.orders and self.orders[data] == order:
@@ -171,17 +212,21 @@ class BaseStrategy(bt.Strategy):
         Args:
             trade: Backtrader Trade object
         """
+        risk_manager = getattr(self, 'risk_manager', None)
+        if risk_manager:
+            risk_manager.on_trade_notify(trade)
+
         if not trade.isclosed:
             return
 
         self.trade_count += 1
-        pnl_pct = (trade.pnlcomm / abs(trade.value)) * 100 if trade.value != 0 else 0
 
-        self.log(f'TRADE CLOSED: {trade.data._name} | '
-                f'Gross P&L: ${trade.pnl:.2f} | '
-                f'Net P&L: ${trade.pnlcomm:.2f} ({pnl_pct:+.2f}%) | '
-                f'Bars: {trade.barlen}',
-                level='INFO' if self.params.log_trades else 'DEBUG')
+        level = 'INFO' if self.params.log_trades else 'DEBUG'
+        if self.log_enabled(level):
+            pnl_pct = (trade.pnlcomm / abs(trade.value)) * 100 if trade.value != 0 else 0
+            self.log('TRADE CLOSED: %s | Gross P&L: $%.2f | Net P&L: $%.2f (%+.2f%%) | Bars: %s',
+                     trade.data._name, trade.pnl, trade.pnlcomm, pnl_pct, trade.barlen,
+                     level=level)
 
     # ===================================================================
     # Main Strategy Logic (Equivalent to LEAN's OnData)
@@ -221,7 +266,7 @@ class BaseStrategy(bt.Strategy):
         self.bar_count += 1
 
         # Log portfolio status periodically (every 20 bars)
-        if self.bar_count % 20 == 0:
+        if self.bar_count % 20 == 0 and self.log_enabled('DEBUG'):
             self.log(f'Portfolio Value: ${self.broker.getvalue():,.2f} | '
                     f'Cash: ${self.broker.getcash():,.2f} | '
                     f'Bars: {self.bar_count}',
@@ -417,6 +462,8 @@ class BaseStrategy(bt.Strategy):
 
     def stop(self):
         """Called when strategy ends."""
+        self.order_history.close()
+
         self.log(f"Strategy stopping. Final value: ${self.broker.getvalue():,.2f}")
         self.log(f"Total trades: {self.trade_count}")
         self.log(f"Total bars processed: {self.bar_count}")
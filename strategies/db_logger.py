@@ -10,15 +10,26 @@ Provides database logging capabilities for Backtrader strategies:
 - Risk event logging
 - Daily summaries
 
+Writes go through BufferedDBWriter: one long-lived SQLite connection,
+events buffered in memory and flushed with executemany() in a single
+transaction every `batch_size` events, at each simulated day boundary
+and on close(). Optionally a background thread performs the writes so
+next() never blocks on disk.
+
 Integrates with:
 - scripts/db_manager.py (database schema)
 - strategies/base_strategy.py (base class)
 - strategies/risk_manager.py (risk events)
 """
 
+import itertools
 import logging
+import queue
+import sqlite3
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, Tuple
 import backtrader as bt
 
 from scripts.db_manager import DBManager
@@ -27,6 +38,223 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+POSITION_HISTORY_INSERT = """
+    INSERT INTO position_history
+    (symbol, algorithm, quantity, price, pnl, event_type, order_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+POSITION_DELETE = "DELETE FROM positions WHERE symbol = ? AND algorithm = ?"
+
+POSITION_UPSERT = """
+    INSERT INTO positions
+    (symbol, algorithm, quantity, cost_basis, average_price,
+     current_price, unrealized_pnl, entry_date, last_updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(symbol) DO UPDATE SET
+        quantity = excluded.quantity,
+        cost_basis = excluded.cost_basis,
+        average_price = excluded.average_price,
+        current_price = excluded.current_price,
+        unrealized_pnl = excluded.unrealized_pnl,
+        last_updated = excluded.last_updated
+"""
+
+RISK_EVENT_INSERT = """
+    INSERT INTO risk_events
+    (event_type, severity, symbol, algorithm, message,
+     portfolio_value, position_value, limit_value, breach_pct, action_taken)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+DAILY_SUMMARY_UPSERT = """
+    INSERT INTO daily_summaries
+    (date, algorithm, starting_equity, ending_equity, total_pnl, total_pnl_pct,
+     trades_count, winning_trades, losing_trades, win_rate,
+     total_commission, positions_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        ending_equity = excluded.ending_equity,
+        total_pnl = excluded.total_pnl,
+        total_pnl_pct = excluded.total_pnl_pct,
+        trades_count = excluded.trades_count,
+        winning_trades = excluded.winning_trades,
+        losing_trades = excluded.losing_trades,
+        win_rate = excluded.win_rate,
+        total_commission = excluded.total_commission,
+        positions_count = excluded.positions_count,
+        timestamp = CURRENT_TIMESTAMP
+"""
+
+
+class BufferedDBWriter:
+    """
+    Buffered SQLite writer backed by a single long-lived connection.
+
+    Statements are queued in memory and written in one transaction once
+    `batch_size` statements are pending or flush() is called. Consecutive
+    statements sharing the same SQL are sent through executemany(), so
+    write order is preserved while sqlite3's statement cache reuses the
+    prepared statement for every row.
+
+    With background=True a daemon thread owns the connection and performs
+    the writes; flush() then only hands the batch over and returns. If the
+    thread dies, queued and later batches are written synchronously instead.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 500,
+                 background: bool = False, max_pending_batches: int = 16):
+        """
+        Initialize buffered writer.
+
+        Args:
+            db_path: Path to SQLite database
+            batch_size: Number of buffered statements that triggers a flush
+            background: Perform writes on a dedicated writer thread
+            max_pending_batches: Batches queued for the writer thread before
+                flush() blocks (bounds memory in background mode)
+        """
+        self.db_path = str(db_path)
+        self.batch_size = max(1, int(batch_size))
+        self.background = background
+
+        self._pending: List[Tuple[str, tuple]] = []
+        self._conn: Optional[sqlite3.Connection] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+
+        if background:
+            self._queue = queue.Queue(maxsize=max_pending_batches)
+            self._thread = threading.Thread(
+                target=self._writer_loop, name='BufferedDBWriter', daemon=True
+            )
+            self._thread.start()
+        else:
+            self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived connection with the DBManager pragmas."""
+        conn = sqlite3.connect(self.db_path, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @property
+    def pending(self) -> int:
+        """Number of statements buffered and not yet handed to SQLite."""
+        return len(self._pending)
+
+    def execute(self, sql: str, params: Tuple = ()):
+        """
+        Buffer a statement for the next flush.
+
+        Args:
+            sql: SQL statement with ? placeholders
+            params: Statement parameters
+        """
+        self._pending.append((sql, tuple(params)))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered statements in one transaction."""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+
+        if self._queue is not None:
+            if self._hand_over(batch):
+                return
+            logger.error("BufferedDBWriter thread died, writing synchronously")
+            self._stop_background()
+
+        if self._conn is not None:
+            self._write_batch(self._conn, batch)
+        else:
+            logger.error(f"BufferedDBWriter closed, dropping {len(batch)} statements")
+
+    def close(self):
+        """Flush remaining statements and release the connection."""
+        self.flush()
+
+        if self._thread is not None:
+            if self._hand_over(None):
+                self._thread.join()
+            if self._queue.empty():
+                self._thread = None
+                self._queue = None
+            else:
+                logger.error("BufferedDBWriter thread died, writing its queued batches")
+                self._stop_background()
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _hand_over(self, item) -> bool:
+        """Queue an item for the writer thread; False if the thread is dead."""
+        while self._thread.is_alive():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _stop_background(self):
+        """Take over from a finished writer thread, writing its unwritten batches."""
+        leftover = []
+        while True:
+            try:
+                batch = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch is not None:
+                leftover.append(batch)
+
+        self._thread = None
+        self._queue = None
+        self._conn = self._connect()
+        for batch in leftover:
+            self._write_batch(self._conn, batch)
+
+    def _writer_loop(self):
+        """Background thread: drain queued batches until close()."""
+        conn = self._connect()
+        try:
+            while True:
+                batch = self._queue.get()
+                if batch is None:
+                    break
+                self._write_batch(conn, batch)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, batch: List[Tuple[str, tuple]]):
+        """
+        Write a batch in a single transaction.
+
+        If the transaction fails (e.g. a CHECK constraint on one row), the
+        batch is replayed statement by statement so a single bad record
+        does not discard the rest, matching per-write error handling.
+        """
+        try:
+            with conn:
+                for sql, group in itertools.groupby(batch, key=itemgetter(0)):
+                    conn.executemany(sql, [params for _, params in group])
+        except sqlite3.Error as e:
+            logger.warning(f"Batch write failed ({e}), retrying {len(batch)} statements individually")
+            for sql, params in batch:
+                try:
+                    with conn:
+                        conn.execute(sql, params)
+                except sqlite3.Error as row_error:
+                    logger.error(f"Failed to write record: {row_error}")
+
+
 class BacktraderDBLogger:
     """
     Database logger for Backtrader strategies.
@@ -38,7 +266,8 @@ class BacktraderDBLogger:
     - Compliance/audit trail
     """
 
-    def __init__(self, strategy, algorithm_name: str, db_path: str = 'data/sqlite/trading.db'):
+    def __init__(self, strategy, algorithm_name: str, db_path: str = 'data/sqlite/trading.db',
+                 batch_size: int = 500, background_writer: bool = False):
         """
         Initialize database logger.
 
@@ -46,6 +275,8 @@ class BacktraderDBLogger:
             strategy: Backtrader strategy instance
             algorithm_name: Name/identifier for this strategy
             db_path: Path to SQLite database
+            batch_size: Buffered events per write transaction (1 = write-through)
+            background_writer: Perform writes on a background thread
         """
         self.strategy = strategy
         self.algorithm_name = algorithm_name
@@ -54,6 +285,15 @@ class BacktraderDBLogger:
         # Ensure schema exists
         self.db_manager.create_schema()
 
+        # Long-lived buffered writer; call close() from strategy.stop()
+        self.writer = BufferedDBWriter(
+            self.db_manager.db_path,
+            batch_size=batch_size,
+            background=background_writer,
+        )
+        self._order_sql: Dict[Tuple[str, ...], str] = {}
+        self._last_bar_date = None
+
         # Track logged orders to avoid duplicates
         self.logged_orders = set()
 
@@ -137,36 +377,7 @@ class BacktraderDBLogger:
                 order_data['submitted_at'] = datetime.now().isoformat()
 
             # Insert or update order
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Check if order exists
-                cursor.execute("SELECT order_id FROM orders WHERE order_id = ?", (order_id,))
-                exists = cursor.fetchone()
-
-                if exists:
-                    # Update existing order
-                    update_fields = []
-                    update_values = []
-
-                    for key, value in order_data.items():
-                        if key != 'order_id':
-                            update_fields.append(f"{key} = ?")
-                            update_values.append(value)
-
-                    update_values.append(order_id)
-                    update_query = f"UPDATE orders SET {', '.join(update_fields)} WHERE order_id = ?"
-
-                    cursor.execute(update_query, update_values)
-                else:
-                    # Insert new order
-                    columns = ', '.join(order_data.keys())
-                    placeholders = ', '.join(['?' for _ in order_data])
-                    insert_query = f"INSERT INTO orders ({columns}) VALUES ({placeholders})"
-
-                    cursor.execute(insert_query, list(order_data.values()))
-
-                conn.commit()
+            self.writer.execute(self._get_order_upsert(tuple(order_data)), order_data.values())
 
             # Mark as logged
             self.logged_orders.add(order_id)
@@ -176,6 +387,17 @@ class BacktraderDBLogger:
         except Exception as e:
             logger.error(f"Failed to log order: {e}", exc_info=True)
 
+    def _get_order_upsert(self, columns: Tuple[str, ...]) -> str:
+        """Build (once per column set) the upsert statement for orders."""
+        sql = self._order_sql.get(columns)
+        if sql is None:
+            placeholders = ', '.join(['?' for _ in columns])
+            updates = ', '.join(f"{col} = excluded.{col}" for col in columns if col != 'order_id')
+            sql = (f"INSERT INTO orders ({', '.join(columns)}) VALUES ({placeholders}) "
+                   f"ON CONFLICT(order_id) DO UPDATE SET {updates}")
+            self._order_sql[columns] = sql
+        return sql
+
     # ===================================================================
     # Position Logging
     # ===================================================================
@@ -197,22 +419,15 @@ class BacktraderDBLogger:
         try:
             symbol = data._name if hasattr(data, '_name') else 'UNKNOWN'
 
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO position_history
-                    (symbol, algorithm, quantity, price, pnl, event_type, order_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    symbol,
-                    self.algorithm_name,
-                    quantity,
-                    price,
-                    pnl,
-                    event_type,
-                    order_id
-                ))
-                conn.commit()
+            self.writer.execute(POSITION_HISTORY_INSERT, (
+                symbol,
+                self.algorithm_name,
+                quantity,
+                price,
+                pnl,
+                event_type,
+                order_id
+            ))
 
             logger.debug(f"Position change logged: {symbol} {event_type} {quantity} @ ${price:.2f}")
 
@@ -232,13 +447,7 @@ class BacktraderDBLogger:
 
             if not position or position.size == 0:
                 # Remove position from table if closed
-                with self.db_manager.get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "DELETE FROM positions WHERE symbol = ? AND algorithm = ?",
-                        (symbol, self.algorithm_name)
-                    )
-                    conn.commit()
+                self.writer.execute(POSITION_DELETE, (symbol, self.algorithm_name))
                 return
 
             # Calculate metrics
@@ -248,34 +457,18 @@ class BacktraderDBLogger:
             current_value = abs(position.size * current_price)
             unrealized_pnl = (current_price - position.price) * position.size
 
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-
-                # Upsert position
-                cursor.execute("""
-                    INSERT INTO positions
-                    (symbol, algorithm, quantity, cost_basis, average_price,
-                     current_price, unrealized_pnl, entry_date, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(symbol) DO UPDATE SET
-                        quantity = excluded.quantity,
-                        cost_basis = excluded.cost_basis,
-                        average_price = excluded.average_price,
-                        current_price = excluded.current_price,
-                        unrealized_pnl = excluded.unrealized_pnl,
-                        last_updated = excluded.last_updated
-                """, (
-                    symbol,
-                    self.algorithm_name,
-                    position.size,
-                    cost_basis,
-                    average_price,
-                    current_price,
-                    unrealized_pnl,
-                    datetime.now().isoformat(),  # Would ideally track actual entry date
-                    datetime.now().isoformat()
-                ))
-                conn.commit()
+            now = datetime.now().isoformat()
+            self.writer.execute(POSITION_UPSERT, (
+                symbol,
+                self.algorithm_name,
+                position.size,
+                cost_basis,
+                average_price,
+                current_price,
+                unrealized_pnl,
+                now,  # Would ideally track actual entry date
+                now
+            ))
 
             logger.debug(f"Position updated: {symbol} size={position.size}")
 
@@ -345,26 +538,18 @@ class BacktraderDBLogger:
             action_taken: Action taken in response
         """
         try:
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO risk_events
-                    (event_type, severity, symbol, algorithm, message,
-                     portfolio_value, position_value, limit_value, breach_pct, action_taken)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    event_type,
-                    severity,
-                    symbol,
-                    self.algorithm_name,
-                    message,
-                    portfolio_value,
-                    position_value,
-                    limit_value,
-                    breach_pct,
-                    action_taken
-                ))
-                conn.commit()
+            self.writer.execute(RISK_EVENT_INSERT, (
+                event_type,
+                severity,
+                symbol,
+                self.algorithm_name,
+                message,
+                portfolio_value,
+                position_value,
+                limit_value,
+                breach_pct,
+                action_taken
+            ))
 
             logger.info(f"Risk event logged: [{severity}] {event_type} - {message}")
 
@@ -410,40 +595,21 @@ class BacktraderDBLogger:
             position_count = sum(1 for data in self.strategy.datas
                                 if self.strategy.getposition(data).size != 0)
 
-            with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO daily_summaries
-                    (date, algorithm, starting_equity, ending_equity, total_pnl, total_pnl_pct,
-                     trades_count, winning_trades, losing_trades, win_rate,
-                     total_commission, positions_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(date) DO UPDATE SET
-                        ending_equity = excluded.ending_equity,
-                        total_pnl = excluded.total_pnl,
-                        total_pnl_pct = excluded.total_pnl_pct,
-                        trades_count = excluded.trades_count,
-                        winning_trades = excluded.winning_trades,
-                        losing_trades = excluded.losing_trades,
-                        win_rate = excluded.win_rate,
-                        total_commission = excluded.total_commission,
-                        positions_count = excluded.positions_count,
-                        timestamp = CURRENT_TIMESTAMP
-                """, (
-                    target_date,
-                    self.algorithm_name,
-                    self.daily_start_value,
-                    ending_equity,
-                    total_pnl,
-                    total_pnl_pct,
-                    self.daily_trade_count,
-                    self.daily_winning_trades,
-                    self.daily_losing_trades,
-                    win_rate,
-                    self.daily_commission,
-                    position_count
-                ))
-                conn.commit()
+            self.writer.execute(DAILY_SUMMARY_UPSERT, (
+                target_date,
+                self.algorithm_name,
+                self.daily_start_value,
+                ending_equity,
+                total_pnl,
+                total_pnl_pct,
+                self.daily_trade_count,
+                self.daily_winning_trades,
+                self.daily_losing_trades,
+                win_rate,
+                self.daily_commission,
+                position_count
+            ))
+            self.writer.flush()
 
             logger.info(f"Daily summary saved: {target_date} P&L=${total_pnl:.2f} ({total_pnl_pct:+.2f}%)")
 
@@ -495,14 +661,34 @@ class BacktraderDBLogger:
         """
         Call this from strategy's next() method.
 
-        Updates position values with latest prices.
+        Updates position values with latest prices and flushes buffered
+        events once per simulated day.
         """
+        if self.strategy.datas:
+            bar_date = self.strategy.datas[0].datetime.date(0)
+            if bar_date != self._last_bar_date:
+                if self._last_bar_date is not None:
+                    self.writer.flush()
+                self._last_bar_date = bar_date
+
         # Update all positions with current prices
         for data in self.strategy.datas:
             position = self.strategy.getposition(data)
             if position and position.size != 0:
                 self.update_position(data)
 
+    def flush(self):
+        """Write all buffered events to the database."""
+        self.writer.flush()
+
+    def close(self):
+        """
+        Flush buffered events and close the database connection.
+
+        Call this from strategy's stop() method.
+        """
+        self.writer.close()
+
 
 if __name__ == "__main__":
     print("BacktraderDBLogger - Ready for use")
@@ -521,3 +707,5 @@ if __name__ == "__main__":
     print("      def next(self):")
     print("          super().next()")
     print("          self.db_logger.on_next()")
+    print("      def stop(self):")
+    print("          self.db_logger.close()")
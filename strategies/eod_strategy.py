@@ -60,6 +60,8 @@ class EODStrategy(BaseStrategy):
         # Database logging
         ('enable_db_logging', False),    # Enable in production
         ('algorithm_name', 'EODStrategy'),
+        ('db_batch_size', 500),          # Buffered DB events per write transaction
+        ('db_background_writer', False), # Write to DB on a background thread
     )
 
     def __init__(self):
@@ -91,7 +93,12 @@ class EODStrategy(BaseStrategy):
         # Initialize database logger if enabled
         self.db_logger = None
         if self.params.enable_db_logging:
-            self.db_logger = BacktraderDBLogger(self, self.params.algorithm_name)
+            self.db_logger = BacktraderDBLogger(
+                self,
+                self.params.algorithm_name,
+                batch_size=self.params.db_batch_size,
+                background_writer=self.params.db_background_writer,
+            )
 
         self.log(f"EOD Strategy initialized: Liquidation at {self.params.eod_hour}:{self.params.eod_minute:02d}")
 
@@ -278,6 +285,10 @@ class EODStrategy(BaseStrategy):
         if self.db_logger and self.current_date:
             self.db_logger.save_daily_summary(self.current_date.isoformat())
 
+        # Flush buffered DB events and release the connection
+        if self.db_logger:
+            self.db_logger.close()
+
         # Call parent
         super().stop()
 
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Columnar Order History for Backtrader Strategies
+
+Stores executed orders in preallocated, growable NumPy arrays instead of a
+list of dicts, so recording an execution is a handful of array stores with
+no per-order Python object allocation. Optionally streams the records to a
+binary trace file that can be replayed after the run.
+
+Used by strategies/base_strategy.py (BaseStrategy.order_history).
+
+Trace file format:
+- 8-byte magic header (TRACE_MAGIC)
+- Fixed-size records of TRACE_DTYPE (NumPy structured dtype, little-endian)
+"""
+
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import backtrader as bt
+import numpy as np
+
+TRACE_MAGIC = b'BTORDTR1'
+
+TRACE_DTYPE = np.dtype([
+    ('datetime', '<f8'),      # Backtrader date number (bt.num2date to convert)
+    ('side', 'i1'),           # 1 = BUY, -1 = SELL
+    ('symbol', 'S32'),
+    ('size', '<f8'),
+    ('price', '<f8'),
+    ('value', '<f8'),
+    ('commission', '<f8'),
+])
+
+# Packed record layout identical to TRACE_DTYPE (no padding)
+_TRACE_RECORD = struct.Struct('<db32s4d')
+assert _TRACE_RECORD.size == TRACE_DTYPE.itemsize
+
+SIDE_LABELS = {1: 'BUY', -1: 'SELL'}
+
+
+class OrderHistoryBuffer:
+    """
+    Growable columnar buffer of executed orders.
+
+    Columns are float64 except side (int8) and symbol (int32 index into
+    `symbols`). Capacity doubles when full. Iterating yields the same dicts
+    the former list-based order history contained.
+    """
+
+    _FLOAT_COLUMNS = ('datetime', 'size', 'price', 'value', 'commission')
+
+    def __init__(self, capacity: int = 1024, trace_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize order history buffer.
+
+        Args:
+            capacity: Initial number of preallocated rows
+            trace_path: Optional binary trace file to stream records to. Records
+                go through a buffered file object, so they reach disk on
+                close() or when the buffer is garbage collected.
+        """
+        self._capacity = max(1, int(capacity))
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(self._capacity, dtype=np.float64) for name in self._FLOAT_COLUMNS
+        }
+        self._columns['side'] = np.empty(self._capacity, dtype=np.int8)
+        self._columns['symbol'] = np.empty(self._capacity, dtype=np.int32)
+
+        self.symbols: List[str] = []
+        self._symbol_ids: Dict[str, int] = {}
+
+        self.trace_path = Path(trace_path) if trace_path else None
+        self._trace_file = None
+        if self.trace_path is not None:
+            self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+            self._trace_file = open(self.trace_path, 'wb')
+            self._trace_file.write(TRACE_MAGIC)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.to_records())
+
+    def append(self, dt: float, is_buy: bool, symbol: str, size: float, price: float,
+               value: float, commission: float):
+        """
+        Record one execution.
+
+        Args:
+            dt: Backtrader date number of the bar (data.datetime[0])
+            is_buy: True for buys, False for sells
+            symbol: Data feed name
+            size: Executed size
+            price: Executed price
+            value: Executed value
+            commission: Commission paid
+        """
+        if self._size == self._capacity:
+            self._grow()
+
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = self._symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+
+        i = self._size
+        columns = self._columns
+        columns['datetime'][i] = dt
+        columns['side'][i] = 1 if is_buy else -1
+        columns['symbol'][i] = symbol_id
+        columns['size'][i] = size
+        columns['price'][i] = price
+        columns['value'][i] = value
+        columns['commission'][i] = commission
+        self._size = i + 1
+
+        if self._trace_file is not None:
+            self._trace_file.write(_TRACE_RECORD.pack(
+                dt, 1 if is_buy else -1, symbol.encode('utf-8'), size, price, value, commission
+            ))
+
+    def _grow(self):
+        """Double the capacity of every column."""
+        self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Get column views trimmed to the recorded rows.
+
+        Returns:
+            Dict of column name -> NumPy array (views, not copies)
+        """
+        return {name: column[:self._size] for name, column in self._columns.items()}
+
+    def to_structured(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """
+        Get rows as a TRACE_DTYPE structured array.
+
+        Args:
+            start: First row
+            end: End row (exclusive), defaults to all recorded rows
+        """
+        end = self._size if end is None else end
+        out = np.empty(end - start, dtype=TRACE_DTYPE)
+        for name in self._FLOAT_COLUMNS:
+            out[name] = self._columns[name][start:end]
+        out['side'] = self._columns['side'][start:end]
+        names = np.array([s.encode('utf-8')[:32] for s in self.symbols] or [b''], dtype='S32')
+        out['symbol'] = names[self._columns['symbol'][start:end]]
+        return out
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get all rows as dicts (datetime, type, symbol, size, price, value, commission)."""
+        return _records_from_structured(self.to_structured())
+
+    def close(self):
+        """Flush and close the trace file (if any)."""
+        if self._trace_file is not None:
+            self._trace_file.close()
+            self._trace_file = None
+
+
+def read_trace(path: Union[str, Path]) -> np.ndarray:
+    """
+    Load an order trace file.
+
+    Args:
+        path: Trace file written by OrderHistoryBuffer
+
+    Returns:
+        TRACE_DTYPE structured array
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(len(TRACE_MAGIC))
+        if magic != TRACE_MAGIC:
+            raise ValueError(f"Not an order trace file: {path}")
+        return np.fromfile(f, dtype=TRACE_DTYPE)
+
+
+def replay_trace(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Replay an order trace file as order history dicts.
+
+    Args:
+        path: Trace file written by OrderHistoryBuffer
+
+    Yields:
+        Dicts with the same keys as BaseStrategy.order_history entries
+    """
+    yield from _records_from_structured(read_trace(path))
+
+
+def _records_from_structured(rows: np.ndarray) -> List[Dict[str, Any]]:
+    """Convert TRACE_DTYPE rows to order history dicts."""
+    return [
+        {
+            'datetime': bt.num2date(float(row['datetime'])),
+            'type': SIDE_LABELS[int(row['side'])],
+            'symbol': row['symbol'].decode('utf-8'),
+            'size': float(row['size']),
+            'price': float(row['price']),
+            'value': float(row['value']),
+            'commission': float(row['commission']),
+        }
+        for row in rows
+    ]
@@ -10,6 +10,10 @@ Provides comprehensive risk controls for trading strategies:
 - Leverage limits
 - Risk violation logging and alerts
 
+Portfolio aggregates (open positions, exposure, leverage) are maintained
+incrementally from order/trade notifications, so checks do not scan every
+data feed. BaseStrategy.notify_order forwards fills automatically.
+
 All strategies should integrate RiskManager to ensure safety.
 """
 
@@ -54,6 +58,12 @@ class RiskManager:
         self.daily_start_value = self.initial_portfolio_value
         self.current_date = None
 
+        # Incremental portfolio state (updated from order/trade notifications)
+        self._position_sizes = {}          # data -> signed position size (open positions only)
+        self._exposure_bar = None          # bar index the cached exposure belongs to
+        self._exposure = 0.0               # cached gross position value for that bar
+        self.resync_positions()
+
         # Risk event log
         self.risk_events = []
 
@@ -129,8 +139,7 @@ class RiskManager:
 
         # Get current position if exists
         if data:
-            current_position = self.strategy.getposition(data)
-            current_value = abs(current_position.size * price) if current_position else 0
+            current_value = abs(self._position_sizes.get(data, 0) * price)
         else:
             current_value = 0
 
@@ -276,6 +285,50 @@ class RiskManager:
                 self.current_date = current_date
                 self.reset_daily()
 
+    # ===================================================================
+    # Position State Tracking
+    # ===================================================================
+
+    def on_order_notify(self, order):
+        """
+        Update position state from an order notification.
+
+        Called by BaseStrategy.notify_order(); call it yourself if your
+        strategy does not inherit from BaseStrategy.
+
+        Args:
+            order: Backtrader Order object
+        """
+        if order.status in (order.Partial, order.Completed):
+            self._sync_position(order.data)
+
+    def on_trade_notify(self, trade):
+        """
+        Update position state from a trade notification.
+
+        Args:
+            trade: Backtrader Trade object
+        """
+        self._sync_position(trade.data)
+
+    def resync_positions(self):
+        """Rebuild position state from the broker (O(symbols), use sparingly)."""
+        self._position_sizes = {}
+        for data in self.strategy.datas:
+            self._sync_position(data)
+
+    def _sync_position(self, data):
+        """Refresh the tracked size for one data feed and invalidate exposure."""
+        position = self.strategy.getposition(data)
+        size = position.size if position else 0
+
+        if size != 0:
+            self._position_sizes[data] = size
+        else:
+            self._position_sizes.pop(data, None)
+
+        self._exposure_bar = None
+
     # ===================================================================
     # Helper Methods
     # ===================================================================
@@ -288,26 +341,25 @@ class RiskManager:
         return total_position_value / portfolio_value if portfolio_value > 0 else 0
 
     def _get_total_position_value(self) -> float:
-        """Get total value of all open positions."""
-        total = 0.0
+        """
+        Get total value of all open positions.
 
-        for data in self.strategy.datas:
-            position = self.strategy.getposition(data)
-            if position and position.size != 0:
-                total += abs(position.size * data.close[0])
+        Recomputed over open positions only, at most once per bar; later
+        calls within the same bar return the cached value.
+        """
+        bar = len(self.strategy)
+
+        if self._exposure_bar != bar:
+            self._exposure = sum(
+                abs(size * data.close[0]) for data, size in self._position_sizes.items()
+            )
+            self._exposure_bar = bar
 
-        return total
+        return self._exposure
 
     def _count_open_positions(self) -> int:
         """Count number of open positions."""
-        count = 0
-
-        for data in self.strategy.datas:
-            position = self.strategy.getposition(data)
-            if position and position.size != 0:
-                count += 1
-
-        return count
+        return len(self._position_sizes)
 
     def _log_risk_event(self, event_type: str, description: str, severity: str = 'INFO'):
         """
@@ -9,6 +9,10 @@ Implements the complete VARM-RSI strategy with:
 - Comprehensive portfolio risk management
 
 Uses 1-minute data with Backtrader resampling to create required timeframes.
+
+Slope, volume-multiple and multi-timeframe RSI filters are Backtrader line
+indicators/line operations, so they are computed once per bar per feed (and
+vectorized in runonce mode) instead of being rebuilt inside next().
 """
 
 import backtrader as bt
@@ -64,6 +68,49 @@ class OnBalanceVolume(bt.Indicator):
             self.lines.obv[0] = self.lines.obv[-1]
 
 
+class RollingSlope(bt.Indicator):
+    """
+    Rolling least-squares slope of the input over its last `period` + 1 values.
+
+    The regression x-axis (bar offsets, oldest to newest) is the same for
+    every window, so the slope reduces to a dot product with fixed weights
+    w_i = (x_i - mean(x)) / sum((x - mean(x))^2). runonce mode computes the
+    whole series with a single np.convolve; next() mode costs period + 1
+    multiply-adds per bar. Positive slope means the input is rising.
+
+    With reverse=True the x-axis counts bars ago (0 at the newest value), as
+    in the original per-bar polyfit helper, so the sign flips: positive
+    means the input has been falling.
+    """
+
+    lines = ("slope",)
+    params = (("period", 5), ("reverse", False))
+
+    def __init__(self):
+        window = self.p.period + 1
+        centered = np.arange(window, dtype=float) - (window - 1) / 2.0
+        self._weights = centered / np.dot(centered, centered)
+        if self.p.reverse:
+            self._weights = -self._weights
+
+        # (ago, weight) pairs for next(): ago 0 is the newest value
+        self._terms = [(-(window - 1 - i), float(w)) for i, w in enumerate(self._weights)]
+        self.addminperiod(window)
+
+    def next(self):
+        data = self.data
+        self.lines.slope[0] = sum(w * data[ago] for ago, w in self._terms)
+
+    def once(self, start, end):
+        window = len(self._weights)
+        src = np.asarray(self.data.array, dtype=float)
+        dst = self.lines.slope.array
+
+        values = np.convolve(src[start - window + 1:end], self._weights[::-1], mode="valid")
+        for i, value in enumerate(values.tolist(), start):
+            dst[i] = value
+
+
 class VARM_RSI(BaseStrategy):
     """
     Volatility-Adaptive RSI Mean Reversion Strategy
@@ -284,6 +331,10 @@ class VARM_RSI(BaseStrategy):
         self.volume_sma = bt.indicators.SMA(
             self.primary_data.volume, period=self.p.volume_avg_period
         )
+        # Volume filter: current volume > multiplier x average (line, once per bar)
+        self.volume_confirm = self.primary_data.volume > (
+            self.volume_sma * self.p.volume_multiplier
+        )
 
         # Trend indicators
         self.sma = bt.indicators.SMA(self.primary_data.close, period=self.p.sma_period)
@@ -291,32 +342,39 @@ class VARM_RSI(BaseStrategy):
         # Custom Bear Power indicator
         self.bear_power = BearPower(self.primary_data)
 
+        # Slope filters keep the sign convention of the original polyfit
+        # helper (x = bars ago), which their thresholds were written against
         # OBV for accumulation signal
         self.obv = OnBalanceVolume(self.primary_data)
+        self.obv_slope = RollingSlope(self.obv, period=5, reverse=True)
 
-        # Multi-timeframe RSI indicators (if data available)
+        # ATR slope for volatility contraction exit
+        self.atr_slope = RollingSlope(self.atr, period=10, reverse=True)
+
+        # Multi-timeframe RSI indicators and confirmations (if data available)
+        # Evaluated on their own timeframe, i.e. once per 1h / 4h bar
         self.rsi_1h = None
         self.rsi_4h = None
+        self.rsi_1h_confirm = None
+        self.rsi_4h_exit = None
         if self.data_1h is not None:
             self.rsi_1h = bt.indicators.RSI(self.data_1h.close, period=14)
+            self.rsi_1h_confirm = self.rsi_1h > self.p.rsi_1h_threshold
         if self.data_4h is not None:
             self.rsi_4h = bt.indicators.RSI(self.data_4h.close, period=14)
+            self.rsi_4h_exit = self.rsi_4h < self.p.rsi_4h_exit_threshold
 
         # Market filter indicators
         self.spy_sma = None
-        if self.spy_daily:
+        if self.spy_daily is not None:
             self.spy_sma = bt.indicators.SMA(
                 self.spy_daily.close, period=self.p.spy_sma_period
             )
 
         # Slope calculation for trend filter (SMA slope in °/day)
         self.sma_slope = None
-        if self.data_daily:
-            # Calculate slope of daily SMA using linear regression approximation
-            daily_sma = bt.indicators.SMA(
-                self.data_daily.close, period=self.p.sma_period
-            )
-            # We'll calculate slope manually in the should_enter method
+        if self.data_daily is not None:
+            self.sma_slope = RollingSlope(self.sma, period=5, reverse=True)
 
         logger.info(f"VARM-RSI strategy initialized with {len(self.datas)} data feeds")
         if self.p.log_signals:
@@ -349,24 +407,20 @@ class VARM_RSI(BaseStrategy):
             return False
 
         # Volume filter: Current volume > 2.5x 10-day average
-        if self.primary_data.volume[0] <= (
-            self.volume_sma[0] * self.p.volume_multiplier
-        ):
+        if not self.volume_confirm[0]:
             return False
 
         # Trend filter: SMA slope > -0.1°/day (not in strong downtrend)
-        if self.data_daily:
-            daily_sma_slope = self._calculate_slope(self.sma, period=5)
-            if daily_sma_slope <= self.p.sma_slope_threshold:
+        if self.sma_slope is not None:
+            if self.sma_slope[0] <= self.p.sma_slope_threshold:
                 return False
 
         # Multi-timeframe confirmations
-        if self.rsi_1h and self.rsi_1h[0] <= self.p.rsi_1h_threshold:
+        if self.rsi_1h_confirm is not None and not self.rsi_1h_confirm[0]:
             return False  # 1-hour RSI must be > 30
 
         # OBV accumulation signal: OBV slope > 0
-        obv_slope = self._calculate_slope(self.obv, period=5)
-        if obv_slope <= 0:
+        if self.obv_slope[0] <= 0:
             return False
 
         # Bear Power capitulation: Bear Power < -ATR
@@ -401,12 +455,11 @@ class VARM_RSI(BaseStrategy):
                 return True, "max_hold_time"
 
         # Momentum failure: 4-hour RSI < 40
-        if self.rsi_4h and self.rsi_4h[0] < self.p.rsi_4h_exit_threshold:
+        if self.rsi_4h_exit is not None and self.rsi_4h_exit[0]:
             return True, "momentum_failure"
 
         # Volatility contraction exit (ATR decreasing significantly)
-        atr_slope = self._calculate_slope(self.atr, period=10)
-        if atr_slope < -0.1:  # ATR decreasing
+        if self.atr_slope[0] < -0.1:  # ATR decreasing
             return True, "volatility_contraction"
 
         # Check profit targets and stops (implemented in order management)
@@ -460,26 +513,26 @@ class VARM_RSI(BaseStrategy):
         """
         Calculate slope of indicator over specified period
 
+        Ad-hoc helper for subclasses; the built-in filters use precomputed
+        RollingSlope(reverse=True) indicators instead.
+
         Args:
             indicator: Backtrader indicator
             period: Period for slope calculation
 
         Returns:
-            float: Slope value
+            float: Slope against bars ago (positive when the indicator has been falling)
         """
         if len(indicator) < period + 1:
             return 0.0
 
-        # Simple linear regression slope
-        y = [indicator[-i] for i in range(period + 1)]
-        x = list(range(period + 1))
+        # Closed-form least-squares slope over x = 0..period bars ago
+        mean_x = period / 2.0
+        sxx = period * (period + 1) * (period + 2) / 12.0
+        sxy = sum((ago - mean_x) * indicator[-ago] for ago in range(period + 1))
 
-        # Calculate slope using numpy polyfit
-        try:
-            slope = np.polyfit(x, y, 1)[0]
-            return slope
-        except:
-            return 0.0
+        slope = sxy / sxx
+        return slope if np.isfinite(slope) else 0.0
 
     def _check_market_filters(self) -> bool:
         """
@@ -489,12 +542,12 @@ class VARM_RSI(BaseStrategy):
             bool: True if market conditions allow trading
         """
         # SPY > 20-day SMA (bull market filter)
-        if self.spy_sma and self.spy_daily:
+        if self.spy_sma is not None and self.spy_daily is not None:
             if self.spy_daily.close[0] <= self.spy_sma[0]:
                 return False
 
         # VIX < 30 (fear/greed filter - not too fearful)
-        if self.vix_daily and self.vix_daily.close[0] >= self.p.vix_fear_threshold:
+        if self.vix_daily is not None and self.vix_daily.close[0] >= self.p.vix_fear_threshold:
             return False
 
         return True
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for DB Logger - BufferedDBWriter batching, per-row fallback and
+the background writer thread. Runs against temporary SQLite files.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Import the modules to test
+import sys
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+sys.path.append(str(ROOT / 'old'))  # scripts.db_manager
+from strategies.db_logger import BufferedDBWriter
+
+INSERT = "INSERT INTO events (id, value) VALUES (?, ?)"
+UPDATE = "UPDATE events SET value = ? WHERE id = ?"
+
+
+class SpyConnection(sqlite3.Connection):
+    """Connection recording execute()/executemany() calls"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+
+    def execute(self, sql, *args):
+        self.calls.append(('execute', sql))
+        return super().execute(sql, *args)
+
+    def executemany(self, sql, rows):
+        rows = list(rows)
+        self.calls.append(('executemany', sql, len(rows)))
+        return super().executemany(sql, rows)
+
+
+class TestBufferedDBWriter(unittest.TestCase):
+    """Test cases for buffered SQLite writes."""
+
+    def setUp(self):
+        """Set up a database with one constrained table."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.db_path = str(Path(self.temp_dir) / 'test.db')
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, value TEXT CHECK (value != 'bad'))")
+        conn.close()
+
+    def _rows(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT id, value FROM events ORDER BY id").fetchall()
+        finally:
+            conn.close()
+
+    def _spy_writer(self, batch_size):
+        writer = BufferedDBWriter(self.db_path, batch_size=batch_size)
+        writer._conn.close()
+        writer._conn = sqlite3.connect(self.db_path, factory=SpyConnection)
+        return writer
+
+    def test_consecutive_statements_use_executemany(self):
+        """Test runs of the same SQL are written with one executemany() each, in order."""
+        writer = self._spy_writer(batch_size=100)
+        for i in range(3):
+            writer.execute(INSERT, (i, 'new'))
+        writer.execute(UPDATE, ('updated', 1))
+        writer.execute(INSERT, (3, 'new'))
+        self.assertEqual(writer.pending, 5)
+        self.assertEqual(self._rows(), [])
+
+        writer.flush()
+        self.assertEqual(writer._conn.calls, [
+            ('executemany', INSERT, 3), ('executemany', UPDATE, 1), ('executemany', INSERT, 1),
+        ])
+        self.assertEqual(self._rows(), [(0, 'new'), (1, 'updated'), (2, 'new'), (3, 'new')])
+        writer.close()
+
+    def test_batch_size_triggers_flush(self):
+        """Test a full buffer is written without an explicit flush."""
+        writer = BufferedDBWriter(self.db_path, batch_size=2)
+        writer.execute(INSERT, (0, 'a'))
+        self.assertEqual(self._rows(), [])
+        writer.execute(INSERT, (1, 'b'))
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(self._rows(), [(0, 'a'), (1, 'b')])
+        writer.close()
+
+    def test_bad_row_falls_back_to_single_statements(self):
+        """Test one failing row is skipped and the rest of the batch is kept."""
+        writer = self._spy_writer(batch_size=100)
+        writer.execute(INSERT, (0, 'a'))
+        writer.execute(INSERT, (1, 'bad'))
+        writer.execute(INSERT, (2, 'c'))
+
+        with self.assertLogs('strategies.db_logger', level='WARNING') as logs:
+            writer.flush()
+
+        self.assertEqual(self._rows(), [(0, 'a'), (2, 'c')])
+        self.assertEqual([call[0] for call in writer._conn.calls], ['executemany'] + ['execute'] * 3)
+        self.assertIn('retrying 3 statements individually', logs.output[0])
+        writer.close()
+
+    def test_background_flush_and_close(self):
+        """Test the writer thread owns the writes and close() drains the queue."""
+        writer = BufferedDBWriter(self.db_path, batch_size=2, background=True)
+        thread = writer._thread
+        for i in range(5):
+            writer.execute(INSERT, (i, 'x'))
+        writer.execute(INSERT, (5, 'bad'))
+        writer.close()
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([row[0] for row in self._rows()], [0, 1, 2, 3, 4])
+
+        # Nothing is written after close
+        writer.execute(INSERT, (6, 'x'))
+        with self.assertLogs('strategies.db_logger', level='ERROR'):
+            writer.flush()
+        self.assertEqual(len(self._rows()), 5)
+
+    def test_dead_writer_thread_falls_back_to_sync(self):
+        """Test flush() neither blocks nor drops batches after the writer thread died."""
+        write_batch = BufferedDBWriter._write_batch
+
+        def crash_in_thread(conn, batch):
+            if threading.current_thread().name == 'BufferedDBWriter':
+                raise RuntimeError('writer crashed')
+            write_batch(conn, batch)
+
+        writer = BufferedDBWriter(self.db_path, batch_size=2, background=True, max_pending_batches=1)
+        with patch.object(BufferedDBWriter, '_write_batch', side_effect=crash_in_thread), \
+                patch.object(threading, 'excepthook'):
+            writer.execute(INSERT, (0, 'lost'))
+            writer.execute(INSERT, (1, 'lost'))  # Handed over, then the thread dies
+            writer._thread.join(5)
+
+            def write_rest():
+                for i in range(2, 9):
+                    writer.execute(INSERT, (i, 'x'))
+                writer.close()
+
+            with self.assertLogs('strategies.db_logger', level='ERROR'):
+                worker = threading.Thread(target=write_rest, daemon=True)
+                worker.start()
+                worker.join(10)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual([row[0] for row in self._rows()], list(range(2, 9)))
+        self.assertIsNone(writer._conn)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Stage Profiling - StageTimer spans, stored stage_timings and
+their percentile summaries, the per-batch and per-job timings written by the
+optimization and backtest services, and the path without Prometheus.
+"""
+
+import itertools
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import yaml
+
+# Import the modules to test
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from backend.models.database import BacktestJob, OptimizationBatch
+from backend.services import profiling
+from backend.services.backtest_service import BacktestService
+from backend.services.optimization_service import OptimizationService
+from backend.services.profiling import (
+    BATCH_CREATE, COMBINATION_GENERATION, CONTAINER_START, JOB_INSERT, JOB_SUBMISSION,
+    LEAN_EXECUTION, RESULT_EXTRACTION, RESULT_INSERT, RESULT_VALIDATION,
+    StageTimer, merge_timings, summarize_stage_timings
+)
+
+BATCH_STAGES = {COMBINATION_GENERATION, BATCH_CREATE, JOB_SUBMISSION}
+
+
+class FakeQuery:
+    """The filter_by()/filter() chains the services run, over added objects"""
+
+    def __init__(self, rows, column=None):
+        self.rows = rows
+        self.column = column
+
+    def filter_by(self, **criteria):
+        return FakeQuery([row for row in self.rows
+                          if all(getattr(row, key) == value for key, value in criteria.items())], self.column)
+
+    def filter(self, clause):
+        key, value = clause.left.key, clause.right.value
+        return FakeQuery([row for row in self.rows if getattr(row, key) == value], self.column)
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def all(self):
+        if self.column is None:
+            return list(self.rows)
+        return [(getattr(row, self.column),) for row in self.rows]
+
+
+class FakeSession:
+    """In-memory stand-in for the SQLAlchemy session (models use PostgreSQL JSONB)"""
+
+    def __init__(self):
+        self.objects = []
+        self._ids = itertools.count(1)
+
+    def add(self, obj):
+        self.objects.append(obj)
+
+    def flush(self):
+        for obj in self.objects:
+            if isinstance(obj, BacktestJob) and obj.id is None:
+                obj.id = next(self._ids)
+
+    def commit(self):
+        self.flush()
+
+    def rollback(self):
+        pass
+
+    def query(self, target):
+        model = getattr(target, 'class_', target)
+        column = None if model is target else target.key
+        return FakeQuery([obj for obj in self.objects if isinstance(obj, model)], column)
+
+
+class TestStageTimer(unittest.TestCase):
+    """Test cases for StageTimer and the stored timings helpers."""
+
+    def test_span_accumulates_and_records_on_error(self):
+        """Test repeated spans add up and a raising block is still timed."""
+        timer = StageTimer(component='test')
+        with patch.object(profiling.time, 'perf_counter', side_effect=[1.0, 1.5, 2.0, 2.25, 3.0, 4.0]):
+            with timer.span(JOB_INSERT):
+                pass
+            with timer.span(JOB_INSERT):
+                pass
+            with self.assertRaises(RuntimeError):
+                with timer.span(CONTAINER_START):
+                    raise RuntimeError('docker unavailable')
+
+        self.assertEqual(timer.timings, {JOB_INSERT: 0.75, CONTAINER_START: 1.0})
+
+    def test_pop_selected_and_all(self):
+        """Test pop() of named stages leaves the rest and pop() without names empties the timer."""
+        timer = StageTimer()
+        timer.record(BATCH_CREATE, 0.5)
+        timer.record(JOB_SUBMISSION, 1.5)
+        timer.record(COMBINATION_GENERATION, 2.0)
+
+        self.assertEqual(timer.pop(BATCH_CREATE, JOB_INSERT), {BATCH_CREATE: 0.5})
+        self.assertEqual(timer.pop(), {JOB_SUBMISSION: 1.5, COMBINATION_GENERATION: 2.0})
+        self.assertEqual(timer.timings, {})
+        self.assertEqual(timer.pop(), {})
+
+    def test_merge_timings(self):
+        """Test merging adds per stage, rounds to microseconds and leaves the stored value alone."""
+        stored = {JOB_INSERT: 0.1}
+        merged = merge_timings(stored, {JOB_INSERT: 0.2000004, CONTAINER_START: 1.23456789})
+
+        self.assertEqual(merged, {JOB_INSERT: 0.3, CONTAINER_START: 1.234568})
+        self.assertEqual(stored, {JOB_INSERT: 0.1})
+        self.assertEqual(merge_timings(None, {}), {})
+
+    def test_summarize_stage_timings(self):
+        """Test per-stage percentiles against numpy, skipping jobs without timings."""
+        rng = np.random.default_rng(0)
+        lean = rng.uniform(10, 600, 200)
+        jobs = [{LEAN_EXECUTION: float(seconds)} for seconds in lean]
+        jobs[::4] = [None] * len(jobs[::4])
+        jobs[1][RESULT_INSERT] = 0.02
+        jobs.append({})
+
+        summary = summarize_stage_timings(jobs)
+        profiled = np.array([job[LEAN_EXECUTION] for job in jobs if job])
+
+        self.assertEqual(set(summary), {LEAN_EXECUTION, RESULT_INSERT})
+        stats = summary[LEAN_EXECUTION]
+        self.assertEqual(stats['count'], 150)
+        self.assertAlmostEqual(stats['total'], profiled.sum())
+        self.assertAlmostEqual(stats['mean'], profiled.mean())
+        for name, percentile in zip(('p50', 'p95', 'p99'), profiling.PERCENTILES):
+            self.assertAlmostEqual(stats[name], np.percentile(profiled, percentile))
+        self.assertEqual(stats['max'], profiled.max())
+        self.assertEqual(summary[RESULT_INSERT]['count'], 1)
+        self.assertEqual(summarize_stage_timings([]), {})
+
+
+class TestBatchTimings(unittest.TestCase):
+    """Test cases for the batch-level stages of OptimizationService."""
+
+    def setUp(self):
+        """Set up an optimization config with 3 x 2 combinations."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.config = {
+            'strategy': {'name': 'momentum', 'lean_project_path': 'momentum'},
+            'parameters': {
+                'fast': {'start': 5, 'end': 15, 'step': 5},
+                'slow': {'start': 20, 'end': 30, 'step': 10},
+            },
+        }
+        self.config_path = str(Path(self.temp_dir) / 'optimization.yaml')
+        Path(self.config_path).write_text(yaml.safe_dump(self.config))
+
+    def test_batch_and_job_stages(self):
+        """Test a batch stores its own stages and the profile summarizes its jobs."""
+        db = FakeSession()
+        service = OptimizationService(db)
+        combinations = service.generate_parameter_combinations(self.config_path)
+        batch_id = service.create_optimization_batch(self.config_path, combinations)
+
+        batch = db.query(OptimizationBatch).filter_by(id=batch_id).first()
+        self.assertEqual(set(batch.stage_timings), {COMBINATION_GENERATION})
+
+        job_ids = service.submit_backtest_jobs(batch_id, combinations, self.config)
+        self.assertEqual(len(job_ids), 6)
+        self.assertEqual(set(batch.stage_timings), BATCH_STAGES)
+        self.assertTrue(all(seconds >= 0 for seconds in batch.stage_timings.values()))
+        self.assertEqual(service.timer.timings, {})
+
+        # Jobs of another batch and jobs not yet profiled are left out
+        jobs = db.query(BacktestJob).all()
+        for i, job in enumerate(jobs[:4]):
+            job.stage_timings = {LEAN_EXECUTION: 10.0 * (i + 1), RESULT_INSERT: 0.01}
+        db.add(BacktestJob(batch_id='other', stage_timings={LEAN_EXECUTION: 999.0}))
+
+        profile = service.get_batch_profile(batch_id)
+        self.assertEqual(profile['total_jobs'], 6)
+        self.assertEqual(profile['profiled_jobs'], 4)
+        self.assertEqual(profile['batch_stages'], batch.stage_timings)
+        self.assertEqual(profile['job_stages'][LEAN_EXECUTION]['max'], 40.0)
+        self.assertEqual(profile['job_stages'][LEAN_EXECUTION]['p50'], 25.0)
+        self.assertEqual(profile['job_stages'][RESULT_INSERT]['count'], 4)
+        self.assertIsNone(service.get_batch_profile('missing'))
+
+    def test_batches_do_not_share_stages(self):
+        """Test a second batch from the same service starts from its own timings."""
+        db = FakeSession()
+        service = OptimizationService(db)
+        first = service.create_optimization_batch(
+            self.config_path, service.generate_parameter_combinations(self.config_path))
+        service.submit_backtest_jobs(first, [{'fast': 5}], self.config)
+
+        # No combinations generated for this one
+        second = service.create_optimization_batch(self.config_path, [{'fast': 10}])
+        service.submit_backtest_jobs(second, [{'fast': 10}], self.config)
+
+        batch = db.query(OptimizationBatch).filter_by(id=second).first()
+        self.assertEqual(set(batch.stage_timings), {BATCH_CREATE, JOB_SUBMISSION})
+
+
+class TestJobTimings(unittest.TestCase):
+    """Test cases for the per-job stages of BacktestService."""
+
+    def setUp(self):
+        """Set up the service with a fake session and container."""
+        self.db = FakeSession()
+        self.service = BacktestService(self.db, docker_client=MagicMock())
+        self.container = MagicMock(id='abc123')
+        self.container.attrs = {'State': {
+            'StartedAt': '2024-05-01T10:00:00.123456789Z',
+            'FinishedAt': '2024-05-01T10:02:30.623456789Z',
+            'ExitCode': 0,
+        }}
+        self.service.run_lean_container = MagicMock(return_value=self.container)
+
+    def test_stages_accumulate_across_job_lifecycle(self):
+        """Test submission and result processing merge into one stage_timings."""
+        self.service.submit_backtest('momentum', 'momentum', {'fast': 5}, ['SPY'])
+        job = self.db.query(BacktestJob).first()
+        self.assertEqual(set(job.stage_timings), {JOB_INSERT, CONTAINER_START})
+
+        with patch.object(self.service, '_extract_results_from_container', return_value={'sharpe_ratio': 1.2}), \
+                patch.object(self.service, '_validate_results', return_value=(True, [])):
+            self.service._process_completed_job(job, self.container)
+
+        self.assertEqual(job.status, 'completed')
+        self.assertEqual(set(job.stage_timings), {
+            JOB_INSERT, CONTAINER_START, LEAN_EXECUTION, RESULT_EXTRACTION, RESULT_VALIDATION, RESULT_INSERT,
+        })
+        # LEAN execution comes from the container's own timestamps
+        self.assertEqual(job.stage_timings[LEAN_EXECUTION], 150.5)
+        self.container.remove.assert_called_once_with(force=True)
+
+    def test_failed_stages_are_kept(self):
+        """Test a failing container start and a failing extraction still store their stages."""
+        self.service.run_lean_container.side_effect = RuntimeError('no docker')
+        with self.assertRaises(RuntimeError):
+            self.service.submit_backtest('momentum', 'momentum', {}, ['SPY'])
+        job = self.db.query(BacktestJob).first()
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(set(job.stage_timings), {JOB_INSERT, CONTAINER_START})
+
+        with patch.object(self.service, '_extract_results_from_container', side_effect=ValueError('bad json')):
+            self.service._process_completed_job(job, self.container)
+        self.assertEqual(set(job.stage_timings), {JOB_INSERT, CONTAINER_START, LEAN_EXECUTION, RESULT_EXTRACTION})
+
+    def test_failed_job_falls_back_to_started_at(self):
+        """Test LEAN execution is measured from started_at without container timestamps."""
+        job = BacktestJob(status='running', stage_timings=None)
+        job.id = 1
+        job.started_at = datetime.utcnow() - timedelta(seconds=42)
+        self.container.attrs = {}
+        self.container.logs.return_value = b'error'
+
+        self.service._handle_failed_job(job, self.container, exit_code=1)
+
+        self.assertEqual(set(job.stage_timings), {LEAN_EXECUTION})
+        self.assertGreaterEqual(job.stage_timings[LEAN_EXECUTION], 42)
+        self.assertLess(job.stage_timings[LEAN_EXECUTION], 60)
+
+
+class TestWithoutPrometheus(unittest.TestCase):
+    """Test cases for the disabled Prometheus export."""
+
+    def setUp(self):
+        """Reset the module's lazily created exporter state."""
+        for name in ('_stage_histogram', '_metrics_server_started'):
+            patcher = patch.object(profiling, name, None if name == '_stage_histogram' else False)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(profiling, 'PROMETHEUS_AVAILABLE', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_timer_records_without_histogram(self):
+        """Test spans are still timed locally when nothing is exported."""
+        self.assertIsNone(profiling._get_histogram())
+        timer = StageTimer()
+        with timer.span(JOB_INSERT):
+            pass
+        timer.record(JOB_INSERT, 1.0)
+        self.assertGreaterEqual(timer.timings[JOB_INSERT], 1.0)
+        self.assertIsNone(profiling._stage_histogram)
+
+    def test_metrics_server_disabled(self):
+        """Test the endpoint is not started without a port or without prometheus_client."""
+        with patch.dict('os.environ', {}, clear=True):
+            self.assertFalse(profiling.start_metrics_server())
+        with patch.dict('os.environ', {'PROMETHEUS_METRICS_PORT': '9100'}):
+            with self.assertLogs('backend.services.profiling', level='WARNING'):
+                self.assertFalse(profiling.start_metrics_server())
+        self.assertFalse(profiling.start_metrics_server(9100))
+        self.assertFalse(profiling._metrics_server_started)
+
+    def test_histogram_observes_when_available(self):
+        """Test records are forwarded to the histogram when one exists."""
+        histogram = MagicMock()
+        with patch.object(profiling, '_stage_histogram', histogram):
+            StageTimer(component='backtest_service').record(LEAN_EXECUTION, 12.5)
+        histogram.labels.assert_called_once_with(component='backtest_service', stage=LEAN_EXECUTION)
+        histogram.labels.return_value.observe.assert_called_once_with(12.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Risk Manager - incrementally tracked positions and the per-bar
+exposure cache, checked against a full recompute from the broker on every bar
+of a Cerebro run with partial fills.
+"""
+
+import unittest
+from pathlib import Path
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+# Import the modules to test
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from strategies.base_strategy import BaseStrategy
+from strategies.risk_manager import RiskManager
+
+
+def price_frame(seed, n_days=40):
+    """Random-walk daily OHLCV bars."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+    return pd.DataFrame({
+        'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close, 'volume': 1e6,
+    }, index=pd.bdate_range('2024-01-01', periods=n_days))
+
+
+class ScheduledOrders(BaseStrategy):
+    """Places orders on fixed bars and records tracked vs. recomputed exposure."""
+
+    params = (('printlog', False), ('log_mode', 'silent'))
+
+    # bar -> (data index, order)
+    SCHEDULE = {
+        3: (0, 'buy 300'),
+        4: (1, 'sell 150'),
+        10: (0, 'sell 600'),  # Reversal from +300 to -300
+        20: (0, 'close'),
+        24: (1, 'close'),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.risk_manager = RiskManager(self)
+        self.statuses = []
+        self.records = []
+
+    def notify_order(self, order):
+        self.statuses.append(order.getstatusname())
+        super().notify_order(order)
+
+    def next(self):
+        rm = self.risk_manager
+        expected = sum(abs(self.getposition(d).size * d.close[0]) for d in self.datas)
+        open_positions = sum(1 for d in self.datas if self.getposition(d).size != 0)
+        # The second call within a bar is served from the cache
+        self.records.append((rm._get_total_position_value(), rm._get_total_position_value(),
+                             expected, rm._count_open_positions(), open_positions,
+                             [self.getposition(d).size for d in self.datas]))
+
+        action = self.SCHEDULE.get(len(self))
+        if action:
+            data = self.datas[action[0]]
+            if action[1] == 'close':
+                self.close(data=data)
+            else:
+                side, size = action[1].split()
+                getattr(self, side)(data=data, size=int(size))
+
+
+class TestExposureCache(unittest.TestCase):
+    """Test cases for the incremental exposure cache."""
+
+    def test_matches_full_recompute(self):
+        """Test exposure and open positions on every bar through partial fills, a reversal and closes."""
+        cerebro = bt.Cerebro(stdstats=False)
+        cerebro.adddata(bt.feeds.PandasData(dataname=price_frame(0)), name='AAA')
+        cerebro.adddata(bt.feeds.PandasData(dataname=price_frame(1)), name='BBB')
+        cerebro.addstrategy(ScheduledOrders)
+        cerebro.broker.setcash(1e6)
+        cerebro.broker.set_filler(bt.broker.fillers.FixedSize(size=100))
+        strategy = cerebro.run()[0]
+
+        self.assertIn('Partial', strategy.statuses)
+        sizes = [record[-1] for record in strategy.records]
+        self.assertIn([300, -150], sizes)
+        self.assertIn([-300, -150], sizes)
+        self.assertEqual(sizes[-1], [0, 0])
+
+        for bar, (tracked, cached, expected, count, open_positions, _) in enumerate(strategy.records):
+            with self.subTest(bar=bar):
+                self.assertAlmostEqual(tracked, expected, places=6)
+                self.assertEqual(cached, tracked)
+                self.assertEqual(count, open_positions)
+
+
+if __name__ == '__main__':
+    unittest.main()